@@ -14,6 +14,13 @@ WEBSOCKET_MAX_SUBSCRIPTIONS = 40
 
 REAL_API_REQUEST_PER_SECOND = 20 - 1
 VIRTUAL_API_REQUEST_PER_SECOND = 2
+API_REQUEST_BURST = 1
+
+ASYNC_CONNECTION_LIMIT = 32
+"""비동기 API 도메인별 최대 동시 연결 수"""
+
+CACHE_MAX_SIZE = 4096
+"""캐시 저장소 기본 최대 항목 수"""
 
 TRACE_DETAIL_ERROR: bool = False
 """
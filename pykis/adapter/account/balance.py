@@ -1,11 +1,14 @@
 from datetime import date
-from typing import Protocol, runtime_checkable
+from typing import Iterator, Protocol, runtime_checkable
 
 from pykis.api.account.balance import KisBalance
+from pykis.api.account.book import KisAccountBook
 from pykis.api.account.daily_order import KisDailyOrders
 from pykis.api.account.order_profit import KisOrderProfits
 from pykis.api.base.account import KisAccountProtocol
 from pykis.api.stock.info import COUNTRY_TYPE
+from pykis.client.journal import KisJournal
+from pykis.client.page import KisPage
 
 __all__ = [
     "KisQuotableAccount",
@@ -43,6 +46,7 @@ class KisQuotableAccount(Protocol):
         start: date,
         end: date | None = None,
         country: COUNTRY_TYPE | None = None,
+        journal: KisJournal | None = None,
     ) -> KisDailyOrders:
         """
         한국투자증권 통합일별 체결내역 조회
@@ -54,6 +58,7 @@ class KisQuotableAccount(Protocol):
             start (date): 조회 시작일
             end (date, optional): 조회 종료일. Defaults to None.
             country (COUNTRY_TYPE, optional): 국가코드
+            journal (KisJournal, optional): 조회 기록. 지정하면 기록의 동기화 기준일 이후와 기록에 없는 기간만 조회합니다.
 
         Raises:
             KisAPIError: API 호출에 실패한 경우
@@ -66,6 +71,7 @@ class KisQuotableAccount(Protocol):
         start: date,
         end: date | None = None,
         country: COUNTRY_TYPE | None = None,
+        journal: KisJournal | None = None,
     ) -> KisOrderProfits:
         """
         한국투자증권 통합 기간 손익 조회
@@ -79,6 +85,91 @@ class KisQuotableAccount(Protocol):
             start (date): 조회 시작일
             end (date, optional): 조회 종료일. Defaults to None.
             country (COUNTRY_TYPE, optional): 국가
+            journal (KisJournal, optional): 조회 기록. 지정하면 기록의 동기화 기준일 이후와 기록에 없는 기간만 조회합니다.
+
+        Raises:
+            KisAPIError: API 호출에 실패한 경우
+            ValueError: 계좌번호가 잘못된 경우
+        """
+        ...
+
+    def iter_daily_orders(
+        self: KisAccountProtocol,
+        start: date,
+        end: date | None = None,
+        country: COUNTRY_TYPE | None = None,
+        page: KisPage | None = None,
+    ) -> Iterator[KisDailyOrders]:
+        """
+        한국투자증권 통합일별 체결내역 페이지 단위 조회
+
+        국내주식주문 -> 주식일별주문체결조회[v1_국내주식-005]
+        국내주식주문 -> 해외주식 주문체결내역[v1_해외주식-007]
+
+        연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+        반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
+        Args:
+            start (date): 조회 시작일
+            end (date, optional): 조회 종료일. Defaults to None.
+            country (COUNTRY_TYPE, optional): 국가코드
+            page (KisPage, optional): 페이지 정보. 국가를 지정한 경우에만 이어서 조회할 수 있습니다.
+
+        Raises:
+            KisAPIError: API 호출에 실패한 경우
+            ValueError: 계좌번호가 잘못된 경우
+        """
+        ...
+
+    def iter_profits(
+        self: KisAccountProtocol,
+        start: date,
+        end: date | None = None,
+        country: COUNTRY_TYPE | None = None,
+        page: KisPage | None = None,
+    ) -> Iterator[KisOrderProfits]:
+        """
+        한국투자증권 통합 기간 손익 페이지 단위 조회
+
+        국내주식주문 -> 기간별매매손익현황조회[v1_국내주식-060] (모의투자 미지원)
+        국내주식주문 -> 해외주식 기간손익[v1_해외주식-032] (모의투자 미지원)
+        (업데이트 날짜: 2024/04/03)
+
+        연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+        반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
+        Args:
+            start (date): 조회 시작일
+            end (date, optional): 조회 종료일. Defaults to None.
+            country (COUNTRY_TYPE, optional): 국가
+            page (KisPage, optional): 페이지 정보. 국가를 지정한 경우에만 이어서 조회할 수 있습니다.
+
+        Raises:
+            KisAPIError: API 호출에 실패한 경우
+            ValueError: 계좌번호가 잘못된 경우
+        """
+        ...
+
+    def book(
+        self: KisAccountProtocol,
+        country: COUNTRY_TYPE | None = None,
+        reconcile_interval: float | None = 60,
+    ) -> KisAccountBook:
+        """
+        실시간 계좌 장부를 시작합니다.
+
+        장부가 실행 중인 동안 보유수량, 매도가능수량, 매입금액 조회와 전량 매도 주문의 매도가능수량 조회는 잔고를 조회하지 않고 장부를 사용합니다.
+        이미 실행 중인 장부가 있으면 해당 장부를 반환합니다.
+
+        국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+        해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
+        해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+        [국내주식] 실시간시세 -> 국내주식 실시간체결통보[실시간-005]
+        [해외주식] 실시간시세 -> 해외주식 실시간체결통보[실시간-009]
+
+        Args:
+            country (COUNTRY_TYPE | None, optional): 국가코드. None이면 국내 및 해외 잔고를 모두 관리합니다.
+            reconcile_interval (float | None, optional): 잔고 조회 대사 주기 (초). Defaults to 60.
 
         Raises:
             KisAPIError: API 호출에 실패한 경우
@@ -91,9 +182,16 @@ class KisQuotableAccountMixin:
     """한국투자증권 잔고조회가능 프로토콜"""
 
     from pykis.api.account.balance import account_balance as balance  # 잔고 조회
+    from pykis.api.account.book import account_book as book  # 실시간 계좌 장부
     from pykis.api.account.daily_order import (
         account_daily_orders as daily_orders,  # 일별 체결내역 조회
     )
+    from pykis.api.account.daily_order import (
+        account_iter_daily_orders as iter_daily_orders,  # 일별 체결내역 페이지 단위 조회
+    )
+    from pykis.api.account.order_profit import (
+        account_iter_order_profits as iter_profits,  # 주문 수익률 페이지 단위 조회
+    )
     from pykis.api.account.order_profit import (
         account_order_profits as profits,  # 주문 수익률 조회
     )
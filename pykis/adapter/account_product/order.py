@@ -1,4 +1,4 @@
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from pykis.api.account.order import (
     IN_ORDER_QUANTITY,
@@ -14,6 +14,10 @@ from pykis.api.account.pending_order import KisPendingOrders
 from pykis.api.base.account_product import KisAccountProductProtocol
 from pykis.api.stock.info import get_market_country
 
+if TYPE_CHECKING:
+    from pykis.api.account.balance import KisBalanceStock
+    from pykis.api.account.book import KisAccountBookPosition
+
 __all__ = [
     "KisOrderableAccountProduct",
     "KisOrderableAccountProductMixin",
@@ -367,6 +371,20 @@ class KisOrderableAccountProduct(Protocol):
         ...
 
 
+def _holding(self: "KisAccountProductProtocol") -> "KisAccountBookPosition | KisBalanceStock | None":
+    """실행 중인 실시간 계좌 장부가 있으면 장부에서, 없으면 잔고를 조회하여 보유종목을 반환합니다."""
+    from pykis.api.account.book import get_book
+
+    country = get_market_country(self.market)
+
+    kis = getattr(self, "kis", None)
+
+    if getattr(kis, "books", None) and (book := get_book(kis, self.account_number, country)) is not None:  # type: ignore
+        return book.position(self.symbol)
+
+    return self.account.balance(country).stock(self.symbol)
+
+
 class KisOrderableAccountProductMixin:
     """한국투자증권 주문가능 상품"""
 
@@ -382,11 +400,7 @@ class KisOrderableAccountProductMixin:
 
     @property
     def quantity(self: "KisAccountProductProtocol") -> ORDER_QUANTITY:
-        return (
-            stock.quantity
-            if (stock := self.account.balance(get_market_country(self.market)).stock(self.symbol))
-            else ORDER_QUANTITY(0)
-        )
+        return stock.quantity if (stock := _holding(self)) else ORDER_QUANTITY(0)
 
     @property
     def qty(self: "KisAccountProductProtocol") -> ORDER_QUANTITY:
@@ -396,11 +410,7 @@ class KisOrderableAccountProductMixin:
         Returns:
             ORDER_QUANTITY: 보유수량
         """
-        return (
-            stock.quantity
-            if (stock := self.account.balance(get_market_country(self.market)).stock(self.symbol))
-            else ORDER_QUANTITY(0)
-        )
+        return stock.quantity if (stock := _holding(self)) else ORDER_QUANTITY(0)
 
     @property
     def orderable(self: "KisAccountProductProtocol") -> ORDER_QUANTITY:
@@ -410,11 +420,7 @@ class KisOrderableAccountProductMixin:
         Returns:
             ORDER_QUANTITY: 주문 가능 수량
         """
-        return (
-            stock.orderable
-            if (stock := self.account.balance(get_market_country(self.market)).stock(self.symbol))
-            else ORDER_QUANTITY(0)
-        )
+        return stock.orderable if (stock := _holding(self)) else ORDER_QUANTITY(0)
 
     @property
     def purchase_amount(self: "KisAccountProductProtocol") -> ORDER_PRICE:
@@ -424,8 +430,4 @@ class KisOrderableAccountProductMixin:
         Returns:
             ORDER_PRICE: 주문 가능 금액
         """
-        return (
-            stock.purchase_amount
-            if (stock := self.account.balance(get_market_country(self.market)).stock(self.symbol))
-            else 0
-        )
+        return stock.purchase_amount if (stock := _holding(self)) else 0
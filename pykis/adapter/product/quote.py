@@ -24,6 +24,7 @@ class KisQuotableProduct(Protocol):
         end: date | None = None,
         period: Literal["day", "week", "month", "year"] = "day",
         adjust: bool = False,
+        columnar: bool = False,
     ) -> KisChart:
         """
         한국투자증권 기간 차트 조회
@@ -36,6 +37,7 @@ class KisQuotableProduct(Protocol):
             end (date, optional): 조회 종료 시간. Defaults to None.
             period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
             adjust (bool, optional): 수정 주가 여부. Defaults to False.
+            columnar (bool, optional): 봉 목록을 열 기반 차트(`KisChartColumns`)로 저장할지 여부. Defaults to False.
 
         Raises:
             KisAPIError: API 호출에 실패한 경우
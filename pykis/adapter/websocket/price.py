@@ -25,6 +25,7 @@ class KisWebsocketQuotableProduct(Protocol):
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
         once: bool = False,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -38,6 +39,7 @@ class KisWebsocketQuotableProduct(Protocol):
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
         ...
 
@@ -49,6 +51,7 @@ class KisWebsocketQuotableProduct(Protocol):
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
         once: bool = False,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -63,6 +66,7 @@ class KisWebsocketQuotableProduct(Protocol):
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
         ...
 
@@ -80,6 +84,7 @@ class KisWebsocketQuotableProduct(Protocol):
         ) = None,
         once: bool = False,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> (
         KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]
         | KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]
@@ -92,6 +97,7 @@ class KisWebsocketQuotableProduct(Protocol):
         callback: Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]], None],
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -104,6 +110,7 @@ class KisWebsocketQuotableProduct(Protocol):
             callback (Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]], None]): 콜백 함수
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
         ...
 
@@ -114,6 +121,7 @@ class KisWebsocketQuotableProduct(Protocol):
         callback: Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]], None],
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -127,6 +135,7 @@ class KisWebsocketQuotableProduct(Protocol):
             callback (Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]], None]): 콜백 함수
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
         ...
 
@@ -143,6 +152,7 @@ class KisWebsocketQuotableProduct(Protocol):
             | None
         ) = None,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> (
         KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]
         | KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]
@@ -160,6 +170,7 @@ class KisWebsocketQuotableProductMixin:
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
         once: bool = False,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -173,6 +184,7 @@ class KisWebsocketQuotableProductMixin:
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
 
     @overload
@@ -183,6 +195,7 @@ class KisWebsocketQuotableProductMixin:
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
         once: bool = False,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -197,6 +210,7 @@ class KisWebsocketQuotableProductMixin:
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
 
     def on(
@@ -213,6 +227,7 @@ class KisWebsocketQuotableProductMixin:
         ) = None,
         once: bool = False,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> (
         KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]
         | KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]
@@ -226,6 +241,7 @@ class KisWebsocketQuotableProductMixin:
                 where=where,  # type: ignore
                 once=once,
                 extended=extended,
+                max_rate=max_rate,
             )
         elif event == "orderbook":
             from pykis.api.websocket.order_book import (
@@ -238,6 +254,7 @@ class KisWebsocketQuotableProductMixin:
                 where=where,  # type: ignore
                 once=once,
                 extended=extended,
+                max_rate=max_rate,
             )
 
         raise ValueError(f"Unknown event: {event}")
@@ -249,6 +266,7 @@ class KisWebsocketQuotableProductMixin:
         callback: Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]], None],
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -261,6 +279,7 @@ class KisWebsocketQuotableProductMixin:
             callback (Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]], None]): 콜백 함수
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
         ...
 
@@ -271,6 +290,7 @@ class KisWebsocketQuotableProductMixin:
         callback: Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]], None],
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -284,6 +304,7 @@ class KisWebsocketQuotableProductMixin:
             callback (Callable[[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]], None]): 콜백 함수
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
         """
         ...
 
@@ -300,6 +321,7 @@ class KisWebsocketQuotableProductMixin:
             | None
         ) = None,
         extended: bool = False,
+        max_rate: float | None = None,
     ) -> (
         KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]
         | KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]
@@ -313,6 +335,7 @@ class KisWebsocketQuotableProductMixin:
                 where=where,  # type: ignore
                 once=True,
                 extended=extended,
+                max_rate=max_rate,
             )
         elif event == "orderbook":
             from pykis.api.websocket.order_book import (
@@ -325,6 +348,7 @@ class KisWebsocketQuotableProductMixin:
                 where=where,  # type: ignore
                 once=True,
                 extended=extended,
+                max_rate=max_rate,
             )
 
         raise ValueError(f"Unknown event: {event}")
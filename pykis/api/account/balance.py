@@ -1,5 +1,6 @@
 from decimal import Decimal
 from functools import cached_property
+from itertools import chain
 from typing import TYPE_CHECKING, Iterator, Protocol, runtime_checkable
 
 from pykis.adapter.account_product.order import (
@@ -25,10 +26,11 @@ from pykis.api.stock.market import (
     get_market_type
 )
 from pykis.client.account import KisAccountNumber
-from pykis.client.page import KisPage
+from pykis.client.page import KisPage, collect_pages, iter_pages
 from pykis.responses.dynamic import KisDynamic, KisList, KisObject, KisTransform
 from pykis.responses.response import KisAPIResponse, KisPaginationAPIResponse
 from pykis.responses.types import KisAny, KisDecimal, KisString
+from pykis.utils.batch import batch_map
 from pykis.utils.math import safe_divide
 from pykis.utils.repr import kis_repr
 from pykis.utils.typing import Checkable
@@ -41,6 +43,8 @@ __all__ = [
     "KisDeposit",
     "KisBalance",
     "balance",
+    "iter_domestic_balance",
+    "iter_foreign_balance",
 ]
 
 
@@ -909,22 +913,23 @@ class KisIntegrationBalance(KisBalanceBase):
                 self.deposits[currency] = deposit
 
 
-def domestic_balance(
+def iter_domestic_balance(
     self: "PyKis",
     account: str | KisAccountNumber,
     page: KisPage | None = None,
-    continuous: bool = True,
-) -> KisDomesticBalance:
+) -> Iterator[KisDomesticBalance]:
     """
-    한국투자증권 국내 주식 잔고 조회
+    한국투자증권 국내 주식 잔고 페이지 단위 조회
 
     국내주식주문 -> 주식잔고조회[v1_국내주식-006]
     (업데이트 날짜: 2024/03/29)
 
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
     Args:
         account (str | KisAccountNumber): 계좌번호
         page (KisPage, optional): 페이지 정보
-        continuous (bool, optional): 연속조회 여부
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -933,11 +938,8 @@ def domestic_balance(
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    page = (page or KisPage.first()).to(100)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/domestic-stock/v1/trading/inquire-balance",
             api="VTTC8434R" if self.virtual else "TTTC8434R",
             params={
@@ -957,37 +959,25 @@ def domestic_balance(
             response_type=KisDomesticBalance(
                 account_number=account,
             ),
-        )
-
-        if first is None:
-            first = result
-        else:
-            first.stocks.extend(result.stocks)
-
-        if not continuous or result.is_last:
-            break
-
-        page = result.next_page
-
-    return first
+        ),
+        (page or KisPage.first()).to(100),
+    )
 
 
-def _internal_foreign_balance(
+def domestic_balance(
     self: "PyKis",
     account: str | KisAccountNumber,
-    market: MARKET_TYPE | None = None,
     page: KisPage | None = None,
     continuous: bool = True,
-) -> KisForeignBalance:
+) -> KisDomesticBalance:
     """
-    한국투자증권 해외 주식 잔고 조회
+    한국투자증권 국내 주식 잔고 조회
 
-    해외주식주문 -> 해외주식 잔고[v1_해외주식-006]
-    (업데이트 날짜: 2024/03/30)
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+    (업데이트 날짜: 2024/03/29)
 
     Args:
         account (str | KisAccountNumber): 계좌번호
-        market (str, optional): 시장코드
         page (KisPage, optional): 페이지 정보
         continuous (bool, optional): 연속조회 여부
 
@@ -995,14 +985,24 @@ def _internal_foreign_balance(
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return collect_pages(
+        iter_domestic_balance(self, account, page=page),
+        lambda result: result.stocks,
+        continuous=continuous,
+    )
+
+
+def _iter_internal_foreign_balance(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisForeignBalance]:
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    page = (page or KisPage.first()).to(200)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/overseas-stock/v1/trading/inquire-balance",
             api="VTTS3012R" if self.virtual else "TTTS3012R",
             params={
@@ -1017,19 +1017,39 @@ def _internal_foreign_balance(
             response_type=KisForeignBalance(
                 account_number=account,
             ),
-        )
+        ),
+        (page or KisPage.first()).to(200),
+    )
 
-        if first is None:
-            first = result
-        else:
-            first.stocks.extend(result.stocks)
 
-        if not continuous or result.is_last:
-            break
+def _internal_foreign_balance(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+) -> KisForeignBalance:
+    """
+    한국투자증권 해외 주식 잔고 조회
 
-        page = result.next_page
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006]
+    (업데이트 날짜: 2024/03/30)
 
-    return first
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        market (str, optional): 시장코드
+        page (KisPage, optional): 페이지 정보
+        continuous (bool, optional): 연속조회 여부
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return collect_pages(
+        _iter_internal_foreign_balance(self, account, market=market, page=page),
+        lambda result: result.stocks,
+        continuous=continuous,
+    )
 
 
 FOREIGN_COUNTRY_MARKET_MAP: dict[tuple[bool | None, COUNTRY_TYPE | None], list[MARKET_TYPE | None]] = {
@@ -1044,6 +1064,45 @@ FOREIGN_COUNTRY_MARKET_MAP: dict[tuple[bool | None, COUNTRY_TYPE | None], list[M
 }
 
 
+def iter_foreign_balance(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisForeignBalance]:
+    """
+    한국투자증권 해외 주식 잔고 페이지 단위 조회
+
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006]
+    (업데이트 날짜: 2024/03/30)
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+    여러 시장을 조회하는 국가는 시장 순서대로 반환합니다.
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE, optional): 국가코드
+        page (KisPage, optional): 페이지 정보
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+        ValueError: 여러 시장을 조회하는 국가를 이어서 조회하는 경우
+    """
+    markets = FOREIGN_COUNTRY_MARKET_MAP.get((not self.virtual, country), FOREIGN_COUNTRY_MARKET_MAP[(None, country)])
+
+    if not markets:
+        raise ValueError("Invalid country code")
+
+    if page is not None and not page.is_first and len(markets) > 1:
+        raise ValueError("여러 시장을 조회하는 국가는 이어서 조회할 수 없습니다.")
+
+    return chain.from_iterable(
+        _iter_internal_foreign_balance(self, account, market=market, page=page) for market in markets
+    )
+
+
 def _foreign_balance(
     self: "PyKis",
     account: str | KisAccountNumber,
@@ -1065,18 +1124,14 @@ def _foreign_balance(
     """
     markets = FOREIGN_COUNTRY_MARKET_MAP.get((not self.virtual, country), FOREIGN_COUNTRY_MARKET_MAP[(None, country)])
 
-    first = None
-
-    for market in markets:
-        result = _internal_foreign_balance(self, account, market)
+    if not markets:
+        raise ValueError("Invalid country code")
 
-        if first is None:
-            first = result
-        else:
-            first.stocks.extend(result.stocks)
+    # 시장별 조회는 서로 독립적이므로 동시에 요청합니다.
+    first, *rest = batch_map(lambda market: _internal_foreign_balance(self, account, market), markets)
 
-    if first is None:
-        raise ValueError("Invalid country code")
+    for result in rest:
+        first.stocks.extend(result.stocks)
 
     return first
 
@@ -1170,11 +1225,11 @@ def balance(
         account = KisAccountNumber(account)
 
     if country is None:
+        # 국내 및 해외 잔고 조회는 서로 독립적이므로 동시에 요청합니다.
         return KisIntegrationBalance(
             self,
             account,
-            domestic_balance(self, account),
-            foreign_balance(self, account),
+            *batch_map(lambda fetch: fetch(self, account), (domestic_balance, foreign_balance)),
         )
     elif country == "KR":
         return domestic_balance(self, account)
@@ -1223,6 +1278,8 @@ def orderable_quantity(
     해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
     (업데이트 날짜: 2024/03/30)
 
+    실시간 계좌 장부(`book`)가 실행 중이면 잔고를 조회하지 않고 장부의 매도가능수량을 반환합니다.
+
     Args:
         account (str | KisAccountNumber): 계좌번호
         symbol (str): 종목코드
@@ -1238,6 +1295,11 @@ def orderable_quantity(
     if not country:
         country = get_market_country(resolve_market(self, symbol=symbol))
 
+    from pykis.api.account.book import get_book
+
+    if (book := get_book(self, account, country)) is not None:
+        return position.orderable if (position := book.position(symbol)) else None
+
     stock = balance(
         self,
         account=account,
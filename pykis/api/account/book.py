@@ -0,0 +1,676 @@
+import threading
+import time
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from pykis import logging
+from pykis.api.account.balance import balance
+from pykis.api.account.order import ORDER_QUANTITY
+from pykis.api.stock.info import COUNTRY_TYPE, get_market_country
+from pykis.api.stock.market import CURRENCY_TYPE, MARKET_TYPE, get_market_currency
+from pykis.api.websocket.order_execution import KisRealtimeExecution, on_execution
+from pykis.client.account import KisAccountNumber
+from pykis.event.handler import KisEventTicket
+from pykis.event.subscription import KisSubscriptionEventArgs
+from pykis.utils.math import safe_divide
+
+if TYPE_CHECKING:
+    from pykis.api.account.order import KisOrderNumber
+    from pykis.api.base.account import KisAccountProtocol
+    from pykis.client.websocket import KisWebsocketClient
+    from pykis.kis import PyKis
+
+__all__ = [
+    "KisAccountBookPosition",
+    "KisAccountBookStats",
+    "KisAccountBook",
+    "book",
+    "account_book",
+    "get_book",
+]
+
+
+class KisAccountBookPosition:
+    """실시간 계좌 장부 보유종목"""
+
+    __slots__ = [
+        "market",
+        "symbol",
+        "quantity",
+        "orderable",
+        "purchase_amount",
+    ]
+
+    market: MARKET_TYPE
+    """상품유형타입"""
+    symbol: str
+    """종목코드"""
+    quantity: ORDER_QUANTITY
+    """보유수량"""
+    orderable: ORDER_QUANTITY
+    """매도가능수량"""
+    purchase_amount: Decimal
+    """매입금액"""
+
+    def __init__(
+        self,
+        market: MARKET_TYPE,
+        symbol: str,
+        quantity: ORDER_QUANTITY = ORDER_QUANTITY(0),
+        orderable: ORDER_QUANTITY = ORDER_QUANTITY(0),
+        purchase_amount: Decimal = Decimal(0),
+    ):
+        self.market = market
+        self.symbol = symbol
+        self.quantity = quantity
+        self.orderable = orderable
+        self.purchase_amount = purchase_amount
+
+    @property
+    def qty(self) -> ORDER_QUANTITY:
+        """보유수량"""
+        return self.quantity
+
+    @property
+    def purchase_price(self) -> Decimal:
+        """매입평균가"""
+        return safe_divide(self.purchase_amount, self.quantity)
+
+    @property
+    def currency(self) -> CURRENCY_TYPE:
+        """통화"""
+        return get_market_currency(self.market)
+
+    def copy(self) -> "KisAccountBookPosition":
+        return KisAccountBookPosition(
+            market=self.market,
+            symbol=self.symbol,
+            quantity=self.quantity,
+            orderable=self.orderable,
+            purchase_amount=self.purchase_amount,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, KisAccountBookPosition) and (
+            self.market,
+            self.symbol,
+            self.quantity,
+            self.orderable,
+            self.purchase_amount,
+        ) == (
+            other.market,
+            other.symbol,
+            other.quantity,
+            other.orderable,
+            other.purchase_amount,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(market={self.market!r}, symbol={self.symbol!r}, quantity={self.quantity}, "
+            f"orderable={self.orderable}, purchase_amount={self.purchase_amount})"
+        )
+
+
+class KisAccountBookStats:
+    """실시간 계좌 장부 통계"""
+
+    __slots__ = [
+        "executions",
+        "receipts",
+        "reconciliations",
+        "corrections",
+        "reconciled_at",
+    ]
+
+    executions: int
+    """반영한 체결 통보 수"""
+    receipts: int
+    """반영한 접수, 취소, 거부 통보 수"""
+    reconciliations: int
+    """잔고 조회로 대사한 횟수"""
+    corrections: int
+    """대사 시 잔고 조회 결과와 달라 교정한 보유종목 및 예수금 수"""
+    reconciled_at: float | None
+    """마지막 대사 시각 (UNIX timestamp)"""
+
+    def __init__(
+        self,
+        executions: int = 0,
+        receipts: int = 0,
+        reconciliations: int = 0,
+        corrections: int = 0,
+        reconciled_at: float | None = None,
+    ):
+        self.executions = executions
+        self.receipts = receipts
+        self.reconciliations = reconciliations
+        self.corrections = corrections
+        self.reconciled_at = reconciled_at
+
+    def copy(self) -> "KisAccountBookStats":
+        return KisAccountBookStats(
+            executions=self.executions,
+            receipts=self.receipts,
+            reconciliations=self.reconciliations,
+            corrections=self.corrections,
+            reconciled_at=self.reconciled_at,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(executions={self.executions}, receipts={self.receipts}, "
+            f"reconciliations={self.reconciliations}, corrections={self.corrections})"
+        )
+
+
+class KisAccountBook:
+    """
+    실시간 계좌 장부
+
+    잔고 조회 결과로 보유종목과 예수금을 초기화한 뒤, 실시간 체결 통보로 갱신합니다.
+    수수료, 제세금, 미수 등 체결 통보로 알 수 없는 변동은 주기적인 잔고 조회 대사로 교정됩니다.
+
+    매도 주문 접수 통보를 받으면 주문수량만큼 매도가능수량을 줄이고, 취소 또는 거부 통보를 받으면 남은 수량을 되돌립니다.
+    """
+
+    __slots__ = [
+        "kis",
+        "account_number",
+        "country",
+        "reconcile_interval",
+        "_positions",
+        "_deposits",
+        "_reserved",
+        "_inflight",
+        "_lock",
+        "_reconcile_lock",
+        "_stats",
+        "_ticket",
+        "_thread",
+        "_stop",
+    ]
+
+    kis: "PyKis"
+    """한국투자증권 API"""
+    account_number: KisAccountNumber
+    """계좌번호"""
+    country: COUNTRY_TYPE | None
+    """국가코드 (None: 국내 및 해외 전체)"""
+    reconcile_interval: float | None
+    """잔고 조회 대사 주기 (초, None: 대사하지 않음)"""
+
+    _positions: dict[str, KisAccountBookPosition]
+    """종목코드별 보유종목"""
+    _deposits: dict[CURRENCY_TYPE, Decimal]
+    """통화별 예수금"""
+    _reserved: dict["KisOrderNumber", ORDER_QUANTITY]
+    """매도 주문별 체결되지 않은 접수 수량"""
+    _inflight: list[KisRealtimeExecution] | None
+    """잔고 조회 대사 중 수신한 체결 통보 (None: 대사 중이 아님)"""
+    _lock: threading.Lock
+    """장부 잠금"""
+    _reconcile_lock: threading.Lock
+    """대사 잠금"""
+    _stats: KisAccountBookStats
+    """장부 통계"""
+    _ticket: KisEventTicket | None
+    """체결 통보 이벤트 티켓"""
+    _thread: threading.Thread | None
+    """대사 스레드"""
+    _stop: threading.Event
+    """대사 중단 이벤트"""
+
+    def __init__(
+        self,
+        kis: "PyKis",
+        account_number: KisAccountNumber,
+        country: COUNTRY_TYPE | None = None,
+        reconcile_interval: float | None = 60,
+    ):
+        """
+        실시간 계좌 장부를 생성합니다.
+
+        Args:
+            kis (PyKis): 한국투자증권 API
+            account_number (KisAccountNumber): 계좌번호
+            country (COUNTRY_TYPE | None, optional): 국가코드. None이면 국내 및 해외 잔고를 모두 관리합니다.
+            reconcile_interval (float | None, optional): 잔고 조회 대사 주기 (초). None이면 `reconcile()`을 호출할 때만 대사합니다.
+        """
+        if reconcile_interval is not None and reconcile_interval <= 0:
+            raise ValueError("대사 주기는 0보다 커야 합니다.")
+
+        self.kis = kis
+        self.account_number = account_number
+        self.country = country
+        self.reconcile_interval = reconcile_interval
+        self._positions = {}
+        self._deposits = {}
+        self._reserved = {}
+        self._inflight = None
+        self._lock = threading.Lock()
+        self._reconcile_lock = threading.Lock()
+        self._stats = KisAccountBookStats()
+        self._ticket = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def stats(self) -> KisAccountBookStats:
+        """장부 통계의 복사본을 반환합니다."""
+        with self._lock:
+            return self._stats.copy()
+
+    @property
+    def running(self) -> bool:
+        """체결 통보를 반영 중인지 여부"""
+        return self._ticket is not None
+
+    @property
+    def positions(self) -> dict[str, KisAccountBookPosition]:
+        """종목코드별 보유종목의 복사본을 반환합니다."""
+        with self._lock:
+            return {symbol: position.copy() for symbol, position in self._positions.items()}
+
+    @property
+    def deposits(self) -> dict[CURRENCY_TYPE, Decimal]:
+        """통화별 예수금의 복사본을 반환합니다."""
+        with self._lock:
+            return self._deposits.copy()
+
+    def covers(self, country: COUNTRY_TYPE | None) -> bool:
+        """해당 국가의 잔고를 관리하는지 여부를 반환합니다."""
+        return self.country is None or self.country == country
+
+    def position(self, symbol: str) -> KisAccountBookPosition | None:
+        """보유종목을 종목코드로 조회합니다."""
+        with self._lock:
+            position = self._positions.get(symbol)
+            return position.copy() if position is not None else None
+
+    def quantity(self, symbol: str) -> ORDER_QUANTITY:
+        """보유수량을 조회합니다."""
+        position = self._positions.get(symbol)
+        return position.quantity if position is not None else ORDER_QUANTITY(0)
+
+    def orderable(self, symbol: str) -> ORDER_QUANTITY:
+        """매도가능수량을 조회합니다."""
+        position = self._positions.get(symbol)
+        return position.orderable if position is not None else ORDER_QUANTITY(0)
+
+    def purchase_amount(self, symbol: str) -> Decimal:
+        """매입금액을 조회합니다."""
+        position = self._positions.get(symbol)
+        return position.purchase_amount if position is not None else Decimal(0)
+
+    def deposit(self, currency: CURRENCY_TYPE) -> Decimal | None:
+        """통화별 예수금을 조회합니다."""
+        return self._deposits.get(currency)
+
+    def reconcile(self) -> int:
+        """
+        잔고를 조회하여 장부를 교정합니다.
+
+        잔고 조회 중 수신한 체결 통보는 보관해 두었다가, 조회 결과에 반영되지 않은 통보만 교체한 장부에 다시 반영합니다.
+        종목별로 조회 전 장부에 통보를 차례로 반영하며 보유수량과 매도가능수량이 조회 결과와 일치하는 가장 긴 앞부분을 반영된 통보로 보고,
+        일치하는 경우가 없으면 조회 결과를 그대로 사용합니다.
+
+        Returns:
+            int: 교정한 보유종목 및 예수금 수
+        """
+        with self._reconcile_lock:
+            with self._lock:
+                self._inflight = []
+                before = {symbol: position.copy() for symbol, position in self._positions.items()}
+                reserved = self._reserved.copy()
+
+            try:
+                result = balance(self.kis, account=self.account_number, country=self.country)
+            except BaseException:
+                with self._lock:
+                    self._inflight = None
+
+                raise
+
+            positions = {
+                stock.symbol: KisAccountBookPosition(
+                    market=stock.market,
+                    symbol=stock.symbol,
+                    quantity=stock.quantity,
+                    orderable=stock.orderable,
+                    purchase_amount=stock.purchase_amount,
+                )
+                for stock in result.stocks
+                if stock.quantity
+            }
+            deposits = {currency: deposit.amount for currency, deposit in result.deposits.items()}
+
+            with self._lock:
+                inflight, self._inflight = self._inflight or [], None
+                included = self._included(inflight, before, reserved, positions)
+                # 조회 결과에 반영된 통보는 매도 예약 수량만 맞추고, 반영되지 않은 통보는 교체할 장부에 다시 반영합니다.
+                scratch = {symbol: position.copy() for symbol, position in before.items()}
+
+                for execution in inflight:
+                    if id(execution) in included:
+                        self._update(execution, scratch, {}, reserved)
+                    else:
+                        self._update(execution, positions, deposits, reserved)
+
+                corrections = sum(
+                    1
+                    for symbol in positions.keys() | self._positions.keys()
+                    if positions.get(symbol) != self._positions.get(symbol)
+                ) + sum(
+                    1
+                    for currency in deposits.keys() | self._deposits.keys()
+                    if deposits.get(currency) != self._deposits.get(currency)
+                )
+
+                # 최초 대사는 장부 초기화이므로 교정으로 세지 않습니다.
+                if self._stats.reconciliations:
+                    self._stats.corrections += corrections
+
+                self._positions = positions
+                self._deposits = deposits
+                self._reserved = reserved
+                self._stats.reconciliations += 1
+                self._stats.reconciled_at = time.time()
+
+        return corrections
+
+    def _included(
+        self,
+        executions: list[KisRealtimeExecution],
+        before: dict[str, KisAccountBookPosition],
+        reserved: dict["KisOrderNumber", ORDER_QUANTITY],
+        positions: dict[str, KisAccountBookPosition],
+    ) -> set[int]:
+        """잔고 조회 결과에 반영된 것으로 보이는 체결 통보의 id 목록을 반환합니다."""
+        symbols: dict[str, list[KisRealtimeExecution]] = {}
+
+        for execution in executions:
+            symbols.setdefault(execution.symbol, []).append(execution)
+
+        included = set()
+
+        for symbol, items in symbols.items():
+            target = self._state(positions, symbol)
+            simulated = {symbol: before[symbol].copy()} if symbol in before else {}
+            simulated_reserved = reserved.copy()
+            # 일치하는 경우가 없으면 조회 결과를 신뢰하여 모든 통보가 반영된 것으로 봅니다.
+            count = len(items) if self._state(simulated, symbol) != target else 0
+
+            for index, execution in enumerate(items):
+                self._update(execution, simulated, {}, simulated_reserved)
+
+                if self._state(simulated, symbol) == target:
+                    count = index + 1
+
+            included.update(id(execution) for execution in items[:count])
+
+        return included
+
+    @staticmethod
+    def _state(positions: dict[str, KisAccountBookPosition], symbol: str) -> tuple[ORDER_QUANTITY, ORDER_QUANTITY]:
+        """보유수량과 매도가능수량"""
+        position = positions.get(symbol)
+        return (position.quantity, position.orderable) if position is not None else (0, 0)
+
+    def apply(self, execution: KisRealtimeExecution) -> bool:
+        """
+        실시간 체결 통보를 장부에 반영합니다.
+
+        Args:
+            execution (KisRealtimeExecution): 실시간 체결 통보
+
+        Returns:
+            bool: 장부에 반영했는지 여부
+        """
+        if execution.account_number != self.account_number or not self.covers(get_market_country(execution.market)):
+            return False
+
+        with self._lock:
+            if not self._update(execution, self._positions, self._deposits, self._reserved):
+                return False
+
+            if self._inflight is not None:
+                self._inflight.append(execution)
+
+            if execution.rejected or execution.canceled or execution.receipt:
+                self._stats.receipts += 1
+            else:
+                self._stats.executions += 1
+
+        return True
+
+    @staticmethod
+    def _update(
+        execution: KisRealtimeExecution,
+        positions: dict[str, KisAccountBookPosition],
+        deposits: dict[CURRENCY_TYPE, Decimal],
+        reserved: dict["KisOrderNumber", ORDER_QUANTITY],
+    ) -> bool:
+        """체결 통보를 주어진 보유종목, 예수금, 매도 예약 수량에 반영합니다."""
+        if execution.rejected or execution.canceled:
+            if (remaining := reserved.pop(execution.order_number, None)) and (
+                position := positions.get(execution.symbol)
+            ):
+                position.orderable += remaining
+
+            return True
+
+        if execution.receipt:
+            if execution.type == "sell" and (position := positions.get(execution.symbol)):
+                quantity = min(execution.quantity, position.orderable)
+                position.orderable -= quantity
+                reserved[execution.order_number] = reserved.get(execution.order_number, 0) + quantity
+
+            return True
+
+        if (quantity := execution.executed_quantity) <= 0:
+            return False
+
+        amount = execution.executed_amount
+        currency = get_market_currency(execution.market)
+
+        if (position := positions.get(execution.symbol)) is None:
+            position = positions[execution.symbol] = KisAccountBookPosition(
+                market=execution.market,
+                symbol=execution.symbol,
+            )
+
+        if execution.type == "buy":
+            position.quantity += quantity
+            position.orderable += quantity
+            position.purchase_amount += amount
+            deposits[currency] = deposits.get(currency, Decimal(0)) - amount
+        else:
+            position.purchase_amount -= position.purchase_price * min(quantity, position.quantity)
+            position.quantity -= quantity
+
+            if remaining := reserved.get(execution.order_number):
+                released = min(remaining, quantity)
+
+                if remaining > released:
+                    reserved[execution.order_number] = remaining - released
+                else:
+                    del reserved[execution.order_number]
+            else:
+                released = 0
+
+            position.orderable -= quantity - released
+            deposits[currency] = deposits.get(currency, Decimal(0)) + amount
+
+            if position.quantity <= 0:
+                del positions[execution.symbol]
+
+        return True
+
+    def _on_execution(self, sender: "KisWebsocketClient", e: KisSubscriptionEventArgs[KisRealtimeExecution]):
+        self.apply(e.response)
+
+    def _run(self):
+        while not self._stop.wait(self.reconcile_interval):
+            try:
+                self.reconcile()
+            except Exception as e:
+                logging.logger.warning("계좌 장부 대사에 실패했습니다: %s", e)
+
+    def start(self) -> "KisAccountBook":
+        """
+        체결 통보를 구독하고 잔고를 조회하여 장부를 초기화합니다.
+
+        잔고 조회 전에 구독하므로, 초기화 중 체결된 주문은 조회 결과에 포함된 것으로 간주합니다.
+        """
+        if self.running:
+            return self
+
+        self._ticket = on_execution(self.kis.websocket, self._on_execution)
+
+        try:
+            self.reconcile()
+        except Exception:
+            self._ticket.unsubscribe()
+            self._ticket = None
+            raise
+
+        if self.reconcile_interval is not None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pykis-account-book", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self):
+        """체결 통보 구독과 대사를 중단합니다."""
+        self._stop.set()
+
+        if (ticket := self._ticket) is not None:
+            self._ticket = None
+            ticket.unsubscribe()
+
+        if (thread := self._thread) is not None and thread is not threading.current_thread():
+            thread.join()
+
+        self._thread = None
+
+    def __enter__(self) -> "KisAccountBook":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(account_number={self.account_number!r}, country={self.country!r}, "
+            f"positions={len(self._positions)}, running={self.running})"
+        )
+
+
+def get_book(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+) -> KisAccountBook | None:
+    """
+    해당 계좌와 국가의 잔고를 관리하는 실행 중인 실시간 계좌 장부를 반환합니다.
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE | None, optional): 국가코드
+    """
+    # 장부를 사용하지 않는 PyKis 대역 객체는 잔고 조회로 대체합니다.
+    if not getattr(self, "books", None):
+        return None
+
+    if not isinstance(account, KisAccountNumber):
+        account = KisAccountNumber(account)
+
+    if isinstance(book := self.books.get(account), KisAccountBook) and book.running and book.covers(country):
+        return book
+
+    return None
+
+
+def book(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    reconcile_interval: float | None = 60,
+) -> KisAccountBook:
+    """
+    실시간 계좌 장부를 시작합니다.
+
+    장부가 실행 중인 동안 보유수량, 매도가능수량, 매입금액 조회와 전량 매도 주문의 매도가능수량 조회는 잔고를 조회하지 않고 장부를 사용합니다.
+    이미 실행 중인 장부가 요청한 국가의 잔고를 관리하면 해당 장부를 반환하고,
+    그렇지 않으면 기존 장부를 중단하고 국내 및 해외 잔고를 모두 관리하는 장부로 교체합니다.
+
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+    해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+    [국내주식] 실시간시세 -> 국내주식 실시간체결통보[실시간-005]
+    [해외주식] 실시간시세 -> 해외주식 실시간체결통보[실시간-009]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE | None, optional): 국가코드. None이면 국내 및 해외 잔고를 모두 관리합니다.
+        reconcile_interval (float | None, optional): 잔고 조회 대사 주기 (초). Defaults to 60.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    if not isinstance(account, KisAccountNumber):
+        account = KisAccountNumber(account)
+
+    if (current := self.books.get(account)) is not None and current.running:
+        if current.covers(country):
+            return current
+
+        # 실행 중인 장부가 요청한 국가를 관리하지 않으면 국내 및 해외 잔고를 모두 관리하는 장부로 교체합니다.
+        current.stop()
+        country = None
+
+    self.books[account] = book = KisAccountBook(
+        self,
+        account_number=account,
+        country=country,
+        reconcile_interval=reconcile_interval,
+    )
+
+    return book.start()
+
+
+def account_book(
+    self: "KisAccountProtocol",
+    country: COUNTRY_TYPE | None = None,
+    reconcile_interval: float | None = 60,
+) -> KisAccountBook:
+    """
+    실시간 계좌 장부를 시작합니다.
+
+    장부가 실행 중인 동안 보유수량, 매도가능수량, 매입금액 조회와 전량 매도 주문의 매도가능수량 조회는 잔고를 조회하지 않고 장부를 사용합니다.
+    이미 실행 중인 장부가 요청한 국가의 잔고를 관리하면 해당 장부를 반환하고,
+    그렇지 않으면 기존 장부를 중단하고 국내 및 해외 잔고를 모두 관리하는 장부로 교체합니다.
+
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+    해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+    [국내주식] 실시간시세 -> 국내주식 실시간체결통보[실시간-005]
+    [해외주식] 실시간시세 -> 해외주식 실시간체결통보[실시간-009]
+
+    Args:
+        country (COUNTRY_TYPE | None, optional): 국가코드. None이면 국내 및 해외 잔고를 모두 관리합니다.
+        reconcile_interval (float | None, optional): 잔고 조회 대사 주기 (초). Defaults to 60.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return book(
+        self.kis,
+        account=self.account_number,
+        country=country,
+        reconcile_interval=reconcile_interval,
+    )
@@ -1,7 +1,8 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Iterable, Protocol, runtime_checkable
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Protocol, runtime_checkable
 from zoneinfo import ZoneInfo
 
 from pykis.api.account.order import (
@@ -26,20 +27,23 @@ from pykis.api.stock.market import (
     get_market_timezone,
 )
 from pykis.client.account import KisAccountNumber
-from pykis.client.page import KisPage
+from pykis.client.page import KisPage, collect_pages, iter_pages
 from pykis.responses.dynamic import KisDynamic, KisList, KisTransform
 from pykis.responses.response import KisPaginationAPIResponse
 from pykis.responses.types import KisAny, KisDecimal, KisString
+from pykis.utils.batch import batch_map
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
 
 if TYPE_CHECKING:
+    from pykis.client.journal import KisJournal
     from pykis.kis import PyKis
 
 __all__ = [
     "KisDailyOrder",
     "KisDailyOrders",
     "daily_orders",
+    "iter_daily_orders",
 ]
 
 
@@ -605,15 +609,14 @@ DOMESTIC_DAILY_ORDERS_API_CODES: dict[tuple[bool, bool], str] = {
 }
 
 
-def _domestic_daily_orders(
+def _iter_domestic_daily_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
     start: date,
     end: date,
     type: ORDER_TYPE | None = None,
     page: KisPage | None = None,
-    continuous: bool = True,
-) -> KisDomesticDailyOrders:
+) -> Iterator[KisDomesticDailyOrders]:
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
@@ -627,11 +630,8 @@ def _domestic_daily_orders(
     if end.month + (now.year - end.year) * 12 - now.month > 3 and is_recent:
         raise ValueError("조회 기간은 최근 3개월 이내거나 3개월 이상이어야 합니다.")
 
-    page = (page or KisPage.first()).to(100)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/domestic-stock/v1/trading/inquire-daily-ccld",
             api=DOMESTIC_DAILY_ORDERS_API_CODES[(not self.virtual, is_recent)],
             params={
@@ -654,19 +654,38 @@ def _domestic_daily_orders(
             response_type=KisDomesticDailyOrders(
                 account_number=account,
             ),
-        )
+        ),
+        (page or KisPage.first()).to(100),
+    )
 
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
 
-        if not continuous or result.is_last:
-            break
+def _domestic_daily_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date,
+    type: ORDER_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+) -> KisDomesticDailyOrders:
+    return collect_pages(
+        _iter_domestic_daily_orders(self, account, start, end, type=type, page=page),
+        lambda result: result.orders,
+        continuous=continuous,
+    )
 
-        page = result.next_page
 
-    return first
+def _domestic_daily_order_ranges(start: date, end: date) -> list[tuple[date, date]]:
+    """조회 기간을 최근 3개월 이내 구간과 이전 구간으로 나눕니다."""
+    now = datetime.now(TIMEZONE).date()
+
+    if (now.year - start.year) * 12 - now.month <= 3 and (now.year - end.year) * 12 - now.month <= 3:
+        return [(start, end)]
+
+    split_start = now - timedelta(days=90)
+    split_start = date(split_start.year, split_start.month, 1)
+
+    return [(split_start, end), (start, split_start - timedelta(days=1))]
 
 
 def domestic_daily_orders(
@@ -697,58 +716,91 @@ def domestic_daily_orders(
     if start > end:
         start, end = end, start
 
-    now = datetime.now(TIMEZONE).date()
+    first = None
 
-    if (now.year - start.year) * 12 - now.month <= 3 and (now.year - end.year) * 12 - now.month <= 3:
-        return _domestic_daily_orders(
+    for range_start, range_end in _domestic_daily_order_ranges(start, end):
+        result = _domestic_daily_orders(
             self,
             account=account,
-            start=start,
-            end=end,
+            start=range_start,
+            end=range_end,
         )
 
-    split_start = now - timedelta(days=90)
-    split_start = date(split_start.year, split_start.month, 1)
+        if first is None:
+            first = result
+        else:
+            first.orders.extend(result.orders)
 
-    first = _domestic_daily_orders(
-        self,
-        account=account,
-        start=split_start,
-        end=end,
-    )
+    return first  # type: ignore
+
+
+def iter_domestic_daily_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisDomesticDailyOrders]:
+    """
+    한국투자증권 국내 체결내역 페이지 단위 조회
+
+    국내주식주문 -> 주식일별주문체결조회[v1_국내주식-005]
+    (업데이트 날짜: 2024/04/02)
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        start (date): 조회 시작일
+        end (date, optional): 조회 종료일
+        page (KisPage, optional): 페이지 정보
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+        ValueError: 최근 3개월 이전을 포함하는 기간을 이어서 조회하는 경우
+    """
+    if end is None:
+        end = datetime.now(TIMEZONE).date()
+
+    if start > end:
+        start, end = end, start
 
-    first.orders.extend(
-        _domestic_daily_orders(
+    ranges = _domestic_daily_order_ranges(start, end)
+
+    # 최근 3개월 이내와 이전 구간은 서로 다른 API로 조회하므로, 하나의 페이지 커서로 이어서 조회할 수 없습니다.
+    if page is not None and not page.is_first and len(ranges) > 1:
+        raise ValueError("최근 3개월 이전을 포함하는 기간은 이어서 조회할 수 없습니다.")
+
+    return chain.from_iterable(
+        _iter_domestic_daily_orders(
             self,
             account=account,
-            start=start,
-            end=split_start - timedelta(days=1),
-        ).orders
+            start=range_start,
+            end=range_end,
+            page=page,
+        )
+        for range_start, range_end in ranges
     )
 
-    return first
-
 
-def _internal_foreign_daily_orders(
+def _iter_internal_foreign_daily_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
     start: date,
     end: date,
     market: MARKET_TYPE | None = None,
     page: KisPage | None = None,
-    continuous: bool = True,
-) -> KisForeignDailyOrders:
+) -> Iterator[KisForeignDailyOrders]:
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
     if start > end:
         start, end = end, start
 
-    page = (page or KisPage.first()).to(200)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/overseas-stock/v1/trading/inquire-ccnl",
             api="VTTS3035R" if self.virtual else "TTTS3035R",
             params={
@@ -771,19 +823,25 @@ def _internal_foreign_daily_orders(
             response_type=KisForeignDailyOrders(
                 account_number=account,
             ),
-        )
-
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
-
-        if not continuous or result.is_last:
-            break
+        ),
+        (page or KisPage.first()).to(200),
+    )
 
-        page = result.next_page
 
-    return first
+def _internal_foreign_daily_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+) -> KisForeignDailyOrders:
+    return collect_pages(
+        _iter_internal_foreign_daily_orders(self, account, start, end, market=market, page=page),
+        lambda result: result.orders,
+        continuous=continuous,
+    )
 
 
 FOREIGN_COUNTRY_MARKET_MAP: dict[str | None, list[MARKET_TYPE | None]] = {
@@ -826,36 +884,142 @@ def foreign_daily_orders(
 
     markets = FOREIGN_COUNTRY_MARKET_MAP.get(country, FOREIGN_COUNTRY_MARKET_MAP[None])
 
-    first = None
+    if not markets:
+        raise ValueError("Invalid country code")
 
-    for market in markets:
-        result = _internal_foreign_daily_orders(
+    # 시장별 조회는 서로 독립적이므로 동시에 요청합니다.
+    first, *rest = batch_map(
+        lambda market: _internal_foreign_daily_orders(
             self,
             account=account,
             start=start,
             end=end,
             market=market,
-        )
+        ),
+        markets,
+    )
 
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
-
-    if first is None:
-        raise ValueError("Invalid country code")
+    for result in rest:
+        first.orders.extend(result.orders)
 
     first.orders.sort(key=lambda x: x.time_kst, reverse=True)
 
     return first
 
 
+def iter_foreign_daily_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date | None = None,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisForeignDailyOrders]:
+    """
+    한국투자증권 해외 체결내역 페이지 단위 조회
+
+    국내주식주문 -> 해외주식 주문체결내역[v1_해외주식-007]
+    (업데이트 날짜: 2024/04/02)
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+    페이지 단위로 반환하므로 `foreign_daily_orders`와 달리 시장 간 주문 시각 정렬은 하지 않습니다.
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        start (date): 조회 시작일
+        end (date, optional): 조회 종료일
+        country (COUNTRY_TYPE, optional): 국가코드
+        page (KisPage, optional): 페이지 정보
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+        ValueError: 여러 시장을 조회하는 국가를 이어서 조회하는 경우
+    """
+    if end is None:
+        end = datetime.now(TIMEZONE).date()
+
+    markets = FOREIGN_COUNTRY_MARKET_MAP.get(country, FOREIGN_COUNTRY_MARKET_MAP[None])
+
+    if page is not None and not page.is_first and len(markets) > 1:
+        raise ValueError("여러 시장을 조회하는 국가는 이어서 조회할 수 없습니다.")
+
+    return chain.from_iterable(
+        _iter_internal_foreign_daily_orders(
+            self,
+            account=account,
+            start=start,
+            end=end,
+            market=market,
+            page=page,
+        )
+        for market in markets
+    )
+
+
+def _journal_daily_orders(
+    self: "PyKis",
+    account: KisAccountNumber,
+    start: date,
+    end: date | None,
+    country: COUNTRY_TYPE | None,
+    journal: "KisJournal",
+) -> KisDailyOrders:
+    today = datetime.now(TIMEZONE).date()
+
+    if end is None:
+        end = today
+
+    if start > end:
+        start, end = end, start
+
+    def sync(leg: COUNTRY_TYPE | None) -> list[KisDailyOrder]:
+        return journal.sync(
+            self,
+            account,
+            kind=f"daily_orders:{leg or 'foreign'}",
+            start=start,
+            end=end,
+            fetch=lambda start, end: (
+                domestic_daily_orders(self, account=account, start=start, end=end)
+                if leg == "KR"
+                else foreign_daily_orders(self, account=account, start=start, end=end, country=leg)
+            ).orders,
+            day=lambda order: order.time_kst.date(),
+            key=lambda order: f"{order.time_kst:%Y%m%d}:{order.order_number.branch}:{order.order_number.number}",
+            # 해외 주문은 현지 거래일이 한국시간 다음날까지 이어지므로 하루 늦게 확정합니다.
+            final=today - timedelta(days=1 if leg == "KR" else 2),
+        )
+
+    if country is None:
+        result = KisIntegrationDailyOrders(self, account)
+        legs = ["KR", None]
+    else:
+        # 국가를 지정한 경우 API 조회와 같은 응답 타입을 반환합니다.
+        result = KisDomesticDailyOrders(account) if country == "KR" else KisForeignDailyOrders(account)
+        result.kis = self
+        result.page_status = "end"
+        result.next_page = KisPage.first()
+        result.orders = []
+        legs = [country]
+
+    for orders in batch_map(sync, legs):
+        # 기록은 주문번호 오름차순이므로, 같은 시각의 주문도 API와 같이 최근 주문이 앞에 오도록 뒤집습니다.
+        result.orders.extend(reversed(orders))
+
+    result.orders.sort(key=lambda x: x.time_kst, reverse=True)
+
+    return result
+
+
 def daily_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
     start: date,
     end: date | None = None,
     country: COUNTRY_TYPE | None = None,
+    journal: "KisJournal | None" = None,
 ) -> KisDailyOrders:
     """
     한국투자증권 통합일별 체결내역 조회
@@ -868,6 +1032,7 @@ def daily_orders(
         start (date): 조회 시작일
         end (date, optional): 조회 종료
         country (COUNTRY_TYPE, optional): 국가코드
+        journal (KisJournal, optional): 조회 기록. 지정하면 기록의 동기화 기준일 이후와 기록에 없는 기간만 조회합니다.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -876,17 +1041,92 @@ def daily_orders(
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
+    if journal is not None:
+        return _journal_daily_orders(self, account, start, end, country, journal)
+
     if country is None:
+        # 국내 및 해외 체결내역 조회는 서로 독립적이므로 동시에 요청합니다.
         return KisIntegrationDailyOrders(
             self,
             account,
-            domestic_daily_orders(
+            *batch_map(
+                lambda fetch: fetch(
+                    self,
+                    account=account,
+                    start=start,
+                    end=end,
+                ),
+                (domestic_daily_orders, foreign_daily_orders),
+            ),
+        )
+    elif country == "KR":
+        return domestic_daily_orders(
+            self,
+            account=account,
+            start=start,
+            end=end,
+        )
+    else:
+        return foreign_daily_orders(
+            self,
+            account=account,
+            start=start,
+            end=end,
+            country=country,
+        )
+
+
+def iter_daily_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date | None = None,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisDailyOrders]:
+    """
+    한국투자증권 통합일별 체결내역 페이지 단위 조회
+
+    국내주식주문 -> 주식일별주문체결조회[v1_국내주식-005]
+    국내주식주문 -> 해외주식 주문체결내역[v1_해외주식-007]
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+    국가를 지정하지 않으면 국내 체결내역 페이지를 모두 반환한 뒤 해외 체결내역 페이지를 반환합니다.
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        start (date): 조회 시작일
+        end (date, optional): 조회 종료일
+        country (COUNTRY_TYPE, optional): 국가코드
+        page (KisPage, optional): 페이지 정보. 국가를 지정한 경우에만 이어서 조회할 수 있습니다.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+        ValueError: 이어서 조회할 수 없는 조회에 페이지 정보를 지정한 경우
+
+    Examples:
+        >>> for page in kis.account().iter_daily_orders(start=date(2024, 1, 1), country="KR"):
+        ...     for order in page.orders:
+        ...         print(order.symbol, order.executed_qty)
+        ...     cursor = page.next_page  # 중단 후 page=cursor로 이어서 조회
+    """
+    if not isinstance(account, KisAccountNumber):
+        account = KisAccountNumber(account)
+
+    if country is None:
+        if page is not None and not page.is_first:
+            raise ValueError("국내 및 해외 통합 조회는 이어서 조회할 수 없습니다. 국가를 지정해주세요.")
+
+        return chain(
+            iter_domestic_daily_orders(
                 self,
                 account=account,
                 start=start,
                 end=end,
             ),
-            foreign_daily_orders(
+            iter_foreign_daily_orders(
                 self,
                 account=account,
                 start=start,
@@ -894,19 +1134,21 @@ def daily_orders(
             ),
         )
     elif country == "KR":
-        return domestic_daily_orders(
+        return iter_domestic_daily_orders(
             self,
             account=account,
             start=start,
             end=end,
+            page=page,
         )
     else:
-        return foreign_daily_orders(
+        return iter_foreign_daily_orders(
             self,
             account=account,
             start=start,
             end=end,
             country=country,
+            page=page,
         )
 
 
@@ -915,6 +1157,7 @@ def account_daily_orders(
     start: date,
     end: date | None = None,
     country: COUNTRY_TYPE | None = None,
+    journal: "KisJournal | None" = None,
 ) -> KisDailyOrders:
     """
     한국투자증권 통합일별 체결내역 조회
@@ -926,6 +1169,7 @@ def account_daily_orders(
         start (date): 조회 시작일
         end (date): 조회 종료일
         country (COUNTRY_TYPE, optional): 국가코드
+        journal (KisJournal, optional): 조회 기록. 지정하면 기록의 동기화 기준일 이후와 기록에 없는 기간만 조회합니다.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -937,4 +1181,41 @@ def account_daily_orders(
         start=start,
         end=end,
         country=country,
+        journal=journal,
+    )
+
+
+def account_iter_daily_orders(
+    self: "KisAccountProtocol",
+    start: date,
+    end: date | None = None,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisDailyOrders]:
+    """
+    한국투자증권 통합일별 체결내역 페이지 단위 조회
+
+    국내주식주문 -> 주식일별주문체결조회[v1_국내주식-005]
+    국내주식주문 -> 해외주식 주문체결내역[v1_해외주식-007]
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
+    Args:
+        start (date): 조회 시작일
+        end (date): 조회 종료일
+        country (COUNTRY_TYPE, optional): 국가코드
+        page (KisPage, optional): 페이지 정보. 국가를 지정한 경우에만 이어서 조회할 수 있습니다.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return iter_daily_orders(
+        self.kis,
+        account=self.account_number,
+        start=start,
+        end=end,
+        country=country,
+        page=page,
     )
@@ -1,7 +1,8 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from functools import cached_property
-from typing import TYPE_CHECKING, Iterable, Protocol, runtime_checkable
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Iterator, Protocol, runtime_checkable
 from zoneinfo import ZoneInfo
 
 from pykis.api.account.order import ORDER_QUANTITY
@@ -18,21 +19,24 @@ from pykis.api.stock.market import (
     get_market_code_timezone,
 )
 from pykis.client.account import KisAccountNumber
-from pykis.client.page import KisPage
+from pykis.client.page import KisPage, collect_pages, iter_pages
 from pykis.responses.dynamic import KisDynamic, KisList, KisTransform
 from pykis.responses.response import KisPaginationAPIResponse
 from pykis.responses.types import KisAny, KisDecimal, KisString
+from pykis.utils.batch import batch_map
 from pykis.utils.math import safe_divide
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
 
 if TYPE_CHECKING:
+    from pykis.client.journal import KisJournal
     from pykis.kis import PyKis
 
 __all__ = [
     "KisOrderProfit",
     "KisOrderProfits",
     "order_profits",
+    "iter_order_profits",
 ]
 
 
@@ -518,26 +522,139 @@ class KisIntegrationOrderProfits(KisOrderProfitsBase):
         self.orders.sort(key=lambda x: x.time_kst, reverse=True)
 
 
-def domestic_order_profits(
+class KisJournalOrderProfits(KisOrderProfitsBase):
+    """한국투자증권 조회 기록 기반 매매손익"""
+
+    account_number: KisAccountNumber
+    """계좌번호"""
+    orders: list[KisOrderProfit]
+    """매매손익"""
+
+    _start: date
+    _end: date
+    _country: COUNTRY_TYPE | None
+
+    # Pylance bug: cached_property[Decimal] type inference error.
+    @cached_property
+    def fees(self) -> Decimal:  # type: ignore
+        """
+        수수료 조회 (모의투자 미지원)
+
+        조회 기록에는 수수료가 없으므로 처음 조회할 때 API로 조회합니다.
+
+        국내주식주문 -> 기간별매매손익현황조회[v1_국내주식-060]
+        국내주식주문 -> 해외주식 기간손익[v1_해외주식-032]
+        """
+        fees = Decimal(0)
+
+        if self._country is None or self._country == "KR":
+            fees += domestic_order_profits(
+                self.kis,
+                account=self.account_number,
+                start=self._start,
+                end=self._end,
+                continuous=False,
+            ).fees
+
+        if self._country != "KR":
+            fees += foreign_order_fees(
+                self.kis,
+                account=self.account_number,
+                start=self._start,
+                end=self._end,
+                country=self._country,
+            )
+
+        return fees
+
+    fees: Decimal
+
+    def __init__(
+        self,
+        kis: "PyKis",
+        account_number: KisAccountNumber,
+        orders: list[KisOrderProfit],
+        start: date,
+        end: date,
+        country: COUNTRY_TYPE | None = None,
+    ):
+        super().__init__()
+        self.kis = kis
+        self.account_number = account_number
+        self.orders = orders
+        self._start = start
+        self._end = end
+        self._country = country
+
+        self.orders.sort(key=lambda x: x.time_kst, reverse=True)
+
+
+class KisJournalDomesticOrderProfits(KisDomesticOrderProfits):
+    """한국투자증권 조회 기록 기반 국내 매매손익"""
+
+    _start: date
+    _end: date
+
+    # Pylance bug: cached_property[Decimal] type inference error.
+    @cached_property
+    def fees(self) -> Decimal:  # type: ignore
+        """
+        수수료 조회 (모의투자 미지원)
+
+        조회 기록에는 수수료가 없으므로 처음 조회할 때 API로 조회합니다.
+
+        국내주식주문 -> 기간별매매손익현황조회[v1_국내주식-060]
+        """
+        return domestic_order_profits(
+            self.kis,
+            account=self.account_number,
+            start=self._start,
+            end=self._end,
+            continuous=False,
+        ).fees
+
+    fees: Decimal
+
+    def __init__(
+        self,
+        kis: "PyKis",
+        account_number: KisAccountNumber,
+        orders: list[KisOrderProfit],
+        start: date,
+        end: date,
+    ):
+        super().__init__(account_number)
+        self.kis = kis
+        self.orders = orders
+        self.page_status = "end"
+        self.next_page = KisPage.first()
+        self._start = start
+        self._end = end
+
+        self.orders.sort(key=lambda x: x.time_kst, reverse=True)
+
+
+def iter_domestic_order_profits(
     self: "PyKis",
     account: str | KisAccountNumber,
     start: date,
     end: date | None = None,
     page: KisPage | None = None,
-    continuous: bool = True,
-) -> KisDomesticOrderProfits:
+) -> Iterator[KisDomesticOrderProfits]:
     """
-    한국투자증권 국내 기간 손익 조회
+    한국투자증권 국내 기간 손익 페이지 단위 조회
 
     국내주식주문 -> 기간별매매손익현황조회[v1_국내주식-060] (모의투자 미지원)
     (업데이트 날짜: 2024/04/03)
 
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
     Args:
         account (str | KisAccountNumber): 계좌번호
         start (date): 조회 시작일
         end (date | None, optional): 조회 종료일
         page (KisPage, optional): 페이지 정보
-        continuous (bool, optional): 연속조회 여부
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -555,11 +672,8 @@ def domestic_order_profits(
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    page = (page or KisPage.first()).to(100)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/domestic-stock/v1/trading/inquire-period-trade-profit",
             api="TTTC8715R",
             params={
@@ -577,19 +691,41 @@ def domestic_order_profits(
             response_type=KisDomesticOrderProfits(
                 account_number=account,
             ),
-        )
+        ),
+        (page or KisPage.first()).to(100),
+    )
 
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
 
-        if not continuous or result.is_last:
-            break
+def domestic_order_profits(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+) -> KisDomesticOrderProfits:
+    """
+    한국투자증권 국내 기간 손익 조회
+
+    국내주식주문 -> 기간별매매손익현황조회[v1_국내주식-060] (모의투자 미지원)
+    (업데이트 날짜: 2024/04/03)
 
-        page = result.next_page
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        start (date): 조회 시작일
+        end (date | None, optional): 조회 종료일
+        page (KisPage, optional): 페이지 정보
+        continuous (bool, optional): 연속조회 여부
 
-    return first
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return collect_pages(
+        iter_domestic_order_profits(self, account, start, end=end, page=page),
+        lambda result: result.orders,
+        continuous=continuous,
+    )
 
 
 FOREIGN_ORDER_PROFIT_MARKET_MAP: dict[COUNTRY_TYPE, MARKET_TYPE] = {
@@ -601,28 +737,29 @@ FOREIGN_ORDER_PROFIT_MARKET_MAP: dict[COUNTRY_TYPE, MARKET_TYPE] = {
 }
 
 
-def foreign_order_profits(
+def iter_foreign_order_profits(
     self: "PyKis",
     account: str | KisAccountNumber,
     start: date,
     end: date | None = None,
     country: COUNTRY_TYPE | None = None,
     page: KisPage | None = None,
-    continuous: bool = True,
-) -> KisForeignOrderProfits:
+) -> Iterator[KisForeignOrderProfits]:
     """
-    한국투자증권 해외 기간 손익 조회
+    한국투자증권 해외 기간 손익 페이지 단위 조회
 
     국내주식주문 -> 해외주식 기간손익[v1_해외주식-032] (모의투자 미지원)
     (업데이트 날짜: 2024/04/03)
 
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
     Args:
         account (str | KisAccountNumber): 계좌번호
         start (date): 조회 시작일
         end (date | None, optional): 조회 종료일
         country (COUNTRY_TYPE, optional): 국가
         page (KisPage, optional): 페이지 정보
-        continuous (bool, optional): 연속조회 여부
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -640,11 +777,8 @@ def foreign_order_profits(
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    page = (page or KisPage.first()).to(200)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/overseas-stock/v1/trading/inquire-period-profit",
             api="TTTS3039R",
             params={
@@ -667,19 +801,43 @@ def foreign_order_profits(
                 end=end,
                 country=country,
             ),
-        )
+        ),
+        (page or KisPage.first()).to(200),
+    )
 
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
 
-        if not continuous or result.is_last:
-            break
+def foreign_order_profits(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date | None = None,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+) -> KisForeignOrderProfits:
+    """
+    한국투자증권 해외 기간 손익 조회
 
-        page = result.next_page
+    국내주식주문 -> 해외주식 기간손익[v1_해외주식-032] (모의투자 미지원)
+    (업데이트 날짜: 2024/04/03)
 
-    return first
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        start (date): 조회 시작일
+        end (date | None, optional): 조회 종료일
+        country (COUNTRY_TYPE, optional): 국가
+        page (KisPage, optional): 페이지 정보
+        continuous (bool, optional): 연속조회 여부
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return collect_pages(
+        iter_foreign_order_profits(self, account, start, end=end, country=country, page=page),
+        lambda result: result.orders,
+        continuous=continuous,
+    )
 
 
 def foreign_order_fees(
@@ -737,12 +895,68 @@ def foreign_order_fees(
     return Decimal(result.output2.smtl_fee1)
 
 
+def _journal_order_profits(
+    self: "PyKis",
+    account: KisAccountNumber,
+    start: date,
+    end: date | None,
+    country: COUNTRY_TYPE | None,
+    journal: "KisJournal",
+) -> KisOrderProfits:
+    today = datetime.now(TIMEZONE).date()
+
+    if end is None:
+        end = today
+
+    if start > end:
+        start, end = end, start
+
+    def sync(leg: COUNTRY_TYPE | None) -> list[KisOrderProfit]:
+        return journal.sync(
+            self,
+            account,
+            kind=f"order_profits:{leg or 'foreign'}",
+            start=start,
+            end=end,
+            fetch=lambda start, end: (
+                domestic_order_profits(self, account=account, start=start, end=end)
+                if leg == "KR"
+                else foreign_order_profits(self, account=account, start=start, end=end, country=leg)
+            ).orders,
+            day=lambda order: order.time_kst.date(),
+            # 해외 주문은 현지 거래일이 한국시간 다음날까지 이어지므로 하루 늦게 확정합니다.
+            final=today - timedelta(days=1 if leg == "KR" else 2),
+        )
+
+    # 국가를 지정한 경우 API 조회와 같은 응답 타입을 반환합니다.
+    if country == "KR":
+        return KisJournalDomesticOrderProfits(self, account, sync(country), start=start, end=end)
+
+    if country is not None:
+        result = KisForeignOrderProfits(account, start=start, end=end, country=country)
+        result.kis = self
+        result.orders = sync(country)
+        result.page_status = "end"
+        result.next_page = KisPage.first()
+        result.orders.sort(key=lambda x: x.time_kst, reverse=True)
+
+        return result
+
+    orders = []
+
+    for rows in batch_map(sync, ["KR", None]):
+        orders.extend(rows)
+
+    return KisJournalOrderProfits(self, account, orders, start=start, end=end, country=country)
+
+
 def order_profits(
     self: "PyKis",
     account: str | KisAccountNumber,
     start: date,
     end: date | None = None,
     country: COUNTRY_TYPE | None = None,
+    journal: "KisJournal | None" = None,
 ) -> KisOrderProfits:
     """
     한국투자증권 통합 기간 손익 조회
@@ -756,6 +970,7 @@ def order_profits(
         start (date): 조회 시작일
         end (date | None, optional): 조회 종료일
         country (COUNTRY_TYPE, optional): 국가
+        journal (KisJournal, optional): 조회 기록. 지정하면 기록의 동기화 기준일 이후와 기록에 없는 기간만 조회합니다.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -764,6 +979,9 @@ def order_profits(
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
+    if journal is not None:
+        return _journal_order_profits(self, account, start, end, country, journal)
+
     if country is None:
         return KisIntegrationOrderProfits(
             self,
@@ -798,11 +1016,83 @@ def order_profits(
         )
 
 
+def iter_order_profits(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    start: date,
+    end: date | None = None,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisOrderProfits]:
+    """
+    한국투자증권 통합 기간 손익 페이지 단위 조회
+
+    국내주식주문 -> 기간별매매손익현황조회[v1_국내주식-060] (모의투자 미지원)
+    국내주식주문 -> 해외주식 기간손익[v1_해외주식-032] (모의투자 미지원)
+    (업데이트 날짜: 2024/04/03)
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+    국가를 지정하지 않으면 국내 손익 페이지를 모두 반환한 뒤 해외 손익 페이지를 반환합니다.
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        start (date): 조회 시작일
+        end (date | None, optional): 조회 종료일
+        country (COUNTRY_TYPE, optional): 국가
+        page (KisPage, optional): 페이지 정보. 국가를 지정한 경우에만 이어서 조회할 수 있습니다.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+        ValueError: 국가를 지정하지 않고 페이지 정보를 지정한 경우
+    """
+    if not isinstance(account, KisAccountNumber):
+        account = KisAccountNumber(account)
+
+    if country is None:
+        if page is not None and not page.is_first:
+            raise ValueError("국내 및 해외 통합 조회는 이어서 조회할 수 없습니다. 국가를 지정해주세요.")
+
+        return chain(
+            iter_domestic_order_profits(
+                self,
+                account=account,
+                start=start,
+                end=end,
+            ),
+            iter_foreign_order_profits(
+                self,
+                account=account,
+                start=start,
+                end=end,
+            ),
+        )
+    elif country == "KR":
+        return iter_domestic_order_profits(
+            self,
+            account=account,
+            start=start,
+            end=end,
+            page=page,
+        )
+    else:
+        return iter_foreign_order_profits(
+            self,
+            account=account,
+            start=start,
+            end=end,
+            country=country,
+            page=page,
+        )
+
+
 def account_order_profits(
     self: "KisAccountProtocol",
     start: date,
     end: date | None = None,
     country: COUNTRY_TYPE | None = None,
+    journal: "KisJournal | None" = None,
 ) -> KisOrderProfits:
     """
     한국투자증권 통합 기간 손익 조회
@@ -816,6 +1106,7 @@ def account_order_profits(
         start (date): 조회 시작일
         end (date): 조회 종료일
         country (COUNTRY_TYPE, optional): 국가
+        journal (KisJournal, optional): 조회 기록. 지정하면 기록의 동기화 기준일 이후와 기록에 없는 기간만 조회합니다.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -827,4 +1118,42 @@ def account_order_profits(
         start=start,
         end=end,
         country=country,
+        journal=journal,
+    )
+
+
+def account_iter_order_profits(
+    self: "KisAccountProtocol",
+    start: date,
+    end: date | None = None,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisOrderProfits]:
+    """
+    한국투자증권 통합 기간 손익 페이지 단위 조회
+
+    국내주식주문 -> 기간별매매손익현황조회[v1_국내주식-060] (모의투자 미지원)
+    국내주식주문 -> 해외주식 기간손익[v1_해외주식-032] (모의투자 미지원)
+    (업데이트 날짜: 2024/04/03)
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
+    Args:
+        start (date): 조회 시작일
+        end (date | None, optional): 조회 종료일
+        country (COUNTRY_TYPE, optional): 국가
+        page (KisPage, optional): 페이지 정보. 국가를 지정한 경우에만 이어서 조회할 수 있습니다.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return iter_order_profits(
+        self.kis,
+        account=self.account_number,
+        start=start,
+        end=end,
+        country=country,
+        page=page,
     )
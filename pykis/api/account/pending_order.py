@@ -1,6 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Iterable, Protocol, runtime_checkable
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Protocol, runtime_checkable
 from zoneinfo import ZoneInfo
 
 from typing_extensions import deprecated
@@ -35,11 +36,12 @@ from pykis.api.stock.market import (
     get_market_code_timezone,
 )
 from pykis.client.account import KisAccountNumber
-from pykis.client.page import KisPage
+from pykis.client.page import KisPage, collect_pages, iter_pages
 from pykis.event.filters.order import KisOrderNumberEventFilter
 from pykis.responses.dynamic import KisDynamic, KisList
 from pykis.responses.response import KisPaginationAPIResponse
 from pykis.responses.types import KisAny, KisDecimal, KisString
+from pykis.utils.batch import batch_map
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
 from pykis.utils.typing import Checkable
@@ -51,6 +53,8 @@ __all__ = [
     "KisPendingOrder",
     "KisPendingOrders",
     "pending_orders",
+    "iter_domestic_pending_orders",
+    "iter_foreign_pending_orders",
 ]
 
 
@@ -671,22 +675,23 @@ class KisSimplePendingOrders(KisPendingOrdersBase):
         self.orders.sort(key=lambda x: x.time_kst, reverse=True)
 
 
-def domestic_pending_orders(
+def iter_domestic_pending_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
     page: KisPage | None = None,
-    continuous: bool = True,
-) -> KisDomesticPendingOrders:
+) -> Iterator[KisDomesticPendingOrders]:
     """
-    한국투자증권 국내 주식 미체결 조회 (모의투자 미지원)
+    한국투자증권 국내 주식 미체결 페이지 단위 조회 (모의투자 미지원)
 
     국내주식주문 -> 주식정정취소가능주문조회[v1_국내주식-004]
     (업데이트 날짜: 2024/03/31)
 
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+
     Args:
         account (str | KisAccountNumber): 계좌번호
         page (KisPage, optional): 페이지 정보
-        continuous (bool, optional): 연속조회 여부
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -698,11 +703,8 @@ def domestic_pending_orders(
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    page = (page or KisPage.first()).to(100)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/domestic-stock/v1/trading/inquire-psbl-rvsecncl",
             api="TTTC8036R",
             params={
@@ -717,37 +719,25 @@ def domestic_pending_orders(
             response_type=KisDomesticPendingOrders(
                 account_number=account,
             ),
-        )
-
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
-
-        if not continuous or result.is_last:
-            break
-
-        page = result.next_page
-
-    return first
+        ),
+        (page or KisPage.first()).to(100),
+    )
 
 
-def _foreign_pending_orders(
+def domestic_pending_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
-    market: MARKET_TYPE | None = None,
     page: KisPage | None = None,
     continuous: bool = True,
-) -> KisForeignPendingOrders:
+) -> KisDomesticPendingOrders:
     """
-    한국투자증권 해외 주식 미체결 조회
+    한국투자증권 국내 주식 미체결 조회 (모의투자 미지원)
 
-    국내주식주문 -> 해외주식 미체결내역[v1_해외주식-005]
-    (업데이트 날짜: 2024/04/01)
+    국내주식주문 -> 주식정정취소가능주문조회[v1_국내주식-004]
+    (업데이트 날짜: 2024/03/31)
 
     Args:
         account (str | KisAccountNumber): 계좌번호
-        market (MARKET_TYPE, optional): 시장코드
         page (KisPage, optional): 페이지 정보
         continuous (bool, optional): 연속조회 여부
 
@@ -755,14 +745,24 @@ def _foreign_pending_orders(
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return collect_pages(
+        iter_domestic_pending_orders(self, account, page=page),
+        lambda result: result.orders,
+        continuous=continuous,
+    )
+
+
+def _iter_foreign_pending_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisForeignPendingOrders]:
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    page = (page or KisPage.first()).to(200)
-    first = None
-
-    while True:
-        result = self.fetch(
+    return iter_pages(
+        lambda page: self.fetch(
             "/uapi/overseas-stock/v1/trading/inquire-nccs",
             api="VTTS3018R" if self.virtual else "TTTS3018R",
             params={
@@ -777,19 +777,39 @@ def _foreign_pending_orders(
             response_type=KisForeignPendingOrders(
                 account_number=account,
             ),
-        )
+        ),
+        (page or KisPage.first()).to(200),
+    )
 
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
 
-        if not continuous or result.is_last:
-            break
+def _foreign_pending_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+) -> KisForeignPendingOrders:
+    """
+    한국투자증권 해외 주식 미체결 조회
 
-        page = result.next_page
+    국내주식주문 -> 해외주식 미체결내역[v1_해외주식-005]
+    (업데이트 날짜: 2024/04/01)
 
-    return first
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        market (MARKET_TYPE, optional): 시장코드
+        page (KisPage, optional): 페이지 정보
+        continuous (bool, optional): 연속조회 여부
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return collect_pages(
+        _iter_foreign_pending_orders(self, account, market=market, page=page),
+        lambda result: result.orders,
+        continuous=continuous,
+    )
 
 
 FOREIGN_COUNTRY_MARKET_MAP: dict[str | None, list[MARKET_TYPE | None]] = {
@@ -803,6 +823,45 @@ FOREIGN_COUNTRY_MARKET_MAP: dict[str | None, list[MARKET_TYPE | None]] = {
 }
 
 
+def iter_foreign_pending_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    page: KisPage | None = None,
+) -> Iterator[KisForeignPendingOrders]:
+    """
+    한국투자증권 해외 주식 미체결 페이지 단위 조회
+
+    국내주식주문 -> 해외주식 미체결내역[v1_해외주식-005]
+    (업데이트 날짜: 2024/04/01)
+
+    연속조회 응답이 도착하는 대로 한 페이지씩 반환하며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`를 `page`로 전달하면 해당 페이지 다음부터 이어서 조회합니다.
+    여러 시장을 조회하는 국가는 시장 순서대로 반환합니다.
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE, optional): 국가코드
+        page (KisPage, optional): 페이지 정보
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+        ValueError: 여러 시장을 조회하는 국가를 이어서 조회하는 경우
+    """
+    markets = FOREIGN_COUNTRY_MARKET_MAP.get(country, FOREIGN_COUNTRY_MARKET_MAP[None])
+
+    if not markets:
+        raise ValueError("Invalid country code")
+
+    if page is not None and not page.is_first and len(markets) > 1:
+        raise ValueError("여러 시장을 조회하는 국가는 이어서 조회할 수 없습니다.")
+
+    return chain.from_iterable(
+        _iter_foreign_pending_orders(self, account, market=market, page=page) for market in markets
+    )
+
+
 def foreign_pending_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
@@ -824,18 +883,14 @@ def foreign_pending_orders(
     """
     markets = FOREIGN_COUNTRY_MARKET_MAP.get(country, FOREIGN_COUNTRY_MARKET_MAP[None])
 
-    first = None
-
-    for market in markets:
-        result = _foreign_pending_orders(self, account, market)
+    if not markets:
+        raise ValueError("Invalid country code")
 
-        if first is None:
-            first = result
-        else:
-            first.orders.extend(result.orders)
+    # 시장별 조회는 서로 독립적이므로 동시에 요청합니다.
+    first, *rest = batch_map(lambda market: _foreign_pending_orders(self, account, market), markets)
 
-    if first is None:
-        raise ValueError("Invalid country code")
+    for result in rest:
+        first.orders.extend(result.orders)
 
     return first
 
@@ -864,11 +919,11 @@ def pending_orders(
         account = KisAccountNumber(account)
 
     if country is None and not self.virtual:
+        # 국내 및 해외 미체결 조회는 서로 독립적이므로 동시에 요청합니다.
         return KisIntegrationPendingOrders(
             self,
             account,
-            domestic_pending_orders(self, account),
-            foreign_pending_orders(self, account),
+            *batch_map(lambda fetch: fetch(self, account), (domestic_pending_orders, foreign_pending_orders)),
         )
     elif country == "KR":
         return domestic_pending_orders(self, account)
@@ -1,9 +1,14 @@
-from typing import TYPE_CHECKING, Literal
+import json
+from datetime import datetime, timedelta
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Literal
 
-from pykis.responses.dynamic import KisDynamic
+from pykis.responses.dynamic import KisDynamic, KisObject
 from pykis.responses.types import KisString
+from pykis.utils.timezone import TIMEZONE
 
 if TYPE_CHECKING:
+    from pykis.client.appkey import KisKey
     from pykis.kis import PyKis
 
 __all__ = [
@@ -12,23 +17,82 @@ __all__ = [
 ]
 
 
+APPROVAL_KEY_VALIDITY_PERIOD = timedelta(hours=24)
+"""웹소켓 접속 키 유효기간"""
+
+
 class KisWebsocketApprovalKey(KisDynamic):
     """한국투자증권 웹소켓 접속 키"""
 
     approval_key: str = KisString["approval_key"]
     """접속 키"""
+    issued_at: datetime
+    """발급 시각"""
+
+    def __pre_init__(self, data: dict[str, Any]) -> None:
+        super().__pre_init__(data)
+        # 접속 키 발급 응답에는 만료 시각이 없으므로 발급 시각을 기준으로 계산합니다.
+        issued_at = data.get("issued_at")
+        self.issued_at = datetime.fromisoformat(issued_at) if issued_at else datetime.now(TIMEZONE)
+
+    @property
+    def expired_at(self) -> datetime:
+        """만료 시각"""
+        return self.issued_at + APPROVAL_KEY_VALIDITY_PERIOD
+
+    @property
+    def expired(self) -> bool:
+        """접속 키가 만료되었는지 여부"""
+        return self.expired_at < datetime.now(TIMEZONE)
+
+    @property
+    def remaining(self) -> timedelta:
+        """접속 키의 남은 유효기간"""
+        return self.expired_at - datetime.now(TIMEZONE)
+
+    def __repr__(self) -> str:
+        return f"<KisWebsocketApprovalKey expired_at={self.expired_at}>"
+
+    def save(self, path: str | PathLike[str]):
+        """접속 키를 파일로 저장합니다."""
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "approval_key": self.approval_key,
+                    "issued_at": self.issued_at.isoformat(),
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]):
+        """파일에서 접속 키를 불러옵니다."""
+        with open(path) as f:
+            return KisObject.transform_(
+                json.load(f),
+                cls,
+            )
 
 
 def websocket_approval_key(
-    self: "PyKis", domain: Literal["real", "virtual"] | None = None
+    self: "PyKis",
+    domain: Literal["real", "virtual"] | None = None,
+    appkey: "KisKey | None" = None,
 ) -> KisWebsocketApprovalKey:
     """
     웹소켓 접속 키를 발급합니다.
 
     OAuth인증 -> 실시간 (웹소켓) 접속키 발급[실시간-000]
     (업데이트 날짜: 2024/04/04)
+
+    접속 키는 발급할 때마다 API 호출이 발생하므로, 캐시된 접속 키를 사용하려면 `PyKis.approval_key()`를 사용하세요.
+
+    Args:
+        domain (Literal["real", "virtual"] | None, optional): 도메인
+        appkey (KisKey | None, optional): 발급에 사용할 앱 키. 기본값은 도메인의 앱 키입니다.
     """
-    appkey = self.appkey if domain == "real" else self.virtual_appkey
+    if appkey is None:
+        appkey = self.appkey if domain == "real" else self.virtual_appkey
 
     if appkey is None:
         raise ValueError("모의도메인 appkey가 없습니다.")
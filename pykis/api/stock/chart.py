@@ -1,8 +1,12 @@
 import bisect
-from datetime import date, datetime, time, tzinfo
+from array import array
+from collections.abc import Sequence
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta, tzinfo
 from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
+    Any,
     Iterable,
     Iterator,
     Literal,
@@ -14,13 +18,23 @@ from typing import (
 
 from pykis.api.base.product import KisProductBase, KisProductProtocol
 from pykis.api.stock.market import MARKET_TYPE
-from pykis.api.stock.quote import STOCK_SIGN_TYPE
+from pykis.api.stock.quote import (
+    STOCK_SIGN_TYPE,
+    STOCK_SIGN_TYPE_KOR_MAP,
+    STOCK_SIGN_TYPE_MAP,
+)
+from pykis.responses.dynamic import KisType
 from pykis.responses.response import KisResponseProtocol
+from pykis.utils.math import safe_divide
 from pykis.utils.repr import kis_repr
+from pykis.utils.timezone import TIMEZONE
 
 __all__ = [
     "KisChartBar",
     "KisChart",
+    "KisChartColumnBar",
+    "KisChartColumns",
+    "KisChartColumnList",
     "TChart",
 ]
 
@@ -198,6 +212,468 @@ class KisChartRepr:
     """한국투자증권 차트"""
 
 
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+_COLUMN_TYPES = {
+    "time": "q",
+    "open": "d",
+    "high": "d",
+    "low": "d",
+    "close": "d",
+    "volume": "q",
+    "amount": "d",
+    "change": "d",
+    "sign": "b",
+}
+"""열 이름과 `array` 타입 코드 (int64 시간, float64 가격, int64 거래량, int8 부호)"""
+_PRICE_COLUMNS = frozenset(("open", "high", "low", "close", "amount", "change"))
+"""소수점 자릿수를 지정하면 정수로 저장되는 가격 열"""
+_SIGN_CODES = {sign: int(code) for code, sign in reversed(STOCK_SIGN_TYPE_MAP.items())}
+
+
+class KisChartColumnBar(KisChartBarRepr):
+    """
+    한국투자증권 열 기반 차트 봉
+
+    열 기반 차트의 한 행을 가리키며, 값은 속성에 접근할 때 변환됩니다.
+    """
+
+    __slots__ = ["columns", "index"]
+
+    columns: "KisChartColumns"
+    """열 기반 차트"""
+    index: int
+    """행 인덱스"""
+
+    def __init__(self, columns: "KisChartColumns", index: int):
+        self.columns = columns
+        self.index = index
+
+    @property
+    def time(self) -> datetime:
+        """시간 (현지시간)"""
+        return (_EPOCH + timedelta(seconds=self.columns.time[self.index])).replace(tzinfo=self.columns.timezone)
+
+    @property
+    def time_kst(self) -> datetime:
+        """시간 (한국시간)"""
+        return self.time.astimezone(TIMEZONE)
+
+    @property
+    def open(self) -> Decimal:
+        """시가"""
+        return self.columns.decimal(self.columns.open[self.index])
+
+    @property
+    def close(self) -> Decimal:
+        """종가 (현재가)"""
+        return self.columns.decimal(self.columns.close[self.index])
+
+    @property
+    def high(self) -> Decimal:
+        """고가"""
+        return self.columns.decimal(self.columns.high[self.index])
+
+    @property
+    def low(self) -> Decimal:
+        """저가"""
+        return self.columns.decimal(self.columns.low[self.index])
+
+    @property
+    def volume(self) -> int:
+        """거래량"""
+        return self.columns.volume[self.index]
+
+    @property
+    def amount(self) -> Decimal:
+        """거래대금"""
+        return self.columns.decimal(self.columns.amount[self.index])
+
+    @property
+    def change(self) -> Decimal:
+        """전일대비"""
+        return self.columns.decimal(self.columns.change[self.index])
+
+    @property
+    def sign(self) -> STOCK_SIGN_TYPE:
+        """전일대비 부호"""
+        return STOCK_SIGN_TYPE_MAP[str(self.columns.sign[self.index])]  # type: ignore
+
+    @property
+    def price(self) -> Decimal:
+        """현재가 (종가)"""
+        return self.close
+
+    @property
+    def prev_price(self) -> Decimal:
+        """전일가"""
+        return self.close - self.change
+
+    @property
+    def rate(self) -> Decimal:
+        """등락률 (-100 ~ 100)"""
+        return safe_divide(self.change, self.prev_price) * 100
+
+    @property
+    def sign_name(self) -> str:
+        """대비부호명"""
+        return STOCK_SIGN_TYPE_KOR_MAP[self.sign]
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, KisChartColumnBar) and other.columns is self.columns and other.index == self.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.columns), self.index))
+
+
+class KisChartColumns(Sequence[KisChartBar]):
+    """
+    한국투자증권 열 기반 차트
+
+    봉마다 객체를 만들지 않고 열마다 하나의 `array`에 값을 저장합니다.
+    시간은 현지시간 기준 UNIX 초(int64), 가격과 거래대금은 float64, 거래량은 int64, 전일대비 부호는 int8로 저장되며,
+    인덱스로 접근할 때 `KisChartColumnBar`가 만들어집니다.
+    소수점 자릿수(`scale`)를 지정하면 가격과 거래대금은 10^scale배 한 int64 고정소수점으로 저장됩니다.
+    """
+
+    __slots__ = [
+        "timezone",
+        "scale",
+        "time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "amount",
+        "change",
+        "sign",
+        "_quantum",
+    ]
+
+    timezone: tzinfo
+    """시간대"""
+    scale: int | None
+    """가격 소수점 자릿수 (None: float64로 저장)"""
+
+    time: array
+    """시간 (현지시간 기준 UNIX 초)"""
+    open: array
+    """시가"""
+    high: array
+    """고가"""
+    low: array
+    """저가"""
+    close: array
+    """종가"""
+    volume: array
+    """거래량"""
+    amount: array
+    """거래대금"""
+    change: array
+    """전일대비"""
+    sign: array
+    """전일대비 부호 코드"""
+
+    _quantum: Decimal | None
+    """Decimal 변환 단위"""
+
+    def __init__(self, timezone: tzinfo = TIMEZONE, scale: int | None = None):
+        """
+        빈 열 기반 차트를 생성합니다.
+
+        Args:
+            timezone (tzinfo, optional): 시간대
+            scale (int | None, optional): 가격 소수점 자릿수. 지정하면 가격을 정수로 저장하고, None이면 float64로 저장합니다.
+        """
+        self.timezone = timezone
+        self.scale = scale
+        self._quantum = Decimal(1).scaleb(-scale) if scale is not None else None
+
+        for name, typecode in _COLUMN_TYPES.items():
+            setattr(self, name, array("q" if scale is not None and name in _PRICE_COLUMNS else typecode))
+
+    @staticmethod
+    def timestamp(value: datetime | date) -> int:
+        """
+        열에 저장되는 현지시간 기준 UNIX 초를 반환합니다.
+
+        Args:
+            value (datetime | date): 시간. datetime인 경우 시간대는 무시됩니다.
+        """
+        if isinstance(value, datetime):
+            return int((value.replace(tzinfo=None) - _EPOCH).total_seconds())
+
+        return (value.toordinal() - _EPOCH_ORDINAL) * 86400
+
+    @classmethod
+    def from_bars(
+        cls,
+        bars: Iterable[KisChartBar],
+        timezone: tzinfo = TIMEZONE,
+        scale: int | None = None,
+    ) -> "KisChartColumns":
+        """
+        봉 목록을 열 기반 차트로 변환합니다.
+
+        Args:
+            bars (Iterable[KisChartBar]): 봉 목록
+            timezone (tzinfo, optional): 시간대
+            scale (int | None, optional): 가격 소수점 자릿수
+        """
+        columns = cls(timezone=timezone, scale=scale)
+        columns.extend(bars)
+
+        return columns
+
+    @property
+    def nbytes(self) -> int:
+        """열 데이터의 크기 (바이트)"""
+        return sum(column.itemsize * len(column) for column in self._columns())
+
+    def _columns(self) -> Iterator[array]:
+        for name in _COLUMN_TYPES:
+            yield getattr(self, name)
+
+    def _empty(self) -> "KisChartColumns":
+        return KisChartColumns(timezone=self.timezone, scale=self.scale)
+
+    def decimal(self, value: float | int) -> Decimal:
+        """저장된 값을 Decimal로 변환합니다."""
+        if self.scale is not None:
+            return Decimal(value).scaleb(-self.scale)
+
+        return Decimal(int(value)) if value.is_integer() else Decimal(repr(value))  # type: ignore
+
+    def value(self, value: Decimal | str | int) -> float | int:
+        """가격을 열에 저장되는 값으로 변환합니다."""
+        if self._quantum is not None:
+            return int(Decimal(value).quantize(self._quantum).scaleb(self.scale))  # type: ignore
+
+        return float(value)
+
+    @contextmanager
+    def _resizing(self) -> Iterator[None]:
+        """열의 길이를 바꾸는 동안 실패하면 모든 열을 원래 길이로 되돌립니다."""
+        size = len(self.time)
+
+        try:
+            yield
+        except BufferError as e:
+            # 메모리를 참조 중인 열은 길이가 바뀌지 않으므로, 길이가 바뀐 열만 되돌립니다.
+            for column in self._columns():
+                if len(column) > size:
+                    del column[size:]
+
+            raise BufferError(
+                "DataFrame 등에서 차트의 메모리를 참조하고 있어 봉을 추가할 수 없습니다. "
+                "참조하는 객체를 삭제하거나, 슬라이싱(`columns[:]`)으로 복사한 차트에 추가해주세요."
+            ) from e
+
+    def append(self, bar: KisChartBar):
+        """봉을 추가합니다."""
+        with self._resizing():
+            self._append(bar)
+
+    def _append(self, bar: KisChartBar):
+        value = self.value
+        self.time.append(self.timestamp(bar.time))
+        self.open.append(value(bar.open))
+        self.high.append(value(bar.high))
+        self.low.append(value(bar.low))
+        self.close.append(value(bar.close))
+        self.volume.append(int(bar.volume))
+        self.amount.append(value(bar.amount))
+        self.change.append(value(bar.change))
+        self.sign.append(_SIGN_CODES[bar.sign])
+
+    def extend(self, bars: Iterable[KisChartBar]):
+        """봉 목록을 추가합니다. 소수점 자릿수가 같은 열 기반 차트인 경우 열 단위로 복사합니다."""
+        with self._resizing():
+            if isinstance(bars, KisChartColumns) and bars.scale == self.scale:
+                for column, other in zip(self._columns(), bars._columns()):
+                    column.extend(other)
+            else:
+                for bar in bars:
+                    self._append(bar)
+
+    def take(self, indices: Iterable[int]) -> "KisChartColumns":
+        """주어진 행만 골라 새 열 기반 차트를 반환합니다."""
+        columns = self._empty()
+        indices = list(indices)
+
+        for column, source in zip(columns._columns(), self._columns()):
+            column.extend(source[i] for i in indices)
+
+        return columns
+
+    @overload
+    def __getitem__(self, index: int) -> KisChartBar: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "KisChartColumns": ...
+
+    def __getitem__(self, index: int | slice) -> "KisChartBar | KisChartColumns":
+        if isinstance(index, slice):
+            columns = self._empty()
+
+            for name in _COLUMN_TYPES:
+                setattr(columns, name, getattr(self, name)[index])
+
+            return columns
+
+        if index < 0:
+            index += len(self.time)
+
+        if not 0 <= index < len(self.time):
+            raise IndexError("차트 인덱스가 범위를 벗어났습니다.")
+
+        return KisChartColumnBar(self, index)
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __iter__(self) -> Iterator[KisChartBar]:
+        for index in range(len(self.time)):
+            yield KisChartColumnBar(self, index)
+
+    def __reversed__(self) -> Iterator[KisChartBar]:
+        for index in range(len(self.time) - 1, -1, -1):
+            yield KisChartColumnBar(self, index)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self)}, timezone={self.timezone}, scale={self.scale})"
+
+    def df(self) -> "DataFrame":
+        """
+        차트를 Pandas DataFrame으로 변환합니다.
+
+        가격과 거래량 열은 복사하지 않고 NumPy 배열로 저장된 메모리를 그대로 사용합니다.
+        소수점 자릿수를 지정한 경우 가격 열은 float64로 변환하여 복사합니다.
+        해당 함수는 Pandas가 설치되어 있어야 합니다.
+
+        Note:
+            차트와 메모리를 공유하므로 DataFrame의 열은 읽기 전용이며, 값을 수정하려면 `df.copy()`를 사용해주세요.
+            DataFrame이 남아 있는 동안에는 차트에 봉을 추가(`append`, `extend`)할 수 없습니다.
+        """
+        try:
+            import numpy as np  # type: ignore
+            import pandas as pd  # type: ignore
+        except ImportError as e:
+            raise ImportError(
+                "Pandas가 설치되어 있지 않습니다.\n" "Pandas를 설치하려면 `pip install pandas`를 실행해주세요."
+            ) from e
+
+        def view(column: array, dtype: Any):
+            values = np.frombuffer(column, dtype=dtype) if len(column) else np.empty(0, dtype=dtype)
+            # DataFrame을 수정해도 차트의 봉이 바뀌지 않도록 읽기 전용으로 공유합니다.
+            values.flags.writeable = False
+            return values
+
+        def price(column: array):
+            if self.scale is None:
+                return view(column, np.float64)
+
+            return view(column, np.int64) / 10**self.scale
+
+        return pd.DataFrame(
+            {
+                # 봉 목록 차트의 `df()`와 같은 나노초 단위로 변환합니다.
+                "time": pd.DatetimeIndex(
+                    view(self.time, np.int64).view("datetime64[s]").astype("datetime64[ns]")
+                ).tz_localize(self.timezone),
+                "open": price(self.open),
+                "high": price(self.high),
+                "low": price(self.low),
+                "close": price(self.close),
+                "volume": view(self.volume, np.int64),
+            },
+            copy=False,
+        )
+
+
+class KisChartColumnList(KisType[KisChartColumns]):
+    """
+    응답 데이터의 봉 목록을 열 기반 차트로 변환합니다.
+
+    봉마다 `KisDynamic` 객체를 만들지 않고 응답 필드를 바로 열에 추가합니다.
+    """
+
+    time_field: str
+    """시간 필드"""
+    time_format: str
+    """시간 형식"""
+    fields: tuple[str, str, str, str, str, str, str, str]
+    """시가, 고가, 저가, 종가, 거래량, 거래대금, 전일대비, 전일대비 부호 필드"""
+    scale: int | None
+    """가격 소수점 자릿수"""
+
+    def __init__(
+        self,
+        time: str,
+        open: str,
+        high: str,
+        low: str,
+        close: str,
+        volume: str,
+        amount: str,
+        change: str,
+        sign: str,
+        time_format: str = "%Y%m%d",
+        scale: int | None = None,
+    ):
+        super().__init__()
+        self.time_field = time
+        self.time_format = time_format
+        self.fields = (open, high, low, close, volume, amount, change, sign)
+        self.scale = scale
+
+    def transform(self, data: Any) -> KisChartColumns:
+        if not isinstance(data, list):
+            raise TypeError(f"list 형을 기대하였지만, {type(data).__name__} 형이 입력되었습니다.")
+
+        columns = KisChartColumns(scale=self.scale)
+        time_field = self.time_field
+        time_format = self.time_format
+        open, high, low, close, volume, amount, change, sign = self.fields
+
+        times = columns.time.append
+        opens = columns.open.append
+        highs = columns.high.append
+        lows = columns.low.append
+        closes = columns.close.append
+        volumes = columns.volume.append
+        amounts = columns.amount.append
+        changes = columns.change.append
+        signs = columns.sign.append
+        price = float if self.scale is None else columns.value
+
+        for row in data:
+            if not row:
+                continue
+
+            value = row[time_field]
+
+            if time_format == "%Y%m%d":
+                times((date(int(value[:4]), int(value[4:6]), int(value[6:8])).toordinal() - _EPOCH_ORDINAL) * 86400)
+            else:
+                times(KisChartColumns.timestamp(datetime.strptime(value, time_format)))
+
+            opens(price(row[open] or 0))
+            highs(price(row[high] or 0))
+            lows(price(row[low] or 0))
+            closes(price(row[close] or 0))
+            volumes(int(row[volume] or 0))
+            amounts(price(row[amount] or 0))
+            changes(price(row[change] or 0))
+            signs(int(row[sign] or 0))
+
+        return columns
+
+
 class KisChartBase(KisChartRepr, KisProductBase):
 
     symbol: str
@@ -207,9 +683,36 @@ class KisChartBase(KisChartRepr, KisProductBase):
 
     timezone: tzinfo
     """시간대"""
-    bars: list[KisChartBar]
+    bars: list[KisChartBar] | KisChartColumns
     """차트 (오름차순)"""
 
+    _time_keys_cache: tuple[Sequence[KisChartBar], int, dict[tuple[str, bool], tuple[list, bool]]] | None = None
+    """봉 목록, 봉 개수, (키 종류, 한국시간 여부)별 시간 키 목록과 정렬 여부"""
+
+    def _time_keys(self, kind: Literal["datetime", "date", "time"], kst: bool) -> tuple[list, bool]:
+        """
+        봉의 시간 키 목록과 오름차순 정렬 여부를 반환합니다.
+
+        키 목록은 봉 목록이 교체되거나 봉 개수가 바뀌기 전까지 캐시됩니다.
+        """
+        bars = self.bars
+        cache = self._time_keys_cache
+
+        if cache is None or cache[0] is not bars or cache[1] != len(bars):
+            cache = self._time_keys_cache = (bars, len(bars), {})
+
+        if (keys := cache[2].get((kind, kst))) is None:
+            times = [bar.time_kst for bar in bars] if kst else [bar.time for bar in bars]
+
+            if kind == "date":
+                times = [value.date() for value in times]
+            elif kind == "time":
+                times = [value.time() for value in times]
+
+            keys = cache[2][(kind, kst)] = (times, all(a <= b for a, b in zip(times, times[1:])))
+
+        return keys
+
     def index(self, time: datetime | date | time, /, kst: bool = False) -> int:
         """
         이진탐색으로 시간에 해당하는 봉의 인덱스를 반환합니다.
@@ -219,21 +722,11 @@ class KisChartBase(KisChartRepr, KisProductBase):
             kst: 한국시간대 여부
         """
         index = bisect.bisect_left(
-            self.bars,
+            self._time_keys(
+                "datetime" if isinstance(time, datetime) else "date" if isinstance(time, date) else "time",
+                kst,
+            )[0],
             time,
-            key=(
-                (
-                    (lambda bar: bar.time_kst)
-                    if isinstance(time, datetime)
-                    else ((lambda bar: bar.time_kst.date()) if isinstance(time, date) else (lambda bar: bar.time_kst.time()))
-                )
-                if kst
-                else (
-                    (lambda bar: bar.time)
-                    if isinstance(time, datetime)
-                    else ((lambda bar: bar.time.date()) if isinstance(time, date) else (lambda bar: bar.time.time()))
-                )
-            ),
         )
 
         if index >= len(self.bars):
@@ -272,11 +765,23 @@ class KisChartBase(KisChartRepr, KisProductBase):
                 return self.bars[index]
 
             if isinstance(index.start, datetime) and isinstance(index.stop, datetime):
-                return [bar for bar in self.bars if index.start <= bar.time <= index.stop]
+                kind = "datetime"
             elif isinstance(index.start, date) and isinstance(index.stop, date):
-                return [bar for bar in self.bars if index.start <= bar.time.date() <= index.stop]
+                kind = "date"
             elif isinstance(index.start, time) and isinstance(index.stop, time):
-                return [bar for bar in self.bars if index.start <= bar.time.time() <= index.stop]
+                kind = "time"
+            else:
+                raise TypeError(f"인덱스 {index}는 지원하지 않습니다.")
+
+            keys, ordered = self._time_keys(kind, False)
+
+            if ordered:
+                return self.bars[  # type: ignore
+                    bisect.bisect_left(keys, index.start) : bisect.bisect_right(keys, index.stop)
+                ]
+
+            # 여러 날의 분봉을 시각으로 자르는 경우 키가 정렬되어 있지 않으므로 전체를 확인합니다.
+            return [bar for bar, key in zip(self.bars, keys) if index.start <= key <= index.stop]
 
         raise TypeError(f"인덱스 {index}는 지원하지 않습니다.")
 
@@ -289,12 +794,29 @@ class KisChartBase(KisChartRepr, KisProductBase):
     def __reversed__(self) -> Iterator[KisChartBar]:
         return reversed(self.bars)
 
+    def columns(self, scale: int | None = None) -> KisChartColumns:
+        """
+        차트를 열 기반 차트로 반환합니다.
+
+        열 기반 차트로 조회하였고 소수점 자릿수가 같은 경우 복사하지 않고 그대로 반환합니다.
+
+        Args:
+            scale: 가격 소수점 자릿수. 지정하면 가격을 정수로 저장합니다.
+        """
+        if isinstance(self.bars, KisChartColumns) and self.bars.scale == scale:
+            return self.bars
+
+        return KisChartColumns.from_bars(self.bars, timezone=self.timezone, scale=scale)
+
     def df(self) -> "DataFrame":
         """
         차트를 Pandas DataFrame으로 변환합니다.
 
         해당 함수는 Pandas가 설치되어 있어야 합니다.
         """
+        if isinstance(self.bars, KisChartColumns):
+            return self.bars.df()
+
         try:
             import pandas as pd  # type: ignore
         except ImportError as e:
@@ -304,7 +826,10 @@ class KisChartBase(KisChartRepr, KisProductBase):
 
         return pd.DataFrame(
             {
-                "time": [bar.time for bar in self.bars],
+                "time": pd.DatetimeIndex(
+                    [bar.time for bar in self.bars],
+                    dtype=pd.DatetimeTZDtype("ns", self.timezone),
+                ),
                 "open": [float(bar.open) for bar in self.bars],
                 "high": [float(bar.high) for bar in self.bars],
                 "low": [float(bar.low) for bar in self.bars],
@@ -0,0 +1,505 @@
+import bisect
+import os
+import struct
+import sys
+from array import array
+from datetime import date, datetime, timedelta, tzinfo
+from os import PathLike
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Iterator, Literal
+from urllib.parse import quote
+
+from pykis.api.stock.chart import KisChartBase, KisChartColumns
+from pykis.api.stock.daily_chart import daily_chart
+from pykis.api.stock.market import MARKET_TYPE, get_market_timezone
+from pykis.utils.batch import KisBatchResult, batch_iter
+from pykis.utils.workspace import get_cache_path
+
+if TYPE_CHECKING:
+    from pykis.kis import PyKis
+
+__all__ = [
+    "KisStoredChart",
+    "KisChartStoreStats",
+    "KisChartStore",
+]
+
+CHART_PERIOD_TYPE = Literal["day", "week", "month", "year"]
+
+_MAGIC = b"KISC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHiiI")
+"""매직, 버전, 동기화 시작일, 동기화 종료일 (서수, 0: 없음), 봉 개수"""
+
+
+class KisStoredChart(KisChartBase):
+    """한국투자증권 저장된 기간 차트"""
+
+    symbol: str
+    """종목코드"""
+    market: MARKET_TYPE
+    """상품유형타입"""
+
+    timezone: tzinfo
+    """시간대"""
+    bars: KisChartColumns
+    """차트 (오름차순)"""
+
+    def __init__(self, kis: "PyKis", symbol: str, market: MARKET_TYPE, bars: KisChartColumns):
+        self.kis = kis
+        self.symbol = symbol
+        self.market = market
+        self.timezone = bars.timezone
+        self.bars = bars
+
+
+class KisChartStoreStats:
+    """차트 저장소 통계"""
+
+    __slots__ = [
+        "hits",
+        "fetches",
+        "fetched",
+        "loaded",
+    ]
+
+    hits: int
+    """저장된 봉만으로 응답한 조회 횟수"""
+    fetches: int
+    """저장소에 없어 API로 조회한 기간 수"""
+    fetched: int
+    """API로 조회한 봉 수"""
+    loaded: int
+    """저장소에서 불러온 봉 수"""
+
+    def __init__(
+        self,
+        hits: int = 0,
+        fetches: int = 0,
+        fetched: int = 0,
+        loaded: int = 0,
+    ):
+        self.hits = hits
+        self.fetches = fetches
+        self.fetched = fetched
+        self.loaded = loaded
+
+    def copy(self) -> "KisChartStoreStats":
+        return KisChartStoreStats(
+            hits=self.hits,
+            fetches=self.fetches,
+            fetched=self.fetched,
+            loaded=self.loaded,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(hits={self.hits}, fetches={self.fetches}, "
+            f"fetched={self.fetched}, loaded={self.loaded})"
+        )
+
+
+def _period_start(day: date, period: CHART_PERIOD_TYPE) -> date:
+    """날짜가 속한 봉의 시작일"""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+
+    if period == "month":
+        return day.replace(day=1)
+
+    if period == "year":
+        return day.replace(month=1, day=1)
+
+    return day
+
+
+class KisChartStore:
+    """
+    한국투자증권 기간 차트 저장소
+
+    (종목코드, 시장, 기간, 수정주가 여부)별로 기간 차트의 봉을 열 기반 이진 파일에 저장하고,
+    확정된 봉까지의 동기화 기간을 함께 기록합니다.
+    다시 조회할 때는 동기화 기간 밖의 날짜만 API로 조회하여 저장된 봉과 병합합니다.
+
+    파일은 헤더 뒤에 `KisChartColumns`의 열이 little-endian 배열로 이어지며, 불러올 때 객체 변환 없이 열로 복사됩니다.
+    """
+
+    __slots__ = [
+        "kis",
+        "path",
+        "_entries",
+        "_locks",
+        "_lock",
+        "_stats",
+    ]
+
+    kis: "PyKis"
+    """한국투자증권 API"""
+    path: Path | None
+    """저장 폴더 (None: 메모리)"""
+
+    _entries: dict[tuple[str, MARKET_TYPE, CHART_PERIOD_TYPE, bool], tuple[date | None, date | None, KisChartColumns]]
+    """메모리 저장소"""
+    _locks: dict[tuple[str, MARKET_TYPE, CHART_PERIOD_TYPE, bool], Lock]
+    """차트별 Lock 객체"""
+    _lock: Lock
+    """Lock 객체"""
+    _stats: KisChartStoreStats
+    """저장소 통계"""
+
+    def __init__(
+        self,
+        kis: "PyKis",
+        path: str | PathLike[str] | None = None,
+        memory: bool = False,
+    ):
+        """
+        기간 차트 저장소를 생성합니다.
+
+        Args:
+            kis (PyKis): 한국투자증권 API
+            path (str | PathLike[str] | None, optional): 저장 폴더. 기본 저장 경로: `~/.pykis/cache/charts`
+            memory (bool, optional): 파일에 저장하지 않고 메모리에만 저장할지 여부
+        """
+        self.kis = kis
+        self.path = None if memory else Path(path or get_cache_path() / "charts").resolve()
+        self._entries = {}
+        self._locks = {}
+        self._lock = Lock()
+        self._stats = KisChartStoreStats()
+
+    @property
+    def stats(self) -> KisChartStoreStats:
+        """저장소 통계의 복사본을 반환합니다."""
+        with self._lock:
+            return self._stats.copy()
+
+    def _file(self, key: tuple[str, MARKET_TYPE, CHART_PERIOD_TYPE, bool]) -> Path:
+        symbol, market, period, adjust = key
+        return self.path / market / f"{quote(symbol, safe='')}.{period}{'.adj' if adjust else ''}.bin"  # type: ignore
+
+    def _read(
+        self,
+        key: tuple[str, MARKET_TYPE, CHART_PERIOD_TYPE, bool],
+    ) -> tuple[date | None, date | None, KisChartColumns]:
+        columns = KisChartColumns(timezone=get_market_timezone(key[1]))
+
+        if self.path is None:
+            entry = self._entries.get(key)
+            return entry if entry is not None else (None, None, columns)
+
+        try:
+            with open(self._file(key), "rb") as f:
+                magic, version, first, last, count = _HEADER.unpack(f.read(_HEADER.size))
+
+                if magic != _MAGIC or version != _VERSION:
+                    return None, None, columns
+
+                for column in columns._columns():
+                    column.fromfile(f, count)
+
+                    if sys.byteorder == "big":
+                        column.byteswap()
+        except (FileNotFoundError, EOFError, struct.error):
+            return None, None, columns
+
+        return (
+            date.fromordinal(first) if first else None,
+            date.fromordinal(last) if last else None,
+            columns,
+        )
+
+    def _write(
+        self,
+        key: tuple[str, MARKET_TYPE, CHART_PERIOD_TYPE, bool],
+        first: date | None,
+        last: date | None,
+        columns: KisChartColumns,
+    ):
+        if self.path is None:
+            self._entries[key] = (first, last, columns)
+            return
+
+        file = self._file(key)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+
+        # 다른 프로세스가 읽는 도중에 파일이 잘리지 않도록 임시 파일을 교체합니다.
+        with open(temp_file, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    first.toordinal() if first else 0,
+                    last.toordinal() if last else 0,
+                    len(columns),
+                )
+            )
+
+            for column in columns._columns():
+                if sys.byteorder == "big":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+
+                column.tofile(f)
+
+        os.replace(temp_file, file)
+
+    def _key_lock(self, key: tuple[str, MARKET_TYPE, CHART_PERIOD_TYPE, bool]) -> Lock:
+        with self._lock:
+            if (lock := self._locks.get(key)) is None:
+                lock = self._locks[key] = Lock()
+
+            return lock
+
+    def synced(
+        self,
+        symbol: str,
+        market: MARKET_TYPE,
+        period: CHART_PERIOD_TYPE = "day",
+        adjust: bool = False,
+    ) -> tuple[date, date] | None:
+        """
+        저장된 차트의 동기화 기간을 반환합니다.
+
+        Args:
+            symbol (str): 종목 코드
+            market (MARKET_TYPE): 시장 구분
+            period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+            adjust (bool, optional): 수정 주가 여부. Defaults to False.
+
+        Returns:
+            (시작일, 종료일) 또는 동기화된 기간이 없는 경우 None
+        """
+        key = (symbol, market, period, adjust)
+
+        with self._key_lock(key):
+            first, last, _ = self._read(key)
+
+        return (first, last) if first and last else None
+
+    def chart(
+        self,
+        symbol: str,
+        market: MARKET_TYPE,
+        start: date | timedelta,
+        end: date | None = None,
+        period: CHART_PERIOD_TYPE = "day",
+        adjust: bool = False,
+    ) -> KisStoredChart:
+        """
+        기간 차트를 조회합니다.
+
+        저장소의 동기화 기간 밖의 날짜만 API로 조회하여 저장한 뒤, 조회 기간의 봉을 반환합니다.
+        확정되지 않은 최근 봉(당일, 이번 주/월/년)은 동기화 기간에 포함하지 않으므로 다음 조회 때 다시 조회합니다.
+
+        국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
+        해외주식현재가 -> 해외주식 기간별시세[v1_해외주식-010]
+
+        Args:
+            symbol (str): 종목 코드
+            market (MARKET_TYPE): 시장 구분
+            start (date | timedelta): 조회 시작일. timedelta인 경우 종료일로부터 timedelta 이전부터 조회합니다.
+            end (date, optional): 조회 종료일. Defaults to None.
+            period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+            adjust (bool, optional): 수정 주가 여부. Defaults to False.
+
+        Raises:
+            KisAPIError: API 호출에 실패한 경우
+            KisNotFoundError: 조회 결과가 없는 경우
+            ValueError: 조회 파라미터가 올바르지 않은 경우
+        """
+        if not symbol:
+            raise ValueError("종목 코드를 입력해주세요.")
+
+        timezone = get_market_timezone(market)
+        today = datetime.now(timezone).date()
+
+        if isinstance(end, datetime):
+            end = end.date()
+
+        if not end or end > today:
+            end = today
+
+        if isinstance(start, timedelta):
+            start = end - start
+        elif isinstance(start, datetime):
+            start = start.date()
+
+        if start > end:
+            start, end = end, start
+
+        key = (symbol, market, period, adjust)
+        # 이번 봉은 확정되지 않았으므로 이전 봉까지만 동기화된 것으로 기록합니다.
+        settled = _period_start(today, period) - timedelta(days=1)
+
+        with self._key_lock(key):
+            first, last, columns = self._read(key)
+            ranges = []
+
+            if first is None or last is None:
+                ranges.append((start, end))
+            else:
+                if start < first:
+                    ranges.append((start, first - timedelta(days=1)))
+
+                if end > last:
+                    ranges.append((last + timedelta(days=1), end))
+
+            for range_start, range_end in ranges:
+                fetched = daily_chart(
+                    self.kis,
+                    symbol,
+                    market,
+                    start=range_start,
+                    end=range_end,
+                    period=period,
+                    adjust=adjust,
+                    columnar=True,
+                ).bars
+
+                columns = self._merge(columns, fetched, range_start, range_end)  # type: ignore
+
+                if range_start <= (range_last := min(range_end, settled)):
+                    first, last = (
+                        (range_start, range_last)
+                        if first is None or last is None
+                        else (min(first, range_start), max(last, range_last))
+                    )
+
+                with self._lock:
+                    self._stats.fetches += 1
+                    self._stats.fetched += len(fetched)
+
+            if ranges:
+                self._write(key, first, last, columns)
+
+        times = columns.time
+        bars = columns[
+            bisect.bisect_left(times, KisChartColumns.timestamp(start)) : bisect.bisect_left(
+                times, KisChartColumns.timestamp(end + timedelta(days=1))
+            )
+        ]
+
+        with self._lock:
+            self._stats.loaded += len(bars)
+
+            if not ranges:
+                self._stats.hits += 1
+
+        return KisStoredChart(self.kis, symbol, market, bars)
+
+    @staticmethod
+    def _merge(columns: KisChartColumns, fetched: KisChartColumns, start: date, end: date) -> KisChartColumns:
+        """저장된 봉 중 조회 기간의 봉을 조회한 봉으로 교체합니다."""
+        times = columns.time
+        lower = bisect.bisect_left(times, KisChartColumns.timestamp(start))
+        upper = bisect.bisect_left(times, KisChartColumns.timestamp(end + timedelta(days=1)))
+
+        merged = columns[:lower]
+        merged.extend(fetched)
+        merged.extend(columns[upper:])
+
+        return merged
+
+    def iter_download(
+        self,
+        symbols: Iterable[str],
+        market: MARKET_TYPE,
+        start: date | timedelta,
+        end: date | None = None,
+        period: CHART_PERIOD_TYPE = "day",
+        adjust: bool = False,
+        max_workers: int | None = None,
+    ) -> Iterator[KisBatchResult[str, KisStoredChart]]:
+        """
+        여러 종목의 기간 차트를 저장소로 내려받습니다.
+
+        종목별 조회를 동시에 요청하고, 조회가 완료되는 순서대로 결과를 반환합니다.
+        종목별 오류는 결과의 `error`에 담기며, 나머지 종목의 조회는 계속됩니다.
+
+        Args:
+            symbols (Iterable[str]): 종목코드 목록
+            market (MARKET_TYPE): 시장 구분
+            start (date | timedelta): 조회 시작일
+            end (date, optional): 조회 종료일. Defaults to None.
+            period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+            adjust (bool, optional): 수정 주가 여부. Defaults to False.
+            max_workers (int | None, optional): 최대 동시 요청 수. 기본값은 차트 조회 도메인(실전도메인)의 초당 호출 제한 수입니다.
+        """
+        if max_workers is None:
+            # 요청 대기 시간 동안 호출 유량이 남지 않도록 초당 호출 제한 수만큼 동시에 요청합니다.
+            # 차트 조회는 모의투자에서도 실전도메인으로 요청하므로 실전도메인 호출 유량 제한을 따릅니다.
+            max_workers = self.kis._rate_limit("real").rate
+
+        return batch_iter(
+            lambda symbol: self.chart(
+                symbol,
+                market,
+                start=start,
+                end=end,
+                period=period,
+                adjust=adjust,
+            ),
+            symbols,
+            max_workers=max_workers,
+        )
+
+    def download(
+        self,
+        symbols: Iterable[str],
+        market: MARKET_TYPE,
+        start: date | timedelta,
+        end: date | None = None,
+        period: CHART_PERIOD_TYPE = "day",
+        adjust: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, KisBatchResult[str, KisStoredChart]]:
+        """
+        여러 종목의 기간 차트를 저장소로 내려받습니다.
+
+        종목별 조회를 동시에 요청하고, 모든 조회가 완료되면 종목코드 순서대로 결과를 반환합니다.
+        종목별 오류는 결과의 `error`에 담기며, 나머지 종목의 조회는 계속됩니다.
+
+        Args:
+            symbols (Iterable[str]): 종목코드 목록
+            market (MARKET_TYPE): 시장 구분
+            start (date | timedelta): 조회 시작일
+            end (date, optional): 조회 종료일. Defaults to None.
+            period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+            adjust (bool, optional): 수정 주가 여부. Defaults to False.
+            max_workers (int | None, optional): 최대 동시 요청 수. 기본값은 차트 조회 도메인(실전도메인)의 초당 호출 제한 수입니다.
+
+        Examples:
+            >>> store = KisChartStore(kis)
+            >>> results = store.download(["005930", "000660"], market="KRX", start=date(2020, 1, 1))
+            >>> results["005930"].unwrap().bars.close
+        """
+        symbols = list(dict.fromkeys(symbols))
+        results = {
+            result.key: result
+            for result in self.iter_download(
+                symbols,
+                market,
+                start=start,
+                end=end,
+                period=period,
+                adjust=adjust,
+                max_workers=max_workers,
+            )
+        }
+
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def clear(self):
+        """저장된 차트를 모두 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+
+            if self.path is not None and self.path.exists():
+                for file in self.path.glob("*/*.bin"):
+                    file.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<KisChartStore path={self.path}>"
@@ -2,7 +2,14 @@ from datetime import date, datetime, timedelta, tzinfo
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
-from pykis.api.stock.chart import KisChart, KisChartBar, KisChartBarRepr, KisChartBase
+from pykis.api.stock.chart import (
+    KisChart,
+    KisChartBar,
+    KisChartBarRepr,
+    KisChartBase,
+    KisChartColumnList,
+    KisChartColumns,
+)
 from pykis.api.stock.market import (
     EX_DATE_TYPE_CODE_MAP,
     MARKET_SHORT_TYPE_MAP,
@@ -111,6 +118,23 @@ class KisDomesticDailyChart(KisResponse, KisChartBase):
         data["output2"] = [x for x in data["output2"] if x]
 
 
+class KisDomesticColumnarDailyChart(KisDomesticDailyChart):
+    """한국투자증권 국내 기간 차트 (열 기반)"""
+
+    bars: KisChartColumns = KisChartColumnList(  # type: ignore
+        time="stck_bsop_date",
+        open="stck_oprc",
+        high="stck_hgpr",
+        low="stck_lwpr",
+        close="stck_clpr",
+        volume="acml_vol",
+        amount="acml_tr_pbmn",
+        change="prdy_vrss",
+        sign="prdy_vrss_sign",
+    )["output2"]
+    """차트"""
+
+
 class KisForeignDailyChartBar(KisChartBarRepr, KisDynamic):
     """한국투자증권 해외 기간 차트 봉"""
 
@@ -198,6 +222,26 @@ class KisForeignDailyChart(KisResponse, KisChartBase):
             bar.time_kst = bar.time.astimezone(TIMEZONE)  # type: ignore
 
 
+class KisForeignColumnarDailyChart(KisForeignDailyChart):
+    """한국투자증권 해외 기간 차트 (열 기반)"""
+
+    bars: KisChartColumns = KisChartColumnList(  # type: ignore
+        time="xymd",
+        open="open",
+        high="high",
+        low="low",
+        close="clos",
+        volume="tvol",
+        amount="tamt",
+        change="diff",
+        sign="sign",
+    )["output2"]
+    """차트"""
+
+    def __post_init__(self) -> None:
+        self.bars.timezone = self.timezone  # type: ignore
+
+
 TChartBase = TypeVar("TChartBase", bound=KisChartBase)
 
 
@@ -209,6 +253,31 @@ def drop_after(
     if isinstance(start, timedelta):
         start = (chart.bars[0].time - start).date()
 
+    if isinstance(chart.bars, KisChartColumns):
+        times = chart.bars.time
+        first = 0
+
+        if end:
+            upper = KisChartColumns.timestamp(end + timedelta(days=1))
+
+            while first < len(times) and times[first] >= upper:
+                first += 1
+
+        last = first
+
+        if start:
+            lower = KisChartColumns.timestamp(start)
+
+            while last < len(times) and times[last] >= lower:
+                last += 1
+        else:
+            last = len(times)
+
+        # 응답은 내림차순이므로 역순으로 잘라 오름차순으로 만듭니다.
+        chart.bars = chart.bars[first:last][::-1]
+
+        return chart
+
     bars: list[KisChartBar] = []
 
     for bar in chart.bars:
@@ -218,8 +287,10 @@ def drop_after(
         if end and bar.time.date() > end:
             continue
 
-        bars.insert(0, bar)
+        bars.append(bar)
 
+    # 응답은 내림차순이므로 뒤집어 오름차순으로 만듭니다.
+    bars.reverse()
     chart.bars = bars
 
     return chart
@@ -232,6 +303,7 @@ def domestic_daily_chart(
     end: date | None = None,
     period: Literal["day", "week", "month", "year"] = "day",
     adjust: bool = False,
+    columnar: bool = False,
 ) -> KisDomesticDailyChart:
     """
     한국투자증권 국내 기간 차트 조회
@@ -245,6 +317,7 @@ def domestic_daily_chart(
         end (date, optional): 조회 종료 시간. Defaults to None.
         period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
         adjust (bool, optional): 수정 주가 여부. Defaults to False.
+        columnar (bool, optional): 봉 목록을 열 기반 차트(`KisChartColumns`)로 저장할지 여부. Defaults to False.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -284,7 +357,7 @@ def domestic_daily_chart(
                 ),
                 "FID_ORG_ADJ_PRC": "0" if adjust else "1",
             },
-            response_type=KisDomesticDailyChart(symbol=symbol),
+            response_type=(KisDomesticColumnarDailyChart if columnar else KisDomesticDailyChart)(symbol=symbol),
             domain="real",
         )
 
@@ -325,6 +398,7 @@ def foreign_daily_chart(
     end: date | None = None,
     period: Literal["day", "week", "month", "year"] = "day",
     adjust: bool = False,
+    columnar: bool = False,
 ) -> KisForeignDailyChart:
     """
     한국투자증권 해외 기간 차트 조회
@@ -339,6 +413,7 @@ def foreign_daily_chart(
         end (date, optional): 조회 종료 시간. Defaults to None.
         period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
         adjust (bool, optional): 수정 주가 여부. Defaults to False.
+        columnar (bool, optional): 봉 목록을 열 기반 차트(`KisChartColumns`)로 저장할지 여부. Defaults to False.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -373,7 +448,7 @@ def foreign_daily_chart(
                 "BYMD": cursor.strftime("%Y%m%d") if cursor else "",
                 "MODP": "1" if adjust else "0",
             },
-            response_type=KisForeignDailyChart(
+            response_type=(KisForeignColumnarDailyChart if columnar else KisForeignDailyChart)(
                 symbol=symbol,
                 market=market,
             ),
@@ -429,7 +504,11 @@ def foreign_daily_chart(
         if best_bar != bars[-1]:
             bars.append(best_bar)
 
-        chart.bars = bars
+        chart.bars = (
+            chart.bars.take(bar.index for bar in bars)  # type: ignore
+            if isinstance(chart.bars, KisChartColumns)
+            else bars
+        )
 
     return drop_after(
         chart,
@@ -446,6 +525,7 @@ def daily_chart(
     end: date | None = None,
     period: Literal["day", "week", "month", "year"] = "day",
     adjust: bool = False,
+    columnar: bool = False,
 ) -> KisChart:
     """
     한국투자증권 기간 차트 조회
@@ -460,6 +540,7 @@ def daily_chart(
         end (date, optional): 조회 종료 시간. Defaults to None.
         period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
         adjust (bool, optional): 수정 주가 여부. Defaults to False.
+        columnar (bool, optional): 봉 목록을 열 기반 차트(`KisChartColumns`)로 저장할지 여부. Defaults to False.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -474,6 +555,7 @@ def daily_chart(
             end=end,
             period=period,
             adjust=adjust,
+            columnar=columnar,
         )
     else:
         return foreign_daily_chart(
@@ -484,6 +566,7 @@ def daily_chart(
             end=end,
             period=period,
             adjust=adjust,
+            columnar=columnar,
         )
 
 
@@ -493,6 +576,7 @@ def product_daily_chart(
     end: date | None = None,
     period: Literal["day", "week", "month", "year"] = "day",
     adjust: bool = False,
+    columnar: bool = False,
 ) -> KisChart:
     """
     한국투자증권 기간 차트 조회
@@ -505,6 +589,7 @@ def product_daily_chart(
         end (date, optional): 조회 종료 시간. Defaults to None.
         period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
         adjust (bool, optional): 수정 주가 여부. Defaults to False.
+        columnar (bool, optional): 봉 목록을 열 기반 차트(`KisChartColumns`)로 저장할지 여부. Defaults to False.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -519,4 +604,5 @@ def product_daily_chart(
         end=end,
         period=period,
         adjust=adjust,
+        columnar=columnar,
     )
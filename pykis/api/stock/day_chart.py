@@ -287,8 +287,10 @@ def drop_after(
         if period and i % period != 0:
             continue
 
-        bars.insert(0, bar)
+        bars.append(bar)
 
+    # 응답은 내림차순이므로 뒤집어 오름차순으로 만듭니다.
+    bars.reverse()
     chart.bars = bars
 
     return chart
@@ -1,7 +1,7 @@
 from datetime import date
 from decimal import Decimal
 from functools import cached_property
-from typing import TYPE_CHECKING, Literal, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Iterable, Iterator, Literal, Protocol, runtime_checkable
 
 from pykis.api.base.product import KisProductBase, KisProductProtocol
 from pykis.api.stock.market import (
@@ -23,6 +23,7 @@ from pykis.responses.types import (
     KisInt,
     KisString,
 )
+from pykis.utils.batch import KisBatchResult, batch_iter
 from pykis.utils.math import safe_divide
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
@@ -37,6 +38,8 @@ __all__ = [
     "KisQuote",
     "KisQuoteResponse",
     "quote",
+    "quotes",
+    "iter_quotes",
 ]
 
 STOCK_SIGN_TYPE = Literal["upper", "rise", "steady", "decline", "lower"]
@@ -735,6 +738,91 @@ def quote(
         )
 
 
+def iter_quotes(
+    self: "PyKis",
+    symbols: Iterable[str],
+    market: MARKET_TYPE,
+    extended: bool = False,
+    max_workers: int | None = None,
+) -> Iterator[KisBatchResult[str, KisQuoteResponse]]:
+    """
+    한국투자증권 여러 종목 주식 현재가 조회
+
+    종목별 현재가 조회를 동시에 요청하고, 조회가 완료되는 순서대로 결과를 반환합니다.
+    종목별 오류는 결과의 `error`에 담기며, 나머지 종목의 조회는 계속됩니다.
+
+    국내주식시세 -> 주식현재가 시세[v1_국내주식-008]
+    해외주식현재가 -> 해외주식 현재가상세[v1_해외주식-029]
+
+    Args:
+        symbols (Iterable[str]): 종목코드 목록
+        market (MARKET_TYPE): 시장구분
+        extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        max_workers (int | None, optional): 최대 동시 요청 수. 기본값은 시세 조회 도메인(실전도메인)의 초당 호출 제한 수입니다.
+
+    Examples:
+        >>> for result in kis.iter_quotes(["005930", "000660"], market="KRX"):
+        ...     if result.ok:
+        ...         print(result.key, result.result.price)
+    """
+    if max_workers is None:
+        # 요청 대기 시간 동안 호출 유량이 남지 않도록 초당 호출 제한 수만큼 동시에 요청합니다.
+        # 시세 조회는 모의투자에서도 실전도메인으로 요청하므로 실전도메인 호출 유량 제한을 따릅니다.
+        max_workers = self._rate_limit("real").rate
+
+    return batch_iter(
+        lambda symbol: quote(
+            self,
+            symbol=symbol,
+            market=market,
+            extended=extended,
+        ),
+        symbols,
+        max_workers=max_workers,
+    )
+
+
+def quotes(
+    self: "PyKis",
+    symbols: Iterable[str],
+    market: MARKET_TYPE,
+    extended: bool = False,
+    max_workers: int | None = None,
+) -> dict[str, KisBatchResult[str, KisQuoteResponse]]:
+    """
+    한국투자증권 여러 종목 주식 현재가 조회
+
+    종목별 현재가 조회를 동시에 요청하고, 모든 조회가 완료되면 종목코드 순서대로 결과를 반환합니다.
+    종목별 오류는 결과의 `error`에 담기며, 나머지 종목의 조회는 계속됩니다.
+
+    국내주식시세 -> 주식현재가 시세[v1_국내주식-008]
+    해외주식현재가 -> 해외주식 현재가상세[v1_해외주식-029]
+
+    Args:
+        symbols (Iterable[str]): 종목코드 목록
+        market (MARKET_TYPE): 시장구분
+        extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        max_workers (int | None, optional): 최대 동시 요청 수. 기본값은 시세 조회 도메인(실전도메인)의 초당 호출 제한 수입니다.
+
+    Examples:
+        >>> results = kis.quotes(["005930", "000660"], market="KRX")
+        >>> results["005930"].unwrap().price
+    """
+    symbols = list(dict.fromkeys(symbols))
+    results = {
+        result.key: result
+        for result in iter_quotes(
+            self,
+            symbols,
+            market=market,
+            extended=extended,
+            max_workers=max_workers,
+        )
+    }
+
+    return {symbol: results[symbol] for symbol in symbols}
+
+
 def product_quote(
     self: "KisProductProtocol",
     extended: bool = False,
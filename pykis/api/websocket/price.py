@@ -21,7 +21,11 @@ from pykis.event.filters.product import KisProductEventFilter
 from pykis.event.handler import KisEventFilter, KisEventTicket, KisMultiEventFilter
 from pykis.event.subscription import KisSubscriptionEventArgs
 from pykis.responses.types import KisAny, KisDecimal, KisInt, KisString
-from pykis.responses.websocket import KisWebsocketResponse, KisWebsocketResponseProtocol
+from pykis.responses.websocket import (
+    KisWebsocketResponse,
+    KisWebsocketResponseProtocol,
+    websocket_property,
+)
 from pykis.utils.math import safe_divide
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
@@ -500,10 +504,15 @@ class KisDomesticRealtimePrice(KisRealtimePriceBase):
     market: MARKET_TYPE = "KRX"
     """상품유형타입"""
 
-    time: datetime
-    """체결 시간"""
-    time_kst: datetime
-    """체결 시간(KST)"""
+    @websocket_property
+    def time(self) -> datetime:
+        """체결 시간"""
+        return datetime.strptime(self.__data__[33] + self.__data__[1], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
+
+    @websocket_property
+    def time_kst(self) -> datetime:
+        """체결 시간(KST)"""
+        return self.time.astimezone(TIMEZONE)
 
     timezone: tzinfo = TIMEZONE
     """시간대"""
@@ -532,24 +541,42 @@ class KisDomesticRealtimePrice(KisRealtimePriceBase):
 
     open: Decimal  # STCK_OPRC 주식 시가
     """당일시가"""
-    open_time: datetime  # OPRC_HOUR 시가 시간
-    """시가시간"""
-    open_time_kst: datetime  # OPRC_HOUR 시가 시간(KST)
-    """시가시간(KST)"""
+
+    @websocket_property
+    def open_time(self) -> datetime:  # OPRC_HOUR 시가 시간
+        """시가시간"""
+        return datetime.strptime(self.__data__[33] + self.__data__[24], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
+
+    @websocket_property
+    def open_time_kst(self) -> datetime:  # OPRC_HOUR 시가 시간(KST)
+        """시가시간(KST)"""
+        return self.open_time.astimezone(TIMEZONE)
 
     high: Decimal  # STCK_HGPR 주식 고가
     """당일고가"""
-    high_time: datetime  # HGPR_HOUR 최고가 시간
-    """고가시간"""
-    high_time_kst: datetime  # HGPR_HOUR 최고가 시간(KST)
-    """고가시간(KST)"""
+
+    @websocket_property
+    def high_time(self) -> datetime:  # HGPR_HOUR 최고가 시간
+        """고가시간"""
+        return datetime.strptime(self.__data__[33] + self.__data__[27], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
+
+    @websocket_property
+    def high_time_kst(self) -> datetime:  # HGPR_HOUR 최고가 시간(KST)
+        """고가시간(KST)"""
+        return self.high_time.astimezone(TIMEZONE)
 
     low: Decimal  # STCK_LWPR 주식 저가
     """당일저가"""
-    low_time: datetime  # LWPR_HOUR 최저가 시간
-    """저가시간"""
-    low_time_kst: datetime  # LWPR_HOUR 최저가 시간(KST)
-    """저가시간(KST)"""
+
+    @websocket_property
+    def low_time(self) -> datetime:  # LWPR_HOUR 최저가 시간
+        """저가시간"""
+        return datetime.strptime(self.__data__[33] + self.__data__[30], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
+
+    @websocket_property
+    def low_time_kst(self) -> datetime:  # LWPR_HOUR 최저가 시간(KST)
+        """저가시간(KST)"""
+        return self.low_time.astimezone(TIMEZONE)
 
     volume: int  # ACML_VOL 누적 거래량
     """누적거래량"""
@@ -573,18 +600,6 @@ class KisDomesticRealtimePrice(KisRealtimePriceBase):
     decimal_places: int = 1
     """소수점 자리수"""
 
-    def __pre_init__(self, data: list[str]):
-        super().__pre_init__(data)
-
-        self.time = datetime.strptime(data[33] + data[1], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
-        self.time_kst = self.time.astimezone(TIMEZONE)
-        self.open_time = datetime.strptime(data[33] + data[24], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
-        self.open_time_kst = self.open_time.astimezone(TIMEZONE)
-        self.high_time = datetime.strptime(data[33] + data[27], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
-        self.high_time_kst = self.high_time.astimezone(TIMEZONE)
-        self.low_time = datetime.strptime(data[33] + data[30], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
-        self.low_time_kst = self.low_time.astimezone(TIMEZONE)
-
 
 FOREIGN_REALTIME_PRICE_ORDER_CONDITION_MAP: dict[str, ORDER_CONDITION | None] = {
     "1": None,
@@ -651,10 +666,16 @@ class KisForeignRealtimePrice(KisRealtimePriceBase):
     market: MARKET_TYPE  # RSYM 실시간종목코드
     """상품유형타입"""
 
-    time: datetime  # XYMD 현지일자 + XHMS 현지시간
-    """체결 시간"""
-    time_kst: datetime  # XYMD 현지일자 + XHMS 현지시간
-    """체결 시간(KST)"""
+    @websocket_property
+    def time(self) -> datetime:  # XYMD 현지일자 + XHMS 현지시간
+        """체결 시간"""
+        return datetime.strptime(self.__data__[4] + self.__data__[5], "%Y%m%d%H%M%S").replace(tzinfo=self.timezone)
+
+    @websocket_property
+    def time_kst(self) -> datetime:  # XYMD 현지일자 + XHMS 현지시간
+        """체결 시간(KST)"""
+        return self.time.astimezone(TIMEZONE)
+
     timezone: tzinfo  # RSYM 실시간종목코드
     """시간대"""
 
@@ -729,9 +750,6 @@ class KisForeignRealtimePrice(KisRealtimePriceBase):
         ) = parse_foreign_realtime_symbol(data[0])
         self.timezone = get_market_timezone(self.market)
 
-        self.time = datetime.strptime(data[4] + data[5], "%Y%m%d%H%M%S").replace(tzinfo=self.timezone)
-        self.time_kst = self.time.astimezone(TIMEZONE)
-
 
 # IDE Type Checker
 if TYPE_CHECKING:
@@ -747,6 +765,7 @@ def on_price(
     where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
     once: bool = False,
     extended: bool = False,
+    max_rate: float | None = None,
 ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]]:
     """
     웹소켓 이벤트 핸들러 등록
@@ -761,6 +780,7 @@ def on_price(
         where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
         once (bool, optional): 한번만 실행 여부. Defaults to False.
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
     """
     filter = KisProductEventFilter(symbol=symbol, market=market)
 
@@ -778,6 +798,7 @@ def on_price(
         callback=callback,
         where=KisMultiEventFilter(filter, where) if where else filter,
         once=once,
+        max_rate=max_rate,
     )
 
 
@@ -787,6 +808,7 @@ def on_product_price(
     where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
     once: bool = False,
     extended: bool = False,
+    max_rate: float | None = None,
 ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]]:
     """
     웹소켓 이벤트 핸들러 등록
@@ -799,6 +821,7 @@ def on_product_price(
         where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
         once (bool, optional): 한번만 실행 여부. Defaults to False.
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 종목별 최신 시세만 전달합니다. Defaults to None.
     """
     return on_price(
         self.kis.websocket,
@@ -808,4 +831,5 @@ def on_product_price(
         where=where,
         once=once,
         extended=extended,
+        max_rate=max_rate,
     )
@@ -1,65 +1,341 @@
+import io
+import pickle
+import sqlite3
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from multiprocessing import Lock
 from multiprocessing.synchronize import Lock as LockType
-from typing import Any, TypeVar
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from requests import Response
+
+from pykis import logging
+from pykis.__env__ import CACHE_MAX_SIZE
+from pykis.client.object import KisObjectBase
+
+if TYPE_CHECKING:
+    from pykis.kis import PyKis
 
 __all__ = [
     "TObject",
+    "KisCacheStats",
     "KisCacheStorage",
 ]
 
 TObject = TypeVar("TObject")
 
 
-class KisCacheStorage:
-    """캐시 저장소"""
+class KisCacheStats:
+    """캐시 통계"""
 
     __slots__ = [
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "disk_hits",
+    ]
+
+    hits: int
+    """캐시 적중 횟수"""
+    misses: int
+    """캐시 미스 횟수"""
+    evictions: int
+    """용량 초과로 제거된 항목 수"""
+    expirations: int
+    """만료되어 제거된 항목 수"""
+    disk_hits: int
+    """디스크 캐시 적중 횟수"""
+
+    def __init__(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        evictions: int = 0,
+        expirations: int = 0,
+        disk_hits: int = 0,
+    ):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.expirations = expirations
+        self.disk_hits = disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def copy(self) -> "KisCacheStats":
+        return KisCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            disk_hits=self.disk_hits,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+            f"expirations={self.expirations}, disk_hits={self.disk_hits})"
+        )
+
+
+class _KisCachePickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, kis: "PyKis | None"):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.kis = kis
+
+    def persistent_id(self, obj: Any) -> str | None:
+        # API 객체는 저장하지 않고, 불러올 때 현재 API 객체로 대체합니다.
+        if self.kis is not None and obj is self.kis:
+            return "kis"
+
+        # 원본 HTTP 응답에는 인증 헤더가 포함되어 있으므로 저장하지 않습니다.
+        if isinstance(obj, Response):
+            return "response"
+
+        return None
+
+
+class _KisCacheUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, kis: "PyKis | None"):
+        super().__init__(file)
+        self.kis = kis
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "kis":
+            return self.kis
+
+        return None
+
+
+class KisCacheStorage(KisObjectBase):
+    """
+    캐시 저장소
+
+    최대 항목 수를 초과하면 가장 오래 사용하지 않은 항목부터 제거하며, 만료된 항목은 주기적으로 정리합니다.
+    경로를 지정하면 디스크 캐시(sqlite)를 함께 사용하여 프로세스를 다시 시작해도 캐시가 유지됩니다.
+
+    Note:
+        디스크 캐시는 pickle로 저장되므로 신뢰할 수 없는 경로를 사용하지 마세요.
+    """
+
+    __slots__ = [
+        "max_size",
+        "path",
+        "sweep_interval",
         "_data",
         "_expire",
         "_lock",
+        "_stats",
+        "_next_sweep",
+        "_connection",
     ]
 
-    _data: dict[str, Any]
-    """캐시 데이터"""
+    max_size: int | None
+    """최대 항목 수 (None: 제한 없음)"""
+    path: Path | None
+    """디스크 캐시 경로"""
+    sweep_interval: timedelta
+    """만료 항목 정리 주기"""
+
+    _data: "OrderedDict[str, Any]"
+    """캐시 데이터 (오래 사용하지 않은 순서)"""
     _expire: dict[str, datetime]
     """캐시 만료 시간"""
     _lock: LockType
     """Lock 객체"""
+    _stats: KisCacheStats
+    """캐시 통계"""
+    _next_sweep: datetime | None
+    """다음 만료 항목 정리 시간"""
+    _connection: sqlite3.Connection | None
+    """디스크 캐시 연결"""
+
+    def __init__(
+        self,
+        max_size: int | None = CACHE_MAX_SIZE,
+        path: str | PathLike[str] | None = None,
+        sweep_interval: timedelta = timedelta(minutes=1),
+    ):
+        """
+        캐시 저장소를 생성합니다.
+
+        Args:
+            max_size (int | None, optional): 최대 항목 수. None이면 제한하지 않습니다.
+            path (str | PathLike[str] | None, optional): 디스크 캐시(sqlite) 경로. 지정하지 않으면 메모리에만 저장합니다.
+            sweep_interval (timedelta, optional): 만료 항목 정리 주기
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("최대 항목 수는 1 이상이어야 합니다.")
 
-    def __init__(self):
-        self._data = {}
+        self.max_size = max_size
+        self.path = Path(path).resolve() if path is not None else None
+        self.sweep_interval = sweep_interval
+        self._data = OrderedDict()
         self._expire = {}
         self._lock = Lock()
+        self._stats = KisCacheStats()
+        self._next_sweep = None
+        self._connection = None
+
+    @property
+    def stats(self) -> KisCacheStats:
+        """캐시 통계의 복사본을 반환합니다."""
+        with self._lock:
+            return self._stats.copy()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    @property
+    def _kis(self) -> "PyKis | None":
+        return getattr(self, "kis", None)
+
+    @property
+    def _disk(self) -> sqlite3.Connection | None:
+        if self.path is None:
+            return None
+
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expire REAL)"
+            )
+
+        return self._connection
+
+    def _dumps(self, value: Any) -> bytes | None:
+        file = io.BytesIO()
+
+        try:
+            _KisCachePickler(file, self._kis).dump(value)
+        except Exception as e:
+            logging.logger.debug("디스크 캐시에 저장할 수 없는 데이터입니다: %s", e)
+            return None
+
+        return file.getvalue()
+
+    def _loads(self, data: bytes) -> Any:
+        return _KisCacheUnpickler(io.BytesIO(data), self._kis).load()
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+
+        while len(self._data) > self.max_size:
+            key, _ = self._data.popitem(last=False)
+            self._expire.pop(key, None)
+            self._stats.evictions += 1
+
+    def _sweep(self, now: datetime, force: bool = False) -> None:
+        if not force and self._next_sweep is not None and now < self._next_sweep:
+            return
+
+        self._next_sweep = now + self.sweep_interval
+
+        for key in [key for key, expire in self._expire.items() if expire < now]:
+            del self._data[key]
+            del self._expire[key]
+            self._stats.expirations += 1
+
+        if (disk := self._disk) is not None:
+            disk.execute("DELETE FROM cache WHERE expire IS NOT NULL AND expire < ?", (now.timestamp(),))
+
+    def _load_from_disk(self, key: str, now: datetime) -> bool:
+        if (disk := self._disk) is None:
+            return False
+
+        if (row := disk.execute("SELECT value, expire FROM cache WHERE key = ?", (key,)).fetchone()) is None:
+            return False
+
+        data, expire = row
+
+        if expire is not None and expire < now.timestamp():
+            disk.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return False
+
+        try:
+            value = self._loads(data)
+        except Exception as e:
+            logging.logger.debug("디스크 캐시를 불러올 수 없습니다: %s", e)
+            disk.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return False
+
+        self._data[key] = value
+
+        if expire is not None:
+            self._expire[key] = datetime.fromtimestamp(expire)
+
+        self._evict()
+        self._stats.disk_hits += 1
+
+        return True
 
     def set(self, key: str, value: Any, expire: datetime | timedelta | float | None = None):
         """캐시에 데이터를 저장합니다."""
         with self._lock:
+            now = datetime.now()
+            self._sweep(now)
+
             self._data[key] = value
+            self._data.move_to_end(key)
+            self._expire.pop(key, None)
 
             if expire is not None:
                 if isinstance(expire, timedelta):
-                    expire = datetime.now() + expire
+                    expire = now + expire
                 elif isinstance(expire, (float, int)):
-                    expire = datetime.now() + timedelta(seconds=expire)
+                    expire = now + timedelta(seconds=expire)
                 elif isinstance(expire, datetime):
                     expire = expire
 
                 self._expire[key] = expire
 
+            self._evict()
+
+            if (disk := self._disk) is not None:
+                if (data := self._dumps(value)) is not None:
+                    disk.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, expire) VALUES (?, ?, ?)",
+                        (key, data, expire.timestamp() if expire is not None else None),
+                    )
+                else:
+                    disk.execute("DELETE FROM cache WHERE key = ?", (key,))
+
     def get(self, key: str, type: type[TObject], default: TObject | None = None) -> TObject | None:
         """캐시에서 데이터를 조회합니다."""
         with self._lock:
-            if (data := self._data.get(key)) is None:
+            now = datetime.now()
+            self._sweep(now)
+
+            if key not in self._data and not self._load_from_disk(key, now):
+                self._stats.misses += 1
                 return default
 
-            if (expire := self._expire.get(key)) is not None and expire < datetime.now():
+            if (expire := self._expire.get(key)) is not None and expire < now:
                 del self._data[key]
+                del self._expire[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
                 return default
 
-            if not isinstance(data, type):
+            data = self._data[key]
+
+            if data is None or not isinstance(data, type):
+                self._stats.misses += 1
                 return default
 
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+
             return data
 
     def remove(self, key: str):
@@ -71,8 +347,30 @@ class KisCacheStorage:
             if key in self._expire:
                 del self._expire[key]
 
+            if (disk := self._disk) is not None:
+                disk.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def sweep(self):
+        """만료된 캐시 데이터를 정리합니다."""
+        with self._lock:
+            self._sweep(datetime.now(), force=True)
+
     def clear(self):
         """캐시를 초기화합니다."""
         with self._lock:
             self._data.clear()
             self._expire.clear()
+
+            if (disk := self._disk) is not None:
+                disk.execute("DELETE FROM cache")
+
+    def close(self):
+        """디스크 캐시 연결을 종료합니다."""
+        with self._lock:
+            connection, self._connection = self._connection, None
+
+            if connection is not None:
+                connection.close()
+
+    def __repr__(self) -> str:
+        return f"<KisCacheStorage size={len(self._data)} max_size={self.max_size} path={self.path}>"
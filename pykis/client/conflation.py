@@ -0,0 +1,365 @@
+import threading
+import time
+from itertools import chain
+from typing import TYPE_CHECKING, Callable
+
+from pykis import logging
+from pykis.client.messaging import KisWebsocketTR
+from pykis.client.object import KisObjectBase, kis_object_init
+from pykis.event.handler import KisEventFilter, KisEventHandler, KisEventTicket
+from pykis.event.subscription import KisSubscriptionEventArgs
+from pykis.responses.websocket import get_websocket_parser
+
+if TYPE_CHECKING:
+    from pykis.client.websocket import KisWebsocketClient
+
+__all__ = [
+    "KisWebsocketConflationStats",
+    "KisWebsocketConflator",
+]
+
+
+class KisWebsocketConflationStats:
+    """실시간 시세 병합 통계"""
+
+    __slots__ = [
+        "received",
+        "conflated",
+        "delivered",
+        "deferred",
+    ]
+
+    received: int
+    """병합 구독으로 수신된 행 수"""
+    conflated: int
+    """전달되기 전에 최신 데이터로 교체된 행 수"""
+    delivered: int
+    """전달된 최신 데이터 수"""
+    deferred: int
+    """병합 구독만 있어 수신 시점의 파싱을 생략한 행 수"""
+
+    def __init__(
+        self,
+        received: int = 0,
+        conflated: int = 0,
+        delivered: int = 0,
+        deferred: int = 0,
+    ):
+        self.received = received
+        self.conflated = conflated
+        self.delivered = delivered
+        self.deferred = deferred
+
+    def copy(self) -> "KisWebsocketConflationStats":
+        return KisWebsocketConflationStats(
+            received=self.received,
+            conflated=self.conflated,
+            delivered=self.delivered,
+            deferred=self.deferred,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(received={self.received}, conflated={self.conflated}, "
+            f"delivered={self.delivered}, deferred={self.deferred})"
+        )
+
+
+class _KisConflatedEntry:
+    """같은 TR과 전달 주기를 사용하는 병합 구독"""
+
+    __slots__ = ["tr", "interval", "event", "values", "response_type", "next_due"]
+
+    tr: KisWebsocketTR
+    """TR ID와 TR Key"""
+    interval: float
+    """최소 전달 간격 (초)"""
+    event: KisEventHandler["KisWebsocketClient", KisSubscriptionEventArgs]
+    """병합 구독 이벤트"""
+    values: tuple[str, ...] | None
+    """전달 대기 중인 최신 행"""
+    response_type: type | None
+    """최신 행의 응답 클래스"""
+    next_due: float
+    """다음 전달 가능 시간 (time.monotonic)"""
+
+    def __init__(self, tr: KisWebsocketTR, interval: float):
+        self.tr = tr
+        self.interval = interval
+        self.event = KisEventHandler()
+        self.values = None
+        self.response_type = None
+        self.next_due = 0
+
+
+_KisConflatedSnapshot = tuple[_KisConflatedEntry, tuple[str, ...], type]
+"""전달할 병합 구독, 최신 행, 응답 클래스"""
+
+
+class KisWebsocketConflator:
+    """
+    실시간 시세 병합기
+
+    TR ID와 TR Key(종목)별로 가장 최근에 수신한 행만 보관하고, 구독별 최대 전달 빈도에 맞춰 전달 스레드에서 콜백을 호출합니다.
+    병합 구독만 있는 종목의 행은 수신 시점에 파싱하지 않고, 전달할 때 최신 행 하나만 파싱합니다.
+
+    Note:
+        병합 구독만 있는 종목의 행은 `KisWebsocketClient.event`로 전달되지 않습니다.
+    """
+
+    __slots__ = [
+        "client",
+        "_entries",
+        "_ids",
+        "_condition",
+        "_deliver_lock",
+        "_thread",
+        "_closed",
+        "_stats",
+    ]
+
+    client: "KisWebsocketClient"
+    """이벤트를 발생시키는 웹소켓 클라이언트"""
+
+    _entries: dict[KisWebsocketTR, list[_KisConflatedEntry]]
+    """TR별 병합 구독 목록"""
+    _ids: frozenset[str]
+    """병합 구독이 있는 TR ID 목록"""
+    _condition: threading.Condition
+    """병합 상태 조건 변수"""
+    _deliver_lock: threading.Lock
+    """콜백이 동시에 호출되지 않도록 하는 락"""
+    _thread: threading.Thread | None
+    """전달 스레드"""
+    _closed: bool
+    """종료 여부"""
+    _stats: KisWebsocketConflationStats
+    """병합 통계"""
+
+    def __init__(self, client: "KisWebsocketClient"):
+        self.client = client
+        self._entries = {}
+        self._ids = frozenset()
+        self._condition = threading.Condition()
+        self._deliver_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self._stats = KisWebsocketConflationStats()
+
+    @property
+    def stats(self) -> KisWebsocketConflationStats:
+        """병합 통계의 복사본을 반환합니다."""
+        with self._condition:
+            return self._stats.copy()
+
+    @property
+    def closed(self) -> bool:
+        """종료 여부"""
+        return self._closed
+
+    def accepts(self, id: str) -> bool:
+        """TR ID에 병합 구독이 있는지 여부를 반환합니다."""
+        return id in self._ids
+
+    def on(
+        self,
+        id: str,
+        key: str,
+        handler: Callable[["KisWebsocketClient", KisSubscriptionEventArgs], None],
+        max_rate: float,
+        where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs] | None = None,
+        once: bool = False,
+    ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs]:
+        """
+        병합 구독 이벤트를 등록합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key
+            handler (Callable[[KisWebsocketClient, KisSubscriptionEventArgs], None]): 콜백 함수
+            max_rate (float): 최대 전달 빈도 (초당 횟수)
+            where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs] | None, optional): 이벤트 필터
+            once (bool, optional): 한번만 실행 여부
+
+        Raises:
+            ValueError: 최대 전달 빈도가 0 이하인 경우
+        """
+        if max_rate <= 0:
+            raise ValueError("최대 전달 빈도는 0보다 커야 합니다.")
+
+        interval = 1 / max_rate
+        tr = KisWebsocketTR(id, key)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("종료된 병합기입니다.")
+
+            entries = self._entries.setdefault(tr, [])
+
+            if (entry := next((entry for entry in entries if entry.interval == interval), None)) is None:
+                entry = _KisConflatedEntry(tr, interval)
+                entries.append(entry)
+
+            ticket = entry.event.on(handler, where=where, once=once)
+            self._ids = frozenset(key.id for key in self._entries)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="pykis-websocket-conflator",
+                    daemon=True,
+                )
+                self._thread.start()
+
+        return ticket
+
+    def offer(self, id: str, count: int, body: str, response_type: type) -> tuple[int, str]:
+        """
+        수신한 행을 병합 구독에 보관합니다.
+
+        Args:
+            id (str): TR ID
+            count (int): 행 수
+            body (str): 복호화된 메시지 본문
+            response_type (type): 응답 클래스
+
+        Returns:
+            tuple[int, str]: 수신 시점에 파싱해야 하는 행 수와 메시지 본문
+        """
+        if not (fields := getattr(response_type, "__fields__", None)):
+            return count, body
+
+        items = body.split("^")
+
+        if len(items) % len(fields) != 0:
+            # 잘못된 메시지는 기존 파싱 경로에서 오류를 기록합니다.
+            return count, body
+
+        rows = list(zip(*[iter(items)] * len(fields)))
+        remaining = []
+        notify = False
+
+        with self._condition:
+            for values in rows:
+                listeners = 0
+
+                for entry in self._entries.get(KisWebsocketTR(id, values[0]), ()):
+                    if not entry.event:
+                        continue
+
+                    listeners += len(entry.event)
+
+                    if entry.values is None:
+                        notify = True
+                    else:
+                        self._stats.conflated += 1
+
+                    entry.values = values
+                    entry.response_type = response_type
+
+                if not listeners:
+                    remaining.append(values)
+                    continue
+
+                self._stats.received += 1
+
+                # 같은 종목에 일반 구독이 함께 있으면 수신 시점에도 파싱합니다.
+                if listeners == self.client._reference_store.get(f"{id}:{values[0]}"):
+                    self._stats.deferred += 1
+                else:
+                    remaining.append(values)
+
+            if notify:
+                self._condition.notify_all()
+
+        if len(remaining) == len(rows):
+            return count, body
+
+        return len(remaining), "^".join(chain.from_iterable(remaining))
+
+    def _collect(self, now: float, force: bool = False) -> tuple[list[_KisConflatedSnapshot], float | None]:
+        """전달할 최신 행과 다음 전달까지 남은 시간을 반환합니다."""
+        due = []
+        wait = None
+
+        for tr, entries in list(self._entries.items()):
+            for entry in entries.copy():
+                if not entry.event:
+                    entries.remove(entry)
+                    continue
+
+                if entry.values is None:
+                    continue
+
+                if force or entry.next_due <= now:
+                    due.append((entry, entry.values, entry.response_type))
+                    entry.values = None
+                    entry.next_due = now + entry.interval
+                elif wait is None or entry.next_due - now < wait:
+                    wait = entry.next_due - now
+
+            if not entries:
+                del self._entries[tr]
+                self._ids = frozenset(key.id for key in self._entries)
+
+        return due, wait
+
+    def _deliver(self, due: list[_KisConflatedSnapshot]):
+        with self._deliver_lock:
+            for entry, values, response_type in due:
+                try:
+                    response = get_websocket_parser(response_type, lazy=self.client.lazy)(values)
+
+                    if isinstance(response, KisObjectBase):
+                        kis_object_init(self.client.kis, response)
+
+                    entry.event.invoke(
+                        self.client,
+                        KisSubscriptionEventArgs(
+                            tr=KisWebsocketTR(entry.tr.id, ""),
+                            response=response,
+                        ),
+                    )
+                except Exception as e:
+                    logging.logger.exception("RTC Failed to emit conflated event: %s %s", entry.tr, e)
+
+            with self._condition:
+                self._stats.delivered += len(due)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+
+                    due, wait = self._collect(time.monotonic())
+
+                    if due:
+                        break
+
+                    self._condition.wait(wait)
+
+            self._deliver(due)
+
+    def flush(self):
+        """전달 주기와 관계없이 대기 중인 최신 데이터를 현재 스레드에서 즉시 전달합니다."""
+        with self._condition:
+            due, _ = self._collect(time.monotonic(), force=True)
+
+        self._deliver(due)
+
+    def close(self, wait: bool = True, timeout: float | None = None):
+        """
+        병합기를 종료합니다. 대기 중인 최신 데이터는 전달되지 않습니다.
+
+        Args:
+            wait (bool): 전달 스레드가 종료될 때까지 기다릴지 여부
+            timeout (float | None): 대기 시간 (초)
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if wait and self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
@@ -0,0 +1,377 @@
+import io
+import sqlite3
+from datetime import date, timedelta
+from os import PathLike
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar
+
+from pykis.client.account import KisAccountNumber
+from pykis.client.cache import _KisCachePickler, _KisCacheUnpickler
+from pykis.utils.workspace import get_cache_path
+
+if TYPE_CHECKING:
+    from pykis.kis import PyKis
+
+__all__ = [
+    "KisJournalStats",
+    "KisJournal",
+]
+
+TRow = TypeVar("TRow")
+
+
+class KisJournalStats:
+    """조회 기록 통계"""
+
+    __slots__ = [
+        "syncs",
+        "fetches",
+        "fetched",
+        "loaded",
+    ]
+
+    syncs: int
+    """동기화 횟수"""
+    fetches: int
+    """기록에 없어 API로 조회한 기간 수"""
+    fetched: int
+    """API로 조회한 항목 수"""
+    loaded: int
+    """기록에서 불러온 항목 수"""
+
+    def __init__(
+        self,
+        syncs: int = 0,
+        fetches: int = 0,
+        fetched: int = 0,
+        loaded: int = 0,
+    ):
+        self.syncs = syncs
+        self.fetches = fetches
+        self.fetched = fetched
+        self.loaded = loaded
+
+    def copy(self) -> "KisJournalStats":
+        return KisJournalStats(
+            syncs=self.syncs,
+            fetches=self.fetches,
+            fetched=self.fetched,
+            loaded=self.loaded,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(syncs={self.syncs}, fetches={self.fetches}, "
+            f"fetched={self.fetched}, loaded={self.loaded})"
+        )
+
+
+class KisJournal:
+    """
+    계좌 조회 기록 (sqlite)
+
+    체결내역, 기간 손익 등 날짜별로 조회하는 계좌 정보를 계좌번호와 종류별로 저장하고,
+    확정된 날짜까지의 동기화 기준일(watermark)을 함께 기록합니다.
+    다시 조회할 때는 기준일 이후와 기록에 없는 기간만 API로 조회합니다.
+
+    Note:
+        기록은 pickle로 저장되므로 신뢰할 수 없는 경로를 사용하지 마세요.
+    """
+
+    __slots__ = [
+        "path",
+        "_connection",
+        "_lock",
+        "_stats",
+    ]
+
+    path: Path | None
+    """기록 파일 경로 (None: 메모리)"""
+
+    _connection: sqlite3.Connection | None
+    """기록 연결"""
+    _lock: Lock
+    """Lock 객체"""
+    _stats: KisJournalStats
+    """기록 통계"""
+
+    def __init__(self, path: str | PathLike[str] | None = None, memory: bool = False):
+        """
+        계좌 조회 기록을 생성합니다.
+
+        Args:
+            path (str | PathLike[str] | None, optional): 기록 파일(sqlite) 경로. 기본 저장 경로: `~/.pykis/cache/journal.db`
+            memory (bool, optional): 파일에 저장하지 않고 메모리에만 기록할지 여부
+        """
+        self.path = None if memory else Path(path or get_cache_path() / "journal.db").resolve()
+        self._connection = None
+        self._lock = Lock()
+        self._stats = KisJournalStats()
+
+    @property
+    def stats(self) -> KisJournalStats:
+        """기록 통계의 복사본을 반환합니다."""
+        with self._lock:
+            return self._stats.copy()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            self._connection = sqlite3.connect(
+                self.path if self.path is not None else ":memory:",
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS rows (
+                    account TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    PRIMARY KEY (account, kind, key)
+                );
+                CREATE INDEX IF NOT EXISTS rows_day ON rows (account, kind, day);
+                CREATE TABLE IF NOT EXISTS watermarks (
+                    account TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    first TEXT NOT NULL,
+                    last TEXT NOT NULL,
+                    PRIMARY KEY (account, kind)
+                );
+                """
+            )
+
+        return self._connection
+
+    @staticmethod
+    def _dumps(kis: "PyKis", value: Any) -> bytes:
+        file = io.BytesIO()
+        _KisCachePickler(file, kis).dump(value)
+        return file.getvalue()
+
+    @staticmethod
+    def _loads(kis: "PyKis", data: bytes) -> Any:
+        return _KisCacheUnpickler(io.BytesIO(data), kis).load()
+
+    def watermark(self, account: KisAccountNumber, kind: str) -> tuple[date, date] | None:
+        """
+        동기화된 기간을 반환합니다.
+
+        Args:
+            account (KisAccountNumber): 계좌번호
+            kind (str): 기록 종류
+
+        Returns:
+            (시작일, 기준일) 또는 동기화된 기간이 없는 경우 None
+        """
+        with self._lock:
+            return self._watermark(str(account), kind)
+
+    def _watermark(self, account: str, kind: str) -> tuple[date, date] | None:
+        row = self._db.execute(
+            "SELECT first, last FROM watermarks WHERE account = ? AND kind = ?",
+            (account, kind),
+        ).fetchone()
+
+        return (date.fromisoformat(row[0]), date.fromisoformat(row[1])) if row else None
+
+    def missing(self, account: KisAccountNumber, kind: str, start: date, end: date) -> list[tuple[date, date]]:
+        """
+        조회 기간 중 동기화되지 않은 기간을 반환합니다.
+
+        조회 기간이 동기화된 기간과 떨어져 있으면 사이 기간을 포함하여, 조회한 기간이 동기화된 기간에 이어지도록 합니다.
+
+        Args:
+            account (KisAccountNumber): 계좌번호
+            kind (str): 기록 종류
+            start (date): 조회 시작일
+            end (date): 조회 종료일
+        """
+        if (watermark := self.watermark(account, kind)) is None:
+            return [(start, end)]
+
+        first, last = watermark
+        ranges = []
+
+        if start < first:
+            ranges.append((start, first - timedelta(days=1)))
+
+        if end > last:
+            ranges.append((last + timedelta(days=1), end))
+
+        return ranges
+
+    def load(self, kis: "PyKis", account: KisAccountNumber, kind: str, start: date, end: date) -> list[Any]:
+        """
+        기록된 항목을 불러옵니다.
+
+        Args:
+            kis (PyKis): 한국투자증권 API
+            account (KisAccountNumber): 계좌번호
+            kind (str): 기록 종류
+            start (date): 조회 시작일
+            end (date): 조회 종료일
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT value FROM rows WHERE account = ? AND kind = ? AND day BETWEEN ? AND ? ORDER BY day, key",
+                (str(account), kind, start.isoformat(), end.isoformat()),
+            ).fetchall()
+
+            self._stats.loaded += len(rows)
+
+        return [self._loads(kis, value) for value, in rows]
+
+    def store(
+        self,
+        kis: "PyKis",
+        account: KisAccountNumber,
+        kind: str,
+        start: date,
+        end: date,
+        rows: Iterable[tuple[date, str | None, Any]],
+        final: date,
+    ):
+        """
+        조회 기간의 항목을 기록합니다.
+
+        기존에 기록된 해당 기간의 항목은 모두 교체되며, 기간 중 `final` 이전 날짜는 동기화된 기간에 포함됩니다.
+        항목의 날짜가 조회 기간을 벗어나면 조회 기간의 경계 날짜로 기록하여, 같은 기간을 다시 조회할 때 함께 교체되도록 합니다.
+
+        Args:
+            kis (PyKis): 한국투자증권 API
+            account (KisAccountNumber): 계좌번호
+            kind (str): 기록 종류
+            start (date): 조회 시작일
+            end (date): 조회 종료일
+            rows (Iterable[tuple[date, str | None, Any]]): (날짜, 고유 키, 항목) 목록
+            final (date): 확정된 마지막 날짜. 이후 날짜는 다음 동기화 때 다시 조회합니다.
+        """
+        data = []
+
+        for index, (day, key, value) in enumerate(rows):
+            day = min(max(day, start), end).isoformat()
+            # 고유 키가 없는 항목은 같은 기간을 다시 조회할 때 함께 교체되므로 조회 순서로 구분합니다.
+            data.append((day, key if key is not None else f"{day}#{index:06d}", self._dumps(kis, value)))
+
+        account_key = str(account)
+
+        with self._lock:
+            db = self._db
+            db.execute("BEGIN")
+
+            try:
+                db.execute(
+                    "DELETE FROM rows WHERE account = ? AND kind = ? AND day BETWEEN ? AND ?",
+                    (account_key, kind, start.isoformat(), end.isoformat()),
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO rows (account, kind, key, day, value) VALUES (?, ?, ?, ?, ?)",
+                    [(account_key, kind, key, day, value) for day, key, value in data],
+                )
+
+                if start <= (last := min(end, final)):
+                    first = start
+
+                    if (watermark := self._watermark(account_key, kind)) is not None:
+                        # 기존 기간과 이어지지 않으면 기존 기간을 유지합니다.
+                        if start > watermark[1] + timedelta(days=1) or last < watermark[0] - timedelta(days=1):
+                            first, last = watermark
+                        else:
+                            first, last = min(first, watermark[0]), max(last, watermark[1])
+
+                    db.execute(
+                        "INSERT OR REPLACE INTO watermarks (account, kind, first, last) VALUES (?, ?, ?, ?)",
+                        (account_key, kind, first.isoformat(), last.isoformat()),
+                    )
+
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    def sync(
+        self,
+        kis: "PyKis",
+        account: KisAccountNumber,
+        kind: str,
+        start: date,
+        end: date,
+        fetch: Callable[[date, date], Iterable[TRow]],
+        day: Callable[[TRow], date],
+        final: date,
+        key: Callable[[TRow], str] | None = None,
+    ) -> list[TRow]:
+        """
+        동기화되지 않은 기간만 조회하여 기록한 뒤, 조회 기간의 모든 항목을 반환합니다.
+
+        Args:
+            kis (PyKis): 한국투자증권 API
+            account (KisAccountNumber): 계좌번호
+            kind (str): 기록 종류
+            start (date): 조회 시작일
+            end (date): 조회 종료일
+            fetch (Callable[[date, date], Iterable[TRow]]): 기간의 항목을 API로 조회하는 함수
+            day (Callable[[TRow], date]): 항목의 날짜를 반환하는 함수
+            final (date): 확정된 마지막 날짜
+            key (Callable[[TRow], str] | None, optional): 항목의 고유 키를 반환하는 함수
+        """
+        with self._lock:
+            self._stats.syncs += 1
+
+        for range_start, range_end in self.missing(account, kind, start, end):
+            rows = list(fetch(range_start, range_end))
+
+            self.store(
+                kis,
+                account,
+                kind,
+                range_start,
+                range_end,
+                ((day(row), key(row) if key is not None else None, row) for row in rows),
+                final=final,
+            )
+
+            with self._lock:
+                self._stats.fetches += 1
+                self._stats.fetched += len(rows)
+
+        return self.load(kis, account, kind, start, end)
+
+    def clear(self, account: KisAccountNumber | None = None):
+        """
+        기록을 삭제합니다.
+
+        Args:
+            account (KisAccountNumber | None, optional): 계좌번호. None이면 모든 계좌의 기록을 삭제합니다.
+        """
+        with self._lock:
+            if account is None:
+                self._db.execute("DELETE FROM rows")
+                self._db.execute("DELETE FROM watermarks")
+            else:
+                self._db.execute("DELETE FROM rows WHERE account = ?", (str(account),))
+                self._db.execute("DELETE FROM watermarks WHERE account = ?", (str(account),))
+
+    def close(self):
+        """기록 연결을 종료합니다."""
+        with self._lock:
+            connection, self._connection = self._connection, None
+
+            if connection is not None:
+                connection.close()
+
+    def __enter__(self) -> "KisJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<KisJournal path={self.path}>"
@@ -0,0 +1,181 @@
+import json
+import os
+import time
+from datetime import timedelta
+from os import PathLike
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from pykis import logging
+
+if TYPE_CHECKING:
+    from pykis.api.stock.market import MARKET_TYPE
+
+__all__ = [
+    "KisMarketIndex",
+]
+
+
+class KisMarketIndex:
+    """
+    종목 상품유형 색인
+
+    조회한 종목의 상품유형을 저장하여, 종목 Scope를 생성할 때 상품기본정보 조회를 생략합니다.
+    경로를 지정하면 색인을 파일에 저장하고, 처음 조회할 때 파일에서 불러옵니다.
+    """
+
+    __slots__ = [
+        "path",
+        "expire",
+        "_data",
+        "_loaded",
+        "_lock",
+    ]
+
+    path: Path | None
+    """색인 파일 경로"""
+    expire: timedelta
+    """색인 유효기간"""
+
+    _data: dict[str, tuple[str, "MARKET_TYPE", float]]
+    """색인 데이터 (조회 키 -> (종목코드, 상품유형, 저장 시각))"""
+    _loaded: bool
+    """색인 파일 로드 여부"""
+    _lock: Lock
+    """Lock 객체"""
+
+    def __init__(
+        self,
+        path: str | PathLike[str] | None = None,
+        expire: timedelta = timedelta(days=1),
+    ):
+        """
+        종목 상품유형 색인을 생성합니다.
+
+        Args:
+            path (str | PathLike[str] | None, optional): 색인 파일 경로. 지정하지 않으면 메모리에만 저장합니다.
+            expire (timedelta, optional): 색인 유효기간. 유효기간이 지난 종목은 다시 조회합니다.
+        """
+        self.path = Path(path).resolve() if path is not None else None
+        self.expire = expire
+        self._data = {}
+        self._loaded = self.path is None
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(symbol: str, market: str | None) -> str:
+        # 같은 종목코드라도 조회한 상품유형에 따라 해석 결과가 다를 수 있습니다. (예: KRX, SZSE)
+        return f"{market}:{symbol}"
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+
+        self._loaded = True
+
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+
+            self._data.update({key: tuple(value) for key, value in data.items()})  # type: ignore
+            logging.logger.debug("종목 상품유형 색인을 불러왔습니다. (%d개)", len(data))
+        except Exception as e:
+            logging.logger.warning("종목 상품유형 색인을 불러오지 못했습니다: %s", e)
+
+    def get(self, symbol: str, market: str | None = None) -> tuple[str, "MARKET_TYPE"] | None:
+        """
+        색인에서 종목을 조회합니다.
+
+        Args:
+            symbol (str): 종목코드
+            market (str | None, optional): 조회한 상품유형명
+
+        Returns:
+            (종목코드, 상품유형) 또는 색인에 없거나 유효기간이 지난 경우 None
+        """
+        with self._lock:
+            self._load()
+
+            if (value := self._data.get(self._key(symbol, market))) is None:
+                return None
+
+            resolved_symbol, resolved_market, saved_at = value
+
+            if time.time() - saved_at > self.expire.total_seconds():
+                return None
+
+            return resolved_symbol, resolved_market
+
+    def set(
+        self,
+        symbol: str,
+        market: str | None,
+        resolved_symbol: str,
+        resolved_market: "MARKET_TYPE",
+        save: bool = True,
+    ) -> None:
+        """
+        색인에 종목을 저장합니다.
+
+        Args:
+            symbol (str): 조회한 종목코드
+            market (str | None): 조회한 상품유형명
+            resolved_symbol (str): 조회된 종목코드
+            resolved_market (MARKET_TYPE): 조회된 상품유형
+            save (bool, optional): 색인 파일 저장 여부
+        """
+        with self._lock:
+            self._load()
+            self._data[self._key(symbol, market)] = (resolved_symbol, resolved_market, time.time())
+
+        if save:
+            self.save()
+
+    def remove(self, symbol: str, market: str | None = None) -> None:
+        """색인에서 종목을 삭제합니다."""
+        with self._lock:
+            self._load()
+            self._data.pop(self._key(symbol, market), None)
+
+        self.save()
+
+    def clear(self) -> None:
+        """색인을 초기화합니다."""
+        with self._lock:
+            self._loaded = True
+            self._data.clear()
+
+        self.save()
+
+    def save(self) -> None:
+        """색인을 파일에 저장합니다."""
+        if self.path is None:
+            return
+
+        with self._lock:
+            self._load()
+            now = time.time()
+            data = {
+                key: value for key, value in self._data.items() if now - value[2] <= self.expire.total_seconds()
+            }
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+            # 다른 프로세스가 읽는 도중에 파일이 잘리지 않도록 임시 파일을 교체합니다.
+            with open(temp_path, "w") as f:
+                json.dump(data, f)
+
+            os.replace(temp_path, self.path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<KisMarketIndex path={self.path} expire={self.expire}>"
@@ -1,7 +1,7 @@
-from typing import TYPE_CHECKING, Any, Literal
+from base64 import b64decode
+from typing import TYPE_CHECKING, Any, Iterable, Literal
 
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from pykis.client.form import KisForm
@@ -9,6 +9,7 @@ from pykis.client.object import KisObjectBase
 from pykis.utils.repr import kis_repr
 
 if TYPE_CHECKING:
+    from pykis.client.appkey import KisKey
     from pykis.kis import PyKis
 
 __all__ = [
@@ -34,6 +35,8 @@ class KisWebsocketRequest(KisForm, KisObjectBase):
     """요청 본문"""
     domain: Literal["real", "virtual"] | None = None
     """요청 도메인"""
+    appkey: "KisKey | None" = None
+    """추가 웹소켓 세션의 앱 키"""
 
     def __init__(
         self,
@@ -41,22 +44,24 @@ class KisWebsocketRequest(KisForm, KisObjectBase):
         type: str,
         body: KisWebsocketForm | None = None,
         domain: Literal["real", "virtual"] | None = None,
+        appkey: "KisKey | None" = None,
     ):
         super().__init__()
         self.kis = kis
         self.type = type
         self.body = body
         self.domain = domain
+        self.appkey = appkey
 
     def build(self, dict: dict[str, Any] | None = None) -> dict[str, Any]:
-        from pykis.api.auth.websocket import websocket_approval_key
-
         dict = dict or {}
 
         dict["header"] = {
-            "approval_key": websocket_approval_key(
-                self.kis,
-                domain=self.domain,
+            # 재접속 시 구독 복원 요청마다 접속 키를 발급하지 않도록 캐시된 접속 키를 사용합니다.
+            "approval_key": (
+                self.kis.approval_key(self.domain, appkey=self.appkey)
+                if self.appkey is not None
+                else self.kis.approval_key(self.domain)
             ).approval_key,
             "custtype": "P",
             "tr_type": self.type,
@@ -69,6 +74,9 @@ class KisWebsocketRequest(KisForm, KisObjectBase):
         return dict
 
 
+AES_BLOCK_SIZE = algorithms.AES.block_size // 8
+"""AES 블록 크기 (bytes)"""
+
 TR_SUBSCRIBE_TYPE: str = "1"
 TR_UNSUBSCRIBE_TYPE: str = "2"
 
@@ -130,6 +138,8 @@ class KisWebsocketEncryptionKey:
     __slots__ = [
         "iv",
         "key",
+        "_cipher",
+        "_iv_int",
     ]
 
     iv: bytes
@@ -137,24 +147,86 @@ class KisWebsocketEncryptionKey:
     key: bytes
     """Key"""
 
+    _cipher: Cipher | None
+    """AES-CBC 암호 객체 (메시지마다 새 복호화 컨텍스트만 생성합니다)"""
+    _iv_int: int
+    """일괄 복호화 시 첫 블록 보정에 사용하는 IV 정수값"""
+
     def __init__(self, iv: bytes, key: bytes):
         super().__init__()
 
         self.iv = iv
         self.key = key
+        self._cipher = None
+        self._iv_int = int.from_bytes(iv, "big")
 
     @property
-    def cipher(self):
-        return Cipher(algorithms.AES(self.key), modes.CBC(self.iv), backend=default_backend())
+    def cipher(self) -> Cipher:
+        if self._cipher is None:
+            self._cipher = Cipher(algorithms.AES(self.key), modes.CBC(self.iv), backend=default_backend())
+
+        return self._cipher
+
+    @staticmethod
+    def _unpad(data: bytes) -> bytes:
+        # PKCS7 패딩 제거
+        if not data or not 0 < (size := data[-1]) <= AES_BLOCK_SIZE or data[-size:] != bytes((size,)) * size:
+            raise ValueError("Invalid padding bytes.")
+
+        return data[:-size]
 
     def decrypt(self, data: bytes) -> bytes:
         decryptor = self.cipher.decryptor()
-        decrypted_data = decryptor.update(data) + decryptor.finalize()
+        return self._unpad(decryptor.update(data) + decryptor.finalize())
+
+    def decrypt_batch(self, data: Iterable[bytes]) -> list[bytes]:
+        """
+        여러 메시지를 한 번에 복호화합니다.
+
+        모든 메시지는 같은 키와 IV로 암호화되므로, 메시지를 이어붙여 하나의 복호화 컨텍스트로 처리한 뒤
+        두 번째 메시지부터 이전 메시지의 마지막 블록과 IV의 차이만큼 첫 블록을 보정합니다.
+        """
+        data = list(data)
 
-        # Unpadding the decrypted data
-        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()  # type: ignore
-        unpadded_data = unpadder.update(decrypted_data) + unpadder.finalize()
-        return unpadded_data
+        if len(data) < 2:
+            return [self.decrypt(item) for item in data]
+
+        for item in data:
+            if not item or len(item) % AES_BLOCK_SIZE:
+                raise ValueError("The length of the provided data is not a multiple of the block length.")
+
+        decryptor = self.cipher.decryptor()
+        decrypted = decryptor.update(b"".join(data)) + decryptor.finalize()
+
+        result = []
+        offset = 0
+        previous = None
+
+        for item in data:
+            chunk = decrypted[offset : offset + len(item)]
+
+            if previous is not None:
+                # CBC: P0 = D(C0) ^ IV 이지만 이어붙인 경우 D(C0) ^ (이전 메시지의 마지막 블록)으로 복호화됩니다.
+                block = int.from_bytes(chunk[:AES_BLOCK_SIZE], "big") ^ previous ^ self._iv_int
+                chunk = block.to_bytes(AES_BLOCK_SIZE, "big") + chunk[AES_BLOCK_SIZE:]
+
+            result.append(self._unpad(chunk))
+            previous = int.from_bytes(item[-AES_BLOCK_SIZE:], "big")
+            offset += len(item)
+
+        return result
 
     def text(self, data: bytes) -> str:
         return self.decrypt(data).decode("utf-8")
+
+    def text_batch(self, data: Iterable[bytes]) -> list[str]:
+        """여러 메시지를 한 번에 복호화하여 문자열로 반환합니다."""
+        return [item.decode("utf-8") for item in self.decrypt_batch(data)]
+
+    def decode(self, data: str) -> str:
+        """Base64로 인코딩된 메시지를 복호화하여 문자열로 반환합니다."""
+        return self.decrypt(b64decode(data)).decode("utf-8")
+
+    def decode_batch(self, data: Iterable[str]) -> list[str]:
+        """Base64로 인코딩된 여러 메시지를 한 번에 복호화하여 문자열로 반환합니다."""
+        return self.text_batch(b64decode(item) for item in data)
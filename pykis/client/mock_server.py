@@ -0,0 +1,1081 @@
+import hashlib
+import json
+import random
+import secrets
+import struct
+import threading
+import time
+import zlib
+from base64 import b64encode
+from collections import deque
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+from urllib.parse import parse_qsl, urlsplit
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from pykis import logging
+from pykis.__env__ import WEBSOCKET_MAX_SUBSCRIPTIONS
+from pykis.client.auth import KisAuth
+from pykis.utils.timezone import TIMEZONE
+
+if TYPE_CHECKING:
+    from pykis.kis import PyKis
+
+__all__ = [
+    "KisMockRequest",
+    "KisMockResponse",
+    "KisMockServerStats",
+    "KisMockServer",
+]
+
+MOCK_ERRORS: dict[str, str] = {
+    "EGW00121": "유효하지 않은 token 입니다.",
+    "EGW00123": "기간이 만료된 token 입니다.",
+    "EGW00201": "초당 거래건수를 초과하였습니다.",
+}
+"""모의 서버 오류 코드별 메시지"""
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+PRICE_ROW = [
+    "", "", "", "2", "500", "0.72", "0", "0", "0", "0",
+    "0", "0", "1", "0", "0", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "0",
+]
+"""국내주식 실시간체결가 (H0STCNT0) 행 템플릿"""
+
+EXECUTION_TR_IDS = frozenset(("H0STCNI0", "H0STCNI9"))
+"""국내주식 실시간체결통보 TR ID"""
+
+
+class KisMockRequest:
+    """모의 서버 요청"""
+
+    __slots__ = ["method", "path", "params", "headers", "body"]
+
+    method: str
+    """요청 메서드"""
+    path: str
+    """요청 경로"""
+    params: dict[str, str]
+    """쿼리 파라미터"""
+    headers: dict[str, str]
+    """요청 헤더 (소문자 키)"""
+    body: dict[str, Any]
+    """요청 본문"""
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+        body: dict[str, Any],
+    ):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.headers = headers
+        self.body = body
+
+    @property
+    def tr_id(self) -> str:
+        """TR ID"""
+        return self.headers.get("tr_id", "")
+
+    @property
+    def virtual(self) -> bool:
+        """모의투자 TR 여부"""
+        return self.tr_id.startswith("V")
+
+    @property
+    def appkey(self) -> str:
+        """앱 키"""
+        return self.headers.get("appkey") or self.body.get("appkey", "")
+
+    def get(self, key: str, default: str = "") -> str:
+        """쿼리 파라미터 또는 본문에서 값을 찾습니다."""
+        return self.params.get(key, self.body.get(key, default))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(method={self.method!r}, path={self.path!r}, tr_id={self.tr_id!r})"
+
+
+class KisMockResponse:
+    """모의 서버 응답"""
+
+    __slots__ = ["data", "status", "tr_cont"]
+
+    data: dict[str, Any]
+    """응답 본문"""
+    status: int
+    """HTTP 상태 코드"""
+    tr_cont: str
+    """연속조회 상태 (F, M: 다음 페이지 있음, D, E: 마지막 페이지)"""
+
+    def __init__(self, data: dict[str, Any], status: int = 200, tr_cont: str = "D"):
+        self.data = data
+        self.status = status
+        self.tr_cont = tr_cont
+
+
+KisMockHandler = Callable[[KisMockRequest], KisMockResponse | dict[str, Any]]
+
+
+class KisMockServerStats:
+    """모의 서버 통계"""
+
+    __slots__ = [
+        "requests",
+        "errors",
+        "rate_limited",
+        "websocket_messages",
+    ]
+
+    requests: int
+    """처리한 REST 요청 수"""
+    errors: int
+    """오류로 응답한 요청 수 (호출 유량 초과 포함)"""
+    rate_limited: int
+    """호출 유량 초과로 거부한 요청 수"""
+    websocket_messages: int
+    """웹소켓으로 전송한 실시간 메시지 수"""
+
+    def __init__(
+        self,
+        requests: int = 0,
+        errors: int = 0,
+        rate_limited: int = 0,
+        websocket_messages: int = 0,
+    ):
+        self.requests = requests
+        self.errors = errors
+        self.rate_limited = rate_limited
+        self.websocket_messages = websocket_messages
+
+    def copy(self) -> "KisMockServerStats":
+        return KisMockServerStats(
+            requests=self.requests,
+            errors=self.errors,
+            rate_limited=self.rate_limited,
+            websocket_messages=self.websocket_messages,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(requests={self.requests}, errors={self.errors}, "
+            f"rate_limited={self.rate_limited}, websocket_messages={self.websocket_messages})"
+        )
+
+
+class _KisMockWebsocket:
+    """모의 서버 웹소켓 연결"""
+
+    __slots__ = ["handler", "subscriptions", "lock", "closed"]
+
+    handler: BaseHTTPRequestHandler
+    subscriptions: set[tuple[str, str]]
+    lock: threading.Lock
+    closed: bool
+
+    def __init__(self, handler: BaseHTTPRequestHandler):
+        self.handler = handler
+        self.subscriptions = set()
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def recv(self) -> tuple[int, bytes] | None:
+        read = self.handler.rfile.read
+        header = read(2)
+
+        if len(header) < 2:
+            return None
+
+        opcode = header[0] & 0x0F
+        length = header[1] & 0x7F
+
+        if length == 126:
+            length = struct.unpack(">H", read(2))[0]
+        elif length == 127:
+            length = struct.unpack(">Q", read(8))[0]
+
+        mask = read(4) if header[1] & 0x80 else None
+        data = read(length)
+
+        if mask:
+            data = bytes(byte ^ mask[i % 4] for i, byte in enumerate(data))
+
+        return opcode, data
+
+    def send(self, data: str | bytes, opcode: int = 0x1) -> bool:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        length = len(data)
+
+        if length < 126:
+            header = struct.pack(">BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack(">BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack(">BBQ", 0x80 | opcode, 127, length)
+
+        with self.lock:
+            if self.closed:
+                return False
+
+            try:
+                self.handler.wfile.write(header + data)
+                self.handler.wfile.flush()
+            except OSError:
+                self.closed = True
+                return False
+
+        return True
+
+    def close(self):
+        self.send(b"", opcode=0x8)
+
+        with self.lock:
+            self.closed = True
+
+        try:
+            self.handler.connection.shutdown(2)
+        except OSError:
+            pass
+
+
+class _KisMockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_KisMockHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _request(self, method: str) -> KisMockRequest:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+        return KisMockRequest(
+            method=method,
+            path=url.path,
+            params=dict(parse_qsl(url.query, keep_blank_values=True)),
+            headers={key.lower(): value for key, value in self.headers.items()},
+            body=body,
+        )
+
+    def _respond(self, request: KisMockRequest, response: KisMockResponse):
+        data = json.dumps(response.data, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("tr_id", request.tr_id)
+        self.send_header("tr_cont", response.tr_cont)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            self.server.mock._serve_websocket(self)
+            self.close_connection = True
+            return
+
+        request = self._request("GET")
+        self._respond(request, self.server.mock._handle(request))
+
+    def do_POST(self):
+        request = self._request("POST")
+        self._respond(request, self.server.mock._handle(request))
+
+
+class _KisMockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    mock: "KisMockServer"
+
+
+class KisMockServer:
+    """
+    한국투자증권 모의 서버
+
+    실제 서버에 접속하지 않고 REST API와 실시간 웹소켓을 로컬에서 흉내냅니다.
+    응답 지연, 호출 유량 제한, 오류 주입(EGW00201, EGW00123)을 설정하여 처리량과 지연 시간을 측정할 수 있습니다.
+
+    제공하는 API:
+        - 접속 토큰 발급, 폐기, 웹소켓 접속 키 발급
+        - 국내 주식 현재가, 호가, 기간 차트 (연속조회)
+        - 국내 주식 잔고, 일별 체결내역, 현금 주문 (연속조회)
+        - 해외 주식 잔고, 체결내역, 미체결 내역, 국내 미체결 내역 (빈 응답)
+        - 웹소켓 구독, 국내주식 실시간체결가(H0STCNT0), 암호화된 국내주식 실시간체결통보(H0STCNI0, H0STCNI9)
+
+    `route()`로 API 응답을 추가하거나 재정의할 수 있습니다.
+
+    Examples:
+        >>> with KisMockServer(latency=0.01) as server:
+        ...     kis = server.create_kis()
+        ...     kis.stock("005930").quote()
+    """
+
+    host: str
+    """접속 주소"""
+    latency: float
+    """REST API 응답 지연 시간 (초)"""
+    jitter: float
+    """응답 지연 시간에 더해지는 최대 무작위 지연 시간 (초)"""
+    rate_limit: int | None
+    """앱 키별 초당 최대 요청 수 (None: 제한 없음)"""
+    error_rate: float
+    """호출 유량 초과 오류(EGW00201)를 무작위로 응답할 확률 (0~1)"""
+    page_size: int
+    """연속조회 API의 페이지당 항목 수"""
+    max_subscriptions: int
+    """웹소켓 연결별 최대 구독 수"""
+
+    prices: dict[str, int]
+    """종목별 현재가. 지정하지 않은 종목은 종목코드로부터 결정됩니다."""
+    holdings: dict[str, int]
+    """종목별 보유수량"""
+    orders: list[dict[str, str]]
+    """접수된 주문 목록 (일별 체결내역 응답 형식)"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        jitter: float = 0,
+        rate_limit: int | None = None,
+        error_rate: float = 0,
+        page_size: int = 50,
+        max_subscriptions: int = WEBSOCKET_MAX_SUBSCRIPTIONS + 1,
+        seed: int | None = None,
+    ):
+        """
+        한국투자증권 모의 서버를 생성합니다. `start()`를 호출하거나 `with` 문을 사용하여 시작합니다.
+
+        Args:
+            host (str, optional): 접속 주소
+            port (int, optional): 접속 포트. 0이면 사용 가능한 포트를 사용합니다.
+            latency (float, optional): REST API 응답 지연 시간 (초)
+            jitter (float, optional): 응답 지연 시간에 더해지는 최대 무작위 지연 시간 (초)
+            rate_limit (int | None, optional): 앱 키별 초당 최대 요청 수. 초과한 요청에는 EGW00201 오류를 응답합니다.
+            error_rate (float, optional): 호출 유량 초과 오류(EGW00201)를 무작위로 응답할 확률 (0~1)
+            page_size (int, optional): 연속조회 API의 페이지당 항목 수
+            max_subscriptions (int, optional): 웹소켓 연결별 최대 구독 수
+            seed (int | None, optional): 무작위 지연 시간, 오류, 시세 생성에 사용할 시드
+        """
+        self.host = host
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.max_subscriptions = max_subscriptions
+
+        self.prices = {}
+        self.holdings = {}
+        self.orders = []
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = KisMockServerStats()
+        self._routes: dict[str, KisMockHandler] = {}
+        self._injected: deque[tuple[str, str | None]] = deque()
+        self._requests: dict[str, deque[float]] = {}
+        self._tokens: set[str] = set()
+        self._expired_tokens: set[str] = set()
+        self._approval_keys: set[str] = set()
+        self._websockets: list[_KisMockWebsocket] = []
+        self._encryption_key = secrets.token_hex(16)
+        self._encryption_iv = secrets.token_hex(8)
+        self._order_number = 0
+        self._server = _KisMockHTTPServer((host, port), _KisMockRequestHandler)
+        self._server.mock = self
+        self._thread: threading.Thread | None = None
+
+        self._register_routes()
+
+    @property
+    def port(self) -> int:
+        """접속 포트"""
+        return self._server.server_address[1]
+
+    @property
+    def domain(self) -> str:
+        """REST API 도메인 (`PyKis(domain=...)`에 사용합니다)"""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def websocket_domain(self) -> str:
+        """웹소켓 도메인 (`PyKis(websocket_domain=...)`에 사용합니다)"""
+        return f"ws://{self.host}:{self.port}"
+
+    @property
+    def stats(self) -> KisMockServerStats:
+        """서버 통계의 복사본을 반환합니다."""
+        with self._lock:
+            return self._stats.copy()
+
+    @property
+    def running(self) -> bool:
+        """서버 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "KisMockServer":
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        if not self.running:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="pykis-mock-server",
+                daemon=True,
+            )
+            self._thread.start()
+
+        return self
+
+    def stop(self):
+        """서버를 종료하고 웹소켓 연결을 닫습니다."""
+        with self._lock:
+            websockets = self._websockets.copy()
+
+        for websocket in websockets:
+            websocket.close()
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+    def __enter__(self) -> "KisMockServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} domain={self.domain} running={self.running}>"
+
+    def auth(self, virtual: bool = False) -> KisAuth:
+        """
+        모의 서버에 사용할 인증 정보를 생성합니다.
+
+        Args:
+            virtual (bool, optional): 모의투자 인증 정보 여부
+        """
+        return KisAuth(
+            id="pykis",
+            account="50000000-01",
+            appkey=("V" if virtual else "P") + "A" * 35,
+            secretkey="S" * 180,
+            virtual=virtual,
+        )
+
+    def create_kis(self, virtual: bool = False, **kwargs: Any) -> "PyKis":
+        """
+        모의 서버에 접속하는 PyKis 객체를 생성합니다.
+
+        Args:
+            virtual (bool, optional): 모의투자 여부
+            **kwargs: PyKis 생성자에 전달할 추가 인자
+        """
+        from pykis.kis import PyKis
+
+        if virtual:
+            return PyKis(
+                self.auth(),
+                self.auth(virtual=True),
+                domain=self.domain,
+                websocket_domain=self.websocket_domain,
+                **kwargs,
+            )
+
+        return PyKis(
+            self.auth(),
+            domain=self.domain,
+            websocket_domain=self.websocket_domain,
+            **kwargs,
+        )
+
+    def route(self, path: str, handler: KisMockHandler):
+        """
+        API 응답을 추가하거나 재정의합니다.
+
+        Args:
+            path (str): 요청 경로 (예: /uapi/domestic-stock/v1/quotations/inquire-price)
+            handler (KisMockHandler): 요청을 받아 응답 본문 또는 KisMockResponse를 반환하는 함수
+        """
+        self._routes[path] = handler
+
+    def inject(self, code: str, count: int = 1, path: str | None = None):
+        """
+        다음 요청에 오류를 응답하도록 예약합니다.
+
+        EGW00123(토큰 만료)을 주입하면 발급된 모든 접속 토큰이 만료 처리됩니다.
+
+        Args:
+            code (str): 오류 코드 (예: EGW00201, EGW00123)
+            count (int, optional): 오류를 응답할 요청 수
+            path (str | None, optional): 오류를 응답할 요청 경로. 지정하지 않으면 모든 API 요청에 응답합니다.
+        """
+        with self._lock:
+            self._injected.extend([(code, path)] * count)
+
+    def expire_tokens(self):
+        """발급된 모든 접속 토큰을 만료 처리합니다. 이후 요청에는 EGW00123 오류를 응답합니다."""
+        with self._lock:
+            self._expired_tokens |= self._tokens
+            self._tokens.clear()
+
+    def price(self, symbol: str) -> int:
+        """종목의 현재가를 반환합니다."""
+        if (price := self.prices.get(symbol)) is None:
+            price = self.prices[symbol] = 1000 + zlib.crc32(symbol.encode()) % 1000 * 100
+
+        return price
+
+    def _error(self, code: str, message: str | None = None, status: int = 500) -> KisMockResponse:
+        with self._lock:
+            self._stats.errors += 1
+
+        return KisMockResponse(
+            {
+                "rt_cd": "1",
+                "msg_cd": code,
+                "msg1": message or MOCK_ERRORS.get(code, "모의 서버 오류입니다."),
+            },
+            status=status,
+        )
+
+    def _check_rate_limit(self, appkey: str) -> bool:
+        if self.rate_limit is None:
+            return True
+
+        now = time.monotonic()
+
+        with self._lock:
+            requests = self._requests.setdefault(appkey, deque())
+
+            while requests and now - requests[0] >= 1:
+                requests.popleft()
+
+            if len(requests) >= self.rate_limit:
+                self._stats.rate_limited += 1
+                return False
+
+            requests.append(now)
+
+        return True
+
+    def _take_injected(self, path: str) -> str | None:
+        with self._lock:
+            for i, (code, target) in enumerate(self._injected):
+                if target is None or target == path:
+                    del self._injected[i]
+
+                    if code == "EGW00123":
+                        self._expired_tokens |= self._tokens
+                        self._tokens.clear()
+
+                    return code
+
+        return None
+
+    def _handle(self, request: KisMockRequest) -> KisMockResponse:
+        with self._lock:
+            self._stats.requests += 1
+
+        if self.latency or self.jitter:
+            time.sleep(self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0))
+
+        if (handler := self._routes.get(request.path)) is None:
+            return self._error("EGW00002", f"존재하지 않는 API 입니다. ({request.path})", status=404)
+
+        if not request.path.startswith("/oauth2/"):
+            if not self._check_rate_limit(request.appkey):
+                return self._error("EGW00201")
+
+            if code := self._take_injected(request.path):
+                return self._error(code)
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._error("EGW00201")
+
+            token = request.headers.get("authorization", "").partition(" ")[2]
+
+            if token not in self._tokens:
+                return self._error("EGW00123" if token in self._expired_tokens else "EGW00121")
+
+        try:
+            response = handler(request)
+        except Exception as e:
+            logging.logger.error("Mock server failed to handle %s: %s", request, e, exc_info=True)
+            return self._error("EGW00500", str(e))
+
+        if not isinstance(response, KisMockResponse):
+            response = KisMockResponse(response)
+
+        response.data.setdefault("rt_cd", "0")
+        response.data.setdefault("msg_cd", "MCA00000")
+        response.data.setdefault("msg1", "정상처리 되었습니다.")
+
+        return response
+
+    def _paginate(self, request: KisMockRequest, items: list[Any], size: int = 100) -> tuple[list[Any], dict[str, str], str]:
+        """연속조회 커서에 해당하는 항목과 다음 페이지 커서, 연속조회 상태를 반환합니다."""
+        offset = int(request.get(f"CTX_AREA_NK{size}", request.get(f"ctx_area_nk{size}")).strip() or 0)
+        end = offset + self.page_size
+        last = end >= len(items)
+        cursor = "" if last else str(end)
+
+        return (
+            items[offset:end],
+            {f"ctx_area_fk{size}": cursor, f"ctx_area_nk{size}": cursor},
+            "D" if last else ("F" if offset == 0 else "M"),
+        )
+
+    def _register_routes(self):
+        routes: dict[str, KisMockHandler] = {
+            "/oauth2/tokenP": self._token,
+            "/oauth2/revokeP": self._revoke,
+            "/oauth2/Approval": self._approval,
+            "/uapi/domestic-stock/v1/quotations/inquire-price": self._quote,
+            "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn": self._orderbook,
+            "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice": self._daily_chart,
+            "/uapi/domestic-stock/v1/trading/inquire-balance": self._balance,
+            "/uapi/domestic-stock/v1/trading/inquire-daily-ccld": self._daily_orders,
+            "/uapi/domestic-stock/v1/trading/order-cash": self._order,
+            "/uapi/domestic-stock/v1/trading/inquire-psbl-rvsecncl": lambda request: KisMockResponse(
+                {"output": [], "ctx_area_fk100": "", "ctx_area_nk100": ""}
+            ),
+            "/uapi/overseas-stock/v1/trading/inquire-present-balance": lambda request: {
+                "output1": [],
+                "output2": [],
+                "output3": {},
+            },
+            "/uapi/overseas-stock/v1/trading/inquire-balance": lambda request: KisMockResponse(
+                {"output1": [], "output2": {}, "ctx_area_fk200": "", "ctx_area_nk200": ""}
+            ),
+            "/uapi/overseas-stock/v1/trading/inquire-ccnl": lambda request: KisMockResponse(
+                {"output": [], "ctx_area_fk200": "", "ctx_area_nk200": ""}
+            ),
+            "/uapi/overseas-stock/v1/trading/inquire-nccs": lambda request: KisMockResponse(
+                {"output": [], "ctx_area_fk200": "", "ctx_area_nk200": ""}
+            ),
+        }
+
+        self._routes.update(routes)
+
+    def _token(self, request: KisMockRequest) -> dict[str, Any]:
+        token = secrets.token_hex(32)
+
+        with self._lock:
+            self._tokens.add(token)
+
+        return {
+            "access_token": token,
+            "access_token_token_expired": (datetime.now(TIMEZONE) + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+            "token_type": "Bearer",
+            "expires_in": 86400,
+        }
+
+    def _revoke(self, request: KisMockRequest) -> dict[str, Any]:
+        with self._lock:
+            self._tokens.discard(request.body.get("token", ""))
+
+        return {"code": 200, "message": "접근토큰 폐기에 성공하였습니다"}
+
+    def _approval(self, request: KisMockRequest) -> dict[str, Any]:
+        approval_key = secrets.token_hex(18)
+
+        with self._lock:
+            self._approval_keys.add(approval_key)
+
+        return {"approval_key": approval_key}
+
+    def _quote(self, request: KisMockRequest) -> dict[str, Any]:
+        symbol = request.get("FID_INPUT_ISCD")
+        price = self.price(symbol)
+
+        return {
+            "output": {
+                "stck_shrn_iscd": symbol,
+                "bstp_kor_isnm": "모의업종",
+                "stck_prpr": str(price),
+                "prdy_vrss": str(price // 100),
+                "prdy_vrss_sign": "2",
+                "prdy_ctrt": "1.01",
+                "acml_vol": "1000000",
+                "acml_tr_pbmn": str(price * 1000000),
+                "hts_avls": str(price * 100),
+                "mrkt_warn_cls_code": "00",
+                "temp_stop_yn": "N",
+                "short_over_yn": "N",
+                "prdy_vrss_vol_rate": "10.5",
+                "stck_oprc": str(price),
+                "stck_hgpr": str(price + price // 50),
+                "stck_lwpr": str(price - price // 50),
+                "stck_mxpr": str(price + price * 3 // 10),
+                "stck_llam": str(price - price * 3 // 10),
+                "stck_sdpr": str(price - price // 100),
+                "aspr_unit": "10",
+                "eps": "1000.00",
+                "bps": "10000.00",
+                "per": "10.00",
+                "pbr": "1.00",
+                "w52_hgpr": str(price * 2),
+                "w52_lwpr": str(price // 2),
+                "w52_hgpr_date": "20240102",
+                "w52_lwpr_date": "20230102",
+            },
+        }
+
+    def _orderbook(self, request: KisMockRequest) -> dict[str, Any]:
+        symbol = request.get("FID_INPUT_ISCD")
+        price = self.price(symbol)
+        output = {"aspr_acpt_hour": datetime.now(TIMEZONE).strftime("%H%M%S")}
+
+        for i in range(1, 11):
+            output[f"askp{i}"] = str(price + i * 10)
+            output[f"bidp{i}"] = str(price - (i - 1) * 10)
+            output[f"askp_rsqn{i}"] = str(i * 100)
+            output[f"bidp_rsqn{i}"] = str(i * 100)
+
+        return {
+            "output1": output,
+            "output2": {"stck_prpr": str(price), "stck_shrn_iscd": symbol},
+        }
+
+    def _daily_chart(self, request: KisMockRequest) -> dict[str, Any]:
+        symbol = request.get("FID_INPUT_ISCD")
+        price = self.price(symbol)
+        start = datetime.strptime(request.get("FID_INPUT_DATE_1", "00010101").replace("00000101", "00010101"), "%Y%m%d").date()
+        cursor = datetime.strptime(request.get("FID_INPUT_DATE_2"), "%Y%m%d").date()
+        bars = []
+
+        # 기준일부터 과거 방향으로 평일 봉을 최대 100개까지 반환합니다.
+        while cursor >= start and len(bars) < 100 and cursor.year > 1990:
+            if cursor.weekday() < 5:
+                bars.append(self._bar(cursor, price))
+
+            cursor -= timedelta(days=1)
+
+        return {
+            "output1": {"stck_prpr": str(price), "stck_shrn_iscd": symbol},
+            "output2": bars,
+        }
+
+    def _bar(self, day: date, price: int) -> dict[str, str]:
+        close = price + (zlib.crc32(day.isoformat().encode()) % 21 - 10) * (price // 200 or 1)
+
+        return {
+            "stck_bsop_date": day.strftime("%Y%m%d"),
+            "stck_oprc": str(close - 10),
+            "stck_hgpr": str(close + 50),
+            "stck_lwpr": str(close - 50),
+            "stck_clpr": str(close),
+            "acml_vol": "100000",
+            "acml_tr_pbmn": str(close * 100000),
+            "prdy_vrss": "10",
+            "prdy_vrss_sign": "2",
+            "flng_cls_code": "00",
+            "prtt_rate": "0.00",
+            "mod_yn": "N",
+            "revl_issu_reas": "",
+        }
+
+    def _balance(self, request: KisMockRequest) -> KisMockResponse:
+        stocks = [
+            {
+                "pdno": symbol,
+                "prdt_name": f"모의종목{symbol}",
+                "hldg_qty": str(quantity),
+                "ord_psbl_qty": str(quantity),
+                "pchs_avg_pric": str(self.price(symbol)),
+                "pchs_amt": str(self.price(symbol) * quantity),
+                "prpr": str(self.price(symbol)),
+                "evlu_amt": str(self.price(symbol) * quantity),
+                "evlu_pfls_amt": "0",
+                "evlu_pfls_rt": "0.00",
+            }
+            for symbol, quantity in sorted(self.holdings.items())
+            if quantity
+        ]
+        items, cursor, tr_cont = self._paginate(request, stocks)
+
+        return KisMockResponse(
+            {
+                "output1": items,
+                "output2": [
+                    {
+                        "dnca_tot_amt": "10000000",
+                        "nxdy_excc_amt": "10000000",
+                        "prvs_rcdl_excc_amt": "10000000",
+                        "tot_evlu_amt": "10000000",
+                    }
+                ],
+                **cursor,
+            },
+            tr_cont=tr_cont,
+        )
+
+    def _daily_orders(self, request: KisMockRequest) -> KisMockResponse:
+        start, end = request.get("INQR_STRT_DT"), request.get("INQR_END_DT")
+
+        with self._lock:
+            orders = [order for order in reversed(self.orders) if start <= order["ord_dt"] <= end]
+
+        items, cursor, tr_cont = self._paginate(request, orders)
+
+        return KisMockResponse(
+            {
+                "output1": items,
+                "output2": {"tot_ord_qty": str(sum(int(order["ord_qty"]) for order in orders))},
+                **cursor,
+            },
+            tr_cont=tr_cont,
+        )
+
+    def _order(self, request: KisMockRequest) -> dict[str, Any]:
+        symbol = request.body["PDNO"]
+        quantity = int(request.body["ORD_QTY"])
+        price = int(request.body.get("ORD_UNPR") or 0) or self.price(symbol)
+        buy = request.tr_id.endswith("0802U")
+        now = datetime.now(TIMEZONE)
+        account = request.body["CANO"] + request.body["ACNT_PRDT_CD"]
+
+        with self._lock:
+            self._order_number += 1
+            number = f"{self._order_number:010d}"
+            self.holdings[symbol] = self.holdings.get(symbol, 0) + (quantity if buy else -quantity)
+            self.orders.append(
+                {
+                    "ord_dt": now.strftime("%Y%m%d"),
+                    "ord_tmd": now.strftime("%H%M%S"),
+                    "ord_gno_brno": "91252",
+                    "odno": number,
+                    "orgn_odno": "",
+                    "pdno": symbol,
+                    "prdt_name": f"모의종목{symbol}",
+                    "sll_buy_dvsn_cd": "02" if buy else "01",
+                    "ord_dvsn_cd": request.body.get("ORD_DVSN", "00"),
+                    "ord_qty": str(quantity),
+                    "ord_unpr": str(price),
+                    "avg_prvs": str(price),
+                    "tot_ccld_qty": str(quantity),
+                    "tot_ccld_amt": str(price * quantity),
+                    "rmn_qty": "0",
+                    "rjct_qty": "0",
+                    "ccld_yn": "Y",
+                    "cncl_yn": "N",
+                    "excg_dvsn_cd": "02",
+                }
+            )
+
+        # 주문은 즉시 전량 체결되며, 체결통보 구독자에게 접수와 체결 통보를 전송합니다.
+        for accepted in ("1", "2"):
+            self._publish_execution(
+                [
+                    request.body.get("CUST_ID", "pykis"),
+                    account,
+                    number,
+                    "",
+                    "02" if buy else "01",
+                    "0",
+                    request.body.get("ORD_DVSN", "00"),
+                    "0",
+                    symbol,
+                    str(quantity),
+                    str(price),
+                    now.strftime("%H%M%S"),
+                    "0",
+                    "1" if accepted == "1" else "2",
+                    accepted,
+                    "91252",
+                    str(quantity),
+                    "모의계좌",
+                    f"모의종목{symbol}",
+                    "10",
+                    "",
+                    f"모의종목{symbol}",
+                    str(price),
+                ]
+            )
+
+        return {
+            "msg_cd": "APBK0013",
+            "msg1": "주문 전송 완료 되었습니다.",
+            "output": {
+                "KRX_FWDG_ORD_ORGNO": "91252",
+                "ODNO": number,
+                "ORD_TMD": now.strftime("%H%M%S"),
+            },
+        }
+
+    def _encrypt(self, text: str) -> str:
+        data = text.encode("utf-8")
+        size = 16 - len(data) % 16
+        encryptor = Cipher(
+            algorithms.AES(self._encryption_key.encode("utf-8")),
+            modes.CBC(self._encryption_iv.encode("utf-8")),
+            backend=default_backend(),
+        ).encryptor()
+
+        return b64encode(encryptor.update(data + bytes((size,)) * size) + encryptor.finalize()).decode("ascii")
+
+    def _publish_execution(self, row: list[str]):
+        with self._lock:
+            targets = [
+                (websocket, id)
+                for websocket in self._websockets
+                for id, key in websocket.subscriptions
+                if id in EXECUTION_TR_IDS
+            ]
+
+        for websocket, id in targets:
+            if websocket.send(f"1|{id}|001|{self._encrypt('^'.join(row))}"):
+                with self._lock:
+                    self._stats.websocket_messages += 1
+
+    def publish(self, id: str, key: str, rows: Iterable[Iterable[str]]) -> int:
+        """
+        구독 중인 웹소켓 연결에 실시간 메시지를 전송합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key (종목코드)
+            rows (Iterable[Iterable[str]]): 메시지 행 목록
+
+        Returns:
+            int: 메시지를 전송한 연결 수
+        """
+        rows = ["^".join(row) for row in rows]
+        message = f"0|{id}|{len(rows):03d}|{'^'.join(rows)}"
+
+        with self._lock:
+            targets = [websocket for websocket in self._websockets if (id, key) in websocket.subscriptions]
+
+        sent = sum(1 for websocket in targets if websocket.send(message))
+
+        with self._lock:
+            self._stats.websocket_messages += sent
+
+        return sent
+
+    def publish_price(self, symbol: str, price: int | None = None, volume: int = 1, count: int = 1) -> int:
+        """
+        구독 중인 웹소켓 연결에 국내주식 실시간체결가(H0STCNT0)를 전송합니다.
+
+        Args:
+            symbol (str): 종목코드
+            price (int | None, optional): 체결가. 지정하지 않으면 현재가를 사용합니다.
+            volume (int, optional): 체결량
+            count (int, optional): 한 메시지에 묶을 체결 건수
+
+        Returns:
+            int: 메시지를 전송한 연결 수
+        """
+        if price is None:
+            price = self.price(symbol)
+        else:
+            self.prices[symbol] = price
+
+        now = datetime.now(TIMEZONE)
+        row = PRICE_ROW.copy()
+        row[0] = symbol
+        row[1] = now.strftime("%H%M%S")
+        row[2] = row[6] = row[7] = row[8] = row[9] = row[10] = row[11] = row[45] = str(price)
+        row[12] = str(volume)
+        row[33] = now.strftime("%Y%m%d")
+
+        return self.publish("H0STCNT0", symbol, [row] * count)
+
+    def _serve_websocket(self, handler: BaseHTTPRequestHandler):
+        accept = b64encode(
+            hashlib.sha1((handler.headers["Sec-WebSocket-Key"] + WEBSOCKET_GUID).encode()).digest()
+        ).decode()
+
+        handler.send_response(101, "Switching Protocols")
+        handler.send_header("Upgrade", "websocket")
+        handler.send_header("Connection", "Upgrade")
+        handler.send_header("Sec-WebSocket-Accept", accept)
+        handler.end_headers()
+        handler.wfile.flush()
+
+        websocket = _KisMockWebsocket(handler)
+
+        with self._lock:
+            self._websockets.append(websocket)
+
+        try:
+            while not websocket.closed:
+                try:
+                    frame = websocket.recv()
+                except OSError:
+                    break
+
+                if frame is None:
+                    break
+
+                opcode, data = frame
+
+                if opcode == 0x8:
+                    break
+                elif opcode == 0x9:
+                    websocket.send(data, opcode=0xA)
+                elif opcode == 0x1:
+                    self._handle_websocket_request(websocket, json.loads(data))
+        finally:
+            with self._lock:
+                self._websockets.remove(websocket)
+
+            websocket.closed = True
+
+    def _handle_websocket_request(self, websocket: _KisMockWebsocket, request: dict[str, Any]):
+        header = request["header"]
+        input = request.get("body", {}).get("input", {})
+        id, key = input.get("tr_id", ""), input.get("tr_key", "")
+        subscribe = header.get("tr_type") == "1"
+        output = None
+
+        with self._lock:
+            valid = header.get("approval_key") in self._approval_keys
+
+        if not valid:
+            failed, code, message = True, "OPSP0011", "invalid approval : NOT FOUND"
+        elif subscribe:
+            if (id, key) in websocket.subscriptions:
+                failed, code, message = False, "OPSP0002", "ALREADY IN SUBSCRIBE"
+            elif len(websocket.subscriptions) >= self.max_subscriptions:
+                failed, code, message = True, "OPSP0008", "MAX SUBSCRIBE OVER"
+            else:
+                websocket.subscriptions.add((id, key))
+                failed, code, message = False, "OPSP0000", "SUBSCRIBE SUCCESS"
+                output = {"iv": self._encryption_iv, "key": self._encryption_key}
+        elif (id, key) in websocket.subscriptions:
+            websocket.subscriptions.discard((id, key))
+            failed, code, message = False, "OPSP0001", "UNSUBSCRIBE SUCCESS"
+        else:
+            failed, code, message = True, "OPSP0003", "UNSUBSCRIBE ERROR(not found!)"
+
+        body: dict[str, Any] = {"rt_cd": "1" if failed else "0", "msg_cd": code, "msg1": message}
+
+        if output is not None:
+            body["output"] = output
+
+        websocket.send(
+            json.dumps(
+                {
+                    "header": {"tr_id": id, "tr_key": key, "encrypt": "N"},
+                    "body": body,
+                }
+            )
+        )
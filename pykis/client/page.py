@@ -1,13 +1,18 @@
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, TypeVar
 
 from pykis.client.form import KisForm
 from pykis.responses.dynamic import KisDynamic
 from pykis.utils.repr import kis_repr
 
+if TYPE_CHECKING:
+    from pykis.responses.response import KisPaginationAPIResponseProtocol
+
 __all__ = [
     "KisPageStatus",
     "to_page_status",
     "KisPage",
+    "iter_pages",
+    "collect_pages",
 ]
 
 KisPageStatus = Literal["begin", "end"]
@@ -100,3 +105,51 @@ class KisPage(KisDynamic, KisForm):
     def first(cls, size: int | None = None) -> "KisPage":
         """첫 번째를 만듭니다."""
         return cls(size)
+
+
+TPage = TypeVar("TPage", bound="KisPaginationAPIResponseProtocol")
+
+
+def iter_pages(fetch: Callable[[KisPage], TPage], page: KisPage) -> Iterator[TPage]:
+    """
+    페이지 커서를 따라 연속조회하며, 응답이 도착하는 대로 한 페이지씩 반환합니다.
+
+    반복을 중간에 멈추면 다음 페이지는 요청하지 않습니다.
+    반환된 페이지의 `next_page`로 다시 조회하면 해당 페이지 다음부터 이어서 조회합니다.
+
+    Args:
+        fetch: 페이지 커서로 한 페이지를 조회하는 함수
+        page: 첫 번째로 조회할 페이지 커서
+    """
+    while True:
+        result = fetch(page)
+
+        yield result
+
+        if result.is_last:
+            break
+
+        page = result.next_page
+
+
+def collect_pages(
+    pages: Iterable[TPage],
+    items: Callable[[TPage], list],
+    continuous: bool = True,
+) -> TPage:
+    """
+    연속조회한 페이지의 항목을 첫 번째 페이지에 합쳐 반환합니다.
+
+    Args:
+        pages: 페이지 목록
+        items: 페이지의 항목 목록을 반환하는 함수
+        continuous: 연속조회 여부. False이면 첫 번째 페이지만 조회합니다.
+    """
+    iterator = iter(pages)
+    first = next(iterator)
+
+    if continuous:
+        for result in iterator:
+            items(first).extend(items(result))
+
+    return first
@@ -0,0 +1,454 @@
+import threading
+import time
+from collections import deque
+from itertools import groupby
+from typing import Callable, Hashable, Literal
+
+from pykis import logging
+
+__all__ = [
+    "OVERFLOW_POLICY",
+    "KisWebsocketPipelineStats",
+    "KisWebsocketPipeline",
+]
+
+OVERFLOW_POLICY = Literal["block", "drop_oldest", "conflate"]
+"""
+대기열 초과 정책
+
+- block: 대기열에 여유가 생길 때까지 수신 스레드를 대기시킵니다.
+- drop_oldest: 가장 오래된 메시지를 버립니다.
+- conflate: 같은 종목의 대기 중인 메시지를 최신 메시지로 교체하고, 없으면 가장 오래된 메시지를 버립니다.
+"""
+
+
+class KisWebsocketPipelineStats:
+    """실시간 메시지 처리 대기열 통계"""
+
+    __slots__ = [
+        "enqueued",
+        "dispatched",
+        "dropped",
+        "conflated",
+        "blocked",
+        "depth",
+        "max_depth",
+    ]
+
+    enqueued: int
+    """대기열에 추가된 메시지 수"""
+    dispatched: int
+    """처리된 메시지 수"""
+    dropped: int
+    """대기열 초과로 버려진 메시지 수"""
+    conflated: int
+    """최신 메시지로 교체된 메시지 수"""
+    blocked: int
+    """대기열 초과로 수신 스레드가 대기한 횟수"""
+    depth: int
+    """현재 대기 중인 메시지 수"""
+    max_depth: int
+    """최대 대기 메시지 수"""
+
+    def __init__(
+        self,
+        enqueued: int = 0,
+        dispatched: int = 0,
+        dropped: int = 0,
+        conflated: int = 0,
+        blocked: int = 0,
+        depth: int = 0,
+        max_depth: int = 0,
+    ):
+        self.enqueued = enqueued
+        self.dispatched = dispatched
+        self.dropped = dropped
+        self.conflated = conflated
+        self.blocked = blocked
+        self.depth = depth
+        self.max_depth = max_depth
+
+    def copy(self) -> "KisWebsocketPipelineStats":
+        return KisWebsocketPipelineStats(
+            enqueued=self.enqueued,
+            dispatched=self.dispatched,
+            dropped=self.dropped,
+            conflated=self.conflated,
+            blocked=self.blocked,
+            depth=self.depth,
+            max_depth=self.max_depth,
+        )
+
+    def __iadd__(self, other: "KisWebsocketPipelineStats") -> "KisWebsocketPipelineStats":
+        self.enqueued += other.enqueued
+        self.dispatched += other.dispatched
+        self.dropped += other.dropped
+        self.conflated += other.conflated
+        self.blocked += other.blocked
+        self.depth += other.depth
+        self.max_depth = max(self.max_depth, other.max_depth)
+        return self
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(enqueued={self.enqueued}, dispatched={self.dispatched}, "
+            f"dropped={self.dropped}, conflated={self.conflated}, blocked={self.blocked}, "
+            f"depth={self.depth}, max_depth={self.max_depth})"
+        )
+
+
+class _KisPipelineEntry:
+    __slots__ = ["key", "message", "droppable", "handler"]
+
+    def __init__(
+        self,
+        key: Hashable,
+        message: str,
+        droppable: bool,
+        handler: Callable[[list[str]], None] | None,
+    ):
+        self.key = key
+        self.message = message
+        self.droppable = droppable
+        self.handler = handler
+
+
+class _KisPipelineLane:
+    """디스패처 스레드 하나가 처리하는 대기열"""
+
+    __slots__ = ["queue", "pending", "condition", "stats", "thread", "busy"]
+
+    queue: "deque[_KisPipelineEntry]"
+    """대기 중인 메시지"""
+    pending: dict[Hashable, _KisPipelineEntry]
+    """종목별 마지막 대기 메시지"""
+    condition: threading.Condition
+    """대기열 조건 변수"""
+    stats: KisWebsocketPipelineStats
+    """대기열 통계"""
+    thread: threading.Thread | None
+    """디스패처 스레드"""
+    busy: int
+    """처리 중인 메시지 수"""
+
+    def __init__(self):
+        self.queue = deque()
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.stats = KisWebsocketPipelineStats()
+        self.thread = None
+        self.busy = 0
+
+    def pop(self, count: int) -> list[_KisPipelineEntry]:
+        entries = []
+
+        while self.queue and len(entries) < count:
+            entry = self.queue.popleft()
+
+            if self.pending.get(entry.key) is entry:
+                del self.pending[entry.key]
+
+            entries.append(entry)
+
+        return entries
+
+    def evict(self) -> bool:
+        # 체결통보와 같이 버릴 수 없는 메시지는 건너뛰고 가장 오래된 메시지를 버립니다.
+        for i, entry in enumerate(self.queue):
+            if entry.droppable:
+                del self.queue[i]
+
+                if self.pending.get(entry.key) is entry:
+                    del self.pending[entry.key]
+
+                return True
+
+        return False
+
+
+def _message_key(message: str) -> tuple[Hashable, bool]:
+    """메시지의 순서 보장 키와 버릴 수 있는지 여부를 반환합니다."""
+    encrypted, id, _, body = message.split("|", 3)
+
+    # 암호화된 메시지(체결통보)는 종목을 알 수 없으므로 TR 단위로 순서를 보장하며, 버리거나 교체하지 않습니다.
+    if encrypted == "1":
+        return id, False
+
+    return (id, body[: body.find("^")]), True
+
+
+class KisWebsocketPipeline:
+    """
+    실시간 메시지 처리 대기열
+
+    수신 스레드는 메시지를 대기열에 추가하기만 하고, 디스패처 스레드가 복호화, 파싱, 이벤트 콜백을 실행합니다.
+    같은 TR과 종목의 메시지는 항상 같은 디스패처 스레드에서 수신 순서대로 처리됩니다.
+
+    Note:
+        이벤트 콜백은 여러 디스패처 스레드에서 동시에 호출될 수 있습니다.
+    """
+
+    __slots__ = [
+        "workers",
+        "max_size",
+        "overflow",
+        "batch_size",
+        "_handler",
+        "_lanes",
+        "_closed",
+        "_lock",
+    ]
+
+    workers: int
+    """디스패처 스레드 수"""
+    max_size: int
+    """디스패처 스레드별 최대 대기 메시지 수"""
+    overflow: OVERFLOW_POLICY
+    """대기열 초과 정책"""
+    batch_size: int
+    """디스패처 스레드가 한 번에 처리하는 최대 메시지 수"""
+
+    _handler: Callable[[list[str]], None] | None
+    """메시지 처리 함수"""
+    _lanes: list[_KisPipelineLane]
+    """디스패처 스레드별 대기열"""
+    _closed: bool
+    """종료 여부"""
+    _lock: threading.Lock
+    """디스패처 스레드 시작 락"""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_size: int = 4096,
+        overflow: OVERFLOW_POLICY = "block",
+        batch_size: int = 64,
+    ):
+        """
+        실시간 메시지 처리 대기열을 생성합니다.
+
+        Args:
+            workers (int, optional): 디스패처 스레드 수
+            max_size (int, optional): 디스패처 스레드별 최대 대기 메시지 수
+            overflow (OVERFLOW_POLICY, optional): 대기열 초과 정책. 체결통보는 정책과 관계없이 버리지 않습니다.
+            batch_size (int, optional): 디스패처 스레드가 한 번에 처리하는 최대 메시지 수
+        """
+        if workers < 1:
+            raise ValueError("디스패처 스레드 수는 1 이상이어야 합니다.")
+
+        if max_size < 1:
+            raise ValueError("최대 대기 메시지 수는 1 이상이어야 합니다.")
+
+        if overflow not in ("block", "drop_oldest", "conflate"):
+            raise ValueError(f"지원하지 않는 대기열 초과 정책입니다: {overflow}")
+
+        self.workers = workers
+        self.max_size = max_size
+        self.overflow = overflow
+        self.batch_size = max(1, batch_size)
+        self._handler = None
+        self._lanes = [_KisPipelineLane() for _ in range(workers)]
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def closed(self) -> bool:
+        """종료 여부"""
+        return self._closed
+
+    @property
+    def depth(self) -> int:
+        """현재 대기 중인 메시지 수"""
+        return sum(len(lane.queue) for lane in self._lanes)
+
+    @property
+    def stats(self) -> KisWebsocketPipelineStats:
+        """대기열 통계의 복사본을 반환합니다."""
+        stats = KisWebsocketPipelineStats()
+
+        for lane in self._lanes:
+            with lane.condition:
+                lane.stats.depth = len(lane.queue)
+                stats += lane.stats
+
+        return stats
+
+    def bind(self, handler: Callable[[list[str]], None]):
+        """
+        메시지 처리 함수를 설정하고 디스패처 스레드를 시작합니다.
+
+        Args:
+            handler (Callable[[list[str]], None]): 수신 순서대로 정렬된 메시지 목록을 처리하는 함수
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("종료된 대기열입니다.")
+
+            self._handler = handler
+
+            for i, lane in enumerate(self._lanes):
+                if lane.thread is None:
+                    lane.thread = threading.Thread(
+                        target=self._run,
+                        args=(lane,),
+                        name=f"pykis-websocket-dispatcher-{i}",
+                        daemon=True,
+                    )
+                    lane.thread.start()
+
+    def put(self, message: str, handler: Callable[[list[str]], None] | None = None) -> bool:
+        """
+        메시지를 대기열에 추가합니다.
+
+        Args:
+            message (str): 실시간 이벤트 메시지
+            handler (Callable[[list[str]], None], optional): 메시지 처리 함수. 지정하지 않으면 `bind`로 설정한 함수로 처리합니다.
+
+        Returns:
+            bool: 메시지가 대기열에 추가되었거나 대기 중인 메시지와 병합되었으면 True
+        """
+        key, droppable = _message_key(message)
+        lane = self._lanes[hash(key) % self.workers]
+
+        with lane.condition:
+            if self._closed:
+                return False
+
+            if len(lane.queue) >= self.max_size:
+                if (appendable := self._overflow(lane, key, message, droppable, handler)) is None:
+                    lane.stats.enqueued += 1
+                    return True
+
+                if not appendable:
+                    return False
+
+            entry = _KisPipelineEntry(key, message, droppable, handler)
+            lane.queue.append(entry)
+            lane.stats.enqueued += 1
+
+            if droppable:
+                lane.pending[key] = entry
+
+            if len(lane.queue) > lane.stats.max_depth:
+                lane.stats.max_depth = len(lane.queue)
+
+            lane.condition.notify_all()
+
+        return True
+
+    def _overflow(
+        self,
+        lane: _KisPipelineLane,
+        key: Hashable,
+        message: str,
+        droppable: bool,
+        handler: Callable[[list[str]], None] | None,
+    ) -> bool | None:
+        """
+        대기열 초과 정책을 적용합니다.
+
+        Returns:
+            대기 중인 메시지와 병합되었으면 None, 메시지를 추가할 수 있으면 True, 대기열이 종료되었으면 False
+        """
+        if (
+            droppable
+            and self.overflow == "conflate"
+            and (entry := lane.pending.get(key)) is not None
+            and entry.handler == handler
+        ):
+            # 대기 중인 메시지의 위치를 유지하므로 다른 종목과의 순서가 바뀌지 않습니다.
+            entry.message = message
+            lane.stats.conflated += 1
+            return None
+
+        # 버릴 수 없는 메시지(체결통보)도 대기 중인 시세를 밀어내고 추가하며, 버릴 수 있는 메시지가 없을 때만 기다립니다.
+        if self.overflow != "block" and lane.evict():
+            lane.stats.dropped += 1
+            return True
+
+        lane.stats.blocked += 1
+
+        while len(lane.queue) >= self.max_size and not self._closed:
+            lane.condition.wait()
+
+        return not self._closed
+
+    def _run(self, lane: _KisPipelineLane):
+        while True:
+            with lane.condition:
+                while not lane.queue and not self._closed:
+                    lane.condition.wait()
+
+                if not lane.queue:
+                    return
+
+                entries = lane.pop(self.batch_size)
+                lane.busy = len(entries)
+                lane.condition.notify_all()
+
+            try:
+                # 메시지 처리 함수가 같은 연속된 메시지끼리 묶어 수신 순서대로 처리합니다.
+                for handler, group in groupby(entries, key=lambda entry: entry.handler):
+                    if (handler := handler or self._handler) is None:
+                        continue
+
+                    try:
+                        handler([entry.message for entry in group])
+                    except Exception as e:
+                        logging.logger.exception("RTC Failed to dispatch messages: %s", e)
+            finally:
+                with lane.condition:
+                    lane.busy = 0
+                    lane.stats.dispatched += len(entries)
+                    lane.condition.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """
+        대기 중인 메시지가 모두 처리될 때까지 기다립니다.
+
+        Args:
+            timeout (float | None): 타임아웃 (초)
+
+        Returns:
+            bool: 모든 메시지가 처리되었으면 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        for lane in self._lanes:
+            with lane.condition:
+                while lane.queue or lane.busy:
+                    if deadline is None:
+                        lane.condition.wait()
+                    elif (remaining := deadline - time.monotonic()) <= 0 or not lane.condition.wait(remaining):
+                        if lane.queue or lane.busy:
+                            return False
+
+        return True
+
+    def close(self, wait: bool = True, timeout: float | None = None):
+        """
+        대기열을 종료합니다. 이미 대기 중인 메시지는 모두 처리됩니다.
+
+        Args:
+            wait (bool): 디스패처 스레드가 종료될 때까지 기다릴지 여부
+            timeout (float | None): 디스패처 스레드별 대기 시간 (초)
+        """
+        with self._lock:
+            self._closed = True
+
+        for lane in self._lanes:
+            with lane.condition:
+                lane.condition.notify_all()
+
+        if not wait:
+            return
+
+        for lane in self._lanes:
+            if lane.thread is not None and lane.thread is not threading.current_thread():
+                lane.thread.join(timeout=timeout)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} workers={self.workers} max_size={self.max_size} "
+            f"overflow={self.overflow!r} depth={self.depth}>"
+        )
@@ -0,0 +1,644 @@
+import mmap
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from io import BufferedWriter
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator, Sequence
+
+from pykis import logging
+from pykis.api.websocket import WEBSOCKET_RESPONSES_MAP
+from pykis.client.messaging import KisWebsocketTR
+from pykis.client.object import KisObjectBase, kis_object_init
+from pykis.responses.websocket import get_websocket_parser
+
+if TYPE_CHECKING:
+    from pykis.kis import PyKis
+
+__all__ = [
+    "KisWebsocketRecordFrame",
+    "KisWebsocketRecordRow",
+    "KisWebsocketRecorder",
+    "KisWebsocketRecordReader",
+]
+
+SEGMENT_MAGIC = b"KISREC01"
+"""세그먼트 파일 식별자"""
+
+SEGMENT_HEADER = struct.Struct("<8sQ")
+"""세그먼트 헤더 (식별자, 기록된 길이)"""
+FRAME_HEADER = struct.Struct("<dI8sH")
+"""프레임 헤더 (수신 시간, 본문 길이, TR ID, 행 수)"""
+INDEX_ENTRY = struct.Struct("<dQI8s24s")
+"""색인 항목 (수신 시간, 행 위치, 행 길이, TR ID, 종목)"""
+
+
+class KisWebsocketRecordFrame:
+    """기록된 실시간 메시지"""
+
+    __slots__ = ["time", "id", "count", "body"]
+
+    time: float
+    """수신 시간 (UNIX timestamp)"""
+    id: str
+    """TR ID"""
+    count: int
+    """행 수"""
+    body: memoryview
+    """메시지 본문 (세그먼트 파일의 메모리 맵 영역)"""
+
+    def __init__(self, time: float, id: str, count: int, body: memoryview):
+        self.time = time
+        self.id = id
+        self.count = count
+        self.body = body
+
+    @property
+    def message(self) -> str:
+        """웹소켓으로 수신한 형식의 메시지"""
+        return f"0|{self.id}|{self.count:03d}|{str(self.body, 'utf-8')}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(time={self.time}, id={self.id!r}, count={self.count}, size={len(self.body)})"
+
+
+class KisWebsocketRecordRow:
+    """기록된 실시간 메시지의 행"""
+
+    __slots__ = ["time", "id", "symbol", "data"]
+
+    time: float
+    """수신 시간 (UNIX timestamp)"""
+    id: str
+    """TR ID"""
+    symbol: str
+    """종목 (TR Key)"""
+    data: memoryview
+    """행 데이터 (세그먼트 파일의 메모리 맵 영역)"""
+
+    def __init__(self, time: float, id: str, symbol: str, data: memoryview):
+        self.time = time
+        self.id = id
+        self.symbol = symbol
+        self.data = data
+
+    @property
+    def values(self) -> tuple[str, ...]:
+        """행의 필드 목록"""
+        return tuple(str(self.data, "utf-8").split("^"))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(time={self.time}, id={self.id!r}, symbol={self.symbol!r}, size={len(self.data)})"
+
+
+def _split_rows(id: str, count: int, data: bytes) -> list[tuple[int, int, str]]:
+    """메시지 본문을 행 단위로 나누어 (행 위치, 행 길이, 종목) 목록을 반환합니다."""
+    parts = data.split(b"^")
+    fields = len(getattr(WEBSOCKET_RESPONSES_MAP.get(id), "__fields__", None) or ())
+
+    if not fields or count < 1 or len(parts) != fields * count:
+        # 행 구분을 알 수 없는 메시지는 본문 전체를 하나의 행으로 색인합니다.
+        return [(0, len(data), parts[0].decode("utf-8", "replace"))]
+
+    rows = []
+    offset = 0
+
+    for i in range(count):
+        row = parts[i * fields : (i + 1) * fields]
+        length = sum(map(len, row)) + fields - 1
+        rows.append((offset, length, row[0].decode("utf-8", "replace")))
+        offset += length + 1
+
+    return rows
+
+
+class KisWebsocketRecorder:
+    """
+    실시간 메시지 기록기
+
+    수신한 실시간 메시지(수신 시간, TR ID, 행 수, 본문)를 미리 할당한 메모리 맵 세그먼트 파일에 순서대로 추가하고,
+    행별 위치를 종목 색인 파일에 기록합니다. 세그먼트가 가득 차면 다음 세그먼트 파일을 생성하며, 기존 파일은 수정하지 않습니다.
+
+    Note:
+        암호화된 메시지(체결통보)는 복호화 키 없이 재생할 수 없으므로 기록하지 않습니다.
+    """
+
+    __slots__ = [
+        "path",
+        "ids",
+        "segment_size",
+        "_lock",
+        "_segment",
+        "_file",
+        "_map",
+        "_cursor",
+        "_index",
+        "_closed",
+        "_frames",
+        "_rows",
+    ]
+
+    path: Path
+    """기록 디렉토리 경로"""
+    ids: frozenset[str] | None
+    """기록할 TR ID 목록 (None: 모든 TR)"""
+    segment_size: int
+    """세그먼트 파일 크기 (바이트)"""
+
+    _lock: threading.Lock
+    """기록 락"""
+    _segment: int
+    """현재 세그먼트 번호"""
+    _file: BinaryIO | None
+    """현재 세그먼트 파일"""
+    _map: mmap.mmap | None
+    """현재 세그먼트 메모리 맵"""
+    _cursor: int
+    """현재 세그먼트의 기록 위치"""
+    _index: BufferedWriter | None
+    """현재 세그먼트의 종목 색인 파일"""
+    _closed: bool
+    """종료 여부"""
+    _frames: int
+    """기록한 메시지 수"""
+    _rows: int
+    """기록한 행 수"""
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        ids: Iterable[str] | None = ("H0STCNT0", "HDFSCNT0"),
+        segment_size: int = 64 * 1024 * 1024,
+    ):
+        """
+        실시간 메시지 기록기를 생성합니다.
+
+        Args:
+            path (str | PathLike[str]): 기록 디렉토리 경로. 이미 기록된 세그먼트가 있으면 다음 번호부터 기록합니다.
+            ids (Iterable[str] | None, optional): 기록할 TR ID 목록. None이면 암호화되지 않은 모든 TR을 기록합니다.
+            segment_size (int, optional): 세그먼트 파일 크기 (바이트)
+        """
+        if segment_size < SEGMENT_HEADER.size + FRAME_HEADER.size:
+            raise ValueError("세그먼트 크기가 너무 작습니다.")
+
+        self.path = Path(path).resolve()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.ids = frozenset(ids) if ids is not None else None
+        self.segment_size = segment_size
+        self._lock = threading.Lock()
+        self._segment = max((int(file.stem) for file in self.path.glob("*.seg") if file.stem.isdigit()), default=-1)
+        self._file = None
+        self._map = None
+        self._cursor = 0
+        self._index = None
+        self._closed = False
+        self._frames = 0
+        self._rows = 0
+
+    @property
+    def closed(self) -> bool:
+        """종료 여부"""
+        return self._closed
+
+    @property
+    def frames(self) -> int:
+        """기록한 메시지 수"""
+        return self._frames
+
+    @property
+    def rows(self) -> int:
+        """기록한 행 수"""
+        return self._rows
+
+    def put(self, message: str, timestamp: float | None = None) -> bool:
+        """
+        수신한 실시간 메시지를 기록합니다. 기록 중 발생한 오류는 로그로만 남깁니다.
+
+        Args:
+            message (str): 실시간 이벤트 메시지
+            timestamp (float | None, optional): 수신 시간 (UNIX timestamp). 지정하지 않으면 현재 시간을 사용합니다.
+
+        Returns:
+            bool: 메시지를 기록했으면 True
+        """
+        try:
+            encrypted, id, count, body = message.split("|", 3)
+
+            if encrypted != "0" or (self.ids is not None and id not in self.ids):
+                return False
+
+            return self.record(id, int(count), body, timestamp)
+        except Exception as e:
+            logging.logger.error("RTC Failed to record message: %s", e)
+            return False
+
+    def record(self, id: str, count: int, body: str, timestamp: float | None = None) -> bool:
+        """
+        실시간 메시지를 기록합니다.
+
+        Args:
+            id (str): TR ID
+            count (int): 행 수
+            body (str): 메시지 본문
+            timestamp (float | None, optional): 수신 시간 (UNIX timestamp). 지정하지 않으면 현재 시간을 사용합니다.
+
+        Returns:
+            bool: 메시지를 기록했으면 True
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        data = body.encode("utf-8")
+        raw_id = id.encode("ascii")
+        rows = _split_rows(id, count, data)
+        size = FRAME_HEADER.size + len(data)
+
+        with self._lock:
+            if self._closed:
+                return False
+
+            if self._map is None or self._cursor + size > len(self._map):
+                self._open_segment(size)
+
+            map = self._map
+            assert map is not None and self._index is not None
+
+            offset = self._cursor + FRAME_HEADER.size
+            FRAME_HEADER.pack_into(map, self._cursor, timestamp, len(data), raw_id, count)
+            map[offset : offset + len(data)] = data
+            self._cursor = offset + len(data)
+            # 헤더의 기록된 길이를 마지막에 갱신하므로, 읽는 쪽은 완전히 기록된 메시지만 읽습니다.
+            SEGMENT_HEADER.pack_into(map, 0, SEGMENT_MAGIC, self._cursor)
+
+            self._index.write(
+                b"".join(
+                    INDEX_ENTRY.pack(timestamp, offset + start, length, raw_id, symbol.encode("utf-8")[:24])
+                    for start, length, symbol in rows
+                )
+            )
+            self._frames += 1
+            self._rows += len(rows)
+
+        return True
+
+    def _open_segment(self, size: int):
+        self._close_segment()
+        self._segment += 1
+
+        capacity = max(self.segment_size, SEGMENT_HEADER.size + size)
+        file = open(self.path / f"{self._segment:06d}.seg", "w+b")
+        file.truncate(capacity)
+
+        self._file = file
+        self._map = mmap.mmap(file.fileno(), capacity)
+        self._cursor = SEGMENT_HEADER.size
+        self._index = open(self.path / f"{self._segment:06d}.idx", "ab")
+
+        SEGMENT_HEADER.pack_into(self._map, 0, SEGMENT_MAGIC, self._cursor)
+
+    def _close_segment(self):
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+
+        if self._file is not None:
+            # 미리 할당한 영역 중 사용하지 않은 부분을 제거합니다.
+            self._file.truncate(self._cursor)
+            self._file.close()
+            self._file = None
+
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    def flush(self):
+        """기록한 내용을 디스크에 반영합니다."""
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+
+            if self._index is not None:
+                self._index.flush()
+
+    def close(self):
+        """기록을 종료합니다."""
+        with self._lock:
+            self._closed = True
+            self._close_segment()
+
+    def __enter__(self) -> "KisWebsocketRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path} frames={self._frames} rows={self._rows}>"
+
+
+class _KisRecordSegment:
+    __slots__ = ["path", "file", "map", "view", "length"]
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.length = 0
+
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 메모리 맵을 생성할 수 없습니다.
+            self.map = None
+
+        if self.map is not None and len(self.map) >= SEGMENT_HEADER.size:
+            magic, length = SEGMENT_HEADER.unpack_from(self.map, 0)
+
+            if magic != SEGMENT_MAGIC:
+                raise ValueError(f"실시간 기록 세그먼트 파일이 아닙니다: {path}")
+
+            self.length = min(length, len(self.map))
+
+        self.view = memoryview(self.map) if self.map is not None else memoryview(b"")
+
+    def close(self):
+        self.view.release()
+
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                # 외부에서 참조 중인 행 데이터가 있으면 참조가 해제될 때 닫힙니다.
+                pass
+
+        self.file.close()
+
+
+class KisWebsocketRecordReader:
+    """
+    실시간 메시지 기록 읽기
+
+    세그먼트 파일을 메모리 맵으로 열고, 종목 색인을 (수신 시간, 세그먼트, 위치, 길이) 열별 배열로 불러옵니다.
+    행 데이터는 복사하지 않고 메모리 맵 영역을 그대로 반환합니다.
+
+    Note:
+        반환된 행 데이터(memoryview)를 보관하는 동안에는 세그먼트 파일이 닫히지 않습니다.
+    """
+
+    __slots__ = [
+        "path",
+        "kis",
+        "_segments",
+        "_keys",
+        "_key_index",
+        "_times",
+        "_segment_ids",
+        "_offsets",
+        "_lengths",
+        "_entry_keys",
+        "_positions",
+        "_key_times",
+    ]
+
+    path: Path
+    """기록 디렉토리 경로"""
+    kis: "PyKis | None"
+    """파싱한 응답을 초기화할 API 객체"""
+
+    _segments: list[_KisRecordSegment]
+    """세그먼트 파일 목록"""
+    _keys: list[KisWebsocketTR]
+    """색인 키 목록 (TR ID, 종목)"""
+    _key_index: dict[KisWebsocketTR, int]
+    """색인 키 번호"""
+    _times: array
+    """행별 수신 시간"""
+    _segment_ids: array
+    """행별 세그먼트 번호"""
+    _offsets: array
+    """행별 위치"""
+    _lengths: array
+    """행별 길이"""
+    _entry_keys: array
+    """행별 색인 키 번호"""
+    _positions: dict[int, array]
+    """색인 키별 행 번호 목록"""
+    _key_times: dict[int, array]
+    """색인 키별 수신 시간 목록"""
+
+    def __init__(self, path: str | PathLike[str], kis: "PyKis | None" = None):
+        """
+        실시간 메시지 기록을 엽니다.
+
+        Args:
+            path (str | PathLike[str]): 기록 디렉토리 경로
+            kis (PyKis | None, optional): 파싱한 응답을 초기화할 API 객체
+        """
+        self.path = Path(path).resolve()
+        self.kis = kis
+        self._segments = []
+        self._keys = []
+        self._key_index = {}
+        self._times = array("d")
+        self._segment_ids = array("I")
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._entry_keys = array("I")
+        self._positions = {}
+        self._key_times = {}
+
+        for file in sorted(self.path.glob("*.seg")):
+            segment = _KisRecordSegment(file)
+            self._segments.append(segment)
+            self._load_index(len(self._segments) - 1, segment)
+
+    def _add_entry(self, segment: int, time: float, offset: int, length: int, id: str, symbol: str):
+        tr = KisWebsocketTR(id, symbol)
+
+        if (key := self._key_index.get(tr)) is None:
+            key = self._key_index[tr] = len(self._keys)
+            self._keys.append(tr)
+            self._positions[key] = array("Q")
+            self._key_times[key] = array("d")
+
+        self._positions[key].append(len(self._times))
+        self._key_times[key].append(time)
+        self._times.append(time)
+        self._segment_ids.append(segment)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        self._entry_keys.append(key)
+
+    def _load_index(self, number: int, segment: _KisRecordSegment):
+        index_path = segment.path.with_suffix(".idx")
+        data = index_path.read_bytes() if index_path.exists() else b""
+        data = data[: len(data) - len(data) % INDEX_ENTRY.size]
+        indexed = 0
+
+        for received, offset, length, raw_id, raw_symbol in INDEX_ENTRY.iter_unpack(data):
+            if offset + length > segment.length:
+                break
+
+            indexed = offset + length
+            self._add_entry(
+                number,
+                received,
+                offset,
+                length,
+                raw_id.rstrip(b"\0").decode("ascii"),
+                raw_symbol.rstrip(b"\0").decode("utf-8", "replace"),
+            )
+
+        # 색인 파일이 없거나 기록 도중 종료되어 색인이 누락된 메시지는 세그먼트를 읽어 색인합니다.
+        for frame_time, id, count, start, end in self._scan(segment):
+            if end <= indexed:
+                continue
+
+            for offset, length, symbol in _split_rows(id, count, bytes(segment.view[start:end])):
+                self._add_entry(number, frame_time, start + offset, length, id, symbol)
+
+    def _scan(self, segment: _KisRecordSegment) -> Iterator[tuple[float, str, int, int, int]]:
+        cursor = SEGMENT_HEADER.size
+
+        while cursor + FRAME_HEADER.size <= segment.length:
+            received, size, raw_id, count = FRAME_HEADER.unpack_from(segment.view, cursor)
+            start = cursor + FRAME_HEADER.size
+            end = start + size
+
+            if end > segment.length:
+                break
+
+            yield received, raw_id.rstrip(b"\0").decode("ascii"), count, start, end
+            cursor = end
+
+    @property
+    def keys(self) -> list[KisWebsocketTR]:
+        """기록된 (TR ID, 종목) 목록"""
+        return self._keys.copy()
+
+    @property
+    def symbols(self) -> list[str]:
+        """기록된 종목 목록"""
+        return list(dict.fromkeys(tr.key for tr in self._keys))
+
+    def __len__(self) -> int:
+        """기록된 행 수"""
+        return len(self._times)
+
+    def frames(self) -> Iterator[KisWebsocketRecordFrame]:
+        """기록된 메시지를 수신 순서대로 반환합니다."""
+        for segment in self._segments:
+            for received, id, count, start, end in self._scan(segment):
+                yield KisWebsocketRecordFrame(received, id, count, segment.view[start:end])
+
+    def _select(
+        self,
+        symbol: str | None,
+        id: str | None,
+        start: float | None,
+        end: float | None,
+    ) -> Sequence[int]:
+        positions: Sequence[int]
+        times: Sequence[float]
+
+        if symbol is None and id is None:
+            positions = range(len(self._times))
+            times = self._times
+        else:
+            keys = [
+                key
+                for tr, key in self._key_index.items()
+                if (symbol is None or tr.key == symbol) and (id is None or tr.id == id)
+            ]
+
+            if len(keys) == 1:
+                positions = self._positions[keys[0]]
+                times = self._key_times[keys[0]]
+            else:
+                positions = array("Q", sorted(position for key in keys for position in self._positions[key]))
+                times = [self._times[position] for position in positions]
+
+        if start is None and end is None:
+            return positions
+
+        # 수신 시간 순으로 기록되므로 이진 탐색으로 구간을 찾습니다.
+        lower = bisect_left(times, start) if start is not None else 0
+        upper = bisect_right(times, end) if end is not None else len(times)
+
+        return positions[lower:upper]
+
+    def rows(
+        self,
+        symbol: str | None = None,
+        id: str | None = None,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> Iterator[KisWebsocketRecordRow]:
+        """
+        기록된 행을 수신 순서대로 반환합니다. 행 데이터는 복사하지 않습니다.
+
+        Args:
+            symbol (str | None, optional): 종목 (TR Key)
+            id (str | None, optional): TR ID
+            start (float | None, optional): 시작 수신 시간 (UNIX timestamp, 포함)
+            end (float | None, optional): 종료 수신 시간 (UNIX timestamp, 포함)
+        """
+        for position in self._select(symbol, id, start, end):
+            offset = self._offsets[position]
+            tr = self._keys[self._entry_keys[position]]
+
+            yield KisWebsocketRecordRow(
+                self._times[position],
+                tr.id,
+                tr.key,
+                self._segments[self._segment_ids[position]].view[offset : offset + self._lengths[position]],
+            )
+
+    def responses(
+        self,
+        symbol: str | None = None,
+        id: str | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        lazy: bool = False,
+    ) -> Iterator[Any]:
+        """
+        기록된 행을 응답 객체(예: KisRealtimePrice)로 파싱하여 수신 순서대로 반환합니다.
+
+        Args:
+            symbol (str | None, optional): 종목 (TR Key)
+            id (str | None, optional): TR ID
+            start (float | None, optional): 시작 수신 시간 (UNIX timestamp, 포함)
+            end (float | None, optional): 종료 수신 시간 (UNIX timestamp, 포함)
+            lazy (bool, optional): 필드를 처음 접근할 때 변환할지 여부
+        """
+        for row in self.rows(symbol=symbol, id=id, start=start, end=end):
+            if (response_type := WEBSOCKET_RESPONSES_MAP.get(row.id)) is None:
+                continue
+
+            response = get_websocket_parser(response_type, lazy=lazy)(row.values)
+            row.data.release()
+
+            if self.kis is not None and isinstance(response, KisObjectBase):
+                kis_object_init(self.kis, response)
+
+            yield response
+
+    def close(self):
+        """세그먼트 파일을 닫습니다."""
+        for segment in self._segments:
+            segment.close()
+
+        self._segments.clear()
+
+    def __enter__(self) -> "KisWebsocketRecordReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path} segments={len(self._segments)} rows={len(self._times)}>"
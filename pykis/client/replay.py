@@ -0,0 +1,286 @@
+import threading
+import time
+from os import PathLike
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from pykis.client.messaging import KisWebsocketForm
+from pykis.client.recorder import KisWebsocketRecordFrame, KisWebsocketRecordReader
+
+if TYPE_CHECKING:
+    from pykis.client.websocket import KisWebsocketClient
+
+__all__ = [
+    "KisWebsocketReplayStats",
+    "KisWebsocketReplaySocket",
+    "KisWebsocketReplay",
+]
+
+
+class KisWebsocketReplayStats:
+    """실시간 메시지 재생 통계"""
+
+    __slots__ = [
+        "frames",
+        "elapsed",
+        "max_lag",
+    ]
+
+    frames: int
+    """재생한 메시지 수"""
+    elapsed: float
+    """재생 시간 (초)"""
+    max_lag: float
+    """재생 예정 시간보다 늦게 전달된 최대 시간 (초)"""
+
+    def __init__(self, frames: int = 0, elapsed: float = 0, max_lag: float = 0):
+        self.frames = frames
+        self.elapsed = elapsed
+        self.max_lag = max_lag
+
+    @property
+    def rate(self) -> float:
+        """초당 재생한 메시지 수"""
+        return self.frames / self.elapsed if self.elapsed else 0
+
+    def copy(self) -> "KisWebsocketReplayStats":
+        return KisWebsocketReplayStats(
+            frames=self.frames,
+            elapsed=self.elapsed,
+            max_lag=self.max_lag,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(frames={self.frames}, elapsed={self.elapsed:.3f}, "
+            f"max_lag={self.max_lag:.3f}, rate={self.rate:.1f})"
+        )
+
+
+class KisWebsocketReplaySocket:
+    """
+    재생용 웹소켓
+
+    서버에 접속하지 않으며, 클라이언트가 보낸 구독 요청을 기록만 합니다.
+    """
+
+    __slots__ = ["requests", "closed"]
+
+    requests: list[tuple[str, KisWebsocketForm | None]]
+    """클라이언트가 보낸 요청 (요청 타입, 요청 본문)"""
+    closed: bool
+    """종료 여부"""
+
+    def __init__(self):
+        self.requests = []
+        self.closed = False
+
+    def send(self, data: str):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class KisWebsocketReplay:
+    """
+    실시간 메시지 재생기
+
+    기록된 실시간 메시지를 `KisWebsocketClient._on_message`로 전달하여 서버 없이 복호화를 제외한 파싱, 이벤트 디스패치, 콜백을 실행합니다.
+    메시지는 항상 기록된 순서대로 전달되며, 재생 속도에 따라 기록된 수신 간격을 유지하거나 줄입니다.
+    """
+
+    __slots__ = [
+        "source",
+        "speed",
+        "ids",
+        "since",
+        "until",
+        "_stop",
+        "_stats",
+        "_thread",
+    ]
+
+    source: KisWebsocketRecordReader | str | PathLike[str] | Iterable[KisWebsocketRecordFrame]
+    """재생할 기록"""
+    speed: float | None
+    """재생 속도 (1: 기록된 속도, None: 최대 속도)"""
+    ids: frozenset[str] | None
+    """재생할 TR ID 목록 (None: 모든 TR)"""
+    since: float | None
+    """재생 시작 수신 시간 (UNIX timestamp)"""
+    until: float | None
+    """재생 종료 수신 시간 (UNIX timestamp)"""
+
+    _stop: threading.Event
+    """재생 중단 이벤트"""
+    _stats: KisWebsocketReplayStats
+    """재생 통계"""
+    _thread: threading.Thread | None
+    """재생 스레드"""
+
+    def __init__(
+        self,
+        source: KisWebsocketRecordReader | str | PathLike[str] | Iterable[KisWebsocketRecordFrame],
+        speed: float | None = 1,
+        ids: Iterable[str] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ):
+        """
+        실시간 메시지 재생기를 생성합니다.
+
+        Args:
+            source (KisWebsocketRecordReader | str | PathLike[str] | Iterable[KisWebsocketRecordFrame]): 기록 읽기 객체, 기록 디렉토리 경로 또는 메시지 목록
+            speed (float | None, optional): 재생 속도. 1이면 기록된 속도, 10이면 10배속, None이면 대기 없이 최대 속도로 재생합니다.
+            ids (Iterable[str] | None, optional): 재생할 TR ID 목록
+            since (float | None, optional): 재생 시작 수신 시간 (UNIX timestamp, 포함)
+            until (float | None, optional): 재생 종료 수신 시간 (UNIX timestamp, 포함)
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("재생 속도는 0보다 커야 합니다.")
+
+        self.source = source
+        self.speed = speed
+        self.ids = frozenset(ids) if ids is not None else None
+        self.since = since
+        self.until = until
+        self._stop = threading.Event()
+        self._stats = KisWebsocketReplayStats()
+        self._thread = None
+
+    @property
+    def stats(self) -> KisWebsocketReplayStats:
+        """재생 통계의 복사본을 반환합니다."""
+        return self._stats.copy()
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 재생 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _frames(self, source: KisWebsocketRecordReader | Iterable[KisWebsocketRecordFrame]) -> Iterator[KisWebsocketRecordFrame]:
+        for frame in source.frames() if isinstance(source, KisWebsocketRecordReader) else source:
+            if self.ids is not None and frame.id not in self.ids:
+                continue
+
+            if self.since is not None and frame.time < self.since:
+                continue
+
+            if self.until is not None and frame.time > self.until:
+                break
+
+            yield frame
+
+    def attach(self, client: "KisWebsocketClient") -> KisWebsocketReplaySocket:
+        """
+        클라이언트를 재생용 웹소켓에 연결된 상태로 설정합니다.
+
+        연결된 클라이언트는 서버에 접속하지 않으며, 구독 요청은 재생용 웹소켓에 기록됩니다.
+
+        Args:
+            client (KisWebsocketClient): 웹소켓 클라이언트
+        """
+        if not isinstance(socket := client.websocket, KisWebsocketReplaySocket):
+            if client.thread is not None and client.thread.is_alive():
+                raise RuntimeError("서버에 접속 중인 클라이언트에는 재생할 수 없습니다.")
+
+            socket = client.websocket = KisWebsocketReplaySocket()  # type: ignore
+
+        client._connected_event.set()
+
+        return socket
+
+    def run(self, client: "KisWebsocketClient", wait: bool = True) -> KisWebsocketReplayStats:
+        """
+        현재 스레드에서 기록된 메시지를 재생합니다.
+
+        Args:
+            client (KisWebsocketClient): 웹소켓 클라이언트
+            wait (bool, optional): 클라이언트에 처리 대기열이 설정된 경우, 대기열의 메시지가 모두 처리될 때까지 기다릴지 여부
+
+        Returns:
+            KisWebsocketReplayStats: 재생 통계
+        """
+        self._stop.clear()
+        return self._run(client, wait=wait)
+
+    def _run(self, client: "KisWebsocketClient", wait: bool = True) -> KisWebsocketReplayStats:
+        socket = self.attach(client)
+        source = self.source
+        reader = None
+
+        if isinstance(source, (str, PathLike)):
+            source = reader = KisWebsocketRecordReader(source)
+
+        self._stats = stats = KisWebsocketReplayStats()
+        started = time.perf_counter()
+        origin = None
+
+        try:
+            for frame in self._frames(source):
+                if self._stop.is_set():
+                    break
+
+                if self.speed is not None:
+                    if origin is None:
+                        origin = frame.time
+
+                    delay = started + (frame.time - origin) / self.speed - time.perf_counter()
+
+                    if delay > 0:
+                        if self._stop.wait(delay):
+                            break
+                    elif -delay > stats.max_lag:
+                        stats.max_lag = -delay
+
+                client._on_message(socket, frame.message)  # type: ignore
+                stats.frames += 1
+
+            if wait and (pipeline := client.pipeline) is not None:
+                pipeline.join()
+        finally:
+            stats.elapsed = time.perf_counter() - started
+
+            if reader is not None:
+                reader.close()
+
+        return stats.copy()
+
+    def start(self, client: "KisWebsocketClient") -> threading.Thread:
+        """
+        백그라운드 스레드에서 기록된 메시지를 재생합니다.
+
+        Args:
+            client (KisWebsocketClient): 웹소켓 클라이언트
+        """
+        if self.running:
+            raise RuntimeError("이미 재생 중입니다.")
+
+        self.attach(client)
+        # 중단 요청은 스레드를 만들기 전에만 초기화하므로, 스레드가 실행되기 전에 호출된 `stop()`도 반영됩니다.
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(client,),
+            name="pykis-websocket-replay",
+            daemon=True,
+        )
+        self._thread.start()
+
+        return self._thread
+
+    def stop(self):
+        """재생을 중단합니다."""
+        self._stop.set()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """
+        백그라운드 재생이 끝날 때까지 기다립니다.
+
+        Returns:
+            bool: 재생이 끝났으면 True
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        return not self.running
@@ -0,0 +1,119 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+from pykis.__env__ import ASYNC_CONNECTION_LIMIT, USER_AGENT
+
+if TYPE_CHECKING:
+    import aiohttp
+
+__all__ = [
+    "KisAsyncTransport",
+]
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "비동기 API를 사용하려면 aiohttp 패키지가 필요합니다. (pip install python-kis[async])"
+        ) from e
+
+    return aiohttp
+
+
+class KisAsyncTransport:
+    """
+    한국투자증권 비동기 HTTP 전송 계층
+
+    `aiohttp` 커넥션 풀을 사용하여 요청을 전송하고, 응답은 동기 API와 동일하게 `requests.Response`로 변환합니다.
+    세션은 처음 요청을 보낼 때 현재 이벤트 루프에서 생성됩니다.
+    """
+
+    __slots__ = [
+        "limit",
+        "timeout",
+        "_session",
+        "_loop",
+    ]
+
+    limit: int
+    """최대 동시 연결 수"""
+    timeout: float | None
+    """요청 타임아웃 (초)"""
+
+    _session: "aiohttp.ClientSession | None"
+    """aiohttp 세션"""
+    _loop: asyncio.AbstractEventLoop | None
+    """세션이 생성된 이벤트 루프"""
+
+    def __init__(self, limit: int = ASYNC_CONNECTION_LIMIT, timeout: float | None = None):
+        """
+        비동기 HTTP 전송 계층을 생성합니다.
+
+        Args:
+            limit: 최대 동시 연결 수
+            timeout: 요청 타임아웃 (초)
+        """
+        self.limit = limit
+        self.timeout = timeout
+        self._session = None
+        self._loop = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """현재 이벤트 루프의 aiohttp 세션을 반환합니다."""
+        aiohttp = _import_aiohttp()
+        loop = asyncio.get_running_loop()
+
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # 이벤트 루프가 바뀐 경우 이전 세션은 재사용할 수 없습니다.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                headers={"User-Agent": USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._loop = loop
+
+        return self._session
+
+    async def send(self, request: PreparedRequest) -> Response:
+        """
+        요청을 전송합니다.
+
+        Args:
+            request: 전송할 요청
+
+        Returns:
+            `requests.Response`로 변환된 응답
+        """
+        from yarl import URL
+
+        async with self.session.request(
+            request.method or "GET",
+            URL(request.url or "", encoded=True),
+            headers=dict(request.headers),
+            data=request.body,
+        ) as resp:
+            content = await resp.read()
+
+        response = Response()
+        response.status_code = resp.status
+        response.reason = resp.reason or ""
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.encoding = resp.charset
+        response.url = str(resp.url)
+        response.request = request
+        response._content = content
+
+        return response
+
+    async def close(self) -> None:
+        """aiohttp 세션을 종료합니다."""
+        session, self._session, self._loop = self._session, None, None
+
+        if session is not None and not session.closed:
+            await session.close()
@@ -1,21 +1,19 @@
-import base64
 import json
 import threading
 import time
 from multiprocessing import Event, Lock
 from multiprocessing.synchronize import Event as EventType
 from multiprocessing.synchronize import Lock as LockType
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Iterable
 
 from websocket import WebSocketApp, WebSocketConnectionClosedException
 
 from pykis import logging
-from pykis.__env__ import (
-    WEBSOCKET_MAX_SUBSCRIPTIONS,
-    WEBSOCKET_REAL_DOMAIN,
-    WEBSOCKET_VIRTUAL_DOMAIN,
-)
+from pykis.__env__ import WEBSOCKET_MAX_SUBSCRIPTIONS
 from pykis.api.websocket import WEBSOCKET_RESPONSES_MAP
+from pykis.client.appkey import KisKey
+from pykis.client.auth import KisAuth
+from pykis.client.conflation import KisWebsocketConflator
 from pykis.client.messaging import (
     TR_SUBSCRIBE_TYPE,
     TR_UNSUBSCRIBE_TYPE,
@@ -25,8 +23,12 @@ from pykis.client.messaging import (
     KisWebsocketTR,
 )
 from pykis.client.object import KisObjectBase, kis_object_init
+from pykis.client.pipeline import KisWebsocketPipeline
+from pykis.client.recorder import KisWebsocketRecorder
+from pykis.client.replay import KisWebsocketReplaySocket
 from pykis.event.filters.subscription import KisSubscriptionEventFilter
 from pykis.event.handler import (
+    KisEventArgs,
     KisEventFilter,
     KisEventHandler,
     KisEventTicket,
@@ -53,6 +55,8 @@ class KisWebsocketClient:
 
     virtual: bool
     """모의투자 서버 여부"""
+    appkey: KisKey | None = None
+    """추가 웹소켓 세션의 앱 키 (None: 기본 앱 키)"""
 
     websocket: WebSocketApp | None = None
     """웹소켓"""
@@ -61,6 +65,8 @@ class KisWebsocketClient:
 
     subscribed_event: KisEventHandler["KisWebsocketClient", KisSubscribedEventArgs]
     """구독 추가 이벤트"""
+    disconnected_event: KisEventHandler["KisWebsocketClient", KisEventArgs]
+    """연결 해제 이벤트"""
     unsubscribed_event: KisEventHandler["KisWebsocketClient", KisSubscribedEventArgs]
     """구독 해제 이벤트"""
 
@@ -71,6 +77,8 @@ class KisWebsocketClient:
     """자동 재접속 여부"""
     reconnect_interval: float = 5
     """재접속 간격 (초)"""
+    _lazy: bool = False
+    """실시간 응답 지연 변환 여부"""
 
     _connect_lock: LockType
     """접속 락"""
@@ -86,17 +94,33 @@ class KisWebsocketClient:
 
     _keychain: dict[KisWebsocketTR, KisWebsocketEncryptionKey]
     """암호화 키체인"""
+    _approval_keys: dict[KisWebsocketTR, str]
+    """TR 요청에 사용된 웹소켓 접속 키"""
+    _approval_retries: set[KisWebsocketTR]
+    """접속 키 오류로 재요청한 TR 목록"""
     _reference_store: ReferenceStore
     """이벤트 참조 카운터"""
 
     _primary_client: "KisWebsocketClient | None" = None
     """계좌 조회가 가능한 서버의 클라이언트 (모의투자에서만 사용)"""
-
-    def __init__(self, kis: "PyKis", virtual: bool = False):
+    _pipeline: KisWebsocketPipeline | None = None
+    """실시간 메시지 처리 대기열"""
+    _conflator: KisWebsocketConflator
+    """실시간 시세 병합기"""
+    _recorder: KisWebsocketRecorder | None = None
+    """실시간 메시지 기록기"""
+    _sessions: list["KisWebsocketClient"]
+    """추가 앱 키로 접속한 웹소켓 세션 목록"""
+    _session_subscriptions: dict[KisWebsocketTR, "KisWebsocketClient"]
+    """추가 웹소켓 세션에 배정된 TR 구독 목록"""
+
+    def __init__(self, kis: "PyKis", virtual: bool = False, appkey: KisKey | None = None):
         self.kis = kis
         self.virtual = virtual
+        self.appkey = appkey
         self.subscribed_event = KisEventHandler()
         self.unsubscribed_event = KisEventHandler()
+        self.disconnected_event = KisEventHandler()
         self.event = KisEventHandler()
         self._connect_lock = Lock()
         self._connect_event = Event()
@@ -104,7 +128,12 @@ class KisWebsocketClient:
         self._subscriptions = set()
         self._registered_subscriptions = set()
         self._keychain = dict()
+        self._approval_keys = dict()
+        self._approval_retries = set()
         self._reference_store = ReferenceStore(callback=self._release_reference)
+        self._conflator = KisWebsocketConflator(self)
+        self._sessions = []
+        self._session_subscriptions = {}
 
     def is_subscribed(self, id: str, key: str = "") -> bool:
         """
@@ -117,13 +146,139 @@ class KisWebsocketClient:
         Returns:
             bool: 구독 여부
         """
-        return (KisWebsocketTR(id, key) in self._subscriptions) or (
-            self._primary_client is not None and self._primary_client.is_subscribed(id, key)
+        tr = KisWebsocketTR(id, key)
+
+        return (
+            (tr in self._subscriptions)
+            or (tr in self._session_subscriptions)
+            or (self._primary_client is not None and self._primary_client.is_subscribed(id, key))
         )
 
     @property
     def subscriptions(self) -> set[KisWebsocketTR]:
-        return self._subscriptions | (self._primary_client.subscriptions if self._primary_client else set())
+        return (
+            self._subscriptions
+            | set(self._session_subscriptions)
+            | (self._primary_client.subscriptions if self._primary_client else set())
+        )
+
+    @property
+    def sessions(self) -> list["KisWebsocketClient"]:
+        """추가 앱 키로 접속한 웹소켓 세션 목록"""
+        return self._sessions.copy()
+
+    @thread_safe("subscriptions")
+    def add_session(self, auth: KisAuth | KisKey) -> "KisWebsocketClient":
+        """
+        추가 앱 키로 웹소켓 세션을 추가합니다.
+
+        세션당 최대 구독 수를 초과하는 TR은 구독 수가 가장 적은 세션에 배정되며,
+        이벤트는 이 클라이언트의 `event`로 전달되므로 `on(...)`을 그대로 사용할 수 있습니다.
+
+        Args:
+            auth (KisAuth | KisKey): 추가 세션의 인증 정보
+
+        Raises:
+            ValueError: 모의투자 앱 키를 실전 서버 세션에 추가하거나, 이미 사용 중인 앱 키인 경우
+        """
+        if isinstance(auth, KisAuth):
+            if auth.virtual != self.virtual:
+                raise ValueError("웹소켓 서버와 같은 도메인의 앱 키를 사용해야 합니다.")
+
+            auth = auth.key
+
+        default_appkey = self.kis.virtual_appkey if self.virtual else self.kis.appkey
+
+        if (default_appkey is not None and auth.appkey == default_appkey.appkey) or any(
+            session.appkey is not None and session.appkey.appkey == auth.appkey for session in self._sessions
+        ):
+            raise ValueError("이미 사용 중인 앱 키입니다.")
+
+        session = KisWebsocketClient(self.kis, virtual=self.virtual, appkey=auth)
+        session.reconnect = self.reconnect
+        session.reconnect_interval = self.reconnect_interval
+        session.lazy = self._lazy
+        session.recorder = self._recorder
+        session._pipeline = self._pipeline
+        session._conflator = self._conflator
+        session.subscribed_event += self._primary_client_subscribed_event
+        session.unsubscribed_event += self._primary_client_unsubscribed_event
+        session.event += self._primary_client_event
+        session.disconnected_event += self._session_disconnected_event
+
+        self._sessions.append(session)
+        self.disconnected_event += self._session_disconnected_event
+
+        return session
+
+    @property
+    def pipeline(self) -> KisWebsocketPipeline | None:
+        """
+        실시간 메시지 처리 대기열
+
+        설정하면 수신 스레드는 이벤트 메시지를 대기열에 추가하기만 하고,
+        대기열의 디스패처 스레드에서 복호화, 파싱, 이벤트 콜백을 실행합니다.
+        추가 세션과 모의투자 체결통보 클라이언트도 같은 대기열을 사용하며, 메시지는 수신한 클라이언트의 암호화 키로 처리됩니다.
+        """
+        return self._pipeline
+
+    @pipeline.setter
+    def pipeline(self, pipeline: KisWebsocketPipeline | None):
+        previous, self._pipeline = self._pipeline, pipeline
+
+        if pipeline is not None:
+            pipeline.bind(self._handle_events)
+
+        for client in [self._primary_client, *self._sessions]:
+            if client is not None:
+                client._pipeline = pipeline
+
+        if previous is not None and previous is not pipeline:
+            previous.close(wait=False)
+
+    @property
+    def lazy(self) -> bool:
+        """
+        실시간 응답 지연 변환 여부
+
+        설정하면 실시간 응답의 필드를 수신 시점에 모두 변환하지 않고, 처음 접근할 때 변환하여 저장합니다.
+        변환 오류는 해당 필드에 접근할 때 발생합니다.
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, lazy: bool):
+        self._lazy = lazy
+
+        for client in [self._primary_client, *self._sessions]:
+            if client is not None:
+                client.lazy = lazy
+
+    @property
+    def recorder(self) -> KisWebsocketRecorder | None:
+        """
+        실시간 메시지 기록기
+
+        설정하면 수신한 실시간 메시지를 수신 시간과 함께 기록합니다.
+        """
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: KisWebsocketRecorder | None):
+        self._recorder = recorder
+
+        for client in [self._primary_client, *self._sessions]:
+            if client is not None:
+                client.recorder = recorder
+
+    @property
+    def conflator(self) -> KisWebsocketConflator:
+        """
+        실시간 시세 병합기
+
+        `on(..., max_rate=...)`로 등록한 병합 구독의 최신 데이터를 보관하고 전달합니다.
+        """
+        return self._conflator
 
     @property
     def connected(self) -> bool:
@@ -131,6 +286,7 @@ class KisWebsocketClient:
             self.websocket is not None
             and self._connected_event.is_set()
             and (self._primary_client is None or self._primary_client.connected)
+            and all(session.connected for session in self._sessions if session._subscriptions)
         )
 
     @thread_safe("connect")
@@ -139,6 +295,10 @@ class KisWebsocketClient:
         if self._primary_client:
             self._primary_client.connect()
 
+        for session in self._sessions:
+            if session._subscriptions:
+                session.connect()
+
         if self.connected:
             return
 
@@ -177,6 +337,9 @@ class KisWebsocketClient:
         if self._primary_client:
             self._primary_client.disconnect()
 
+        for session in self._sessions:
+            session.disconnect()
+
         thread = self.thread
 
         if thread is not None and thread.is_alive():
@@ -201,17 +364,24 @@ class KisWebsocketClient:
         if not self.websocket or (not force and not self._connected_event.is_set()):
             return False
 
+        if isinstance(self.websocket, KisWebsocketReplaySocket):
+            # 재생용 웹소켓은 서버에 접속하지 않으므로 접속키를 발급받지 않고 요청만 기록합니다.
+            self.websocket.requests.append((type, body))
+            return True
+
         logging.logger.debug("RTC Sending request: %s %s", type, body)
-        self.websocket.send(
-            json.dumps(
-                KisWebsocketRequest(
-                    kis=self.kis,
-                    type=type,
-                    body=body,
-                    domain="virtual" if self.virtual else "real",
-                ).build()
-            )
-        )
+        request = KisWebsocketRequest(
+            kis=self.kis,
+            type=type,
+            body=body,
+            domain="virtual" if self.virtual else "real",
+            appkey=self.appkey,
+        ).build()
+
+        if isinstance(body, KisWebsocketTR):
+            self._approval_keys[body] = request["header"]["approval_key"]
+
+        self.websocket.send(json.dumps(request))
 
         return True
 
@@ -236,9 +406,23 @@ class KisWebsocketClient:
             )
             return
 
-        self._ensure_connection()
         tr = KisWebsocketTR(id, key)
 
+        if self._sessions:
+            if tr in self._subscriptions or tr in self._session_subscriptions:
+                return
+
+            if (session := self._select_session()) is None:
+                logging.logger.warning("RTC Maximum number of subscriptions reached")
+                raise ValueError("Maximum number of subscriptions reached")
+
+            if session is not self:
+                session.subscribe(id, key)
+                self._session_subscriptions[tr] = session
+                return
+
+        self._ensure_connection()
+
         if tr in self._subscriptions:
             return
 
@@ -269,6 +453,10 @@ class KisWebsocketClient:
 
         tr = KisWebsocketTR(id, key)
 
+        if (session := self._session_subscriptions.pop(tr, None)) is not None:
+            session.unsubscribe(id, key)
+            return
+
         if tr not in self._subscriptions:
             return
 
@@ -280,9 +468,58 @@ class KisWebsocketClient:
         if self._primary_client:
             self._primary_client.unsubscribe_all()
 
-        for tr in self._subscriptions.copy():
+        for tr in self._subscriptions | set(self._session_subscriptions):
             self.unsubscribe(tr.id, tr.key)
 
+    def _select_session(
+        self,
+        exclude: "KisWebsocketClient | None" = None,
+        connected: bool = False,
+    ) -> "KisWebsocketClient | None":
+        """구독 수가 가장 적은 세션을 반환합니다. 모든 세션의 구독 수가 최대인 경우 None을 반환합니다."""
+        candidates = [
+            session
+            for session in [self, *self._sessions]
+            if session is not exclude
+            and len(session._subscriptions) < WEBSOCKET_MAX_SUBSCRIPTIONS
+            and (not connected or session._connected_event.is_set())
+        ]
+
+        # 구독 수가 같으면 기본 세션을 우선합니다.
+        return min(candidates, key=lambda session: len(session._subscriptions), default=None)
+
+    def _session_disconnected_event(self, sender: "KisWebsocketClient", e: KisEventArgs):
+        # disconnect()로 종료한 경우에는 구독을 옮기지 않습니다.
+        if sender.thread is None or not self._sessions:
+            return
+
+        self._rebalance(sender)
+
+    @thread_safe("subscriptions")
+    def _rebalance(self, session: "KisWebsocketClient"):
+        """연결이 끊긴 세션의 구독을 연결된 다른 세션으로 옮깁니다."""
+        moved = []
+
+        for tr in list(session._subscriptions):
+            if (target := self._select_session(exclude=session, connected=True)) is None:
+                break
+
+            # 연결이 끊긴 세션에는 구독 해제 요청을 보내지 않고 목록에서만 제거합니다.
+            session._subscriptions.discard(tr)
+
+            if target is self:
+                self._session_subscriptions.pop(tr, None)
+                self._subscriptions.add(tr)
+                self._request(TR_SUBSCRIBE_TYPE, tr)
+            else:
+                target.subscribe(tr.id, tr.key)
+                self._session_subscriptions[tr] = target
+
+            moved.append(tr)
+
+        if moved:
+            logging.logger.info("RTC Moved %d subscriptions from disconnected session", len(moved))
+
     def referenced_subscribe(self, id: str, key: str, primary: bool = False) -> ReferenceTicket:
         """
         래퍼런스 카운터를 사용하여 TR을 구독합니다.
@@ -304,6 +541,7 @@ class KisWebsocketClient:
         where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]] | None = None,
         once: bool = False,
         primary: bool = False,
+        max_rate: float | None = None,
     ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]]:
         """
         TR을 구독합니다.
@@ -314,19 +552,35 @@ class KisWebsocketClient:
             callback (Callable[[TSender, TEventArgs], None]): 콜백 함수
             where (KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]], optional): 이벤트 필터. Defaults to None.
             primary (bool): 주 서버에 구독할지 여부
+            max_rate (float | None, optional): 최대 전달 빈도 (초당 횟수). 지정하면 TR Key별 최신 데이터만 전달합니다. Defaults to None.
         """
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("최대 전달 빈도는 0보다 커야 합니다.")
+
         subscription_filter = KisSubscriptionEventFilter(id)
+        handler = package_mathod(
+            callback,
+            ticket=self.referenced_subscribe(
+                id=id,
+                key=key,
+                primary=primary,
+            ),
+        )
+        where = KisMultiEventFilter(subscription_filter, where) if where else subscription_filter
+
+        if max_rate is not None:
+            return self._conflator.on(
+                id=id,
+                key=key,
+                handler=handler,
+                max_rate=max_rate,
+                where=where,
+                once=once,
+            )
 
         return self.event.on(
-            handler=package_mathod(
-                callback,
-                ticket=self.referenced_subscribe(
-                    id=id,
-                    key=key,
-                    primary=primary,
-                ),
-            ),
-            where=KisMultiEventFilter(subscription_filter, where) if where else subscription_filter,
+            handler=handler,
+            where=where,
             once=once,
         )
 
@@ -342,6 +596,9 @@ class KisWebsocketClient:
         self._registered_subscriptions.clear()
         # 암호화 키 초기화
         self._keychain.clear()
+        # 접속 키 재요청 기록 초기화
+        self._approval_keys.clear()
+        self._approval_retries.clear()
 
     def _restore_subscriptions(self):
         """구독 목록을 복원합니다."""
@@ -366,7 +623,7 @@ class KisWebsocketClient:
                 try:
                     self._connected_event.clear()
                     self.websocket = WebSocketApp(
-                        f"{WEBSOCKET_VIRTUAL_DOMAIN if self.virtual else WEBSOCKET_REAL_DOMAIN}/tryitout",
+                        f"{self.kis.websocket_domains['virtual' if self.virtual else 'real']}/tryitout",
                         on_open=self._on_open,  # type: ignore
                         on_error=self._on_error,  # type: ignore
                         on_close=self._on_close,  # type: ignore
@@ -429,6 +686,12 @@ class KisWebsocketClient:
             return
 
         logging.logger.info("RTC Disconnected from server: %s", reason)
+        self._connected_event.clear()
+
+        try:
+            self.disconnected_event.invoke(self, KisEventArgs())
+        except Exception as e:
+            logging.logger.exception("RTC Failed to emit disconnected event: %s", e)
 
     def _on_message(self, websocket: WebSocketApp, message: str):
         if websocket is not self.websocket:
@@ -437,7 +700,14 @@ class KisWebsocketClient:
         try:
             match message[0]:
                 case "0" | "1":  # 이벤트 데이터 (암호화여부)
-                    self._handle_event(message)
+                    if (recorder := self._recorder) is not None:
+                        recorder.put(message)
+
+                    if (pipeline := self._pipeline) is not None:
+                        # 추가 세션 등 하위 클라이언트의 메시지도 수신한 클라이언트의 암호화 키로 처리합니다.
+                        pipeline.put(message, self._handle_events)
+                    else:
+                        self._handle_event(message)
                 case "{" | _:  # 제어 데이터
                     self._handle_control(json.loads(message))
         except Exception as e:
@@ -503,9 +773,33 @@ class KisWebsocketClient:
             case "OPSP0007":  # internal error
                 logging.logger.error("RTC Internal server error: %s %s", tr, message)
 
+            case "OPSP0011":  # invalid approval key
+                self._handle_invalid_approval_key(tr, message)
+
             case _:
                 logging.logger.warning("RTC Unhandled control message: %s(%s) %s", tr, code, message)
 
+    def _handle_invalid_approval_key(self, tr: KisWebsocketTR, message: str):
+        """접속 키 오류를 처리합니다."""
+        logging.logger.warning("RTC Invalid approval key for %s: %s", tr, message)
+
+        # 같은 접속 키로 보낸 요청들이 동시에 실패하더라도 접속 키는 한 번만 재발급합니다.
+        if self.appkey is not None:
+            self.kis.discard_approval_key(
+                "virtual" if self.virtual else "real",
+                approval_key=self._approval_keys.pop(tr, None),
+                appkey=self.appkey,
+            )
+        else:
+            self.kis.discard_approval_key(
+                "virtual" if self.virtual else "real",
+                approval_key=self._approval_keys.pop(tr, None),
+            )
+
+        if tr in self._subscriptions and tr not in self._approval_retries:
+            self._approval_retries.add(tr)
+            self._request(TR_SUBSCRIBE_TYPE, tr, force=True)
+
     def _set_encryption_key(self, tr: KisWebsocketTR, body: dict):
         """암호화 키를 설정합니다."""
         # 국내주식 실시간체결통보 실전, 모의 해외주식 실시간체결통보 실전, 모의
@@ -513,10 +807,14 @@ class KisWebsocketClient:
             # 체결통보의 경우 tr key를 사용하지 않음
             tr = KisWebsocketTR(tr.id, "")
 
-        self._keychain[tr] = KisWebsocketEncryptionKey(
-            key=body["key"].encode("utf-8"),
-            iv=body["iv"].encode("utf-8"),
-        )
+        key = body["key"].encode("utf-8")
+        iv = body["iv"].encode("utf-8")
+
+        # 재구독 시 같은 키가 다시 전달되면 기존 암호 객체를 그대로 사용합니다.
+        if (current := self._keychain.get(tr)) is not None and current.key == key and current.iv == iv:
+            return
+
+        self._keychain[tr] = KisWebsocketEncryptionKey(key=key, iv=iv)
 
     def _handle_event(self, message: str):
         (
@@ -525,11 +823,9 @@ class KisWebsocketClient:
             count,
             body,
         ) = message.split("|", 3)
-        encrypted = encrypted == "1"
-        count = int(count)
         tr = KisWebsocketTR(id, "")
 
-        if encrypted:
+        if encrypted == "1":
             try:
                 key = self._keychain.get(tr)
 
@@ -537,20 +833,78 @@ class KisWebsocketClient:
                     logging.logger.error("RTC No encryption key for %s", tr)
                     return
 
-                body = key.decrypt(base64.b64decode(body)).decode("utf-8")
+                body = key.decode(body)
             except Exception as e:
                 logging.logger.exception("RTC Failed to decrypt message: %s %s", id, e)
                 return
 
-        if not (response_type := WEBSOCKET_RESPONSES_MAP.get(id)):
-            logging.logger.warning("RTC No response type for %s", id)
+        self._emit_event(tr, int(count), body)
+
+    def _handle_events(self, messages: Iterable[str]):
+        """
+        여러 이벤트 메시지를 수신 순서대로 처리합니다.
+
+        암호화된 메시지는 TR별로 모아 한 번에 복호화합니다. (예: 장 시작 동시호가 체결통보)
+        """
+        events: list[tuple[KisWebsocketTR, int, str | None]] = []
+        encrypted_events: dict[KisWebsocketTR, list[int]] = {}
+
+        for message in messages:
+            (
+                encrypted,
+                id,
+                count,
+                body,
+            ) = message.split("|", 3)
+            tr = KisWebsocketTR(id, "")
+
+            if encrypted == "1":
+                encrypted_events.setdefault(tr, []).append(len(events))
+
+            events.append((tr, int(count), body))
+
+        for tr, indices in encrypted_events.items():
+            if not (key := self._keychain.get(tr)):
+                logging.logger.error("RTC No encryption key for %s", tr)
+                texts = [None] * len(indices)
+            else:
+                try:
+                    texts = key.decode_batch(events[i][2] for i in indices)  # type: ignore
+                except Exception as e:
+                    logging.logger.debug("RTC Failed to decrypt batch, falling back: %s %s", tr, e)
+                    texts = [self._decode_event(tr, key, events[i][2]) for i in indices]  # type: ignore
+
+            for i, text in zip(indices, texts):
+                events[i] = (tr, events[i][1], text)
+
+        for tr, count, body in events:
+            if body is not None:
+                self._emit_event(tr, count, body)
+
+    def _decode_event(self, tr: KisWebsocketTR, key: KisWebsocketEncryptionKey, body: str) -> str | None:
+        try:
+            return key.decode(body)
+        except Exception as e:
+            logging.logger.exception("RTC Failed to decrypt message: %s %s", tr.id, e)
+            return None
+
+    def _emit_event(self, tr: KisWebsocketTR, count: int, body: str):
+        if not (response_type := WEBSOCKET_RESPONSES_MAP.get(tr.id)):
+            logging.logger.warning("RTC No response type for %s", tr.id)
             return
 
+        if self._conflator.accepts(tr.id):
+            count, body = self._conflator.offer(tr.id, count, body, response_type)
+
+            if not count:
+                return
+
         try:
             for response in KisWebsocketResponse.parse(
                 body,
                 count=count,
                 response_type=response_type,
+                lazy=self._lazy,
             ):
                 if isinstance(response, KisObjectBase):
                     kis_object_init(self.kis, response)
@@ -573,6 +927,10 @@ class KisWebsocketClient:
     def _ensure_primary_client(self) -> "KisWebsocketClient":
         if self.kis.virtual and not self.virtual and not self._primary_client:
             self._primary_client = KisWebsocketClient(self.kis, virtual=True)
+            self._primary_client._conflator = self._conflator
+            self._primary_client.lazy = self._lazy
+            self._primary_client.recorder = self._recorder
+            self._primary_client._pipeline = self._pipeline
 
             self._primary_client.subscribed_event += self._primary_client_subscribed_event
             self._primary_client.unsubscribed_event += self._primary_client_unsubscribed_event
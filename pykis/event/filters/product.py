@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Protocol, overload, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, overload, runtime_checkable
 
 from pykis.api.base.product import KisProductProtocol
 from pykis.api.stock.market import MARKET_TYPE
@@ -86,12 +86,15 @@ class KisProductEventFilter(KisEventFilterBase["KisWebsocketClient", KisSubscrip
         # if isinstance(e.response, KisProductProtocol):
         #     return False
 
+        # KisSimpleProductProtocol의 isinstance 검사와 같이 속성 존재 여부만 확인합니다.
         return not (
-            isinstance(e.response, KisSimpleProductProtocol)
-            and e.response.symbol == self._product.symbol
-            and e.response.market == self._product.market
+            getattr(e.response, "symbol", None) == self._product.symbol
+            and getattr(e.response, "market", None) == self._product.market
         )
 
+    def __event_keys__(self) -> dict[str, Any]:
+        return {"symbol": self._product.symbol, "market": self._product.market}
+
     def __hash__(self) -> int:
         return hash((self.__class__, self._product))
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pykis.event.handler import KisEventFilterBase, KisEventHandler
 from pykis.event.subscription import KisSubscriptionEventArgs
@@ -30,6 +30,9 @@ class KisSubscriptionEventFilter(KisEventFilterBase["KisWebsocketClient", KisSub
     ) -> bool:
         return not (e.tr.id == self.id and (self.key is None or e.tr.key == self.key))
 
+    def __event_keys__(self) -> dict[str, Any]:
+        return {"id": self.id}
+
     def __hash__(self) -> int:
         return hash((self.__class__, self.id, self.key))
 
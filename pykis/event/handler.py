@@ -1,6 +1,7 @@
 import warnings
 from abc import ABCMeta, abstractmethod
 from typing import (
+    Any,
     Callable,
     Generic,
     Iterable,
@@ -22,6 +23,7 @@ __all__ = [
     "KisLambdaEventCallback",
     "KisEventTicket",
     "KisEventHandler",
+    "get_event_keys",
 ]
 
 TSender = TypeVar("TSender")
@@ -31,7 +33,13 @@ TCSender = TypeVar("TCSender", contravariant=True)
 class KisEventArgs:
     """이벤트 데이터"""
 
-    pass
+    def __event_keys__(self) -> dict[str, Any]:
+        """
+        이벤트 색인 키를 반환합니다.
+
+        이벤트 핸들러는 필터가 선언한 색인 키와 이 값이 일치하는 콜백만 호출합니다.
+        """
+        return {}
 
 
 TEventArgs = TypeVar("TEventArgs", bound=KisEventArgs)
@@ -111,7 +119,7 @@ class KisMultiEventFilter(KisEventFilterBase[TSender, TEventArgs]):
 
     def __filter__(self, handler: "KisEventHandler", sender: TSender, e: TEventArgs) -> bool:
         results = (
-            filter.__filter__(handler, sender, e) if isinstance(filter, KisEventFilter) else filter(sender, e)
+            filter.__filter__(handler, sender, e) if hasattr(filter, "__filter__") else filter(sender, e)
             for filter in self.filters
         )
 
@@ -122,6 +130,18 @@ class KisMultiEventFilter(KisEventFilterBase[TSender, TEventArgs]):
 
         return False
 
+    def __event_keys__(self) -> dict[str, Any]:
+        # 'or' 게이트는 하위 필터를 모두 통과해야 이벤트를 전달하므로 하위 필터의 색인 키를 모두 만족해야 합니다.
+        if self.gate != "or":
+            return {}
+
+        keys = {}
+
+        for filter in self.filters:
+            keys.update(get_event_keys(filter))
+
+        return keys
+
     def __hash__(self) -> int:
         return hash((self.filters, self.gate))
 
@@ -171,7 +191,11 @@ class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
         if self.where is None:
             return False
 
-        return self.where.__filter__(handler, sender, e) if isinstance(self.where, KisEventFilter) else self.where(sender, e)
+        # runtime_checkable 프로토콜의 isinstance 검사는 느리므로 매 이벤트마다 속성 존재 여부만 확인합니다.
+        return self.where.__filter__(handler, sender, e) if hasattr(self.where, "__filter__") else self.where(sender, e)
+
+    def __event_keys__(self) -> dict[str, Any]:
+        return get_event_keys(self.where)
 
     def __callback__(self, handler: "KisEventHandler", sender: TSender, e: TEventArgs):
         if self.once:
@@ -199,6 +223,19 @@ class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
 EventCallback = Callable[[TSender, TEventArgs], None] | KisEventCallback[TSender, TEventArgs]
 
 
+def get_event_keys(filter: Any) -> dict[str, Any]:
+    """
+    필터의 색인 키를 반환합니다.
+
+    필터는 `__event_keys__`를 구현하여 통과하는 이벤트가 반드시 가져야 하는 색인 값을 선언할 수 있습니다.
+    색인 키를 선언하지 않은 필터는 모든 이벤트에 대해 평가됩니다.
+    """
+    if (event_keys := getattr(filter, "__event_keys__", None)) is None or isinstance(filter, type):
+        return {}
+
+    return event_keys()
+
+
 class KisEventTicket(Generic[TSender, TEventArgs]):
     """이벤트 티켓"""
 
@@ -295,12 +332,75 @@ class KisEventHandler(Generic[TSender, TEventArgs]):
     handlers: set[EventCallback[TSender, TEventArgs]]
     """이벤트 핸들러 목록"""
 
+    _index: dict[tuple[str, ...], dict[tuple[Any, ...], set[EventCallback[TSender, TEventArgs]]]]
+    """이벤트 색인 (색인 필드 -> 색인 값 -> 이벤트 핸들러)"""
+    _index_keys: dict[EventCallback[TSender, TEventArgs], tuple[tuple[str, ...], tuple[Any, ...]]]
+    """이벤트 핸들러별 색인 위치"""
+
     def __init__(self, *handlers: EventCallback[TSender, TEventArgs]):
-        self.handlers = set(handlers)
+        self.handlers = set()
+        self._index = {}
+        self._index_keys = {}
+
+        for handler in handlers:
+            self._add(handler)
+
+    def _add(self, handler: EventCallback[TSender, TEventArgs]):
+        if handler in self.handlers:
+            return
+
+        keys = get_event_keys(handler) if isinstance(handler, KisEventCallback) else {}
+        fields = tuple(sorted(keys))
+        values = tuple(keys[field] for field in fields)
+
+        self._index_keys[handler] = (fields, values)
+        self._index.setdefault(fields, {}).setdefault(values, set()).add(handler)
+        self.handlers.add(handler)
+
+    def _remove(self, handler: EventCallback[TSender, TEventArgs]):
+        try:
+            self.handlers.remove(handler)
+        except KeyError:
+            pass
+
+        if (position := self._index_keys.pop(handler, None)) is None:
+            return
+
+        fields, values = position
+        index = self._index[fields]
+        bucket = index[values]
+        bucket.discard(handler)
+
+        if not bucket:
+            del index[values]
+
+            if not index:
+                del self._index[fields]
+
+    def match(self, e: TEventArgs) -> list[EventCallback[TSender, TEventArgs]]:
+        """
+        이벤트의 색인 키와 일치하는 이벤트 핸들러 목록을 반환합니다.
+
+        반환된 핸들러의 필터는 호출 시점에 다시 평가됩니다.
+        """
+        keys = e.__event_keys__() if isinstance(e, KisEventArgs) else {}
+        handlers = []
+
+        for fields, index in list(self._index.items()):
+            try:
+                values = tuple(keys[field] for field in fields)
+            except KeyError:
+                # 색인 필드가 없는 이벤트는 해당 필터를 통과할 수 없습니다.
+                continue
+
+            if bucket := index.get(values):
+                handlers.extend(bucket.copy())
+
+        return handlers
 
     def add(self, handler: EventCallback[TSender, TEventArgs]) -> KisEventTicket[TSender, TEventArgs]:
         """이벤트 핸들러를 추가합니다."""
-        self.handlers.add(handler)
+        self._add(handler)
         return KisEventTicket(self, handler)
 
     def on(
@@ -353,18 +453,17 @@ class KisEventHandler(Generic[TSender, TEventArgs]):
         else:
             release_method(handler)
 
-        try:
-            self.handlers.remove(handler)
-        except KeyError:
-            pass
+        self._remove(handler)
 
     def clear(self):
         """이벤트 핸들러를 모두 제거합니다."""
         self.handlers.clear()
+        self._index.clear()
+        self._index_keys.clear()
 
     def invoke(self, sender: TSender, e: TEventArgs):
         """이벤트를 발생시킵니다."""
-        for handler in self.handlers.copy():
+        for handler in self.match(e):
             if isinstance(handler, KisEventCallback):
                 if not handler.__filter__(self, sender, e):
                     handler.__callback__(self, sender, e)
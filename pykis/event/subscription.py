@@ -1,4 +1,4 @@
-from typing import Generic
+from typing import Any, Generic
 
 from pykis.client.messaging import KisWebsocketTR
 from pykis.event.handler import KisEventArgs
@@ -45,3 +45,14 @@ class KisSubscriptionEventArgs(Generic[TWebsocketResponse], KisEventArgs):
         super().__init__()
         self.tr = tr
         self.response = response
+
+    def __event_keys__(self) -> dict[str, Any]:
+        keys: dict[str, Any] = {"id": self.tr.id}
+
+        if (symbol := getattr(self.response, "symbol", None)) is not None:
+            keys["symbol"] = symbol
+
+        if (market := getattr(self.response, "market", None)) is not None:
+            keys["market"] = market
+
+        return keys
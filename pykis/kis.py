@@ -1,9 +1,10 @@
+import asyncio
 import hashlib
 from datetime import timedelta
 from os import PathLike
 from pathlib import Path
 from time import sleep
-from typing import Callable, Iterable, Literal, overload
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, overload
 from urllib.parse import urljoin
 
 import requests
@@ -11,27 +12,51 @@ from requests import Response
 
 from pykis import logging
 from pykis.__env__ import (
+    API_REQUEST_BURST,
     REAL_API_REQUEST_PER_SECOND,
     REAL_DOMAIN,
     USER_AGENT,
     VIRTUAL_API_REQUEST_PER_SECOND,
     VIRTUAL_DOMAIN,
+    WEBSOCKET_REAL_DOMAIN,
+    WEBSOCKET_VIRTUAL_DOMAIN,
 )
 from pykis.api.auth.token import KisAccessToken
+from pykis.api.auth.websocket import KisWebsocketApprovalKey
 from pykis.client.account import KisAccountNumber
 from pykis.client.appkey import KisKey
 from pykis.client.auth import KisAuth
 from pykis.client.cache import KisCacheStorage
 from pykis.client.exceptions import KisHTTPError
 from pykis.client.form import KisForm
+from pykis.client.market_index import KisMarketIndex
 from pykis.client.object import KisObjectBase, kis_object_init
+from pykis.client.transport import KisAsyncTransport
 from pykis.client.websocket import KisWebsocketClient
 from pykis.responses.dynamic import KisObject, TDynamic
 from pykis.responses.types import KisDynamicDict
-from pykis.utils.rate_limit import RateLimiter
+from pykis.utils.rate_limit import RateLimiter, SharedRateLimiter
 from pykis.utils.thread_safe import thread_safe
 from pykis.utils.workspace import get_cache_path
 
+if TYPE_CHECKING:
+    from pykis.api.account.book import KisAccountBook
+
+
+def _resolve_domains(
+    domain: str | dict[Literal["real", "virtual"], str] | None,
+    real: str,
+    virtual: str,
+) -> dict[Literal["real", "virtual"], str]:
+    """도메인 재정의를 적용한 도메인별 주소를 반환합니다."""
+    if domain is None:
+        return {"real": real, "virtual": virtual}
+
+    if isinstance(domain, str):
+        return {"real": domain, "virtual": domain}
+
+    return {"real": domain.get("real", real), "virtual": domain.get("virtual", virtual)}
+
 
 class PyKis:
     """한국투자증권 API"""
@@ -48,8 +73,17 @@ class PyKis:
         """모의도메인 여부"""
         return self.virtual_appkey is not None
 
+    domains: dict[Literal["real", "virtual"], str]
+    """도메인별 API 주소"""
+    websocket_domains: dict[Literal["real", "virtual"], str]
+    """도메인별 웹소켓 주소"""
+
     cache: KisCacheStorage
     """캐시 저장소"""
+    market_index: KisMarketIndex
+    """종목 상품유형 색인"""
+    books: dict[KisAccountNumber, "KisAccountBook"]
+    """계좌별 실시간 계좌 장부"""
 
     _rate_limiters: dict[str, RateLimiter]
     """API 호출 제한"""
@@ -57,12 +91,18 @@ class PyKis:
     """실전투자 API 접속 토큰"""
     _virtual_token: KisAccessToken | None
     """API 접속 토큰"""
+    _approval_keys: dict[Literal["real", "virtual"], KisWebsocketApprovalKey]
+    """웹소켓 접속 키"""
+    _session_approval_keys: dict[str, KisWebsocketApprovalKey]
+    """추가 웹소켓 세션의 앱 키별 접속 키"""
     _websocket: KisWebsocketClient | None
     """웹소켓 클라이언트"""
     _keep_token: Path | None
     """API 접속 토큰 자동 저장 경로"""
     _sessions: dict[Literal["real", "virtual"], requests.Session]
     """API 세션"""
+    _transports: dict[Literal["real", "virtual"], KisAsyncTransport]
+    """비동기 API 전송 계층"""
 
     @property
     def keep_token(self) -> bool:
@@ -78,6 +118,11 @@ class PyKis:
         token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        shared_rate_limit: bool | str | PathLike[str] | None = None,
+        market_index: bool | str | PathLike[str] | None = None,
+        cache: KisCacheStorage | bool | str | PathLike[str] | None = None,
+        domain: str | dict[Literal["real", "virtual"], str] | None = None,
+        websocket_domain: str | dict[Literal["real", "virtual"], str] | None = None,
     ):
         """
         `KisAuth` 인증 정보를 이용하여 실전투자용 한국투자증권 API를 생성합니다.
@@ -87,6 +132,11 @@ class PyKis:
             token (KisAccessToken | str | PathLike[str] | None, optional): 실전도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            shared_rate_limit (bool | str | PathLike[str] | None, optional): 같은 AppKey를 사용하는 프로세스 간 API 호출 유량을 공유할지 여부. 기본 저장 폴더: `~/.pykis/`
+            market_index (bool | str | PathLike[str] | None, optional): 종목 상품유형 색인을 파일에 저장할지 여부. 기본 저장 경로: `~/.pykis/cache/market_index.json`
+            cache (KisCacheStorage | bool | str | PathLike[str] | None, optional): 캐시 저장소 또는 디스크 캐시를 사용할지 여부. 기본 저장 경로: `~/.pykis/cache/cache.db`
+            domain (str | dict[Literal["real", "virtual"], str] | None, optional): API 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다. (예: `KisMockServer.domain`)
+            websocket_domain (str | dict[Literal["real", "virtual"], str] | None, optional): 웹소켓 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다.
 
         Examples:
 
@@ -125,6 +175,11 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        shared_rate_limit: bool | str | PathLike[str] | None = None,
+        market_index: bool | str | PathLike[str] | None = None,
+        cache: KisCacheStorage | bool | str | PathLike[str] | None = None,
+        domain: str | dict[Literal["real", "virtual"], str] | None = None,
+        websocket_domain: str | dict[Literal["real", "virtual"], str] | None = None,
     ):
         """
         `KisAuth` 인증 정보를 이용하여 모의투자용 한국투자증권 API를 생성합니다.
@@ -136,6 +191,11 @@ class PyKis:
             virtual_token (KisAccessToken | str | PathLike[str] | None, optional): 모의도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            shared_rate_limit (bool | str | PathLike[str] | None, optional): 같은 AppKey를 사용하는 프로세스 간 API 호출 유량을 공유할지 여부. 기본 저장 폴더: `~/.pykis/`
+            market_index (bool | str | PathLike[str] | None, optional): 종목 상품유형 색인을 파일에 저장할지 여부. 기본 저장 경로: `~/.pykis/cache/market_index.json`
+            cache (KisCacheStorage | bool | str | PathLike[str] | None, optional): 캐시 저장소 또는 디스크 캐시를 사용할지 여부. 기본 저장 경로: `~/.pykis/cache/cache.db`
+            domain (str | dict[Literal["real", "virtual"], str] | None, optional): API 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다. (예: `KisMockServer.domain`)
+            websocket_domain (str | dict[Literal["real", "virtual"], str] | None, optional): 웹소켓 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다.
 
         Examples:
 
@@ -185,6 +245,11 @@ class PyKis:
         token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        shared_rate_limit: bool | str | PathLike[str] | None = None,
+        market_index: bool | str | PathLike[str] | None = None,
+        cache: KisCacheStorage | bool | str | PathLike[str] | None = None,
+        domain: str | dict[Literal["real", "virtual"], str] | None = None,
+        websocket_domain: str | dict[Literal["real", "virtual"], str] | None = None,
     ):
         """
         실전투자용 한국투자증권 API를 생성합니다.
@@ -197,6 +262,11 @@ class PyKis:
             token (KisAccessToken | str | PathLike[str] | None, optional): 실전도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            shared_rate_limit (bool | str | PathLike[str] | None, optional): 같은 AppKey를 사용하는 프로세스 간 API 호출 유량을 공유할지 여부. 기본 저장 폴더: `~/.pykis/`
+            market_index (bool | str | PathLike[str] | None, optional): 종목 상품유형 색인을 파일에 저장할지 여부. 기본 저장 경로: `~/.pykis/cache/market_index.json`
+            cache (KisCacheStorage | bool | str | PathLike[str] | None, optional): 캐시 저장소 또는 디스크 캐시를 사용할지 여부. 기본 저장 경로: `~/.pykis/cache/cache.db`
+            domain (str | dict[Literal["real", "virtual"], str] | None, optional): API 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다. (예: `KisMockServer.domain`)
+            websocket_domain (str | dict[Literal["real", "virtual"], str] | None, optional): 웹소켓 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다.
 
         Examples:
 
@@ -231,6 +301,11 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        shared_rate_limit: bool | str | PathLike[str] | None = None,
+        market_index: bool | str | PathLike[str] | None = None,
+        cache: KisCacheStorage | bool | str | PathLike[str] | None = None,
+        domain: str | dict[Literal["real", "virtual"], str] | None = None,
+        websocket_domain: str | dict[Literal["real", "virtual"], str] | None = None,
     ):
         """
         모의투자용 한국투자증권 API를 생성합니다.
@@ -247,6 +322,11 @@ class PyKis:
             virtual_token (KisAccessToken | str | PathLike[str] | None, optional): 모의도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            shared_rate_limit (bool | str | PathLike[str] | None, optional): 같은 AppKey를 사용하는 프로세스 간 API 호출 유량을 공유할지 여부. 기본 저장 폴더: `~/.pykis/`
+            market_index (bool | str | PathLike[str] | None, optional): 종목 상품유형 색인을 파일에 저장할지 여부. 기본 저장 경로: `~/.pykis/cache/market_index.json`
+            cache (KisCacheStorage | bool | str | PathLike[str] | None, optional): 캐시 저장소 또는 디스크 캐시를 사용할지 여부. 기본 저장 경로: `~/.pykis/cache/cache.db`
+            domain (str | dict[Literal["real", "virtual"], str] | None, optional): API 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다. (예: `KisMockServer.domain`)
+            websocket_domain (str | dict[Literal["real", "virtual"], str] | None, optional): 웹소켓 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다.
 
         Examples:
 
@@ -282,6 +362,11 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        shared_rate_limit: bool | str | PathLike[str] | None = None,
+        market_index: bool | str | PathLike[str] | None = None,
+        cache: KisCacheStorage | bool | str | PathLike[str] | None = None,
+        domain: str | dict[Literal["real", "virtual"], str] | None = None,
+        websocket_domain: str | dict[Literal["real", "virtual"], str] | None = None,
     ):
         """
         `KisAuth` 인증 정보를 이용하여 모의투자용 한국투자증권 API를 생성합니다.
@@ -296,6 +381,11 @@ class PyKis:
             virtual_token (KisAccessToken | str | PathLike[str] | None, optional): 모의도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            shared_rate_limit (bool | str | PathLike[str] | None, optional): 같은 AppKey를 사용하는 프로세스 간 API 호출 유량을 공유할지 여부. 기본 저장 폴더: `~/.pykis/`
+            market_index (bool | str | PathLike[str] | None, optional): 종목 상품유형 색인을 파일에 저장할지 여부. 기본 저장 경로: `~/.pykis/cache/market_index.json`
+            cache (KisCacheStorage | bool | str | PathLike[str] | None, optional): 캐시 저장소 또는 디스크 캐시를 사용할지 여부. 기본 저장 경로: `~/.pykis/cache/cache.db`
+            domain (str | dict[Literal["real", "virtual"], str] | None, optional): API 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다. (예: `KisMockServer.domain`)
+            websocket_domain (str | dict[Literal["real", "virtual"], str] | None, optional): 웹소켓 도메인. 문자열인 경우 실전, 모의도메인 모두에 사용합니다.
 
         Examples:
 
@@ -343,6 +433,11 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         use_websocket: bool = True,
         keep_token: bool | str | PathLike[str] | None = None,
+        shared_rate_limit: bool | str | PathLike[str] | None = None,
+        market_index: bool | str | PathLike[str] | None = None,
+        cache: KisCacheStorage | bool | str | PathLike[str] | None = None,
+        domain: str | dict[Literal["real", "virtual"], str] | None = None,
+        websocket_domain: str | dict[Literal["real", "virtual"], str] | None = None,
     ):
         if auth is not None:
             if not isinstance(auth, KisAuth):
@@ -409,19 +504,69 @@ class PyKis:
 
         self.primary_account = account
 
+        self.domains = _resolve_domains(domain, REAL_DOMAIN, VIRTUAL_DOMAIN)
+        self.websocket_domains = _resolve_domains(websocket_domain, WEBSOCKET_REAL_DOMAIN, WEBSOCKET_VIRTUAL_DOMAIN)
+
         self._websocket = KisWebsocketClient(self) if use_websocket else None
-        self.cache = KisCacheStorage()
+        if isinstance(cache, KisCacheStorage):
+            self.cache = cache
+        elif cache:
+            if cache is True:
+                cache = get_cache_path() / "cache.db"
 
-        self._rate_limiters = {
-            "real": RateLimiter(REAL_API_REQUEST_PER_SECOND, 1),
-            "virtual": RateLimiter(VIRTUAL_API_REQUEST_PER_SECOND, 1),
-        }
+            self.cache = KisCacheStorage(path=cache)
+        else:
+            self.cache = KisCacheStorage()
+
+        kis_object_init(self, self.cache)
+
+        if market_index:
+            if market_index is True:
+                market_index = get_cache_path() / "market_index.json"
+
+            self.market_index = KisMarketIndex(market_index)
+        else:
+            self.market_index = KisMarketIndex()
+
+        # 호출이 한 번에 몰리지 않도록 모든 호출을 `1 / 초당 호출 제한 수` 간격으로 분산합니다.
+        if shared_rate_limit:
+            if shared_rate_limit is True:
+                shared_rate_limit = get_cache_path()
+
+            rate_limit_dir = Path(shared_rate_limit).resolve()
+
+            self._rate_limiters = {
+                "real": SharedRateLimiter(
+                    rate_limit_dir / self._get_hashed_rate_limit_name("real"),
+                    REAL_API_REQUEST_PER_SECOND,
+                    1,
+                    burst=API_REQUEST_BURST,
+                ),
+                "virtual": (
+                    SharedRateLimiter(
+                        rate_limit_dir / self._get_hashed_rate_limit_name("virtual"),
+                        VIRTUAL_API_REQUEST_PER_SECOND,
+                        1,
+                        burst=API_REQUEST_BURST,
+                    )
+                    if self.virtual_appkey is not None
+                    else RateLimiter(VIRTUAL_API_REQUEST_PER_SECOND, 1, burst=API_REQUEST_BURST)
+                ),
+            }
+        else:
+            self._rate_limiters = {
+                "real": RateLimiter(REAL_API_REQUEST_PER_SECOND, 1, burst=API_REQUEST_BURST),
+                "virtual": RateLimiter(VIRTUAL_API_REQUEST_PER_SECOND, 1, burst=API_REQUEST_BURST),
+            }
         self._token = token if isinstance(token, KisAccessToken) else KisAccessToken.load(token) if token else None
         self._virtual_token = (
             virtual_token
             if isinstance(virtual_token, KisAccessToken)
             else KisAccessToken.load(virtual_token) if self.virtual and virtual_token else None
         )
+        self._approval_keys = {}
+        self._session_approval_keys = {}
+        self.books = {}
         self._sessions = {
             "real": requests.Session(),
             "virtual": requests.Session(),
@@ -430,6 +575,11 @@ class PyKis:
         for session in self._sessions.values():
             session.headers.update({"User-Agent": USER_AGENT})
 
+        self._transports = {
+            "real": KisAsyncTransport(),
+            "virtual": KisAsyncTransport(),
+        }
+
         if keep_token:
             if keep_token is True:
                 keep_token = get_cache_path()
@@ -449,6 +599,27 @@ class PyKis:
 
         return f"token_{domain}_{self.appkey.id}_{hash}.json"
 
+    def _get_hashed_rate_limit_name(self, domain: Literal["real", "virtual"]) -> str:
+        appkey = self.appkey if domain == "real" else self.virtual_appkey
+
+        if appkey is None:
+            raise ValueError("모의도메인 AppKey가 없습니다.")
+
+        # 호출 유량은 AppKey 단위로 제한되므로 ID를 제외합니다.
+        hash = hashlib.sha1(f"pykis{appkey.appkey}{appkey.secretkey}ratelimit".encode()).hexdigest()
+
+        return f"ratelimit_{domain}_{hash}.json"
+
+    def _get_hashed_approval_key_name(self, domain: Literal["real", "virtual"]) -> str:
+        appkey = self.appkey if domain == "real" else self.virtual_appkey
+
+        if appkey is None:
+            raise ValueError("모의도메인 AppKey가 없습니다.")
+
+        hash = hashlib.sha1(f"pykis{appkey.id}{appkey.appkey}{appkey.secretkey}approval".encode()).hexdigest()
+
+        return f"approval_{domain}_{self.appkey.id}_{hash}.json"
+
     def _load_cached_token(self, token_dir: str | PathLike[str] | Path) -> None:
         if not isinstance(token_dir, Path):
             token_dir = Path(token_dir)
@@ -473,6 +644,31 @@ class PyKis:
                 except:
                     pass
 
+        for domain in ("real", "virtual") if self.virtual else ("real",):
+            approval_key_path = token_dir / self._get_hashed_approval_key_name(domain)
+
+            if approval_key_path.exists():
+                try:
+                    self._approval_keys[domain] = KisWebsocketApprovalKey.load(approval_key_path)
+                    logging.logger.debug("웹소켓 접속 키를 불러왔습니다.")
+                except Exception:
+                    pass
+
+    def _save_cached_approval_key(
+        self,
+        token_dir: str | PathLike[str] | Path,
+        domain: Literal["real", "virtual"],
+    ):
+        if not isinstance(token_dir, Path):
+            token_dir = Path(token_dir)
+
+        token_dir = token_dir.resolve()
+        token_dir.mkdir(parents=True, exist_ok=True)
+
+        if (approval_key := self._approval_keys.get(domain)) is not None:
+            approval_key.save(token_dir / self._get_hashed_approval_key_name(domain))
+            logging.logger.debug("웹소켓 접속 키를 저장했습니다.")
+
     def _save_cached_token(
         self,
         token_dir: str | PathLike[str] | Path,
@@ -502,20 +698,23 @@ class PyKis:
     def _rate_limit_exceeded(self) -> None:
         logging.logger.warning("API 호출 횟수를 초과하여 호출 유량 획득까지 대기합니다.")
 
-    def request(
+    def _rate_limit(self, domain: Literal["real", "virtual"] | None = None) -> RateLimiter:
+        """요청 도메인의 호출 유량 제한을 반환합니다. 도메인을 지정하지 않으면 `fetch`와 같이 모의투자 여부로 결정합니다."""
+        return self._rate_limiters[domain or ("virtual" if self.virtual else "real")]
+
+    def _prepare_request(
         self,
-        path: str,
         *,
-        method: Literal["GET", "POST"] = "GET",
-        params: dict[str, str] | None = None,
-        body: dict[str, str] | None = None,
-        form: Iterable[KisForm | None] | None = None,
-        headers: dict[str, str] | None = None,
-        domain: Literal["real", "virtual"] | None = None,
-        appkey_location: Literal["header", "body"] | None = "header",
-        form_location: Literal["header", "params", "body"] | None = None,
-        auth: bool = True,
-    ) -> Response:
+        method: Literal["GET", "POST"],
+        params: dict[str, str] | None,
+        body: dict[str, str] | None,
+        form: Iterable[KisForm | None] | None,
+        headers: dict[str, str] | None,
+        domain: Literal["real", "virtual"] | None,
+        appkey_location: Literal["header", "body"] | None,
+        form_location: Literal["header", "params", "body"] | None,
+    ) -> tuple[Literal["real", "virtual"], dict[str, str], dict[str, str] | None, dict[str, str] | None]:
+        """요청 도메인, 헤더, 파라미터, 본문을 구성합니다."""
         if method == "GET":
             if body is not None:
                 raise ValueError("GET 요청에는 body를 입력할 수 없습니다.")
@@ -530,8 +729,6 @@ class PyKis:
         if domain is None:
             domain = "virtual" if self.virtual else "real"
 
-        session = self._sessions[domain]
-
         if appkey_location:
             appkey = self.appkey if domain == "real" else self.virtual_appkey
 
@@ -550,17 +747,82 @@ class PyKis:
                 if f is not None:
                     f.build(dist)
 
+        return domain, request_headers, params, body
+
+    def _handle_error_response(self, domain: Literal["real", "virtual"], response: Response) -> float:
+        """
+        실패한 응답을 처리합니다.
+
+        Returns:
+            재시도 전 대기 시간(초)
+
+        Raises:
+            KisHTTPError: 재시도할 수 없는 오류인 경우
+        """
+        try:
+            data = response.json()
+        except Exception:
+            data = None
+
+        error_code = data.get("msg_cd") if data is not None else None
+
+        match error_code:
+            case "EGW00201":
+                # Rate limit exceeded
+                logging.logger.warning("API 호출 횟수를 초과하였습니다.")
+                return 0.1
+
+            case "EGW00123":
+                # Token expired
+                if domain == "real":
+                    self._token = None
+                else:
+                    self._virtual_token = None
+
+                return 0
+
+            case _:
+                raise KisHTTPError(response=response)
+
+    def request(
+        self,
+        path: str,
+        *,
+        method: Literal["GET", "POST"] = "GET",
+        params: dict[str, str] | None = None,
+        body: dict[str, str] | None = None,
+        form: Iterable[KisForm | None] | None = None,
+        headers: dict[str, str] | None = None,
+        domain: Literal["real", "virtual"] | None = None,
+        appkey_location: Literal["header", "body"] | None = "header",
+        form_location: Literal["header", "params", "body"] | None = None,
+        auth: bool = True,
+    ) -> Response:
+        domain, request_headers, params, body = self._prepare_request(
+            method=method,
+            params=params,
+            body=body,
+            form=form,
+            headers=headers,
+            domain=domain,
+            appkey_location=appkey_location,
+            form_location=form_location,
+        )
+        session = self._sessions[domain]
         rate_limit = self._rate_limiters[domain]
 
         while True:
-            rate_limit.acquire(blocking_callback=self._rate_limit_exceeded)
+            rate_limit.acquire(
+                blocking_callback=self._rate_limit_exceeded,
+                key=request_headers.get("tr_id"),
+            )
 
             if auth:
                 (self.token if domain == "real" else self.primary_token).build(request_headers)
 
             resp = session.request(
                 method=method,
-                url=urljoin(REAL_DOMAIN if domain == "real" else VIRTUAL_DOMAIN, path),
+                url=urljoin(self.domains[domain], path),
                 headers=request_headers,
                 params=params,
                 json=body,
@@ -569,31 +831,10 @@ class PyKis:
             if resp.ok:
                 return resp
 
-            try:
-                data = resp.json()
-            except Exception:
-                data = None
-
-            error_code = data.get("msg_cd") if data is not None else None
-
-            match error_code:
-                case "EGW00201":
-                    # Rate limit exceeded
-                    logging.logger.warning("API 호출 횟수를 초과하였습니다.")
-                    sleep(0.1)
-                    continue
+            if delay := self._handle_error_response(domain, resp):
+                sleep(delay)
 
-                case "EGW00123":
-                    # Token expired
-                    if domain == "real":
-                        self._token = None
-                    else:
-                        self._virtual_token = None
-
-                case _:
-                    raise KisHTTPError(response=resp)
-
-    def fetch(
+    async def arequest(
         self,
         path: str,
         *,
@@ -606,11 +847,72 @@ class PyKis:
         appkey_location: Literal["header", "body"] | None = "header",
         form_location: Literal["header", "params", "body"] | None = None,
         auth: bool = True,
-        api: str | None = None,
-        continuous: bool = False,
-        response_type: TDynamic | type[TDynamic] | Callable[[], TDynamic] = KisDynamicDict,
-        verbose: bool = True,
-    ) -> TDynamic:
+    ) -> Response:
+        """
+        `request`의 비동기 버전입니다.
+
+        도메인별 호출 유량을 동기 API와 공유하며, 요청은 `aiohttp` 커넥션 풀을 통해 전송됩니다.
+
+        Raises:
+            ImportError: aiohttp 패키지가 설치되어 있지 않은 경우
+        """
+        domain, request_headers, params, body = self._prepare_request(
+            method=method,
+            params=params,
+            body=body,
+            form=form,
+            headers=headers,
+            domain=domain,
+            appkey_location=appkey_location,
+            form_location=form_location,
+        )
+        transport = self._transports[domain]
+        rate_limit = self._rate_limiters[domain]
+
+        while True:
+            await rate_limit.acquire_async(
+                blocking_callback=self._rate_limit_exceeded,
+                key=request_headers.get("tr_id"),
+            )
+
+            if auth:
+                (await self._atoken(domain)).build(request_headers)
+
+            resp = await transport.send(
+                requests.Request(
+                    method=method,
+                    url=urljoin(self.domains[domain], path),
+                    headers=request_headers,
+                    params=params,
+                    json=body,
+                ).prepare()
+            )
+
+            if resp.ok:
+                return resp
+
+            if delay := self._handle_error_response(domain, resp):
+                await asyncio.sleep(delay)
+
+    async def _atoken(self, domain: Literal["real", "virtual"]) -> KisAccessToken:
+        """
+        도메인의 API 접속 토큰을 반환합니다.
+
+        발급이 필요한 경우 토큰 발급 요청과 토큰 잠금 대기가 이벤트 루프를 막지 않도록 별도 스레드에서 발급합니다.
+        """
+        token = self._token if domain == "real" or not self.virtual else self._virtual_token
+
+        if token is None or token.remaining < timedelta(minutes=10):
+            token = await asyncio.to_thread(lambda: self.token if domain == "real" else self.primary_token)
+
+        return token
+
+    def _fetch_headers(
+        self,
+        headers: dict[str, str] | None,
+        api: str | None,
+        continuous: bool,
+    ) -> dict[str, str] | None:
         if api is not None:
             if headers is None:
                 headers = {}
@@ -623,19 +925,19 @@ class PyKis:
 
             headers["tr_cont"] = "N"
 
-        response = self.request(
-            path,
-            method=method,
-            params=params,
-            body=body,
-            form=form,
-            headers=headers,
-            domain=domain,
-            appkey_location=appkey_location,
-            form_location=form_location,
-            auth=auth,
-        )
+        return headers
 
+    def _transform_response(
+        self,
+        response: Response,
+        *,
+        path: str,
+        params: dict[str, str] | None,
+        body: dict[str, str] | None,
+        api: str | None,
+        response_type: TDynamic | type[TDynamic] | Callable[[], TDynamic],
+        verbose: bool,
+    ) -> TDynamic:
         data = response.json()
         data["__response__"] = response
 
@@ -661,6 +963,104 @@ class PyKis:
 
         return response_object  # type: ignore
 
+    def fetch(
+        self,
+        path: str,
+        *,
+        method: Literal["GET", "POST"] = "GET",
+        params: dict[str, str] | None = None,
+        body: dict[str, str] | None = None,
+        form: Iterable[KisForm | None] | None = None,
+        headers: dict[str, str] | None = None,
+        domain: Literal["real", "virtual"] | None = None,
+        appkey_location: Literal["header", "body"] | None = "header",
+        form_location: Literal["header", "params", "body"] | None = None,
+        auth: bool = True,
+        api: str | None = None,
+        continuous: bool = False,
+        response_type: TDynamic | type[TDynamic] | Callable[[], TDynamic] = KisDynamicDict,
+        verbose: bool = True,
+    ) -> TDynamic:
+        response = self.request(
+            path,
+            method=method,
+            params=params,
+            body=body,
+            form=form,
+            headers=self._fetch_headers(headers, api, continuous),
+            domain=domain,
+            appkey_location=appkey_location,
+            form_location=form_location,
+            auth=auth,
+        )
+
+        return self._transform_response(
+            response,
+            path=path,
+            params=params,
+            body=body,
+            api=api,
+            response_type=response_type,
+            verbose=verbose,
+        )
+
+    async def afetch(
+        self,
+        path: str,
+        *,
+        method: Literal["GET", "POST"] = "GET",
+        params: dict[str, str] | None = None,
+        body: dict[str, str] | None = None,
+        form: Iterable[KisForm | None] | None = None,
+        headers: dict[str, str] | None = None,
+        domain: Literal["real", "virtual"] | None = None,
+        appkey_location: Literal["header", "body"] | None = "header",
+        form_location: Literal["header", "params", "body"] | None = None,
+        auth: bool = True,
+        api: str | None = None,
+        continuous: bool = False,
+        response_type: TDynamic | type[TDynamic] | Callable[[], TDynamic] = KisDynamicDict,
+        verbose: bool = True,
+    ) -> TDynamic:
+        """
+        `fetch`의 비동기 버전입니다.
+
+        Examples:
+
+            >>> quote = await kis.afetch(
+            ...     "/uapi/domestic-stock/v1/quotations/inquire-price",
+            ...     api="FHKST01010100",
+            ...     params={"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"},
+            ...     response_type=KisDomesticQuote("005930", "KRX"),
+            ...     domain="real",
+            ... )
+
+        Raises:
+            ImportError: aiohttp 패키지가 설치되어 있지 않은 경우
+        """
+        response = await self.arequest(
+            path,
+            method=method,
+            params=params,
+            body=body,
+            form=form,
+            headers=self._fetch_headers(headers, api, continuous),
+            domain=domain,
+            appkey_location=appkey_location,
+            form_location=form_location,
+            auth=auth,
+        )
+
+        return self._transform_response(
+            response,
+            path=path,
+            params=params,
+            body=body,
+            api=api,
+            response_type=response_type,
+            verbose=verbose,
+        )
+
     @property
     @thread_safe("token")
     def token(self) -> KisAccessToken:
@@ -706,6 +1106,95 @@ class PyKis:
         """API 접속 토큰을 설정합니다."""
         self._virtual_token = token
 
+    @thread_safe("approval_key")
+    def approval_key(
+        self,
+        domain: Literal["real", "virtual"] | None = None,
+        appkey: KisKey | None = None,
+    ) -> KisWebsocketApprovalKey:
+        """
+        웹소켓 접속 키를 반환합니다.
+
+        발급된 접속 키는 도메인별로 캐시되며, 만료가 임박한 경우에만 재발급합니다.
+
+        Args:
+            domain (Literal["real", "virtual"] | None, optional): 도메인. 기본값은 기본 도메인입니다.
+            appkey (KisKey | None, optional): 추가 웹소켓 세션의 앱 키. 지정한 경우 앱 키별로 캐시되며 파일에 저장하지 않습니다.
+        """
+        if domain is None:
+            domain = "virtual" if self.virtual else "real"
+
+        if appkey is not None:
+            approval_key = self._session_approval_keys.get(appkey.appkey)
+
+            if approval_key is None or approval_key.remaining < timedelta(minutes=10):
+                from pykis.api.auth.websocket import websocket_approval_key
+
+                approval_key = self._session_approval_keys[appkey.appkey] = websocket_approval_key(
+                    self,
+                    domain=domain,
+                    appkey=appkey,
+                )
+                logging.logger.debug("추가 웹소켓 세션의 접속 키를 발급했습니다.")
+
+            return approval_key
+
+        approval_key = self._approval_keys.get(domain)
+
+        if approval_key is None or approval_key.remaining < timedelta(minutes=10):
+            from pykis.api.auth.websocket import websocket_approval_key
+
+            approval_key = self._approval_keys[domain] = websocket_approval_key(self, domain=domain)
+            logging.logger.debug("웹소켓 접속 키를 발급했습니다.")
+
+            if self._keep_token:
+                self._save_cached_approval_key(self._keep_token, domain=domain)
+
+        return approval_key
+
+    @thread_safe("approval_key")
+    def discard_approval_key(
+        self,
+        domain: Literal["real", "virtual"] | None = None,
+        approval_key: str | None = None,
+        appkey: KisKey | None = None,
+    ) -> bool:
+        """
+        캐시된 웹소켓 접속 키를 폐기합니다. 다음 요청에서 접속 키가 재발급됩니다.
+
+        Args:
+            domain (Literal["real", "virtual"] | None, optional): 도메인. 기본값은 기본 도메인입니다.
+            approval_key (str | None, optional): 폐기할 접속 키. 지정한 경우 캐시된 접속 키와 같을 때만 폐기합니다.
+            appkey (KisKey | None, optional): 추가 웹소켓 세션의 앱 키
+
+        Returns:
+            bool: 폐기 여부
+        """
+        if domain is None:
+            domain = "virtual" if self.virtual else "real"
+
+        if appkey is not None:
+            cached = self._session_approval_keys.get(appkey.appkey)
+
+            if cached is None or (approval_key is not None and cached.approval_key != approval_key):
+                return False
+
+            del self._session_approval_keys[appkey.appkey]
+            return True
+
+        cached = self._approval_keys.get(domain)
+
+        if cached is None or (approval_key is not None and cached.approval_key != approval_key):
+            return False
+
+        del self._approval_keys[domain]
+        logging.logger.debug("웹소켓 접속 키를 폐기했습니다.")
+
+        if self._keep_token:
+            (self._keep_token / self._get_hashed_approval_key_name(domain)).unlink(missing_ok=True)
+
+        return True
+
     def discard(self, domain: Literal["real", "virtual"] | None = None) -> None:
         """API 접속 토큰을 폐기합니다."""
         from pykis.api.auth.token import token_revoke
@@ -744,10 +1233,21 @@ class PyKis:
         for session in self._sessions.values():
             session.close()
 
+        self.cache.close()
+
+    async def aclose(self) -> None:
+        """API 세션과 비동기 API 세션을 종료합니다."""
+        self.close()
+
+        for transport in self._transports.values():
+            await transport.close()
+
     def __del__(self) -> None:
         """API 세션을 종료합니다."""
         self.close()
 
+    from pykis.api.account.book import book
+    from pykis.api.stock.quote import iter_quotes, quotes
     from pykis.api.stock.trading_hours import trading_hours
     from pykis.scope.account import account
-    from pykis.scope.stock import stock
+    from pykis.scope.stock import stock, stocks
@@ -3,11 +3,13 @@ from typing import (
     Any,
     Callable,
     Generic,
+    NamedTuple,
     Protocol,
     TypeVar,
     get_args,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 from pykis import logging
 
@@ -21,6 +23,8 @@ __all__ = [
     "TListItem",
     "KisList",
     "KisObject",
+    "KisDynamicField",
+    "get_field_plan",
     "KisNoneValueError",
 ]
 
@@ -219,6 +223,71 @@ class KisList(Generic[TListItem], KisType[list[Any]], metaclass=KisTypeMeta[list
             return [KisObject.transform_(item, self.type) for item in data]
 
 
+class KisDynamicField(NamedTuple):
+    """응답 데이터 변환 필드"""
+
+    name: str
+    """속성 이름"""
+    type: KisType[Any]
+    """응답 타입"""
+    field: str | None
+    """응답 필드 (None인 경우 응답 데이터 전체)"""
+    nullable: bool | None
+    """빈 값 허용 여부"""
+
+
+_field_plans: "WeakKeyDictionary[type, tuple[KisDynamicField, ...]]" = WeakKeyDictionary()
+"""타입별 응답 데이터 변환 필드 캐시"""
+
+
+def get_field_plan(object_type: type) -> tuple[KisDynamicField, ...]:
+    """
+    타입의 응답 데이터 변환 필드 목록을 반환합니다.
+
+    MRO 전체의 어노테이션과 `dir()` 탐색은 타입마다 처음 한 번만 수행됩니다.
+    """
+    if (plan := _field_plans.get(object_type)) is not None:
+        return plan
+
+    annotations = {
+        key: value
+        for obj in object_type.__mro__
+        if (annotations := getattr(obj, "__annotations__", None)) is not None
+        for key, value in annotations.items()
+    }
+    fields = []
+
+    for key in dir(object_type):
+        if key.startswith("_") and not key.endswith("_"):
+            continue
+
+        type_ = getattr(object_type, key, None)
+
+        if isinstance(type_, type) and issubclass(type_, KisType):
+            if (getattr(type_, "__default__", None)) is None:
+                raise ValueError(
+                    f"{object_type.__name__}의 {key} 필드에 {type_.__name__}은 간접적으로 타입을 지정할 수 없습니다."
+                )
+
+            type_ = type_.default_type()
+        elif not isinstance(type_, KisType):
+            continue
+
+        anno = annotations.get(key, None)
+        fields.append(
+            KisDynamicField(
+                name=key,
+                type=type_,
+                field=None if isinstance(type_, KisTransform) else type_.field or key,
+                nullable=NoneType in get_args(anno) if anno else None,
+            )
+        )
+
+    plan = _field_plans[object_type] = tuple(fields)
+
+    return plan
+
+
 class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
     type_: type[TDynamic] | Callable[[], TDynamic]
 
@@ -269,40 +338,19 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
                 parsing_data = scoped_path(data)
 
         ignore_missing = ignore_missing or getattr(object_type, "__ignore_missing__", False)
-        annotations = {
-            key: value
-            for obj in object_type.__mro__
-            if (annotations := getattr(obj, "__annotations__", None)) is not None
-            for key, value in annotations.items()
-        }
-        missing = set(parsing_data.keys())
-        missing.discard("__response__")
-
-        for key, type_, anno in (
-            (field, type_, annotations.get(field, None))
-            for field in dir(object_type)
-            if (not field.startswith("_") or field.endswith("_"))
-            and (
-                isinstance(type_ := getattr(object_type, field, None), KisType)
-                or (isinstance(type_, type) and issubclass(type_, KisType))
-            )
-        ):
-            if isinstance(type_, type):
-                if (getattr(type_, "__default__", None)) is None:
-                    raise ValueError(
-                        f"{object_type.__name__}의 {key} 필드에 {type_.__name__}은 간접적으로 타입을 지정할 수 없습니다."
-                    )
+        verbose_missing = getattr(object_type, "__verbose_missing__", False)
 
-                type_ = type_.default_type()
+        if verbose_missing:
+            missing = set(parsing_data.keys())
+            missing.discard("__response__")
 
+        for key, type_, field, nullable in get_field_plan(object_type):
             if scope is not None and type_.scope != scope:
                 continue
 
-            field = None if isinstance(type_, KisTransform) else type_.field or key
-            nullable = NoneType in get_args(anno) if anno else None
             target_data = data if type_.absolute else parsing_data
 
-            if field is not None and target_data is parsing_data:
+            if verbose_missing and field is not None and target_data is parsing_data:
                 missing.discard(field)
 
             if field is None:
@@ -341,7 +389,7 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
 
             setattr(object, key, result)
 
-        if missing and getattr(object_type, "__verbose_missing__", False):
+        if verbose_missing and missing:
             if ignore_missing_fields is not None:
                 missing -= ignore_missing_fields
 
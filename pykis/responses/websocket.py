@@ -1,5 +1,16 @@
+from functools import cached_property
+from keyword import iskeyword
 from types import NoneType
-from typing import Any, Iterable, Protocol, TypeVar, get_args, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Protocol,
+    TypeVar,
+    get_args,
+    runtime_checkable,
+)
+from weakref import WeakKeyDictionary
 
 from pykis import logging
 from pykis.responses.dynamic import KisNoneValueError, KisType, empty
@@ -8,6 +19,8 @@ from pykis.responses.types import KisAny
 __all__ = [
     "TWebsocketResponse",
     "KisWebsocketResponse",
+    "websocket_property",
+    "get_websocket_parser",
 ]
 
 
@@ -53,6 +66,7 @@ class KisWebsocketResponse:
         split: str = "^",
         *,
         response_type: "type[TWebsocketResponse]",
+        lazy: bool = False,
     ) -> "Iterable[TWebsocketResponse]":
         """
         데이터를 파싱합니다.
@@ -62,6 +76,7 @@ class KisWebsocketResponse:
             count (int | None): 데이터 갯수
             split (str): 데이터 구분자
             response_type (Callable[..., TWebsocketResponse]): 응답 클래스
+            lazy (bool): 필드를 처음 접근할 때 변환할지 여부
         """
         items = data.split(split)
         fields = getattr(response_type, "__fields__", None)
@@ -90,61 +105,252 @@ class KisWebsocketResponse:
         else:
             count = len(items) // len(fields)
 
+        parse_row = get_websocket_parser(response_type, lazy=lazy)
+
         # 각 아이템의 필드를 묶음 [A, A, B, B] -> [(A, A), (B, B)]
         try:
             for values in zip(*[iter(items)] * len(fields)):
-                values: list[str]
-                response = response_type()
+                yield parse_row(values)
+        except Exception as e:
+            raise ValueError(f"데이터 파싱 중 오류가 발생했습니다.\n→ {type(e).__name__}: {e}") from e
+
 
-                if (pre_init := getattr(response, "__pre_init__", None)) is not None:
-                    pre_init(values)
+class websocket_property(cached_property):
+    """
+    실시간 응답의 파생 속성
 
-                setattr(response, "__data__", values)
+    원본 데이터로부터 계산하는 속성으로, 즉시 변환 모드에서는 파싱할 때 계산하고
+    지연 변환 모드에서는 처음 접근할 때 계산한 뒤 저장합니다.
+    """
 
-                annotation = response_type.__annotations__
 
-                for i, (field, value) in enumerate(zip(fields, values)):
-                    if field is None:
-                        continue
+class _KisLazyField:
+    """지연 변환 모드에서 처음 접근할 때 원본 데이터를 변환하여 저장하는 필드"""
 
-                    if isinstance(field, type):
-                        field = field.default_type()
+    __slots__ = ["name", "index", "transform", "none_value", "error"]
 
-                    if field.field is None:
-                        logging.logger.warning(f"{response_type.__name__}[{i}] 필드의 이름이 지정되지 않았습니다.")
-                        continue
+    def __init__(
+        self,
+        name: str,
+        index: int | None,
+        transform: Callable[[Any], Any],
+        none_value: Callable[[], Any],
+        error: Callable[[Exception], ValueError],
+    ):
+        self.name = name
+        self.index = index
+        self.transform = transform
+        self.none_value = none_value
+        self.error = error
 
-                    try:
-                        if isinstance(field, KisAny) and field.absolute:
-                            value = field.transform(values)
-                        else:
-                            value = field.transform(value)
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
 
-                        setattr(response, field.field, value)
-                    except KisNoneValueError:
-                        nullable = NoneType in get_args(anno) if (anno := annotation.get(field.field)) else False
+        values = instance.__data__
 
-                        default_value = None if field.default is empty else field.default
+        try:
+            value = self.transform(values if self.index is None else values[self.index])
+        except KisNoneValueError:
+            value = self.none_value()
+        except Exception as e:
+            raise self.error(e) from e
 
-                        if callable(default_value):
-                            default_value = default_value()
+        # 인스턴스 속성이 클래스 속성보다 우선하므로 이후에는 변환하지 않습니다.
+        instance.__dict__[self.name] = value
+        return value
 
-                        if default_value is None and not nullable:
-                            raise ValueError(f"{response_type.__name__}.{field.field} 필드가 None일 수 없습니다.")
 
-                        setattr(response, field.field, default_value)
+_parsers: "WeakKeyDictionary[type, tuple[list[Any], Callable[[tuple[str, ...]], Any]]]" = WeakKeyDictionary()
+"""응답 클래스별 파서 캐시"""
+_lazy_parsers: "WeakKeyDictionary[type, tuple[list[Any], Callable[[tuple[str, ...]], Any]]]" = WeakKeyDictionary()
+"""응답 클래스별 지연 변환 파서 캐시"""
+_lazy_types: "WeakKeyDictionary[type, type]" = WeakKeyDictionary()
+"""응답 클래스별 지연 변환 응답 클래스"""
 
-                    except Exception as e:
-                        raise ValueError(
-                            f"{response_type.__name__}.{field.field} 필드를 변환하는 중 오류가 발생했습니다.\n→ {type(e).__name__}: {e}"
-                        ) from e
 
-                if (post_init := getattr(response, "__post_init__", None)) is not None:
-                    post_init()
+def get_websocket_parser(response_type: type, lazy: bool = False) -> Callable[[tuple[str, ...]], Any]:
+    """
+    응답 클래스의 행 파서를 반환합니다.
 
-                yield response
-        except Exception as e:
-            raise ValueError(f"데이터 파싱 중 오류가 발생했습니다.\n→ {type(e).__name__}: {e}") from e
+    `__fields__`에서 변환할 필드만 골라 필드별 대입문으로 이루어진 함수를 생성하며,
+    응답 클래스마다 처음 한 번만 생성합니다.
+
+    Args:
+        response_type (type): 응답 클래스
+        lazy (bool): 지연 변환 모드 여부. 응답 클래스를 상속한 지연 변환 클래스의 객체를 생성하며,
+            필드와 파생 속성은 처음 접근할 때 변환합니다.
+    """
+    fields = getattr(response_type, "__fields__", None)
+    parsers = _lazy_parsers if lazy else _parsers
+
+    if (cached := parsers.get(response_type)) is not None and cached[0] is fields:
+        return cached[1]
+
+    parser = _compile_websocket_parser(response_type, fields or [], lazy=lazy)
+    parsers[response_type] = (fields, parser)  # type: ignore
+
+    return parser
+
+
+def _websocket_properties(response_type: type) -> list[str]:
+    names = []
+
+    for cls in reversed(response_type.__mro__):
+        for name, value in vars(cls).items():
+            if isinstance(value, websocket_property) and name not in names:
+                names.append(name)
+
+    return names
+
+
+def _lazy_response_type(response_type: type, fields: dict[str, _KisLazyField]) -> type:
+    lazy_type = type(
+        response_type.__name__,
+        (response_type,),
+        {
+            "__module__": response_type.__module__,
+            "__qualname__": response_type.__qualname__,
+            "__doc__": response_type.__doc__,
+            "__reduce__": _reduce_lazy_response,
+            **fields,
+        },
+    )
+    _lazy_types[response_type] = lazy_type
+
+    return lazy_type
+
+
+def _reduce_lazy_response(self: Any) -> tuple[Any, ...]:
+    # 지연 변환 클래스는 동적으로 생성되므로 원본 응답 클래스를 기준으로 저장합니다.
+    return _restore_lazy_response, (type(self).__mro__[1], self.__dict__.copy())
+
+
+def _restore_lazy_response(response_type: type, state: dict[str, Any]) -> Any:
+    if (lazy_type := _lazy_types.get(response_type)) is None:
+        get_websocket_parser(response_type, lazy=True)
+        lazy_type = _lazy_types[response_type]
+
+    response = lazy_type.__new__(lazy_type)
+    response.__dict__.update(state)
+
+    return response
+
+
+def _compile_websocket_parser(
+    response_type: type,
+    fields: list[Any],
+    lazy: bool = False,
+) -> Callable[[tuple[str, ...]], Any]:
+    annotation = response_type.__annotations__
+    namespace: dict[str, Any] = {
+        "response_type": response_type,
+        "KisNoneValueError": KisNoneValueError,
+    }
+    lines = [
+        "def parse_row(values):",
+        "    response = response_type()",
+    ]
+
+    pre_init = getattr(response_type, "__pre_init__", None)
+
+    if pre_init is not None and pre_init is not KisWebsocketResponse.__pre_init__:
+        lines.append("    response.__pre_init__(values)")
+
+    lines.append("    response.__data__ = values")
+
+    lazy_fields: dict[str, _KisLazyField] = {}
+
+    for i, field in enumerate(fields):
+        if field is None:
+            continue
+
+        if isinstance(field, type):
+            field = field.default_type()
+
+        if field.field is None:
+            logging.logger.warning(f"{response_type.__name__}[{i}] 필드의 이름이 지정되지 않았습니다.")
+            continue
+
+        name = field.field
+        absolute = isinstance(field, KisAny) and field.absolute
+
+        if lazy:
+            lazy_fields[name] = _KisLazyField(
+                name,
+                None if absolute else i,
+                field.transform,
+                _none_value_handler(response_type, field, annotation),
+                _error_handler(response_type, field),
+            )
+            continue
+
+        namespace[f"transform_{i}"] = field.transform
+        namespace[f"none_{i}"] = _none_value_handler(response_type, field, annotation)
+        namespace[f"error_{i}"] = _error_handler(response_type, field)
+        source = "values" if absolute else f"values[{i}]"
+        target = f"response.{name}" if name.isidentifier() and not iskeyword(name) else None
+
+        lines.append("    try:")
+
+        if target:
+            lines.append(f"        {target} = transform_{i}({source})")
+        else:
+            namespace[f"name_{i}"] = name
+            lines.append(f"        setattr(response, name_{i}, transform_{i}({source}))")
+
+        lines.append("    except KisNoneValueError:")
+
+        if target:
+            lines.append(f"        {target} = none_{i}()")
+        else:
+            lines.append(f"        setattr(response, name_{i}, none_{i}())")
+
+        lines.append("    except Exception as e:")
+        lines.append(f"        raise error_{i}(e) from e")
+
+    if lazy:
+        namespace["response_type"] = _lazy_response_type(response_type, lazy_fields)
+    else:
+        for name in _websocket_properties(response_type):
+            lines.append(f"    response.{name}")
+
+    post_init = getattr(response_type, "__post_init__", None)
+
+    if post_init is not None and post_init is not KisWebsocketResponse.__post_init__:
+        lines.append("    response.__post_init__()")
+
+    lines.append("    return response")
+
+    exec(compile("\n".join(lines), f"<websocket parser {response_type.__qualname__}>", "exec"), namespace)
+
+    return namespace["parse_row"]
+
+
+def _none_value_handler(response_type: type, field: KisType, annotation: dict[str, Any]) -> Callable[[], Any]:
+    nullable = NoneType in get_args(anno) if (anno := annotation.get(field.field)) else False
+
+    def none_value() -> Any:
+        default_value = None if field.default is empty else field.default
+
+        if callable(default_value):
+            default_value = default_value()
+
+        if default_value is None and not nullable:
+            raise ValueError(f"{response_type.__name__}.{field.field} 필드가 None일 수 없습니다.")
+
+        return default_value
+
+    return none_value
+
+
+def _error_handler(response_type: type, field: KisType) -> Callable[[Exception], ValueError]:
+    def error(e: Exception) -> ValueError:
+        return ValueError(
+            f"{response_type.__name__}.{field.field} 필드를 변환하는 중 오류가 발생했습니다.\n→ {type(e).__name__}: {e}"
+        )
+
+    return error
 
 
 TWebsocketResponse = TypeVar("TWebsocketResponse", bound=KisWebsocketResponseProtocol)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Iterable, Protocol
 
 from pykis.adapter.account_product.order import (
     KisOrderableAccountProduct,
@@ -21,6 +21,7 @@ from pykis.event.filters.product import KisProductEventFilter
 from pykis.event.handler import KisEventFilter
 from pykis.event.subscription import KisSubscriptionEventArgs
 from pykis.scope.base import KisScope, KisScopeBase
+from pykis.utils.batch import KisBatchResult, batch_iter
 
 if TYPE_CHECKING:
     from pykis.api.stock.market import MARKET_TYPE
@@ -82,6 +83,32 @@ class KisStockScope(
         self.account_number = account
 
 
+def _stock(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_INFO_TYPES,
+    account: KisAccountNumber,
+    save: bool = True,
+) -> KisStock:
+    if (indexed := self.market_index.get(symbol, market)) is not None:
+        resolved_symbol, resolved_market = indexed
+    else:
+        info = _info(
+            self,
+            symbol=symbol,
+            market=market,
+        )
+        resolved_symbol, resolved_market = info.symbol, info.market
+        self.market_index.set(symbol, market, resolved_symbol, resolved_market, save=save)
+
+    return KisStockScope(
+        kis=self,
+        symbol=resolved_symbol,
+        market=resolved_market,
+        account=account,
+    )
+
+
 def stock(
     self: "PyKis",
     symbol: str,
@@ -91,6 +118,8 @@ def stock(
     """
     종목을 조회하고 종목 Scope를 반환합니다.
 
+    종목 상품유형 색인(`PyKis.market_index`)에 있는 종목은 API 호출 없이 Scope를 생성합니다.
+
     국내주식시세 -> 상품기본조회[v1_국내주식-029]
 
     Args:
@@ -103,15 +132,62 @@ def stock(
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    info = _info(
+    return _stock(
         self,
         symbol=symbol,
         market=market,
-    )
-
-    return KisStockScope(
-        kis=self,
-        symbol=info.symbol,
-        market=info.market,
         account=account or self.primary,
     )
+
+
+def stocks(
+    self: "PyKis",
+    symbols: Iterable[str],
+    market: MARKET_INFO_TYPES = None,
+    account: KisAccountNumber | None = None,
+    max_workers: int | None = None,
+) -> dict[str, KisBatchResult[str, KisStock]]:
+    """
+    여러 종목을 조회하고 종목 Scope를 반환합니다.
+
+    종목 상품유형 색인에 없는 종목만 동시에 조회하며, 조회가 끝나면 색인을 한 번 저장합니다.
+    종목별 오류는 결과의 `error`에 담기며, 나머지 종목의 조회는 계속됩니다.
+
+    국내주식시세 -> 상품기본조회[v1_국내주식-029]
+
+    Args:
+        symbols (Iterable[str]): 종목코드 목록
+        market (str): 상품유형명
+        account (KisAccountNumber): 계좌번호
+        max_workers (int | None, optional): 최대 동시 요청 수. 기본값은 상품기본조회 도메인(실전도메인)의 초당 호출 제한 수입니다.
+
+    Examples:
+        >>> stocks = kis.stocks(["005930", "000660"], market="KRX")
+        >>> stocks["005930"].unwrap().quote()
+    """
+    symbols = list(dict.fromkeys(symbols))
+    account = account or self.primary
+    results: dict[str, KisBatchResult[str, KisStock]] = {}
+    missing: list[str] = []
+
+    for symbol in symbols:
+        if self.market_index.get(symbol, market) is None:
+            missing.append(symbol)
+        else:
+            results[symbol] = KisBatchResult(symbol, result=_stock(self, symbol, market, account))
+
+    if missing:
+        if max_workers is None:
+            # 상품기본조회는 모의투자에서도 실전도메인으로 요청하므로 실전도메인 호출 유량 제한을 따릅니다.
+            max_workers = self._rate_limit("real").rate
+
+        for result in batch_iter(
+            lambda symbol: _stock(self, symbol, market, account, save=False),
+            missing,
+            max_workers=max_workers,
+        ):
+            results[result.key] = result
+
+        self.market_index.save()
+
+    return {symbol: results[symbol] for symbol in symbols}
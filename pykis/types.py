@@ -54,6 +54,7 @@ Python-KIS 내부 타입 및 Protocol 정의
 - KisAuth: 인증 정보
 - KisWebsocketClient: WebSocket 연결
 - KisPage: 페이지네이션
+- KisBatchResult: 일괄 요청 결과
 
 ==============================================================================
 버전 정책
@@ -134,6 +135,11 @@ from pykis.adapter.product.quote import KisQuotableProduct
 from pykis.adapter.websocket.execution import KisRealtimeOrderableAccount
 from pykis.adapter.websocket.price import KisWebsocketQuotableProduct
 from pykis.api.account.balance import KisBalance, KisBalanceStock, KisDeposit
+from pykis.api.account.book import (
+    KisAccountBook,
+    KisAccountBookPosition,
+    KisAccountBookStats,
+)
 from pykis.api.account.daily_order import KisDailyOrder, KisDailyOrders
 from pykis.api.account.order import (
     IN_ORDER_QUANTITY,
@@ -159,7 +165,8 @@ from pykis.api.base.account import KisAccountProtocol
 from pykis.api.base.account_product import KisAccountProductProtocol
 from pykis.api.base.market import KisMarketProtocol
 from pykis.api.base.product import KisProductProtocol
-from pykis.api.stock.chart import KisChart, KisChartBar
+from pykis.api.stock.chart import KisChart, KisChartBar, KisChartColumnBar, KisChartColumns
+from pykis.api.stock.chart_store import KisChartStore, KisChartStoreStats, KisStoredChart
 from pykis.api.stock.info import (
     COUNTRY_TYPE,
     MARKET_INFO_TYPES,
@@ -186,16 +193,37 @@ from pykis.api.websocket.price import KisRealtimePrice
 from pykis.client.account import KisAccountNumber
 from pykis.client.appkey import KisKey
 from pykis.client.auth import KisAuth
-from pykis.client.cache import KisCacheStorage
+from pykis.client.cache import KisCacheStats, KisCacheStorage
+from pykis.client.conflation import KisWebsocketConflationStats, KisWebsocketConflator
 from pykis.client.form import KisForm
+from pykis.client.journal import KisJournal, KisJournalStats
+from pykis.client.market_index import KisMarketIndex
 from pykis.client.messaging import (
     KisWebsocketEncryptionKey,
     KisWebsocketForm,
     KisWebsocketRequest,
     KisWebsocketTR,
 )
+from pykis.client.mock_server import (
+    KisMockRequest,
+    KisMockResponse,
+    KisMockServer,
+    KisMockServerStats,
+)
 from pykis.client.object import KisObjectProtocol
 from pykis.client.page import KisPage, KisPageStatus
+from pykis.client.pipeline import KisWebsocketPipeline, KisWebsocketPipelineStats
+from pykis.client.recorder import (
+    KisWebsocketRecorder,
+    KisWebsocketRecordFrame,
+    KisWebsocketRecordReader,
+    KisWebsocketRecordRow,
+)
+from pykis.client.replay import (
+    KisWebsocketReplay,
+    KisWebsocketReplaySocket,
+    KisWebsocketReplayStats,
+)
 from pykis.client.websocket import KisWebsocketClient
 from pykis.event.filters.order import KisOrderNumberEventFilter
 from pykis.event.filters.product import KisProductEventFilter
@@ -228,6 +256,7 @@ from pykis.responses.websocket import KisWebsocketResponse, KisWebsocketResponse
 from pykis.scope.account import KisAccount, KisAccountScope
 from pykis.scope.base import KisScope, KisScopeBase
 from pykis.scope.stock import KisStock, KisStockScope
+from pykis.utils.batch import KisBatchResult
 from pykis.utils.timex import TIMEX_TYPE
 
 __all__ = [
@@ -257,9 +286,14 @@ __all__ = [
     "KisKey",
     "KisAuth",
     "KisCacheStorage",
+    "KisCacheStats",
+    "KisJournal",
+    "KisJournalStats",
+    "KisMarketIndex",
     "KisForm",
     "KisPage",
     "KisPageStatus",
+    "KisBatchResult",
     ################################
     ##          Websocket         ##
     ################################
@@ -269,6 +303,21 @@ __all__ = [
     "KisWebsocketTR",
     "KisWebsocketEncryptionKey",
     "KisWebsocketClient",
+    "KisWebsocketConflator",
+    "KisWebsocketConflationStats",
+    "KisWebsocketPipeline",
+    "KisWebsocketPipelineStats",
+    "KisWebsocketRecorder",
+    "KisWebsocketRecordReader",
+    "KisWebsocketRecordFrame",
+    "KisWebsocketRecordRow",
+    "KisWebsocketReplay",
+    "KisWebsocketReplaySocket",
+    "KisWebsocketReplayStats",
+    "KisMockServer",
+    "KisMockServerStats",
+    "KisMockRequest",
+    "KisMockResponse",
     ################################
     ##            Events          ##
     ################################
@@ -322,12 +371,20 @@ __all__ = [
     "KisOrderbookItem",
     "KisChartBar",
     "KisChart",
+    "KisChartColumnBar",
+    "KisChartColumns",
+    "KisChartStore",
+    "KisChartStoreStats",
+    "KisStoredChart",
     "KisTradingHours",
     "KisIndicator",
     "KisQuote",
     "KisBalanceStock",
     "KisDeposit",
     "KisBalance",
+    "KisAccountBookPosition",
+    "KisAccountBookStats",
+    "KisAccountBook",
     "KisDailyOrder",
     "KisDailyOrders",
     "KisOrderProfit",
@@ -0,0 +1,130 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+from pykis.utils.repr import kis_repr
+
+__all__ = [
+    "KisBatchResult",
+    "batch_iter",
+    "batch_map",
+]
+
+
+TKey = TypeVar("TKey")
+TResult = TypeVar("TResult")
+
+
+@kis_repr(
+    "key",
+    "result",
+    "error",
+    lines="single",
+)
+class KisBatchResult(Generic[TKey, TResult]):
+    """일괄 요청 결과"""
+
+    __slots__ = [
+        "key",
+        "result",
+        "error",
+    ]
+
+    key: TKey
+    """요청 키"""
+    result: TResult | None
+    """결과"""
+    error: Exception | None
+    """오류"""
+
+    def __init__(self, key: TKey, result: TResult | None = None, error: Exception | None = None):
+        self.key = key
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부"""
+        return self.error is None
+
+    def unwrap(self) -> TResult:
+        """
+        결과를 반환합니다.
+
+        Raises:
+            Exception: 요청에 실패한 경우 해당 오류
+        """
+        if self.error is not None:
+            raise self.error
+
+        return self.result  # type: ignore
+
+
+def batch_iter(
+    fn: Callable[[TKey], TResult],
+    keys: Iterable[TKey],
+    max_workers: int,
+) -> Iterator[KisBatchResult[TKey, TResult]]:
+    """
+    요청을 작업자 풀에서 동시에 실행하고, 완료되는 순서대로 결과를 반환합니다.
+
+    각 요청의 오류는 결과에 담기며, 다른 요청의 실행을 중단하지 않습니다.
+    반복을 중간에 멈추면 아직 시작되지 않은 요청은 취소됩니다.
+
+    Args:
+        fn: 각 키에 대해 실행할 함수
+        keys: 요청 키 목록
+        max_workers: 최대 동시 실행 수
+    """
+    keys = list(dict.fromkeys(keys))
+
+    if not keys:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys))), thread_name_prefix="pykis-batch")
+
+    try:
+        pending: dict[Future[TResult], TKey] = {executor.submit(fn, key): key for key in keys}
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                key = pending.pop(future)
+
+                try:
+                    result = KisBatchResult(key, result=future.result())
+                except Exception as e:
+                    result = KisBatchResult(key, error=e)
+
+                yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def batch_map(
+    fn: Callable[[TKey], TResult],
+    keys: Iterable[TKey],
+    max_workers: int | None = None,
+) -> list[TResult]:
+    """
+    요청을 작업자 풀에서 동시에 실행하고, 키 순서대로 결과를 반환합니다.
+
+    요청이 하나뿐이면 작업자 풀 없이 현재 스레드에서 실행합니다.
+    호출 유량은 각 요청의 유량 제한기가 조절하므로, 동시 실행 수는 기본적으로 요청 수와 같습니다.
+
+    Args:
+        fn: 각 키에 대해 실행할 함수
+        keys: 요청 키 목록
+        max_workers: 최대 동시 실행 수. 기본값은 요청 수입니다.
+
+    Raises:
+        Exception: 요청에 실패한 경우 키 순서상 첫 번째 요청의 오류
+    """
+    keys = list(keys)
+
+    if len(keys) <= 1:
+        return [fn(key) for key in keys]
+
+    results = {result.key: result for result in batch_iter(fn, keys, max_workers=max_workers or len(keys))}
+
+    return [results[key].unwrap() for key in keys]
@@ -1,81 +1,442 @@
+import asyncio
+import json
+import os
+import threading
 import time
-from multiprocessing import Lock
-from multiprocessing.synchronize import Lock as LockType
-from typing import Callable
+from collections import deque
+from contextlib import contextmanager
+from os import PathLike
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator
 
 __all__ = [
+    "RateLimiterStats",
     "RateLimiter",
+    "SharedRateLimiter",
 ]
 
 
+class RateLimiterStats:
+    """호출 유량 대기 통계"""
+
+    __slots__ = [
+        "acquired",
+        "rejected",
+        "waited",
+        "total_wait",
+        "max_wait",
+    ]
+
+    acquired: int
+    """획득한 호출 횟수"""
+    rejected: int
+    """획득하지 못한 비블로킹 호출 횟수"""
+    waited: int
+    """대기가 발생한 호출 횟수"""
+    total_wait: float
+    """총 대기 시간 (초)"""
+    max_wait: float
+    """최대 대기 시간 (초)"""
+
+    def __init__(
+        self,
+        acquired: int = 0,
+        rejected: int = 0,
+        waited: int = 0,
+        total_wait: float = 0,
+        max_wait: float = 0,
+    ):
+        self.acquired = acquired
+        self.rejected = rejected
+        self.waited = waited
+        self.total_wait = total_wait
+        self.max_wait = max_wait
+
+    @property
+    def average_wait(self) -> float:
+        """호출당 평균 대기 시간 (초)"""
+        return self.total_wait / self.acquired if self.acquired else 0
+
+    def copy(self) -> "RateLimiterStats":
+        return RateLimiterStats(
+            acquired=self.acquired,
+            rejected=self.rejected,
+            waited=self.waited,
+            total_wait=self.total_wait,
+            max_wait=self.max_wait,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(acquired={self.acquired}, rejected={self.rejected}, waited={self.waited}, "
+            f"total_wait={self.total_wait:.3f}, max_wait={self.max_wait:.3f})"
+        )
+
+
 class RateLimiter:
-    """호출 유량을 제한하는 클래스입니다."""
+    """
+    호출 유량을 제한하는 클래스입니다.
+
+    GCRA(Generic Cell Rate Algorithm)로 호출 시각을 예약하여 `burst`회 이후의 호출을 `period / rate` 간격으로 고르게 분산하고,
+    슬라이딩 윈도우로 어떤 `period` 구간에서도 `rate`회를 넘지 않도록 보장합니다.
+
+    호출 시각은 락 안에서 예약하고 대기는 락 밖에서 이루어지므로, 대기 중인 호출이 다른 호출을 막지 않으며 예약 순서대로(FIFO) 호출 유량을 획득합니다.
+    """
 
     __slots__ = [
         "rate",
         "period",
-        "_count",
-        "_last",
+        "burst",
+        "_history",
+        "_tat",
         "_lock",
+        "_budgets",
+        "_stats",
     ]
 
     rate: int
     """기간 호출 횟수"""
     period: float
     """기간"""
+    burst: int
+    """대기 없이 연속으로 호출할 수 있는 횟수"""
 
-    _count: int
-    """호출 횟수"""
-    _last: float
-    """마지막 호출 시간"""
-    _lock: LockType
+    _history: deque[float]
+    """최근 `rate`회의 호출 시각 (예약 포함)"""
+    _tat: float
+    """GCRA 이론적 도착 시간"""
+    _lock: threading.Lock
     """Lock 객체"""
+    _budgets: dict[str, "RateLimiter"]
+    """키별 하위 호출 유량"""
+    _stats: RateLimiterStats
+    """대기 통계"""
 
-    def __init__(self, rate: int, period: float):
-        """호출 유량을 제한하는 클래스를 생성합니다.
+    def __init__(self, rate: int, period: float, burst: int | None = None):
+        """
+        호출 유량을 제한하는 클래스를 생성합니다.
 
         Args:
-            rate: 초당 호출 횟수
+            rate: 기간 호출 횟수
             period: 기간(초)
+            burst: 대기 없이 연속으로 호출할 수 있는 횟수. 기본값은 `rate`이며, 1일 경우 모든 호출이 `period / rate` 간격으로 분산됩니다.
         """
+        if rate < 1:
+            raise ValueError("rate는 1 이상이어야 합니다.")
+
+        if period <= 0:
+            raise ValueError("period는 0보다 커야 합니다.")
+
         self.rate = rate
         self.period = period
-        self._count = 0
-        self._last = 0
-        self._lock = Lock()
+        self.burst = rate if burst is None else max(1, min(burst, rate))
+        self._history = deque(maxlen=rate)
+        self._tat = 0
+        self._lock = threading.Lock()
+        self._budgets = {}
+        self._stats = RateLimiterStats()
+
+    @property
+    def interval(self) -> float:
+        """호출 간 최소 평균 간격 (초)"""
+        return self.period / self.rate
+
+    def _now(self) -> float:
+        """현재 시각을 반환합니다."""
+        return time.monotonic()
+
+    @contextmanager
+    def _state(self) -> Iterator[None]:
+        """호출 유량 상태를 잠그고 갱신합니다."""
+        with self._lock:
+            yield
 
     @property
     def count(self) -> int:
         """기간 호출 횟수를 반환합니다."""
+        with self._state():
+            now = self._now()
+            return sum(1 for at in self._history if now - self.period < at <= now)
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """대기 통계의 복사본을 반환합니다."""
         with self._lock:
-            return 0 if time.time() - self._last > self.period else self._count
+            return self._stats.copy()
+
+    @property
+    def budgets(self) -> dict[str, "RateLimiter"]:
+        """키별 하위 호출 유량을 반환합니다."""
+        return self._budgets.copy()
 
-    def acquire(self, blocking: bool = True, blocking_callback: Callable[[], None] | None = None) -> bool:
+    def budget(self, key: str, rate: int, period: float, burst: int | None = None) -> "RateLimiter":
+        """
+        키(TR ID 등)별 하위 호출 유량을 설정합니다.
+
+        하위 호출 유량은 전체 호출 유량과 별개로 적용되며, `acquire(key=...)`로 호출할 때 두 유량을 모두 획득합니다.
+
+        Args:
+            key: 하위 호출 유량 키
+            rate: 기간 호출 횟수
+            period: 기간(초)
+            burst: 대기 없이 연속으로 호출할 수 있는 횟수
+
+        Examples:
+            >>> kis._rate_limiters["real"].budget("TTTC8001R", rate=1, period=1)
+        """
+        limiter = self._create_budget(key, rate, period, burst)
+        self._budgets[key] = limiter
+        return limiter
+
+    def _create_budget(self, key: str, rate: int, period: float, burst: int | None) -> "RateLimiter":
+        return RateLimiter(rate, period, burst=burst)
+
+    def _earliest(self, now: float) -> float:
+        """`now` 이후 호출 가능한 가장 빠른 시각을 계산합니다. 락 안에서 호출해야 합니다."""
+        at = max(now, self._tat - (self.burst - 1) * self.interval)
+
+        if len(self._history) >= self.rate:
+            at = max(at, self._history[0] + self.period)
+
+        return at
+
+    def _commit(self, at: float, now: float) -> None:
+        """호출 시각을 예약합니다. 락 안에서 호출해야 합니다."""
+        self._tat = max(self._tat, at) + self.interval
+        self._history.append(at)
+
+        wait = at - now
+        self._stats.acquired += 1
+
+        if wait > 0:
+            self._stats.waited += 1
+            self._stats.total_wait += wait
+            self._stats.max_wait = max(self._stats.max_wait, wait)
+
+    def _reserve(self) -> float:
+        """호출 시각을 예약하고 대기해야 하는 시간(초)을 반환합니다."""
+        with self._state():
+            now = self._now()
+            at = self._earliest(now)
+            self._commit(at, now)
+
+        return at - now
+
+    async def _reserve_async(self) -> float:
+        """이벤트 루프에서 호출 시각을 예약하고 대기해야 하는 시간(초)을 반환합니다."""
+        return self._reserve()
+
+    def _try_acquire(self, budget: "RateLimiter | None") -> bool:
+        """대기 없이 호출 유량을 획득합니다."""
+        if budget is None:
+            with self._state():
+                now = self._now()
+
+                if self._earliest(now) > now:
+                    self._stats.rejected += 1
+                    return False
+
+                self._commit(now, now)
+                return True
+
+        # 하위 유량과 전체 유량을 함께 확인합니다. 락 순서는 항상 하위 -> 전체입니다.
+        with budget._state(), self._state():
+            now = self._now()
+
+            if budget._earliest(now) > now or self._earliest(now) > now:
+                self._stats.rejected += 1
+                return False
+
+            budget._commit(now, now)
+            self._commit(now, now)
+            return True
+
+    async def _try_acquire_async(self, budget: "RateLimiter | None") -> bool:
+        """이벤트 루프에서 대기 없이 호출 유량을 획득합니다."""
+        return self._try_acquire(budget)
+
+    def acquire(
+        self,
+        blocking: bool = True,
+        blocking_callback: Callable[[], None] | None = None,
+        key: str | None = None,
+    ) -> bool:
         """
         호출 유량을 획득합니다.
 
         Args:
             blocking: 호출 횟수가 초과되었을 때 대기 여부
             blocking_callback: blocking=True일 경우 호출 횟수 초과 시 호출할 함수
+            key: 하위 호출 유량 키 (TR ID 등). 설정되지 않은 키는 무시됩니다.
 
         Returns:
             호출 횟수 초과 여부, blocking=True일 경우 항상 True
         """
-        with self._lock:
-            now = time.time()
-            if now - self._last > self.period:
-                self._count = 0
-                self._last = now
-            if self._count >= self.rate:
-                if not blocking:
-                    return False
+        budget = self._budgets.get(key) if key is not None else None
+
+        if not blocking:
+            return self._try_acquire(budget)
 
-                if blocking_callback is not None:
+        notified = False
+
+        for limiter in (budget, self) if budget is not None else (self,):
+            if (wait := limiter._reserve()) > 0:
+                if not notified and blocking_callback is not None:
                     blocking_callback()
+                    notified = True
 
-                time.sleep(max(self.period - (time.time() - self._last) + 0.05, 0))
-                self._count = 0
-                self._last = time.time()
+                time.sleep(wait)
 
-            self._count += 1
-            return True
+        return True
+
+    async def acquire_async(
+        self,
+        blocking: bool = True,
+        blocking_callback: Callable[[], None] | None = None,
+        key: str | None = None,
+    ) -> bool:
+        """
+        호출 유량을 비동기로 획득합니다.
+
+        대기하는 동안 이벤트 루프를 점유하지 않습니다.
+
+        Args:
+            blocking: 호출 횟수가 초과되었을 때 대기 여부
+            blocking_callback: blocking=True일 경우 호출 횟수 초과 시 호출할 함수
+            key: 하위 호출 유량 키 (TR ID 등). 설정되지 않은 키는 무시됩니다.
+
+        Returns:
+            호출 횟수 초과 여부, blocking=True일 경우 항상 True
+        """
+        budget = self._budgets.get(key) if key is not None else None
+
+        if not blocking:
+            return await self._try_acquire_async(budget)
+
+        notified = False
+
+        for limiter in (budget, self) if budget is not None else (self,):
+            if (wait := await limiter._reserve_async()) > 0:
+                if not notified and blocking_callback is not None:
+                    blocking_callback()
+                    notified = True
+
+                await asyncio.sleep(wait)
+
+        return True
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rate={self.rate}, period={self.period}, burst={self.burst})"
+
+
+def _lock_file(file: IO[Any]) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        file.seek(0)
+        # msvcrt.LK_LOCK은 10회 재시도 후 실패하므로 획득할 때까지 반복합니다.
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore
+                return
+            except OSError:
+                continue
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(file: IO[Any]) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    여러 프로세스가 공유하는 호출 유량을 제한하는 클래스입니다.
+
+    호출 유량 상태를 파일에 저장하고 파일 잠금으로 동기화하므로, 같은 호스트에서 같은 `path`를 사용하는 모든 프로세스가 하나의 호출 유량을 나누어 사용합니다.
+    프로세스 간에 공유되는 시계가 필요하므로 `time.time()`을 기준으로 예약합니다.
+    """
+
+    __slots__ = [
+        "path",
+    ]
+
+    path: Path
+    """호출 유량 상태 파일 경로"""
+
+    def __init__(self, path: str | PathLike[str], rate: int, period: float, burst: int | None = None):
+        """
+        여러 프로세스가 공유하는 호출 유량을 제한하는 클래스를 생성합니다.
+
+        Args:
+            path: 호출 유량 상태 파일 경로
+            rate: 기간 호출 횟수
+            period: 기간(초)
+            burst: 대기 없이 연속으로 호출할 수 있는 횟수
+        """
+        super().__init__(rate, period, burst=burst)
+        self.path = Path(path).resolve()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    def _now(self) -> float:
+        return time.time()
+
+    @contextmanager
+    def _state(self) -> Iterator[None]:
+        with self._lock, open(self.path, "r+") as file:
+            _lock_file(file)
+
+            try:
+                self._load(file.read())
+                yield
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps({"tat": self._tat, "history": list(self._history)}))
+                file.flush()
+            finally:
+                _unlock_file(file)
+
+    async def _reserve_async(self) -> float:
+        # 파일 잠금 대기와 파일 입출력이 이벤트 루프를 막지 않도록 별도 스레드에서 예약합니다.
+        return await asyncio.to_thread(self._reserve)
+
+    async def _try_acquire_async(self, budget: RateLimiter | None) -> bool:
+        return await asyncio.to_thread(self._try_acquire, budget)
+
+    def _load(self, text: str) -> None:
+        self._history.clear()
+        self._tat = 0
+
+        if not text:
+            return
+
+        try:
+            data = json.loads(text)
+            self._tat = float(data["tat"])
+            self._history.extend(float(at) for at in data["history"])
+        except (ValueError, KeyError, TypeError):
+            # 손상된 상태 파일은 초기화합니다.
+            self._history.clear()
+            self._tat = 0
+
+    def _create_budget(self, key: str, rate: int, period: float, burst: int | None) -> RateLimiter:
+        return SharedRateLimiter(
+            self.path.with_name(f"{self.path.stem}.{key}{self.path.suffix}"),
+            rate,
+            period,
+            burst=burst,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r}, rate={self.rate}, period={self.period}, burst={self.burst})"
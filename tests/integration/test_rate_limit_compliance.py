@@ -40,7 +40,7 @@ def mock_token_response():
     """토큰 발급 응답"""
     return {
         "access_token": "test_token_12345",
-        "access_token_token_expired": "2025-12-31 23:59:59",
+        "access_token_token_expired": "2099-12-31 23:59:59",
         "token_type": "Bearer",
         "expires_in": 86400
     }
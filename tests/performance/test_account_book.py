@@ -0,0 +1,54 @@
+"""
+실시간 계좌 장부 벤치마크
+로컬 모의 서버에 지연 시간을 주입하여 잔고 조회와 실시간 계좌 장부의 보유수량 조회 시간을 비교합니다
+"""
+
+import time
+
+from pykis.api.account.balance import balance, orderable_quantity
+from pykis.api.account.book import book
+from pykis.api.account.order import domestic_order
+from pykis.client.mock_server import KisMockServer
+
+
+class TestAccountBookBenchmark:
+    """실시간 계좌 장부 벤치마크"""
+
+    def test_benchmark_position_lookup(self):
+        """서버 지연 시간 20ms 환경에서 20개 보유종목의 매도가능수량 조회"""
+        symbols = [f"{i:06d}" for i in range(1, 21)]
+
+        with KisMockServer(latency=0.02) as server:
+            kis = server.create_kis()
+            account = kis.primary_account
+
+            for symbol in symbols:
+                domestic_order(kis, account, symbol, "buy", price=10000, qty=3)
+
+            started = time.perf_counter()
+            expected = [orderable_quantity(kis, account, symbol, country="KR") for symbol in symbols]
+            rest = time.perf_counter() - started
+
+            account_book = book(kis, account, country="KR", reconcile_interval=None)
+
+            try:
+                requests = server.stats.requests
+                started = time.perf_counter()
+                actual = [orderable_quantity(kis, account, symbol, country="KR") for symbol in symbols]
+                lookup = time.perf_counter() - started
+
+                assert server.stats.requests == requests
+            finally:
+                account_book.stop()
+                kis.websocket.disconnect()
+
+            snapshot = balance(kis, account, country="KR")
+
+        print(
+            f"\n보유종목 {len(symbols)}개 매도가능수량 조회: 잔고 조회 {rest * 1000:.1f}ms, "
+            f"계좌 장부 {lookup * 1000:.3f}ms ({rest / lookup:,.0f}x)"
+        )
+
+        assert actual == expected == [snapshot.stock(symbol).orderable for symbol in symbols]  # type: ignore
+        # 기준: 계좌 장부 조회가 잔고 조회보다 100배 이상 빠름
+        assert lookup * 100 < rest
@@ -0,0 +1,79 @@
+"""
+열 기반 차트 벤치마크
+10년치 일봉 응답을 봉 객체 목록과 열 기반 차트로 변환하여 변환 시간과 메모리 사용량을 비교합니다
+"""
+
+import gc
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from pykis.api.stock.daily_chart import (
+    KisDomesticColumnarDailyChart,
+    KisDomesticDailyChart,
+)
+
+BARS = 2500
+
+
+def _rows() -> list[dict[str, str]]:
+    day = date(2024, 12, 31)
+    rows = []
+
+    for i in range(BARS):
+        price = 70000 + (i * 37) % 5000
+        rows.append(
+            {
+                "stck_bsop_date": (day - timedelta(days=i)).strftime("%Y%m%d"),
+                "stck_clpr": str(price),
+                "stck_oprc": str(price - 100),
+                "stck_hgpr": str(price + 300),
+                "stck_lwpr": str(price - 300),
+                "acml_vol": str(1000000 + i),
+                "acml_tr_pbmn": str(price * (1000000 + i)),
+                "flng_cls_code": "00",
+                "prtt_rate": "0.00",
+                "mod_yn": "N",
+                "prdy_vrss_sign": "2",
+                "prdy_vrss": "100",
+                "revl_issu_reas": "",
+            }
+        )
+
+    return rows
+
+
+def _transform(chart_type: type[KisDomesticDailyChart], rows: list[dict[str, str]]):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    bars = chart_type.bars.transform(rows)  # type: ignore
+
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return bars, elapsed, size
+
+
+class TestChartColumnsBenchmark:
+    """열 기반 차트 벤치마크"""
+
+    def test_benchmark_daily_chart_columns(self):
+        """일봉 2,500개 (약 10년) 변환"""
+        rows = _rows()
+
+        objects, object_elapsed, object_size = _transform(KisDomesticDailyChart, rows)
+        columns, column_elapsed, column_size = _transform(KisDomesticColumnarDailyChart, rows)
+
+        print(
+            f"\n일봉 {BARS:,}개 변환: 봉 객체 {object_elapsed * 1000:.1f}ms / {object_size / 1024:,.0f}KiB, "
+            f"열 기반 {column_elapsed * 1000:.1f}ms / {column_size / 1024:,.0f}KiB "
+            f"(속도 {object_elapsed / column_elapsed:.1f}x, 메모리 {object_size / column_size:.1f}x)"
+        )
+
+        assert len(objects) == len(columns) == BARS
+        assert objects[0].close == columns[0].close
+        # 기준: 열 기반 차트가 봉 객체 목록보다 메모리를 5배 이상 적게 사용
+        assert column_size * 5 < object_size
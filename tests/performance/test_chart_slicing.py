@@ -0,0 +1,103 @@
+"""
+차트 시간 범위 조회 벤치마크
+여러 해의 분봉 차트에서 시간 범위 슬라이싱과 drop_after 정리 시간을 측정합니다
+"""
+
+import time
+from datetime import date, datetime, timedelta
+
+from pykis.api.stock import day_chart
+from pykis.api.stock.chart import KisChartBase
+from pykis.utils.timezone import TIMEZONE
+
+
+class _Bar:
+    __slots__ = ["time", "time_kst"]
+
+    def __init__(self, time: datetime):
+        self.time = time
+        self.time_kst = time
+
+
+class _Chart(KisChartBase):
+    def __init__(self, bars: list):
+        self.symbol = "005930"
+        self.market = "KRX"
+        self.timezone = TIMEZONE
+        self.bars = bars
+
+
+def _minute_bars(years: int) -> list[_Bar]:
+    # 하루 390분, 1년 250 거래일
+    bars = []
+    day = datetime(2020, 1, 2, 9, tzinfo=TIMEZONE)
+
+    for _ in range(years * 250):
+        bars.extend(_Bar(day + timedelta(minutes=minute)) for minute in range(390))
+        day += timedelta(days=1)
+
+    return bars
+
+
+def _insert_drop_after(bars: list[_Bar]) -> list[_Bar]:
+    # 기존 구현: 결과 앞쪽에 삽입
+    result = []
+
+    for bar in bars:
+        result.insert(0, bar)
+
+    return result
+
+
+class TestChartSlicingBenchmark:
+    """차트 시간 범위 조회 벤치마크"""
+
+    def test_benchmark_range_slicing(self):
+        """3년치 분봉 (292,500개)에서 하루 범위 1,000회 조회"""
+        chart = _Chart(_minute_bars(3))
+        days = [date(2020, 1, 2) + timedelta(days=i * 7 % 700) for i in range(1000)]
+
+        started = time.perf_counter()
+        chart[days[0] : days[0]]
+        first = time.perf_counter() - started
+
+        started = time.perf_counter()
+        sizes = [len(chart[day:day]) for day in days]
+        bisect = time.perf_counter() - started
+
+        # 전체 순회는 20회만 측정하여 1,000회로 환산
+        started = time.perf_counter()
+        for day in days[:20]:
+            [bar for bar in chart.bars if day <= bar.time.date() <= day]
+        scan = (time.perf_counter() - started) / 20 * 1000
+
+        print(
+            f"\n{len(chart):,}개 분봉 하루 범위 1,000회 조회: 이진탐색 {bisect * 1000:.1f}ms "
+            f"(키 캐시 생성 {first * 1000:.1f}ms), 전체 순회 {scan * 1000:.1f}ms ({scan / bisect:.0f}x)"
+        )
+
+        assert all(size == 390 for size in sizes)
+        # 기준: 캐시된 키로 1,000회 조회가 전체 순회 1,000회보다 50배 이상 빠름
+        assert bisect * 50 < scan
+
+    def test_benchmark_drop_after(self):
+        """1년치 분봉 (97,500개) 정리"""
+        bars = _minute_bars(1)
+        descending = bars[::-1]
+
+        started = time.perf_counter()
+        result = day_chart.drop_after(_Chart(descending.copy()))
+        linear = time.perf_counter() - started
+
+        started = time.perf_counter()
+        _insert_drop_after(descending)
+        insert = time.perf_counter() - started
+
+        print(
+            f"\n{len(bars):,}개 분봉 drop_after: 순차 추가 후 뒤집기 {linear * 1000:.1f}ms, "
+            f"앞쪽 삽입 {insert * 1000:.1f}ms ({insert / linear:.1f}x)"
+        )
+
+        assert result.bars == bars
+        # 기준: 앞쪽 삽입만 수행하는 기존 방식보다 빠름
+        assert linear < insert
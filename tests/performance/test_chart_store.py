@@ -0,0 +1,63 @@
+"""
+기간 차트 저장소 벤치마크
+로컬 모의 서버에 지연 시간을 주입하여 여러 종목의 1년 일봉을 순차로 조회할 때와 차트 저장소로 동시에 내려받을 때, 저장된 차트를 다시 내려받을 때의 시간을 비교합니다
+"""
+
+import time
+from datetime import date, timedelta
+
+from pykis.api.stock.chart_store import KisChartStore
+from pykis.api.stock.daily_chart import daily_chart
+from pykis.client.mock_server import KisMockServer
+
+SYMBOLS = [f"{i:06d}" for i in range(1, 9)]
+LATENCY = 0.1
+
+
+class TestChartStoreBenchmark:
+    """기간 차트 저장소 벤치마크"""
+
+    def test_benchmark_download(self, tmp_path):
+        """서버 지연 시간 100ms 환경에서 8개 종목의 1년 일봉 (종목당 3회 요청) 조회"""
+        start = date.today() - timedelta(days=365)
+
+        with KisMockServer() as server:
+            kis = server.create_kis(use_websocket=False)
+            # 토큰 발급은 측정에서 제외합니다.
+            daily_chart(kis, SYMBOLS[0], "KRX", start=date.today())
+            server.latency = LATENCY
+
+            started = time.perf_counter()
+            expected = {symbol: daily_chart(kis, symbol, "KRX", start=start, columnar=True) for symbol in SYMBOLS}
+            sequential = time.perf_counter() - started
+
+            # 호출 유량 제한이 회복되도록 기다립니다.
+            time.sleep(1)
+
+            started = time.perf_counter()
+            KisChartStore(kis, tmp_path).download(SYMBOLS, "KRX", start=start)
+            cold = time.perf_counter() - started
+            time.sleep(1)
+
+            requests = server.stats.requests
+            store = KisChartStore(kis, tmp_path)
+            started = time.perf_counter()
+            results = store.download(SYMBOLS, "KRX", start=start)
+            warm = time.perf_counter() - started
+            warm_requests = server.stats.requests - requests
+
+        bars = sum(len(chart.bars) for chart in expected.values())
+
+        print(
+            f"\n{len(SYMBOLS)}개 종목 일봉 {bars}건: 순차 조회 {sequential * 1000:.1f}ms, "
+            f"동시 내려받기 {cold * 1000:.1f}ms ({sequential / cold:.1f}x), "
+            f"저장소 재조회 {warm * 1000:.1f}ms, {warm_requests}회 요청 ({sequential / warm:.1f}x)"
+        )
+
+        for symbol, chart in expected.items():
+            assert list(results[symbol].unwrap().bars.close) == list(chart.bars.close)  # type: ignore
+
+        # 기준: 종목별 요청이 겹쳐 순차 조회보다 빠르고, 저장소 재조회는 미확정 봉만 조회하여 5배 이상 빠름
+        assert cold < sequential
+        assert warm_requests == len(SYMBOLS)
+        assert warm * 5 < sequential
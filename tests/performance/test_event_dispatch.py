@@ -0,0 +1,103 @@
+"""
+이벤트 디스패치 벤치마크
+구독 종목 수와 콜백 수에 따른 체결가 이벤트 1건당 디스패치 비용을 측정합니다
+"""
+
+import time
+from types import SimpleNamespace
+
+from pykis.client.messaging import KisWebsocketTR
+from pykis.event.filters.product import KisProductEventFilter
+from pykis.event.filters.subscription import KisSubscriptionEventFilter
+from pykis.event.handler import KisEventCallback, KisEventHandler, KisMultiEventFilter
+from pykis.event.subscription import KisSubscriptionEventArgs
+
+SYMBOLS = [f"{i:06d}" for i in range(40)]
+
+
+def _build_handler(count: int) -> tuple[KisEventHandler, list]:
+    """40개 종목에 콜백을 고르게 등록합니다. 콜백 수가 40개를 넘으면 종목별로 여러 콜백이 등록됩니다."""
+    handler = KisEventHandler()
+    tickets = []
+
+    for i in range(count):
+        symbol = SYMBOLS[i % len(SYMBOLS)]
+        tickets.append(
+            handler.on(
+                lambda sender, e: None,
+                where=KisMultiEventFilter(
+                    KisSubscriptionEventFilter("H0STCNT0"),
+                    KisProductEventFilter(symbol, "KRX"),
+                ),
+            )
+        )
+
+    return handler, tickets
+
+
+def _linear_invoke(handler: KisEventHandler, sender, e) -> None:
+    # 색인 도입 이전과 같이 모든 콜백의 필터를 평가합니다.
+    for callback in handler.handlers.copy():
+        if isinstance(callback, KisEventCallback):
+            if not callback.__filter__(handler, sender, e):
+                callback.__callback__(handler, sender, e)
+        else:
+            callback(sender, e)
+
+
+def _ticks() -> list[KisSubscriptionEventArgs]:
+    return [
+        KisSubscriptionEventArgs(KisWebsocketTR("H0STCNT0", ""), SimpleNamespace(symbol=symbol, market="KRX"))
+        for symbol in SYMBOLS
+    ]
+
+
+def _cost(fn, handler: KisEventHandler, ticks: list, rounds: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        for tick in ticks:
+            fn(handler, None, tick)
+
+    return (time.perf_counter() - start) / (rounds * len(ticks))
+
+
+class TestEventDispatchBenchmark:
+    """이벤트 디스패치 벤치마크"""
+
+    def test_indexed_dispatch_matches_linear_dispatch(self):
+        handler, tickets = _build_handler(80)
+        tick = _ticks()[3]
+
+        linear = {callback for callback in handler.handlers if not callback.__filter__(handler, None, tick)}
+
+        assert set(handler.match(tick)) == linear
+        assert len(linear) == 2
+
+        for ticket in tickets:
+            ticket.unsubscribe()
+
+    def test_benchmark_dispatch_cost_vs_handler_count(self):
+        """콜백 수 40 ~ 400개에서 이벤트 1건당 디스패치 비용"""
+        ticks = _ticks()
+        results = {}
+
+        for count in (40, 80, 200, 400):
+            handler, tickets = _build_handler(count)
+            rounds = max(1, 4000 // count)
+
+            linear = _cost(_linear_invoke, handler, ticks, rounds)
+            indexed = _cost(KisEventHandler.invoke, handler, ticks, rounds)
+            results[count] = (linear, indexed)
+
+            print(
+                f"\n콜백 {count:>3}개: 선형 {linear * 1e6:8.2f}us/tick, "
+                f"색인 {indexed * 1e6:6.2f}us/tick ({linear / indexed:.1f}x)"
+            )
+
+            for ticket in tickets:
+                ticket.unsubscribe()
+
+        # 기준: 200개 콜백에서 5배 이상 빠르고, 색인 디스패치 비용은 전체 콜백 수가 아닌 일치하는 콜백 수에 비례함
+        assert results[200][0] / results[200][1] > 5
+        assert results[400][1] < results[40][1] * 10 * 2
@@ -0,0 +1,86 @@
+"""
+통합 계좌 조회 지연 시간 벤치마크
+로컬 모의 서버에 지연 시간을 주입하여 국내 및 해외 조회를 순차로 요청할 때와 통합 조회로 동시에 요청할 때의 지연 시간을 비교합니다
+"""
+
+import time
+from datetime import date
+
+from pykis.api.account.balance import balance, domestic_balance, foreign_balance
+from pykis.api.account.daily_order import (
+    _internal_foreign_daily_orders,
+    daily_orders,
+    domestic_daily_orders,
+)
+from pykis.api.account.pending_order import (
+    domestic_pending_orders,
+    foreign_pending_orders,
+    pending_orders,
+)
+from pykis.client.mock_server import KisMockServer
+
+LATENCY = 0.1
+
+
+def _median(fn, count: int = 5) -> float:
+    elapsed = []
+
+    for _ in range(count):
+        started = time.perf_counter()
+        fn()
+        elapsed.append(time.perf_counter() - started)
+
+    elapsed.sort()
+    return elapsed[len(elapsed) // 2]
+
+
+class TestIntegrationLatencyBenchmark:
+    """통합 계좌 조회 지연 시간 벤치마크"""
+
+    def test_benchmark_integration_queries(self):
+        """서버 지연 시간 100ms 환경에서 통합 잔고, 미체결, 체결내역 조회"""
+        today = date.today()
+
+        with KisMockServer(latency=LATENCY) as server:
+            kis = server.create_kis(use_websocket=False)
+            account = kis.primary_account
+            balance(kis, account)
+
+            cases = {
+                "잔고": (
+                    lambda: (domestic_balance(kis, account), foreign_balance(kis, account)),
+                    lambda: balance(kis, account),
+                ),
+                "미체결": (
+                    lambda: (domestic_pending_orders(kis, account), foreign_pending_orders(kis, account)),
+                    lambda: pending_orders(kis, account),
+                ),
+                "체결내역": (
+                    lambda: (
+                        domestic_daily_orders(kis, account, start=today, end=today),
+                        _internal_foreign_daily_orders(kis, account, start=today, end=today),
+                    ),
+                    lambda: daily_orders(kis, account, start=today, end=today),
+                ),
+                "중국 체결내역 (2개 시장)": (
+                    lambda: [
+                        _internal_foreign_daily_orders(kis, account, start=today, end=today, market=market)
+                        for market in ("SSE", "SZSE")
+                    ],
+                    lambda: daily_orders(kis, account, start=today, end=today, country="CN"),
+                ),
+            }
+
+            results = {name: (_median(sequential), _median(concurrent)) for name, (sequential, concurrent) in cases.items()}
+
+        print()
+
+        for name, (sequential, concurrent) in results.items():
+            print(
+                f"{name} 조회: 순차 {sequential * 1000:.1f}ms, 동시 {concurrent * 1000:.1f}ms "
+                f"({sequential / concurrent:.1f}x)"
+            )
+
+        for sequential, concurrent in results.values():
+            # 기준: 두 요청이 겹쳐 순차 요청보다 서버 지연 시간의 절반 이상 단축
+            assert concurrent + LATENCY / 2 < sequential
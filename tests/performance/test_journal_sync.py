@@ -0,0 +1,81 @@
+"""
+조회 기록 동기화 벤치마크
+로컬 모의 서버에 지연 시간을 주입하여 3개월 체결내역을 매번 전체 조회할 때와 조회 기록으로 오늘 체결내역만 조회할 때의 시간을 비교합니다
+"""
+
+import time
+from datetime import date, timedelta
+
+from pykis.api.account.daily_order import daily_orders
+from pykis.client.journal import KisJournal
+from pykis.client.mock_server import KisMockServer
+
+DAYS = 90
+ORDERS_PER_DAY = 5
+PAGE_SIZE = 20
+
+
+class TestJournalSyncBenchmark:
+    """조회 기록 동기화 벤치마크"""
+
+    def test_benchmark_incremental_sync(self):
+        """서버 지연 시간 20ms 환경에서 3개월 체결내역 450건 조회"""
+        today = date.today()
+        start = today - timedelta(days=DAYS - 1)
+
+        with KisMockServer(page_size=PAGE_SIZE) as server:
+            kis = server.create_kis(use_websocket=False)
+            account = kis.primary_account
+
+            for i in range(DAYS * ORDERS_PER_DAY):
+                server.orders.append(
+                    {
+                        "ord_dt": (start + timedelta(days=i // ORDERS_PER_DAY)).strftime("%Y%m%d"),
+                        "ord_tmd": f"09{i % ORDERS_PER_DAY:02d}00",
+                        "ord_gno_brno": "91252",
+                        "odno": f"{i + 1:010d}",
+                        "orgn_odno": "",
+                        "pdno": "005930",
+                        "prdt_name": "모의종목005930",
+                        "sll_buy_dvsn_cd": "02",
+                        "ord_dvsn_cd": "00",
+                        "ord_qty": "1",
+                        "ord_unpr": "10000",
+                        "avg_prvs": "10000",
+                        "tot_ccld_qty": "1",
+                        "tot_ccld_amt": "10000",
+                        "rmn_qty": "0",
+                        "rjct_qty": "0",
+                        "ccld_yn": "Y",
+                        "cncl_yn": "N",
+                        "excg_dvsn_cd": "02",
+                    }
+                )
+
+            with KisJournal(memory=True) as journal:
+                # 토큰 발급과 최초 동기화는 측정에서 제외합니다.
+                daily_orders(kis, account, start=start, country="KR", journal=journal)
+                server.latency = 0.02
+
+                requests = server.stats.requests
+                started = time.perf_counter()
+                full = daily_orders(kis, account, start=start, country="KR")
+                full_elapsed = time.perf_counter() - started
+                full_requests = server.stats.requests - requests
+
+                requests = server.stats.requests
+                started = time.perf_counter()
+                synced = daily_orders(kis, account, start=start, country="KR", journal=journal)
+                synced_elapsed = time.perf_counter() - started
+                synced_requests = server.stats.requests - requests
+
+        print(
+            f"\n체결내역 {len(full.orders)}건 ({DAYS}일): 전체 조회 {full_elapsed * 1000:.1f}ms ({full_requests}회 요청), "
+            f"조회 기록 {synced_elapsed * 1000:.1f}ms ({synced_requests}회 요청) ({full_elapsed / synced_elapsed:.1f}x)"
+        )
+
+        assert [order.order_number.number for order in synced.orders] == [
+            order.order_number.number for order in full.orders
+        ]
+        # 기준: 오늘 체결내역만 조회하여 전체 조회보다 5배 이상 빠름
+        assert synced_elapsed * 5 < full_elapsed
@@ -0,0 +1,57 @@
+"""
+실시간 응답 지연 변환 벤치마크
+콜백이 일부 필드만 읽을 때 즉시 변환과 지연 변환의 체결가 1건당 처리 비용을 비교합니다
+"""
+
+import time
+
+from pykis.api.websocket.price import KisDomesticRealtimePrice
+from pykis.responses.websocket import KisWebsocketResponse
+
+ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+BODY = "^".join(ROW * 4)
+
+
+def _cost(lazy: bool, count: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(count):
+        for response in KisWebsocketResponse.parse(
+            BODY,
+            count=4,
+            response_type=KisDomesticRealtimePrice,
+            lazy=lazy,
+        ):
+            # 일반적인 콜백처럼 현재가, 거래량, 체결 시간만 읽습니다.
+            response.price
+            response.volume
+            response.time
+
+    return (time.perf_counter() - start) / (count * 4)
+
+
+class TestLazyDecodingBenchmark:
+    """실시간 응답 지연 변환 벤치마크"""
+
+    def test_benchmark_lazy_vs_eager_decoding(self):
+        """H0STCNT0 4건 묶음 메시지 파싱 후 3개 필드 접근"""
+        count = 1000
+
+        _cost(False, 10)
+        _cost(True, 10)
+
+        eager = _cost(False, count)
+        lazy = _cost(True, count)
+        speedup = eager / lazy
+
+        print(f"\nH0STCNT0 3개 필드 접근: 즉시 변환 {eager * 1e6:.2f}us/tick, 지연 변환 {lazy * 1e6:.2f}us/tick ({speedup:.1f}x)")
+
+        # 기준: 지연 변환이 2배 이상 빠름 (측정 환경 편차 고려)
+        assert speedup > 2
@@ -0,0 +1,80 @@
+"""
+로컬 모의 서버 벤치마크
+로컬 모의 서버에 지연 시간을 주입하여 REST API 호출 지연 시간과 실시간 체결가 수신 처리량을 측정합니다
+"""
+
+import threading
+import time
+
+from pykis.api.stock.quote import domestic_quote
+from pykis.api.websocket.price import on_price
+from pykis.client.mock_server import KisMockServer
+
+
+class TestMockServerBenchmark:
+    """로컬 모의 서버 벤치마크"""
+
+    def test_benchmark_rest_latency(self):
+        """서버 지연 시간 20ms 환경에서 현재가 조회 15회"""
+        with KisMockServer(latency=0.02) as server:
+            kis = server.create_kis(use_websocket=False)
+            domestic_quote(kis, "005930")
+
+            elapsed = []
+
+            for _ in range(15):
+                started = time.perf_counter()
+                domestic_quote(kis, "005930")
+                elapsed.append(time.perf_counter() - started)
+
+            elapsed.sort()
+            median = elapsed[len(elapsed) // 2]
+
+            print(
+                f"\n현재가 조회 지연 시간: 중앙값 {median * 1000:.1f}ms, 최대 {elapsed[-1] * 1000:.1f}ms "
+                f"(서버 지연 20ms, 클라이언트 오버헤드 {(median - 0.02) * 1000:.1f}ms)"
+            )
+
+            assert median >= 0.02
+            # 기준: 클라이언트 유량 제한 대기를 포함한 중앙값이 서버 지연 + 100ms 미만
+            assert median < 0.12
+
+    def test_benchmark_websocket_throughput(self):
+        """로컬 웹소켓으로 체결가 5,000건 수신"""
+        ticks = 5000
+
+        with KisMockServer() as server:
+            kis = server.create_kis()
+            received = []
+            done = threading.Event()
+
+            def callback(sender, e):
+                received.append(e.response.price)
+
+                if len(received) == ticks:
+                    done.set()
+
+            ticket = on_price(kis.websocket, "KRX", "005930", callback)
+
+            try:
+                kis.websocket.ensure_connected(5)
+
+                for _ in range(500):
+                    if kis.websocket._registered_subscriptions:
+                        break
+
+                    time.sleep(0.01)
+
+                started = time.perf_counter()
+                server.publish_price("005930", 70000, count=ticks)
+
+                assert done.wait(30)
+                elapsed = time.perf_counter() - started
+            finally:
+                ticket.unsubscribe()
+                kis.websocket.disconnect()
+
+            print(f"\n체결가 {ticks:,}건 수신: {elapsed:.3f}s ({ticks / elapsed:,.0f} ticks/s)")
+
+            # 기준: 로컬 웹소켓 수신 처리량이 초당 500건 이상 (측정 환경 편차 고려)
+            assert ticks / elapsed > 500
@@ -0,0 +1,75 @@
+"""
+연속조회 페이지 스트리밍 벤치마크
+로컬 모의 서버에 지연 시간을 주입하여 전체 체결내역 조회와 페이지 단위 조회의 첫 결과 수신 시간을 비교합니다
+"""
+
+import time
+from datetime import date
+
+from pykis.api.account.daily_order import domestic_daily_orders, iter_daily_orders
+from pykis.client.mock_server import KisMockServer
+
+ORDERS = 200
+PAGE_SIZE = 20
+
+
+class TestPageStreamingBenchmark:
+    """연속조회 페이지 스트리밍 벤치마크"""
+
+    def test_benchmark_first_page_latency(self):
+        """서버 지연 시간 20ms 환경에서 체결내역 200건 (10페이지) 조회"""
+        today = date.today()
+
+        with KisMockServer(page_size=PAGE_SIZE) as server:
+            kis = server.create_kis(use_websocket=False)
+            account = kis.primary_account
+
+            for i in range(ORDERS):
+                server.orders.append(
+                    {
+                        "ord_dt": today.strftime("%Y%m%d"),
+                        "ord_tmd": f"{9 + i // 3600:02d}{i // 60 % 60:02d}{i % 60:02d}",
+                        "ord_gno_brno": "91252",
+                        "odno": f"{i + 1:010d}",
+                        "orgn_odno": "",
+                        "pdno": "005930",
+                        "prdt_name": "모의종목005930",
+                        "sll_buy_dvsn_cd": "02",
+                        "ord_dvsn_cd": "00",
+                        "ord_qty": "1",
+                        "ord_unpr": "10000",
+                        "avg_prvs": "10000",
+                        "tot_ccld_qty": "1",
+                        "tot_ccld_amt": "10000",
+                        "rmn_qty": "0",
+                        "rjct_qty": "0",
+                        "ccld_yn": "Y",
+                        "cncl_yn": "N",
+                        "excg_dvsn_cd": "02",
+                    }
+                )
+
+            # 토큰 발급은 측정에서 제외합니다.
+            domestic_daily_orders(kis, account, start=today, end=today)
+            server.latency = 0.02
+
+            started = time.perf_counter()
+            collected = domestic_daily_orders(kis, account, start=today, end=today)
+            full = time.perf_counter() - started
+
+            started = time.perf_counter()
+            pages = iter_daily_orders(kis, account, start=today, end=today, country="KR")
+            first = next(pages)
+            streamed = time.perf_counter() - started
+
+            count = sum(1 for _ in pages) + 1
+
+        print(
+            f"\n체결내역 {len(collected.orders)}건 ({count}페이지): 전체 조회 {full * 1000:.1f}ms, "
+            f"첫 페이지 수신 {streamed * 1000:.1f}ms ({full / streamed:.1f}x)"
+        )
+
+        assert len(first.orders) == PAGE_SIZE
+        assert len(collected.orders) == ORDERS
+        # 기준: 첫 페이지를 전체 조회보다 5배 이상 빨리 수신
+        assert streamed * 5 < full
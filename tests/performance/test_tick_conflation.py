@@ -0,0 +1,93 @@
+"""
+실시간 시세 병합 벤치마크
+종목별 최신 시세만 전달하는 병합 구독과 모든 체결가를 전달하는 일반 구독의 수신 스레드 비용을 비교합니다
+"""
+
+import time
+from types import SimpleNamespace
+
+from pykis.api.websocket.price import on_price
+from pykis.client.websocket import KisWebsocketClient
+
+SYMBOLS = [f"{i:06d}" for i in range(20)]
+
+ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+
+class DummyWS:
+    def send(self, data):
+        pass
+
+
+def _client() -> KisWebsocketClient:
+    kis = SimpleNamespace(
+        virtual=False,
+        approval_key=lambda domain=None, appkey=None: SimpleNamespace(approval_key="APPKEY"),
+    )
+    client = KisWebsocketClient(kis=kis, virtual=False)  # type: ignore
+    client.websocket = DummyWS()  # type: ignore
+    client._connected_event.set()
+    return client
+
+
+def _frames(rounds: int) -> list[str]:
+    # 바쁜 종목의 체결가가 4건씩 묶여 수신되는 상황
+    return [
+        "0|H0STCNT0|004|" + "^".join("^".join([symbol, *ROW[1:]]) for _ in range(4))
+        for _ in range(rounds)
+        for symbol in SYMBOLS
+    ]
+
+
+def _run(max_rate: float | None, frames: list[str]) -> tuple[float, int]:
+    client = _client()
+    received = []
+    tickets = [
+        on_price(client, "KRX", symbol, lambda sender, e: received.append(e.response.price), max_rate=max_rate)
+        for symbol in SYMBOLS
+    ]
+
+    start = time.perf_counter()
+
+    for frame in frames:
+        client._handle_event(frame)
+
+    elapsed = time.perf_counter() - start
+
+    client.conflator.flush()
+
+    for ticket in tickets:
+        ticket.unsubscribe()
+
+    client.conflator.close()
+
+    return elapsed, len(received)
+
+
+class TestTickConflationBenchmark:
+    """실시간 시세 병합 벤치마크"""
+
+    def test_benchmark_conflated_vs_regular_subscription(self):
+        """20개 종목, 종목당 4건 묶음 메시지 200회: 수신 스레드 처리 시간과 콜백 호출 수"""
+        frames = _frames(200)
+        ticks = len(frames) * 4
+
+        regular_elapsed, regular_calls = _run(None, frames)
+        conflated_elapsed, conflated_calls = _run(10, frames)
+        speedup = regular_elapsed / conflated_elapsed
+
+        print(
+            f"\n{ticks:,} ticks: 일반 {ticks / regular_elapsed:,.0f} ticks/s (콜백 {regular_calls:,}회), "
+            f"병합 {ticks / conflated_elapsed:,.0f} ticks/s (콜백 {conflated_calls:,}회, {speedup:.1f}x)"
+        )
+
+        assert regular_calls == ticks
+        assert len(SYMBOLS) <= conflated_calls < ticks / 10
+        # 기준: 병합 구독의 수신 스레드 처리 시간이 5배 이상 짧음 (측정 환경 편차 고려)
+        assert speedup > 5
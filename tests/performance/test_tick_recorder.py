@@ -0,0 +1,78 @@
+"""
+실시간 메시지 기록 벤치마크
+원본 메시지를 메모리 맵 세그먼트에 기록하는 경우와 파싱한 객체를 pickle로 저장하는 경우의 비용을 비교합니다
+"""
+
+import pickle
+import time
+
+from pykis.api.websocket.price import KisDomesticRealtimePrice
+from pykis.client.recorder import KisWebsocketRecorder, KisWebsocketRecordReader
+from pykis.responses.websocket import KisWebsocketResponse
+
+SYMBOLS = [f"{i:06d}" for i in range(20)]
+
+ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+
+def _messages(rounds: int) -> list[str]:
+    return [
+        "0|H0STCNT0|004|" + "^".join("^".join([symbol, *ROW[1:]]) for _ in range(4))
+        for _ in range(rounds)
+        for symbol in SYMBOLS
+    ]
+
+
+class TestTickRecorderBenchmark:
+    """실시간 메시지 기록 벤치마크"""
+
+    def test_benchmark_record_vs_pickle(self, tmp_path):
+        """20개 종목, 4건 묶음 메시지 100회 기록 및 종목별 조회"""
+        messages = _messages(100)
+        ticks = len(messages) * 4
+
+        start = time.perf_counter()
+
+        with open(tmp_path / "ticks.pickle", "wb") as file:
+            for message in messages:
+                _, _, count, body = message.split("|", 3)
+
+                for response in KisWebsocketResponse.parse(
+                    body,
+                    count=int(count),
+                    response_type=KisDomesticRealtimePrice,
+                ):
+                    pickle.dump(response, file)
+
+        pickle_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+
+        with KisWebsocketRecorder(tmp_path / "capture") as recorder:
+            for i, message in enumerate(messages):
+                recorder.put(message, timestamp=i)
+
+        record_elapsed = time.perf_counter() - start
+        speedup = pickle_elapsed / record_elapsed
+
+        start = time.perf_counter()
+
+        with KisWebsocketRecordReader(tmp_path / "capture") as reader:
+            rows = sum(1 for _ in reader.rows(symbol=SYMBOLS[3]))
+
+        read_elapsed = time.perf_counter() - start
+
+        print(
+            f"\n{ticks:,} ticks: pickle {ticks / pickle_elapsed:,.0f} ticks/s, "
+            f"기록 {ticks / record_elapsed:,.0f} ticks/s ({speedup:.1f}x), "
+            f"종목별 조회 {read_elapsed * 1000:.2f}ms (색인 로드 포함)"
+        )
+
+        assert rows == 400
+        # 기준: 원본 메시지 기록이 파싱 후 pickle 저장보다 3배 이상 빠름 (측정 환경 편차 고려)
+        assert speedup > 3
@@ -0,0 +1,109 @@
+"""
+변환 필드 캐시 벤치마크
+KisObject.transform_()가 타입별 변환 필드 목록을 재사용할 때의 성능을 측정합니다
+"""
+
+import time
+from decimal import Decimal
+
+from pykis.responses.dynamic import KisDynamic, KisObject, _field_plans, get_field_plan
+from pykis.responses.types import KisDecimal, KisInt, KisString
+
+
+class MockOrderRow(KisDynamic):
+    """모의 주문 내역 행 (20개 필드)"""
+
+    order_number: str = KisString["odno"]
+    original_order_number: str = KisString["orgn_odno"]
+    symbol: str = KisString["pdno"]
+    name: str = KisString["prdt_name"]
+    type: str = KisString["sll_buy_dvsn_cd"]
+    order_type: str = KisString["ord_dvsn_cd"]
+    quantity: Decimal = KisDecimal["ord_qty"]
+    price: Decimal = KisDecimal["ord_unpr"]
+    executed_quantity: Decimal = KisDecimal["tot_ccld_qty"]
+    executed_amount: Decimal = KisDecimal["tot_ccld_amt"]
+    average_price: Decimal = KisDecimal["avg_prvs"]
+    pending_quantity: Decimal = KisDecimal["rmn_qty"]
+    rejected_quantity: Decimal = KisDecimal["rjct_qty"]
+    cancelled: str = KisString["cncl_yn"]
+    branch: str = KisString["ord_gno_brno"]
+    order_date: str = KisString["ord_dt"]
+    order_time: str = KisString["ord_tmd"]
+    condition: str = KisString["ccld_cndt_name"]
+    exchange: str = KisString["excg_id_dvsn_cd"]
+    sequence: int = KisInt["seq"]
+
+
+ROW = {
+    "odno": "0000012345",
+    "orgn_odno": "",
+    "pdno": "005930",
+    "prdt_name": "삼성전자",
+    "sll_buy_dvsn_cd": "02",
+    "ord_dvsn_cd": "00",
+    "ord_qty": "10",
+    "ord_unpr": "70000",
+    "tot_ccld_qty": "10",
+    "tot_ccld_amt": "700000",
+    "avg_prvs": "70000",
+    "rmn_qty": "0",
+    "rjct_qty": "0",
+    "cncl_yn": "N",
+    "ord_gno_brno": "06010",
+    "ord_dt": "20240101",
+    "ord_tmd": "090000",
+    "ccld_cndt_name": "없음",
+    "excg_id_dvsn_cd": "KRX",
+    "seq": "1",
+}
+
+PAGE = [dict(ROW, seq=str(i)) for i in range(100)]
+
+
+def _parse_page() -> list[MockOrderRow]:
+    return [KisObject.transform_(row, MockOrderRow) for row in PAGE]
+
+
+def _elapsed(fn, count: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(count):
+        fn()
+
+    return time.perf_counter() - start
+
+
+class TestTransformPlanBenchmark:
+    """변환 필드 캐시 벤치마크"""
+
+    def test_field_plan_is_cached_per_type(self):
+        plan = get_field_plan(MockOrderRow)
+
+        assert get_field_plan(MockOrderRow) is plan
+        assert len(plan) == 20
+        assert {field.name for field in plan} >= {"order_number", "sequence"}
+
+    def test_benchmark_cached_plan_speedup(self):
+        """100행 페이지 변환: 매번 필드를 탐색하는 경우와 캐시된 필드 목록을 사용하는 경우"""
+        count = 30
+
+        def uncached():
+            # 기존 구현처럼 변환마다 MRO 어노테이션과 dir()을 탐색합니다.
+            for row in PAGE:
+                _field_plans.pop(MockOrderRow, None)
+                KisObject.transform_(row, MockOrderRow)
+
+        _parse_page()
+        uncached_elapsed = _elapsed(uncached, count)
+        cached_elapsed = _elapsed(_parse_page, count)
+        speedup = uncached_elapsed / cached_elapsed
+
+        print(
+            f"\n100행 변환: 필드 탐색 {uncached_elapsed / count * 1000:.2f}ms/page, "
+            f"캐시 {cached_elapsed / count * 1000:.2f}ms/page ({speedup:.1f}x)"
+        )
+
+        assert _parse_page()[99].sequence == 99
+        # 기준: 캐시된 필드 목록 사용 시 2배 이상 빠름 (측정 환경 편차 고려)
+        assert speedup > 2
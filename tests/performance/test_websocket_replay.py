@@ -0,0 +1,82 @@
+"""
+실시간 메시지 재생 벤치마크
+기록된 장 시작 체결가를 최대 속도로 재생하여 파싱, 이벤트 디스패치, 콜백을 포함한 전체 처리량을 측정합니다
+"""
+
+from types import SimpleNamespace
+
+from pykis.api.websocket.price import on_price
+from pykis.client.recorder import KisWebsocketRecorder
+from pykis.client.replay import KisWebsocketReplay
+from pykis.client.websocket import KisWebsocketClient
+
+SYMBOLS = [f"{i:06d}" for i in range(20)]
+
+ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+
+def _record(path, rounds: int) -> int:
+    # 장 시작 직후 20개 종목의 체결가가 4건씩 묶여 1ms 간격으로 수신되는 상황
+    with KisWebsocketRecorder(path) as recorder:
+        for i in range(rounds):
+            for j, symbol in enumerate(SYMBOLS):
+                recorder.put(
+                    "0|H0STCNT0|004|" + "^".join("^".join([symbol, *ROW[1:]]) for _ in range(4)),
+                    timestamp=1704155400 + (i * len(SYMBOLS) + j) * 0.001,
+                )
+
+        return recorder.rows
+
+
+def _replay(path, lazy: bool) -> tuple[float, int]:
+    client = KisWebsocketClient(
+        kis=SimpleNamespace(virtual=False),  # type: ignore
+        virtual=False,
+    )
+    client.lazy = lazy
+
+    replay = KisWebsocketReplay(path, speed=None)
+    replay.attach(client)
+
+    received = []
+    tickets = [
+        on_price(client, "KRX", symbol, lambda sender, e: received.append(e.response.price))
+        for symbol in SYMBOLS
+    ]
+
+    stats = replay.run(client)
+
+    for ticket in tickets:
+        ticket.unsubscribe()
+
+    client.conflator.close()
+
+    return stats.elapsed, len(received)
+
+
+class TestWebsocketReplayBenchmark:
+    """실시간 메시지 재생 벤치마크"""
+
+    def test_benchmark_replay_throughput(self, tmp_path):
+        """20개 종목, 4건 묶음 메시지 200회 (16,000 ticks) 최대 속도 재생"""
+        ticks = _record(tmp_path, 200)
+
+        _replay(tmp_path, False)
+
+        eager, eager_received = _replay(tmp_path, False)
+        lazy, lazy_received = _replay(tmp_path, True)
+
+        print(
+            f"\n{ticks:,} ticks 재생: 즉시 변환 {ticks / eager:,.0f} ticks/s, "
+            f"지연 변환 {ticks / lazy:,.0f} ticks/s ({eager / lazy:.1f}x)"
+        )
+
+        assert eager_received == lazy_received == ticks
+        # 기준: 서버 없이 재생한 전체 처리량이 초당 1,000건 이상 (측정 환경 편차 고려)
+        assert ticks / eager > 1000
@@ -481,5 +481,58 @@ class TestWebSocketResilience:
         assert result.success_count >= 1
 
 
+DOMESTIC_PRICE_ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+
+class TestWebSocketParseThroughput:
+    """WebSocket 실시간 체결가 파싱 처리량"""
+
+    def test_parse_throughput(self):
+        """H0STCNT0 4건 묶음 메시지 파싱: 매번 파서를 생성하는 경우와 캐시된 파서를 사용하는 경우"""
+        from pykis.api.websocket.price import KisDomesticRealtimePrice
+        from pykis.responses.websocket import KisWebsocketResponse, _parsers
+
+        body = "^".join(DOMESTIC_PRICE_ROW * 4)
+        count = 500
+
+        def parse():
+            return list(KisWebsocketResponse.parse(body, count=4, response_type=KisDomesticRealtimePrice))
+
+        def uncached():
+            _parsers.pop(KisDomesticRealtimePrice, None)
+            return parse()
+
+        rows = parse()
+        assert len(rows) == 4
+        assert rows[0].symbol == "005930"
+        assert rows[0].volume == 1234567
+        assert rows[0].condition is None
+
+        start = time.perf_counter()
+        for _ in range(count):
+            uncached()
+        uncached_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(count):
+            parse()
+        cached_elapsed = time.perf_counter() - start
+
+        ticks = count * 4
+        print(
+            f"\nH0STCNT0 파싱: 파서 생성 {ticks / uncached_elapsed:,.0f} ticks/s, "
+            f"캐시 {ticks / cached_elapsed:,.0f} ticks/s"
+        )
+
+        # 기준: 캐시된 파서가 매번 생성하는 경우보다 느리지 않아야 함 (측정 환경 편차 고려)
+        assert cached_elapsed < uncached_elapsed
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
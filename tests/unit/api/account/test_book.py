@@ -0,0 +1,227 @@
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from pykis.api.account.balance import orderable_quantity
+from pykis.api.account.book import (
+    KisAccountBook,
+    KisAccountBookPosition,
+    book,
+    get_book,
+)
+from pykis.api.account.order import domestic_order
+from pykis.client.account import KisAccountNumber
+from pykis.client.mock_server import KisMockServer
+from pykis.scope.stock import KisStockScope
+
+ACCOUNT = KisAccountNumber("12345678-01")
+
+
+def _execution(
+    type="buy",
+    quantity=10,
+    executed_quantity=0,
+    price=100,
+    order_number="1",
+    receipt=False,
+    canceled=False,
+    rejected=False,
+    symbol="005930",
+    market="KRX",
+    account_number=ACCOUNT,
+):
+    return SimpleNamespace(
+        account_number=account_number,
+        symbol=symbol,
+        market=market,
+        type=type,
+        price=Decimal(price),
+        quantity=quantity,
+        executed_quantity=executed_quantity,
+        executed_amount=Decimal(price) * executed_quantity,
+        receipt=receipt,
+        canceled=canceled,
+        rejected=rejected,
+        order_number=order_number,
+    )
+
+
+def _book(**positions: tuple[int, int, int]) -> KisAccountBook:
+    book = KisAccountBook(SimpleNamespace(), ACCOUNT, reconcile_interval=None)  # type: ignore
+
+    for symbol, (quantity, orderable, amount) in positions.items():
+        book._positions[symbol] = KisAccountBookPosition("KRX", symbol, quantity, orderable, Decimal(amount))
+
+    book._deposits["KRW"] = Decimal(10000)
+    return book
+
+
+def test_apply_buy_and_sell():
+    book = _book()
+
+    assert book.apply(_execution("buy", receipt=True))
+    assert book.apply(_execution("buy", executed_quantity=10, price=100))
+
+    assert book.quantity("005930") == 10
+    assert book.orderable("005930") == 10
+    assert book.purchase_amount("005930") == 1000
+    assert book.deposit("KRW") == 9000
+
+    # 매도 접수 시 매도가능수량을 예약하고, 체결 시 예약 수량에서 차감합니다.
+    book.apply(_execution("sell", quantity=6, order_number="2", receipt=True))
+    assert book.quantity("005930") == 10
+    assert book.orderable("005930") == 4
+
+    book.apply(_execution("sell", quantity=6, executed_quantity=4, price=120, order_number="2"))
+    position = book.position("005930")
+    assert position is not None
+    assert (position.quantity, position.orderable, position.purchase_amount) == (6, 4, 600)
+    assert book.deposit("KRW") == 9480
+
+    # 취소 시 체결되지 않은 예약 수량을 되돌립니다.
+    book.apply(_execution("sell", quantity=2, order_number="2", canceled=True))
+    assert book.orderable("005930") == 6
+
+    book.apply(_execution("sell", quantity=6, executed_quantity=6, price=100, order_number="3"))
+    assert book.position("005930") is None
+    assert book.quantity("005930") == 0
+
+    assert book.stats.executions == 3
+    assert book.stats.receipts == 3
+
+
+def test_apply_ignores_other_accounts_and_countries():
+    book = _book(AAPL=(1, 1, 100))
+    book.country = "KR"
+
+    assert not book.apply(_execution(executed_quantity=1, account_number=KisAccountNumber("87654321-01")))
+    assert not book.apply(_execution(executed_quantity=1, symbol="AAPL", market="NASDAQ"))
+    assert not book.apply(_execution(executed_quantity=0))
+    assert book.positions == {"AAPL": KisAccountBookPosition("KRX", "AAPL", 1, 1, Decimal(100))}
+
+
+def test_reject_restores_reserved_orderable():
+    book = _book(**{"005930": (5, 5, 500)})
+
+    book.apply(_execution("sell", quantity=3, receipt=True))
+    assert book.orderable("005930") == 2
+
+    book.apply(_execution("sell", quantity=3, rejected=True))
+    assert book.orderable("005930") == 5
+    assert not book._reserved
+
+
+@pytest.mark.parametrize("included", [False, True])
+def test_reconcile_replays_executions_missing_from_snapshot(monkeypatch, included):
+    book = _book(**{"005930": (5, 5, 500)})
+    book._stats.reconciliations = 1
+
+    def balance(*args, **kwargs):
+        # 잔고 조회 중 체결 통보를 수신합니다.
+        book.apply(_execution("buy", executed_quantity=3, price=100))
+        quantity = 8 if included else 5
+
+        return SimpleNamespace(
+            stocks=[
+                SimpleNamespace(
+                    market="KRX",
+                    symbol="005930",
+                    quantity=quantity,
+                    orderable=quantity,
+                    purchase_amount=Decimal(quantity * 100),
+                )
+            ],
+            deposits={"KRW": SimpleNamespace(amount=Decimal(9700 if included else 10000))},
+        )
+
+    monkeypatch.setattr("pykis.api.account.book.balance", balance)
+
+    # 조회 결과에 반영되지 않은 통보는 다시 반영하고, 반영된 통보는 중복 반영하지 않습니다.
+    assert book.reconcile() == 0
+    assert book.positions == {"005930": KisAccountBookPosition("KRX", "005930", 8, 8, Decimal(800))}
+    assert book.deposit("KRW") == 9700
+    assert book._inflight is None
+
+
+def test_book_replaces_running_book_for_other_country(monkeypatch):
+    started = []
+
+    def start(self):
+        self._ticket = SimpleNamespace(unsubscribe=lambda: None)
+        started.append(self)
+        return self
+
+    monkeypatch.setattr(KisAccountBook, "start", start)
+    kis = SimpleNamespace(books={})
+
+    us = book(kis, ACCOUNT, country="US", reconcile_interval=None)  # type: ignore
+    assert book(kis, ACCOUNT, country="US", reconcile_interval=None) is us  # type: ignore
+
+    # 다른 국가를 요청하면 국내 및 해외 잔고를 모두 관리하는 장부로 교체합니다.
+    both = book(kis, ACCOUNT, country="KR", reconcile_interval=None)  # type: ignore
+    assert both is not us and not us.running
+    assert both.country is None
+    assert get_book(kis, ACCOUNT, "KR") is both  # type: ignore
+    assert get_book(kis, ACCOUNT, "US") is both  # type: ignore
+    assert book(kis, ACCOUNT, country="US", reconcile_interval=None) is both  # type: ignore
+    assert started == [us, both]
+
+
+@pytest.fixture
+def server():
+    with KisMockServer(seed=0) as server:
+        yield server
+
+
+def test_book_with_mock_server(server):
+    kis = server.create_kis()
+    account = kis.primary_account
+    server.prices["005930"] = 70000
+
+    domestic_order(kis, account, "005930", "buy", price=70000, qty=3)
+
+    try:
+        account_book = book(kis, account, country="KR", reconcile_interval=None)
+
+        assert book(kis, account, country="KR") is account_book
+        assert get_book(kis, account, "KR") is account_book
+        assert get_book(kis, account, "US") is None
+        assert account_book.quantity("005930") == 3
+
+        kis.websocket.ensure_connected(5)
+
+        for _ in range(500):
+            if len(kis.websocket._registered_subscriptions) == 2:
+                break
+
+            threading.Event().wait(0.01)
+
+        domestic_order(kis, account, "005930", "buy", price=70000, qty=2)
+
+        for _ in range(500):
+            if account_book.quantity("005930") == 5:
+                break
+
+            threading.Event().wait(0.01)
+
+        # 장부가 실행 중이면 잔고를 조회하지 않습니다.
+        requests = server.stats.requests
+        stock = KisStockScope(kis=kis, symbol="005930", market="KRX", account=account)
+        assert account_book.quantity("005930") == 5
+        assert (stock.quantity, stock.orderable, stock.purchase_amount) == (5, 5, 350000)
+        assert orderable_quantity(kis, account, "005930", country="KR") == 5
+        assert server.stats.requests == requests
+
+        positions = account_book.positions
+        # 모의 서버는 예수금이 고정되어 있으므로 예수금만 교정됩니다.
+        assert account_book.reconcile() == 1
+        assert account_book.positions == positions
+        assert account_book.stats.executions == 1
+    finally:
+        account_book.stop()
+        kis.websocket.disconnect()
+
+    assert not account_book.running
+    assert get_book(kis, account, "KR") is None
@@ -120,3 +120,47 @@ def test_order_profits_routes_and_integration(monkeypatch):
     # other country -> foreign
     res3 = op.order_profits(kis, account="12345678", start=date(2024, 1, 1), end=date(2024, 1, 2), country="US")
     assert res3 is fori
+
+
+def test_order_profits_with_journal(monkeypatch):
+    from pykis.client.journal import KisJournal
+
+    calls = []
+
+    def fetch(country):
+        def fetch(*a, start, end, **k):
+            calls.append((country or k.get("country"), start, end))
+            return types.SimpleNamespace(
+                orders=[
+                    types.SimpleNamespace(time_kst=datetime(2024, 1, 2), profit=Decimal(1)),
+                    types.SimpleNamespace(time_kst=datetime(2024, 1, 3), profit=Decimal(2)),
+                ],
+                fees=Decimal("5"),
+            )
+
+        return fetch
+
+    monkeypatch.setattr(op, "domestic_order_profits", fetch("KR"))
+    monkeypatch.setattr(op, "foreign_order_profits", fetch(None))
+    monkeypatch.setattr(op, "foreign_order_fees", lambda *a, **k: Decimal("3"))
+
+    with KisJournal(memory=True) as journal:
+        res = op.order_profits(object(), account="12345678", start=date(2024, 1, 1), end=date(2024, 1, 3), journal=journal)
+        assert isinstance(res, op.KisJournalOrderProfits)
+        assert [order.profit for order in res.orders] == [2, 2, 1, 1]
+
+        # 확정된 기간은 다시 조회하지 않습니다.
+        res = op.order_profits(object(), account="12345678", start=date(2024, 1, 1), end=date(2024, 1, 3), country="US", journal=journal)
+        assert isinstance(res, op.KisForeignOrderProfits)
+        assert [order.profit for order in res.orders] == [2, 1]
+        assert res.fees == Decimal("3")
+        assert sorted(calls, key=str) == [
+            ("KR", date(2024, 1, 1), date(2024, 1, 3)),
+            ("US", date(2024, 1, 1), date(2024, 1, 3)),
+            (None, date(2024, 1, 1), date(2024, 1, 3)),
+        ]
+
+        res = op.order_profits(object(), account="12345678", start=date(2024, 1, 1), end=date(2024, 1, 3), country="KR", journal=journal)
+        assert isinstance(res, op.KisDomesticOrderProfits)
+        assert [order.profit for order in res.orders] == [2, 1]
+        assert res.fees == Decimal("5")
@@ -64,3 +64,28 @@ def test_websocket_approval_key_uses_virtual_when_present(monkeypatch):
     body = kis.last.get("body")
     assert body["appkey"] == "VAPP"
     assert body["secretkey"] == "VSEC"
+
+
+def test_approval_key_expiry_and_save_load_roundtrip(tmp_path):
+    from datetime import datetime, timedelta
+
+    from pykis.responses.dynamic import KisObject
+    from pykis.utils.timezone import TIMEZONE
+
+    key = KisObject.transform_({"approval_key": "KEY"}, ws.KisWebsocketApprovalKey)
+
+    assert not key.expired
+    assert timedelta(hours=23) < key.remaining <= timedelta(hours=24)
+
+    path = tmp_path / "approval.json"
+    key.save(path)
+    loaded = ws.KisWebsocketApprovalKey.load(path)
+
+    assert loaded.approval_key == "KEY"
+    assert loaded.issued_at == key.issued_at
+
+    old = KisObject.transform_(
+        {"approval_key": "OLD", "issued_at": (datetime.now(TIMEZONE) - timedelta(days=2)).isoformat()},
+        ws.KisWebsocketApprovalKey,
+    )
+    assert old.expired
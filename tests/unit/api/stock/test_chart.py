@@ -2,6 +2,8 @@ from datetime import datetime, date, time
 from decimal import Decimal
 import sys
 
+import pytest
+
 from pykis.api.stock import chart
 
 
@@ -103,6 +105,14 @@ def test_df_importerror_and_success(monkeypatch):
             def DataFrame(obj):
                 return {k: v for k, v in obj.items()}
 
+            @staticmethod
+            def DatetimeIndex(values, dtype=None):
+                return list(values)
+
+            @staticmethod
+            def DatetimeTZDtype(unit, tz):
+                return (unit, tz)
+
         monkeypatch.setitem(sys.modules, "pandas", FakePD())
         df = c.df()
         assert "time" in df and "open" in df
@@ -110,3 +120,177 @@ def test_df_importerror_and_success(monkeypatch):
         # restore pandas if it was present
         if "_pandas_backup" in sys.modules:
             monkeypatch.setitem(sys.modules, "pandas", sys.modules.pop("_pandas_backup"))
+
+
+FOREIGN_ROWS = [
+    {"xymd": "20231201", "open": "150.50", "clos": "152.00", "high": "153.00", "low": "149.50",
+     "tvol": "5000000", "tamt": "756000000", "diff": "1.50", "sign": "2"},
+    {"xymd": "20231130", "open": "149.00", "clos": "150.50", "high": "151.00", "low": "148.50",
+     "tvol": "4800000", "tamt": "720000000", "diff": "-0.50", "sign": "5"},
+    {"xymd": "20231129", "open": "148.00", "clos": "151.00", "high": "151.25", "low": "147.50",
+     "tvol": "4500000", "tamt": "670000000", "diff": "1.0625", "sign": "2"},
+]
+
+
+def _foreign_columns():
+    from pykis.api.stock.daily_chart import KisForeignColumnarDailyChart
+
+    return KisForeignColumnarDailyChart.bars.transform(FOREIGN_ROWS)
+
+
+def test_column_list_matches_object_bars():
+    """Columnar bars expose the same values as bars transformed one by one."""
+    from pykis.api.stock.daily_chart import KisForeignDailyChartBar
+    from pykis.responses.dynamic import KisObject
+
+    columns = _foreign_columns()
+
+    assert len(columns) == 3
+    assert columns.nbytes == 3 * (8 * 8 + 1)
+
+    for row, bar in zip(FOREIGN_ROWS, columns):
+        expected = KisObject.transform_(row, KisForeignDailyChartBar)
+
+        for key in ("open", "high", "low", "close", "volume", "amount", "change", "sign", "price", "prev_price"):
+            assert getattr(bar, key) == getattr(expected, key), key
+
+        assert bar.time.date() == expected.time.date()
+
+    assert columns[-1].change == Decimal("1.0625")
+    assert columns[0] == columns[0] and columns[0] != columns[1]
+
+    with pytest.raises(IndexError):
+        columns[3]
+
+
+def test_columns_slice_take_extend_and_scale():
+    """Slicing, take and extend keep the columnar storage."""
+    columns = _foreign_columns()
+
+    ascending = columns[::-1]
+    assert isinstance(ascending, chart.KisChartColumns)
+    assert [bar.time.day for bar in ascending] == [29, 30, 1]
+    assert [bar.time.day for bar in reversed(ascending)] == [1, 30, 29]
+
+    taken = columns.take([2, 0])
+    taken.extend(columns[1:2])
+    assert [bar.volume for bar in taken] == [4500000, 5000000, 4800000]
+
+    scaled = chart.KisChartColumns.from_bars(list(columns), timezone=columns.timezone, scale=2)
+    assert scaled.time == columns.time
+    assert str(scaled[0].open) == "150.50"
+    assert str(scaled[2].change) == "1.06"
+    # 소수점 자릿수를 지정하면 가격을 정수로 저장합니다.
+    assert scaled.open.typecode == "q"
+    assert list(scaled.close) == [15200, 15050, 15100]
+
+    # 소수점 자릿수가 다른 차트는 봉 단위로 변환하여 추가합니다.
+    scaled.extend(columns[:1])
+    assert scaled[-1].close == Decimal("152.00")
+    assert scaled.open[-1] == 15050
+
+
+def test_column_list_with_scale():
+    """Columnar transform with a scale stores prices as fixed-point integers."""
+    columns = chart.KisChartColumnList(
+        "xymd", "open", "high", "low", "clos", "tvol", "tamt", "diff", "sign", scale=4
+    ).transform(FOREIGN_ROWS)
+
+    assert columns.change.typecode == "q"
+    assert list(columns.change) == [15000, -5000, 10625]
+    assert columns[2].change == Decimal("1.0625")
+    assert columns[0].amount == Decimal("756000000")
+
+
+def test_chart_base_with_columns():
+    """KisChartBase indexing and columns() work on columnar bars."""
+    from pykis.api.stock.daily_chart import drop_after
+
+    c = _make_chart(_foreign_columns())
+    c.timezone = c.bars.timezone
+
+    c = drop_after(c, start=date(2023, 11, 30), end=date(2023, 12, 1))
+    assert [bar.time.date() for bar in c] == [date(2023, 11, 30), date(2023, 12, 1)]
+    assert c[date(2023, 12, 1)].close == Decimal("152")
+    assert c.index(date(2023, 12, 1)) == 1
+    assert c.columns() is c.bars
+
+    bars = [_Bar(datetime(2020, 1, 1, 9), "1", "2", "1", "1.5", 10, "100", "0")]
+    bars[0].sign = "steady"
+    converted = _make_chart(bars).columns()
+    assert converted[0].close == Decimal("1.5")
+    assert converted[0].time == datetime(2020, 1, 1, 9, tzinfo=converted.timezone)
+
+
+def test_columns_df():
+    """`df()` builds the DataFrame from the column buffers."""
+    pd = pytest.importorskip("pandas")
+
+    df = _make_chart(_foreign_columns()[::-1]).df()
+
+    assert isinstance(df, pd.DataFrame)
+    assert list(df["close"]) == [151.0, 150.5, 152.0]
+    assert list(df["volume"]) == [4500000, 4800000, 5000000]
+
+    # 봉 목록 차트와 같은 시간 형식으로 변환합니다.
+    objects = _make_chart(list(_foreign_columns()[::-1]))
+    objects.timezone = df["time"].dt.tz
+    assert df["time"].dtype == objects.df()["time"].dtype
+    assert list(df["time"]) == list(objects.df()["time"])
+
+
+def test_columns_df_shares_memory_read_only():
+    """The DataFrame shares read-only buffers and blocks resizing while alive."""
+    pytest.importorskip("pandas")
+
+    columns = _foreign_columns()
+    df = columns.df()
+
+    with pytest.raises(ValueError):
+        df.loc[0, "open"] = 999
+
+    assert columns[0].open == Decimal("150.50")
+
+    # 실패한 추가는 모든 열을 원래 길이로 되돌립니다.
+    with pytest.raises(BufferError, match="DataFrame"):
+        columns.append(columns[0])
+
+    with pytest.raises(BufferError):
+        columns.extend(list(columns))
+
+    assert {len(column) for column in columns._columns()} == {3}
+
+    del df
+    columns.append(columns[0])
+    assert len(columns) == 4
+
+
+def test_slice_bisect_and_cache_invalidation():
+    """Time range slicing uses cached keys and falls back to a scan for unordered time-of-day keys."""
+    bars = [
+        _Bar(datetime(2020, 1, day, hour), "1", "2", "1", "1.5", day * 100 + hour, "100", "0")
+        for day in (1, 2, 3)
+        for hour in (9, 10, 11)
+    ]
+    c = _make_chart(bars)
+
+    assert c[datetime(2020, 1, 1, 10) : datetime(2020, 1, 2, 9)] == bars[1:4]
+    assert c[date(2020, 1, 2) : date(2020, 1, 3)] == bars[3:]
+    assert c[datetime(2020, 1, 4) : datetime(2020, 1, 5)] == []
+    # 여러 날의 분봉을 시각으로 자르는 경우
+    assert [bar.volume for bar in c[time(10) : time(11)]] == [110, 111, 210, 211, 310, 311]
+
+    keys = c._time_keys("datetime", False)
+    assert c._time_keys("datetime", False) is keys
+
+    c.bars = bars[:3]
+    assert c._time_keys("datetime", False) is not keys
+    assert c.index(datetime(2020, 1, 1, 11)) == 2
+    assert c[date(2020, 1, 1) : date(2020, 1, 1)] == bars[:3]
+
+    try:
+        c[datetime(2020, 1, 1) : 3]
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Expected TypeError for mixed slice")
@@ -0,0 +1,99 @@
+from datetime import date, timedelta
+
+import pytest
+
+from pykis.api.stock.chart_store import KisChartStore, KisStoredChart
+from pykis.api.stock.daily_chart import daily_chart
+from pykis.client.exceptions import KisHTTPError
+from pykis.client.mock_server import KisMockServer
+
+
+@pytest.fixture
+def server():
+    with KisMockServer(seed=0) as server:
+        yield server
+
+
+def _closes(chart) -> list:
+    return [bar.close for bar in chart.bars]
+
+
+def test_chart_fills_gaps(server):
+    kis = server.create_kis(use_websocket=False)
+    store = KisChartStore(kis, memory=True)
+
+    chart = store.chart("005930", "KRX", start=date(2024, 3, 1), end=date(2024, 4, 30))
+    assert isinstance(chart, KisStoredChart)
+    assert _closes(chart) == _closes(daily_chart(kis, "005930", "KRX", start=date(2024, 3, 1), end=date(2024, 4, 30)))
+    assert store.synced("005930", "KRX") == (date(2024, 3, 1), date(2024, 4, 30))
+
+    # 저장된 기간의 앞뒤 기간만 조회하여 병합합니다.
+    chart = store.chart("005930", "KRX", start=date(2024, 1, 1), end=date(2024, 6, 30))
+    expected = daily_chart(kis, "005930", "KRX", start=date(2024, 1, 1), end=date(2024, 6, 30), columnar=True)
+    assert list(chart.bars.time) == list(expected.bars.time)  # type: ignore
+    assert _closes(chart) == _closes(expected)
+    assert store.synced("005930", "KRX") == (date(2024, 1, 1), date(2024, 6, 30))
+    assert store.stats.fetches == 3
+
+    requests = server.stats.requests
+    chart = store.chart("005930", "KRX", start=date(2024, 2, 1), end=date(2024, 2, 29))
+    assert chart.bars[0].time.date() == date(2024, 2, 1)
+    assert chart.bars[-1].time.date() == date(2024, 2, 29)
+    assert server.stats.requests == requests
+    assert store.stats.hits == 1
+
+    # 수정주가 여부별로 따로 저장합니다.
+    assert store.synced("005930", "KRX", adjust=True) is None
+
+
+def test_chart_refetches_unsettled_bars(server):
+    kis = server.create_kis(use_websocket=False)
+    store = KisChartStore(kis, memory=True)
+    today = date.today()
+
+    store.chart("005930", "KRX", start=timedelta(days=30))
+    assert store.synced("005930", "KRX") == (today - timedelta(days=30), today - timedelta(days=1))
+
+    requests = server.stats.requests
+    store.chart("005930", "KRX", start=timedelta(days=30))
+    assert server.stats.requests == requests + 1
+
+    store.chart("005930", "KRX", start=timedelta(days=30), period="month")
+    assert store.synced("005930", "KRX", period="month") == (today - timedelta(days=30), today.replace(day=1) - timedelta(days=1))
+
+
+def test_store_persists_to_disk(server, tmp_path):
+    kis = server.create_kis(use_websocket=False)
+    store = KisChartStore(kis, tmp_path)
+    chart = store.chart("005930", "KRX", start=date(2024, 1, 1), end=date(2024, 6, 30))
+
+    requests = server.stats.requests
+    reloaded = KisChartStore(kis, tmp_path).chart("005930", "KRX", start=date(2024, 1, 1), end=date(2024, 6, 30))
+    assert server.stats.requests == requests
+    assert list(reloaded.bars.time) == list(chart.bars.time)
+    assert list(reloaded.bars.close) == list(chart.bars.close)
+    assert reloaded.bars.timezone == chart.bars.timezone
+
+    # 손상된 파일은 저장되지 않은 것으로 간주합니다.
+    (tmp_path / "KRX" / "005930.day.bin").write_bytes(b"KISC")
+    assert KisChartStore(kis, tmp_path).synced("005930", "KRX") is None
+
+    store.clear()
+    assert not list(tmp_path.glob("*/*.bin"))
+
+
+def test_download(server):
+    kis = server.create_kis(use_websocket=False)
+    store = KisChartStore(kis, memory=True)
+    symbols = ["005930", "000660", "035720"]
+
+    server.inject("EGW00500", path="/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice")
+    results = store.download(symbols, "KRX", start=date(2024, 1, 1), end=date(2024, 3, 31), max_workers=1)
+
+    assert list(results) == symbols
+    assert isinstance(results["005930"].error, KisHTTPError)
+    assert [len(results[symbol].unwrap()) for symbol in symbols[1:]] == [65, 65]
+
+    results = store.download(symbols, "KRX", start=date(2024, 1, 1), end=date(2024, 3, 31))
+    assert all(result.ok for result in results.values())
+    assert store.stats.fetches == 3
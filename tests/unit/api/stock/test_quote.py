@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock, patch
+
+from pykis.api.stock import quote as quote_mod
+
+
+def _fake_quote(self, symbol, market, extended=False):
+    if symbol == "000000":
+        raise ValueError("종목코드가 올바르지 않습니다.")
+
+    return f"{market}:{symbol}"
+
+
+def test_quotes_returns_results_in_symbol_order():
+    kis = MagicMock()
+    kis._rate_limit.return_value = MagicMock(rate=4)
+
+    with patch.object(quote_mod, "quote", _fake_quote):
+        results = quote_mod.quotes(kis, ["005930", "000000", "000660"], market="KRX")
+
+    # 시세 조회는 모의투자에서도 실전도메인으로 요청합니다.
+    kis._rate_limit.assert_called_once_with("real")
+
+    assert list(results) == ["005930", "000000", "000660"]
+    assert results["005930"].unwrap() == "KRX:005930"
+    assert results["000660"].result == "KRX:000660"
+    # 한 종목의 오류가 나머지 종목 조회를 중단하지 않습니다.
+    assert not results["000000"].ok
+    assert isinstance(results["000000"].error, ValueError)
+
+
+def test_iter_quotes_passes_market_and_extended():
+    kis = MagicMock()
+    calls = []
+
+    def fake_quote(self, symbol, market, extended=False):
+        calls.append((symbol, market, extended))
+        return symbol
+
+    with patch.object(quote_mod, "quote", fake_quote):
+        results = list(quote_mod.iter_quotes(kis, ["AAPL", "TSLA"], market="NASDAQ", extended=True, max_workers=2))
+
+    assert sorted(result.key for result in results) == ["AAPL", "TSLA"]
+    assert sorted(calls) == [("AAPL", "NASDAQ", True), ("TSLA", "NASDAQ", True)]
@@ -77,3 +77,39 @@ def test_on_product_price_forwarding():
     ticket = price.on_product_price(prod, lambda *_: None)
     assert ticket.id == "H0STCNT0"
     assert ticket.key == "XYZ"
+
+
+DOMESTIC_PRICE_ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+
+def test_domestic_realtime_price_lazy_parse_matches_eager_parse():
+    """Lazy parsing keeps the raw row and yields the same attributes as eager parsing."""
+    import pickle
+
+    from pykis.responses.websocket import KisWebsocketResponse
+
+    body = "^".join(DOMESTIC_PRICE_ROW)
+    eager = next(iter(KisWebsocketResponse.parse(body, response_type=price.KisDomesticRealtimePrice)))
+    lazy = next(iter(KisWebsocketResponse.parse(body, response_type=price.KisDomesticRealtimePrice, lazy=True)))
+
+    assert isinstance(lazy, price.KisDomesticRealtimePrice)
+    assert "time" not in vars(lazy) and "price" not in vars(lazy)
+
+    for name in (
+        "symbol", "market", "price", "change", "sign", "volume", "amount", "condition", "prev_volume",
+        "time", "time_kst", "open_time", "high_time_kst", "low_time",
+    ):
+        assert getattr(lazy, name) == getattr(eager, name), name
+
+    assert lazy.time.isoformat() == "2024-01-02T09:30:00+09:00"
+    assert repr(lazy) == repr(eager)
+
+    restored = pickle.loads(pickle.dumps(lazy))
+    assert type(restored) is type(lazy)
+    assert restored.price == eager.price
@@ -2,7 +2,16 @@ from datetime import datetime, timedelta
 
 import pytest
 
+from requests import Response
+
 from pykis.client.cache import KisCacheStorage
+from pykis.client.object import KisObjectBase
+
+
+class _CachedValue(KisObjectBase):
+    def __init__(self):
+        self.response = Response()
+        self.value = 1
 
 
 def test_set_get_without_expire_and_type_check():
@@ -102,3 +111,114 @@ def test_get_returns_default_when_missing_key_or_wrong_type():
     # store a dict but request int -> default
     store.set("x", {"a": 1})
     assert store.get("x", int, 0) == 0
+
+
+def test_lru_eviction_and_stats():
+    store = KisCacheStorage(max_size=2)
+    store.set("a", 1)
+    store.set("b", 2)
+
+    # "a" becomes most recently used
+    assert store.get("a", int) == 1
+
+    store.set("c", 3)
+
+    assert store.get("b", int) is None
+    assert store.get("a", int) == 1
+    assert store.get("c", int) == 3
+    assert len(store) == 2
+
+    stats = store.stats
+    assert stats.evictions == 1
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.hit_rate == pytest.approx(0.75)
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        KisCacheStorage(max_size=0)
+
+
+def test_expired_entries_are_swept_without_get(monkeypatch):
+    class DummyDateTime:
+        _now = datetime.now()
+
+        @classmethod
+        def now(cls):
+            return cls._now
+
+    monkeypatch.setattr("pykis.client.cache.datetime", DummyDateTime)
+
+    store = KisCacheStorage(sweep_interval=timedelta(seconds=10))
+    for i in range(100):
+        store.set(f"info:KRX:{i}", i, expire=timedelta(seconds=1))
+
+    store.set("keep", "v")
+    assert len(store) == 101
+
+    DummyDateTime._now = DummyDateTime._now + timedelta(seconds=11)
+    # any access after the sweep interval removes expired entries
+    store.set("other", "v")
+
+    assert len(store) == 2
+    assert store.stats.expirations == 100
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = tmp_path / "cache.db"
+    store = KisCacheStorage(path=path)
+    store.set("quotable_market:None:005930", "KRX", expire=timedelta(days=1))
+    store.set("expired", "x", expire=datetime.now() - timedelta(seconds=1))
+    store.close()
+
+    restored = KisCacheStorage(path=path)
+    assert restored.get("quotable_market:None:005930", str) == "KRX"
+    assert restored.get("expired", str) is None
+    assert restored.stats.disk_hits == 1
+
+    restored.remove("quotable_market:None:005930")
+    restored.close()
+
+    assert KisCacheStorage(path=path).get("quotable_market:None:005930", str) is None
+
+
+def test_disk_tier_rebinds_kis_and_drops_http_response(tmp_path):
+    from pykis.client.object import kis_object_init
+
+    class Kis:
+        pass
+
+    kis = Kis()
+    path = tmp_path / "cache.db"
+    store = KisCacheStorage(path=path)
+    kis_object_init(kis, store)  # type: ignore
+
+    value = _CachedValue()
+    value.kis = kis  # type: ignore
+    store.set("v", value)
+    store.close()
+
+    other_kis = Kis()
+    restored = KisCacheStorage(path=path)
+    kis_object_init(other_kis, restored)  # type: ignore
+
+    loaded = restored.get("v", _CachedValue)
+    assert loaded is not None
+    assert loaded.value == 1
+    assert loaded.kis is other_kis
+    assert loaded.response is None
+
+
+def test_disk_tier_skips_unpicklable_values(tmp_path):
+    import threading
+
+    store = KisCacheStorage(path=tmp_path / "cache.db")
+    lock = threading.Lock()
+    store.set("lock", lock)
+
+    # still available from memory
+    assert store.get("lock", type(lock)) is lock
+    store.close()
+
+    assert KisCacheStorage(path=tmp_path / "cache.db").get("lock", type(lock)) is None
@@ -0,0 +1,151 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import pykis.client.websocket as websocket_mod
+from pykis.client.websocket import KisWebsocketClient
+from pykis.responses.types import KisInt, KisString
+from pykis.responses.websocket import KisWebsocketResponse
+
+
+class Tick(KisWebsocketResponse):
+    __fields__ = [KisString["symbol"], KisInt["price"]]
+
+    symbol: str
+    price: int
+
+    parsed = 0
+
+    def __pre_init__(self, data):
+        Tick.parsed += 1
+
+
+class DummyWS:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setitem(websocket_mod.WEBSOCKET_RESPONSES_MAP, "TESTCNT0", Tick)
+    Tick.parsed = 0
+
+    kis = SimpleNamespace(
+        virtual=False,
+        approval_key=lambda domain=None, appkey=None: SimpleNamespace(approval_key="APPKEY"),
+    )
+    c = KisWebsocketClient(kis=kis, virtual=False)
+    c.websocket = DummyWS()
+    c._connected_event.set()
+
+    yield c
+
+    c.conflator.close()
+
+
+def _frame(*rows: tuple[str, int]) -> str:
+    return f"0|TESTCNT0|{len(rows):03d}|" + "^".join(f"{symbol}^{price}" for symbol, price in rows)
+
+
+def test_conflated_subscription_delivers_latest_row_only(client):
+    received = []
+    ticket = client.on("TESTCNT0", "A", lambda sender, e: received.append(e.response.price), max_rate=0.01)
+
+    client._handle_event(_frame(("A", 1)))
+    deadline = time.monotonic() + 5
+
+    while not received and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # 첫 데이터는 즉시 전달되고, 이후 데이터는 전달 주기 동안 최신 데이터로 교체됩니다.
+    assert received == [1]
+
+    for price in range(2, 102):
+        client._handle_event(_frame(("A", price), ("B", price)))
+
+    client.conflator.flush()
+
+    assert received == [1, 101]
+    # 병합 구독만 있는 종목은 수신 시점에 파싱하지 않습니다. (B는 일반 경로로 파싱)
+    assert Tick.parsed == 2 + 100
+
+    stats = client.conflator.stats
+    assert stats.received == 101
+    assert stats.conflated == 99
+    assert stats.delivered == 2
+    assert stats.deferred == 101
+
+    ticket.unsubscribe()
+
+
+def test_regular_subscription_still_receives_every_row(client):
+    conflated = []
+    regular = []
+    conflated_ticket = client.on("TESTCNT0", "A", lambda sender, e: conflated.append(e.response.price), max_rate=0.01)
+    regular_ticket = client.on("TESTCNT0", "A", lambda sender, e: regular.append(e.response.price))
+
+    for price in range(1, 11):
+        client._handle_event(_frame(("A", price)))
+
+    client.conflator.flush()
+
+    assert regular == list(range(1, 11))
+    assert conflated[-1] == 10
+    assert client.conflator.stats.deferred == 0
+
+    conflated_ticket.unsubscribe()
+    regular_ticket.unsubscribe()
+
+
+def test_delivery_respects_max_rate(client):
+    received = []
+    lock = threading.Lock()
+
+    def callback(sender, e):
+        with lock:
+            received.append(time.monotonic())
+
+    ticket = client.on("TESTCNT0", "A", callback, max_rate=20)
+    start = time.monotonic()
+
+    while time.monotonic() - start < 0.5:
+        client._handle_event(_frame(("A", 1)))
+        time.sleep(0.001)
+
+    time.sleep(0.1)
+    ticket.unsubscribe()
+
+    with lock:
+        intervals = [b - a for a, b in zip(received, received[1:])]
+
+    assert 2 <= len(received) <= 13
+    assert min(intervals) >= 0.05 * 0.9
+
+
+def test_unsubscribe_releases_subscription(client):
+    ticket = client.on("TESTCNT0", "A", lambda sender, e: None, max_rate=10)
+
+    assert client.is_subscribed("TESTCNT0", "A")
+    assert client.conflator.accepts("TESTCNT0")
+
+    ticket.unsubscribe()
+
+    assert not client.is_subscribed("TESTCNT0", "A")
+
+    # 빈 병합 구독은 다음 수신 또는 전달 시 정리됩니다.
+    client._handle_event(_frame(("A", 1)))
+    client.conflator.flush()
+
+    assert not client.conflator.accepts("TESTCNT0")
+
+
+def test_invalid_max_rate(client):
+    with pytest.raises(ValueError):
+        client.on("TESTCNT0", "A", lambda sender, e: None, max_rate=0)
+
+    assert not client.is_subscribed("TESTCNT0", "A")
@@ -0,0 +1,137 @@
+from datetime import date
+
+from pykis.client.account import KisAccountNumber
+from pykis.client.journal import KisJournal
+
+ACCOUNT = KisAccountNumber("12345678-01")
+
+
+def _fetcher(rows: dict[date, list[str]], calls: list[tuple[date, date]]):
+    def fetch(start: date, end: date) -> list[tuple[date, str]]:
+        calls.append((start, end))
+        return [(day, value) for day, values in sorted(rows.items()) if start <= day <= end for value in values]
+
+    return fetch
+
+
+def _sync(journal: KisJournal, fetch, start: date, end: date, final: date, key: bool = True) -> list[str]:
+    rows = journal.sync(
+        None,  # type: ignore
+        ACCOUNT,
+        kind="test",
+        start=start,
+        end=end,
+        fetch=fetch,
+        day=lambda row: row[0],
+        final=final,
+        key=(lambda row: row[1]) if key else None,
+    )
+    return [value for _, value in rows]
+
+
+def test_missing_ranges():
+    journal = KisJournal(memory=True)
+
+    assert journal.watermark(ACCOUNT, "test") is None
+    assert journal.missing(ACCOUNT, "test", date(2024, 1, 1), date(2024, 1, 31)) == [
+        (date(2024, 1, 1), date(2024, 1, 31))
+    ]
+
+    journal.store(None, ACCOUNT, "test", date(2024, 1, 10), date(2024, 1, 20), [], final=date(2024, 1, 18))  # type: ignore
+
+    assert journal.watermark(ACCOUNT, "test") == (date(2024, 1, 10), date(2024, 1, 18))
+    assert journal.missing(ACCOUNT, "test", date(2024, 1, 1), date(2024, 1, 31)) == [
+        (date(2024, 1, 1), date(2024, 1, 9)),
+        (date(2024, 1, 19), date(2024, 1, 31)),
+    ]
+    assert journal.missing(ACCOUNT, "test", date(2024, 1, 12), date(2024, 1, 15)) == []
+    assert journal.missing(ACCOUNT, "test", date(2024, 1, 12), date(2024, 1, 25)) == [
+        (date(2024, 1, 19), date(2024, 1, 25))
+    ]
+
+    # 기존 기간과 이어지지 않는 기간은 동기화 기간에 포함하지 않습니다.
+    journal.store(None, ACCOUNT, "test", date(2024, 3, 1), date(2024, 3, 5), [], final=date(2024, 3, 5))  # type: ignore
+    assert journal.watermark(ACCOUNT, "test") == (date(2024, 1, 10), date(2024, 1, 18))
+
+    journal.store(None, ACCOUNT, "test", date(2024, 1, 1), date(2024, 1, 9), [], final=date(2024, 3, 5))  # type: ignore
+    assert journal.watermark(ACCOUNT, "test") == (date(2024, 1, 1), date(2024, 1, 18))
+    assert journal.watermark(KisAccountNumber("87654321-01"), "test") is None
+
+
+def test_sync_fetches_only_unsynced_days():
+    rows = {
+        date(2024, 1, 2): ["a", "b"],
+        date(2024, 1, 3): ["c"],
+        date(2024, 1, 5): ["d"],
+    }
+    calls = []
+    fetch = _fetcher(rows, calls)
+
+    with KisJournal(memory=True) as journal:
+        assert _sync(journal, fetch, date(2024, 1, 1), date(2024, 1, 5), final=date(2024, 1, 4)) == ["a", "b", "c", "d"]
+
+        # 확정되지 않은 날짜의 항목이 바뀌면 다시 조회하여 교체합니다.
+        rows[date(2024, 1, 5)] = ["e"]
+        rows[date(2024, 1, 6)] = ["f"]
+        assert _sync(journal, fetch, date(2024, 1, 1), date(2024, 1, 6), final=date(2024, 1, 5)) == ["a", "b", "c", "e", "f"]
+        assert _sync(journal, fetch, date(2024, 1, 3), date(2024, 1, 5), final=date(2024, 1, 5)) == ["c", "e"]
+
+        assert calls == [
+            (date(2024, 1, 1), date(2024, 1, 5)),
+            (date(2024, 1, 5), date(2024, 1, 6)),
+        ]
+        assert journal.stats.syncs == 3
+        assert journal.stats.fetches == 2
+        assert journal.stats.fetched == 6
+
+
+def test_sync_disjoint_window_extends_watermark():
+    rows = {date(2024, 1, 15): ["a"], date(2024, 3, 1): ["b"], date(2024, 5, 5): ["c"]}
+    calls = []
+    fetch = _fetcher(rows, calls)
+
+    with KisJournal(memory=True) as journal:
+        assert _sync(journal, fetch, date(2024, 1, 1), date(2024, 1, 31), final=date(2024, 6, 30)) == ["a"]
+
+        # 동기화된 기간과 떨어진 기간은 사이 기간을 함께 조회하여 동기화된 기간에 이어 붙입니다.
+        for _ in range(3):
+            assert _sync(journal, fetch, date(2024, 5, 1), date(2024, 5, 10), final=date(2024, 6, 30)) == ["c"]
+
+        assert journal.watermark(ACCOUNT, "test") == (date(2024, 1, 1), date(2024, 5, 10))
+        assert calls == [
+            (date(2024, 1, 1), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 5, 10)),
+        ]
+        assert _sync(journal, fetch, date(2024, 2, 1), date(2024, 3, 31), final=date(2024, 6, 30)) == ["b"]
+        assert len(calls) == 2
+
+
+def test_store_replaces_rows_without_keys(tmp_path):
+    rows = {date(2024, 1, 2): ["a", "b"], date(2024, 1, 3): ["c"]}
+    calls = []
+    fetch = _fetcher(rows, calls)
+    path = tmp_path / "journal.db"
+
+    with KisJournal(path) as journal:
+        assert _sync(journal, fetch, date(2024, 1, 2), date(2024, 1, 3), final=date(2024, 1, 2), key=False) == ["a", "b", "c"]
+
+        rows[date(2024, 1, 3)] = ["d", "e"]
+        assert _sync(journal, fetch, date(2024, 1, 2), date(2024, 1, 3), final=date(2024, 1, 3), key=False) == [
+            "a",
+            "b",
+            "d",
+            "e",
+        ]
+
+    # 파일에 기록된 내용은 다시 열어도 유지됩니다.
+    with KisJournal(path) as journal:
+        assert _sync(journal, fetch, date(2024, 1, 2), date(2024, 1, 3), final=date(2024, 1, 3), key=False) == [
+            "a",
+            "b",
+            "d",
+            "e",
+        ]
+        assert len(calls) == 2
+
+        journal.clear(ACCOUNT)
+        assert journal.watermark(ACCOUNT, "test") is None
@@ -0,0 +1,71 @@
+import json
+from datetime import timedelta
+
+from pykis.client.market_index import KisMarketIndex
+
+
+def test_memory_index_get_set_remove():
+    index = KisMarketIndex()
+
+    assert index.get("005930") is None
+
+    index.set("005930", None, "005930", "KRX")
+
+    assert index.get("005930") == ("005930", "KRX")
+    # 조회한 상품유형별로 구분합니다.
+    assert index.get("005930", "CN") is None
+    assert len(index) == 1
+
+    index.remove("005930")
+    assert index.get("005930") is None
+
+
+def test_index_is_persisted_and_loaded_lazily(tmp_path):
+    path = tmp_path / "cache" / "market_index.json"
+    index = KisMarketIndex(path)
+    index.set("AAPL", "US", "AAPL", "NASDAQ")
+
+    assert path.exists()
+
+    other = KisMarketIndex(path)
+    assert other._loaded is False
+    assert other.get("AAPL", "US") == ("AAPL", "NASDAQ")
+    assert other._loaded is True
+
+
+def test_index_entries_expire(tmp_path, monkeypatch):
+    import pykis.client.market_index as market_index_mod
+
+    now = [1000.0]
+    monkeypatch.setattr(market_index_mod.time, "time", lambda: now[0])
+
+    path = tmp_path / "market_index.json"
+    index = KisMarketIndex(path, expire=timedelta(days=1))
+    index.set("AAPL", "US", "AAPL", "NASDAQ")
+
+    now[0] += 86400 + 1
+    assert index.get("AAPL", "US") is None
+
+    # 만료된 항목은 저장하지 않습니다.
+    index.save()
+    assert json.loads(path.read_text()) == {}
+
+
+def test_index_ignores_corrupted_file(tmp_path):
+    path = tmp_path / "market_index.json"
+    path.write_text("not json")
+
+    index = KisMarketIndex(path)
+    assert index.get("AAPL") is None
+
+    index.set("AAPL", None, "AAPL", "NASDAQ")
+    assert KisMarketIndex(path).get("AAPL") == ("AAPL", "NASDAQ")
+
+
+def test_clear(tmp_path):
+    path = tmp_path / "market_index.json"
+    index = KisMarketIndex(path)
+    index.set("AAPL", None, "AAPL", "NASDAQ", save=False)
+    index.clear()
+
+    assert len(KisMarketIndex(path)) == 0
@@ -51,21 +51,16 @@ def test_tr_constants():
     assert TR_UNSUBSCRIBE_TYPE == "2"
 
 
-def test_websocket_request_build_includes_header_and_body(monkeypatch):
-    class DummyKis:
-        pass
-
-    # fake approval key function
+def test_websocket_request_build_includes_header_and_body():
+    # fake approval key
     class FakeApproval:
         def __init__(self, key: str):
             self.approval_key = key
 
-    def fake_websocket_approval_key(kis_obj: Any, domain=None):
-        assert isinstance(kis_obj, DummyKis)
-        return FakeApproval("APPKEY-123")
-
-    # patch the function that is imported inside build()
-    monkeypatch.setattr("pykis.api.auth.websocket.websocket_approval_key", fake_websocket_approval_key)
+    class DummyKis:
+        def approval_key(self, domain=None):
+            assert domain == "real"
+            return FakeApproval("APPKEY-123")
 
     # body that implements build()
     class SimpleBody:
@@ -87,14 +82,10 @@ def test_websocket_request_build_includes_header_and_body(monkeypatch):
     assert built["body"]["input"] == {"x": 1}
 
 
-def test_websocket_request_build_without_body(monkeypatch):
+def test_websocket_request_build_without_body():
     class DummyKis:
-        pass
-
-    def fake_websocket_approval_key(kis_obj: Any, domain=None):
-        return type("A", (), {"approval_key": "K"})()
-
-    monkeypatch.setattr("pykis.api.auth.websocket.websocket_approval_key", fake_websocket_approval_key)
+        def approval_key(self, domain=None):
+            return type("A", (), {"approval_key": "K"})()
 
     kis = DummyKis()
     req = KisWebsocketRequest(kis=kis, type="T2", body=None, domain=None)
@@ -126,3 +117,45 @@ def test_encryption_key_decrypt_and_text_roundtrip():
     dec = ek.decrypt(ciphertext)
     assert dec == plaintext
     assert ek.text(ciphertext) == plaintext.decode("utf-8")
+
+
+def _encrypt(key: bytes, iv: bytes, plaintext: bytes) -> bytes:
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(plaintext) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend()).encryptor()
+    return encryptor.update(padded) + encryptor.finalize()
+
+
+def test_encryption_key_reuses_cipher():
+    ek = KisWebsocketEncryptionKey(iv=b"i" * 16, key=b"k" * 32)
+    assert ek.cipher is ek.cipher
+
+
+def test_encryption_key_decrypt_batch_matches_single():
+    import base64
+
+    key = b"k" * 32
+    iv = b"i" * 16
+    ek = KisWebsocketEncryptionKey(iv=iv, key=key)
+    plaintexts = [b"a", b"b" * 16, "체결통보^005930".encode("utf-8") * 7, b""]
+    ciphertexts = [_encrypt(key, iv, plaintext) for plaintext in plaintexts]
+
+    assert ek.decrypt_batch(ciphertexts) == plaintexts
+    assert ek.decrypt_batch(ciphertexts) == [ek.decrypt(ciphertext) for ciphertext in ciphertexts]
+    assert ek.text_batch(ciphertexts[:1]) == ["a"]
+    assert ek.decrypt_batch([]) == []
+    assert ek.decode_batch(base64.b64encode(ciphertext).decode() for ciphertext in ciphertexts) == [
+        plaintext.decode("utf-8") for plaintext in plaintexts
+    ]
+
+
+def test_encryption_key_decrypt_batch_rejects_invalid_data():
+    ek = KisWebsocketEncryptionKey(iv=b"i" * 16, key=b"k" * 32)
+    valid = _encrypt(ek.key, ek.iv, b"hello")
+
+    with pytest.raises(ValueError):
+        ek.decrypt_batch([valid, b"short"])
+
+    with pytest.raises(ValueError):
+        # 다른 키로 암호화된 메시지는 패딩이 맞지 않습니다.
+        ek.decrypt_batch([valid, _encrypt(b"x" * 32, ek.iv, b"hello" * 5)])
@@ -0,0 +1,198 @@
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+from pykis.api.account.balance import balance, iter_foreign_balance
+from pykis.api.account.daily_order import (
+    KisDomesticDailyOrders,
+    daily_orders,
+    domestic_daily_orders,
+    iter_daily_orders,
+)
+from pykis.api.account.order import domestic_order
+from pykis.api.account.pending_order import iter_foreign_pending_orders
+from pykis.api.stock.daily_chart import domestic_daily_chart
+from pykis.api.stock.order_book import domestic_orderbook
+from pykis.api.stock.quote import domestic_quote
+from pykis.api.websocket.order_execution import on_execution
+from pykis.api.websocket.price import on_price
+from pykis.client.exceptions import KisHTTPError
+from pykis.client.journal import KisJournal
+from pykis.client.mock_server import KisMockServer
+from pykis.client.page import KisPage
+
+
+@pytest.fixture
+def server():
+    with KisMockServer(page_size=2, seed=0) as server:
+        yield server
+
+
+def test_quotations(server):
+    kis = server.create_kis(use_websocket=False)
+    server.prices["005930"] = 70000
+
+    quote = domestic_quote(kis, "005930")
+    assert quote.symbol == "005930"
+    assert quote.price == 70000
+
+    orderbook = domestic_orderbook(kis, "005930")
+    assert [item.price for item in orderbook.asks[:2]] == [70010, 70020]
+    assert len(orderbook.bids) == 10
+
+    # 100봉 단위로 연속조회합니다.
+    chart = domestic_daily_chart(kis, "005930", start=date.today() - timedelta(days=365))
+    assert 250 <= len(chart.bars) <= 262
+    assert all(bar.time.weekday() < 5 for bar in chart.bars)
+    assert chart.bars == sorted(chart.bars, key=lambda bar: bar.time)
+
+
+def test_account_pagination(server):
+    kis = server.create_kis(use_websocket=False)
+
+    for symbol in ("005930", "000660", "035720"):
+        domestic_order(kis, kis.primary_account, symbol, "buy", price=10000, qty=2)
+
+    domestic_order(kis, kis.primary_account, "005930", "sell", price=10000, qty=1)
+
+    # 페이지당 2개 항목으로 연속조회합니다.
+    assert {stock.symbol: stock.qty for stock in balance(kis, kis.primary_account).stocks} == {
+        "000660": 2,
+        "005930": 1,
+        "035720": 2,
+    }
+
+    orders = domestic_daily_orders(kis, kis.primary_account, start=date.today(), end=date.today()).orders
+    assert [order.type for order in orders] == ["sell", "buy", "buy", "buy"]
+    assert server.stats.requests > 8
+
+
+def test_iter_daily_orders(server):
+    kis = server.create_kis(use_websocket=False)
+    today = date.today()
+
+    for qty in range(1, 6):
+        domestic_order(kis, kis.primary_account, "005930", "buy", price=10000, qty=qty)
+
+    requests = server.stats.requests
+    pages = iter_daily_orders(kis, kis.primary_account, start=today, end=today, country="KR")
+    first = next(pages)
+
+    # 첫 페이지만 요청하고, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+    assert [order.qty for order in first.orders] == [5, 4]
+    assert server.stats.requests == requests + 1
+
+    resumed = iter_daily_orders(kis, kis.primary_account, start=today, end=today, country="KR", page=first.next_page)
+    assert [[order.qty for order in page.orders] for page in resumed] == [[3, 2], [1]]
+
+    with pytest.raises(ValueError):
+        iter_daily_orders(kis, kis.primary_account, start=today, end=today, page=first.next_page)
+
+
+def test_iter_foreign_pages(server):
+    kis = server.create_kis(use_websocket=False)
+
+    # 여러 시장을 조회하는 국가는 시장 순서대로 페이지를 반환합니다.
+    for iterate in (iter_foreign_balance, iter_foreign_pending_orders):
+        pages = list(iterate(kis, kis.primary_account, country="CN"))
+        assert len(pages) == 2
+
+        with pytest.raises(ValueError):
+            iterate(kis, kis.primary_account, country="CN", page=KisPage(200, "1", "1"))
+
+
+def test_daily_orders_journal(server):
+    kis = server.create_kis(use_websocket=False)
+    today = date.today()
+    start = today - timedelta(days=30)
+
+    for qty in range(1, 4):
+        domestic_order(kis, kis.primary_account, "005930", "buy", price=10000, qty=qty)
+
+    server.orders.insert(
+        0,
+        {**server.orders[0], "ord_dt": (today - timedelta(days=10)).strftime("%Y%m%d"), "odno": "0000009999"},
+    )
+
+    with KisJournal(memory=True) as journal:
+        orders = daily_orders(kis, kis.primary_account, start=start, journal=journal).orders
+        assert [order.qty for order in orders] == [3, 2, 1, 1]
+        assert journal.watermark(kis.primary_account, "daily_orders:KR") == (start, today - timedelta(days=1))
+
+        domestic_order(kis, kis.primary_account, "005930", "buy", price=10000, qty=4)
+        requests = server.stats.requests
+        fetched = journal.stats.fetched
+
+        # 확정된 날짜는 기록에서 불러오고, 오늘 체결내역만 다시 조회합니다.
+        orders = daily_orders(kis, kis.primary_account, start=start, journal=journal).orders
+        assert [order.qty for order in orders] == [4, 3, 2, 1, 1]
+        assert orders[-1].kis is kis
+        assert journal.stats.fetched - fetched == 4
+        assert server.stats.requests - requests <= 4
+
+        # 국가를 지정하면 API 조회와 같은 응답 타입을 반환합니다.
+        result = daily_orders(kis, kis.primary_account, start=start, country="KR", journal=journal)
+        assert isinstance(result, KisDomesticDailyOrders)
+        assert [order.qty for order in result.orders] == [4, 3, 2, 1, 1]
+        assert result.is_last
+
+
+def test_error_injection_and_rate_limit(server):
+    kis = server.create_kis(use_websocket=False)
+    domestic_quote(kis, "005930")
+    token = kis.token.token
+
+    # 토큰 만료(EGW00123)는 토큰 재발급 후, 호출 유량 초과(EGW00201)는 대기 후 재시도합니다.
+    server.inject("EGW00123")
+    server.inject("EGW00201", count=2)
+    domestic_quote(kis, "005930")
+
+    assert kis.token.token != token
+    assert server.stats.errors == 3
+
+    server.inject("EGW00500", path="/uapi/domestic-stock/v1/quotations/inquire-price")
+
+    with pytest.raises(KisHTTPError):
+        domestic_quote(kis, "005930")
+
+    server.rate_limit = 1
+    domestic_quote(kis, "005930")
+    domestic_quote(kis, "005930")
+
+    assert server.stats.rate_limited >= 1
+
+
+def test_websocket_price_and_execution(server):
+    kis = server.create_kis()
+    prices = []
+    executions = []
+    received = threading.Event()
+
+    price_ticket = on_price(kis.websocket, "KRX", "005930", lambda sender, e: prices.append(e.response.price))
+    execution_ticket = on_execution(
+        kis.websocket,
+        lambda sender, e: (executions.append(e.response.executed_quantity), len(executions) == 2 and received.set()),
+    )
+
+    try:
+        kis.websocket.ensure_connected(5)
+
+        for _ in range(500):
+            if len(kis.websocket._registered_subscriptions) == 3:
+                break
+
+            threading.Event().wait(0.01)
+
+        assert server.publish_price("005930", 71000, count=3) == 1
+
+        domestic_order(kis, kis.primary_account, "005930", "buy", price=71000, qty=5)
+
+        assert received.wait(5)
+        assert prices == [71000] * 3
+        # 접수 통보는 체결수량이 0, 체결 통보는 체결수량이 주문수량입니다.
+        assert executions == [0, 5]
+    finally:
+        price_ticket.unsubscribe()
+        execution_ticket.unsubscribe()
+        kis.websocket.disconnect()
@@ -1,6 +1,8 @@
+from types import SimpleNamespace
+
 import pytest
 
-from pykis.client.page import KisPage, to_page_status
+from pykis.client.page import KisPage, collect_pages, iter_pages, to_page_status
 
 
 def test_to_page_status_begin_and_end_and_invalid():
@@ -83,3 +85,44 @@ def test_build_requires_size_and_builds_keys():
     p2 = KisPage()
     with pytest.raises(ValueError):
         p2.build()
+
+
+def _fake_pages(count: int):
+    requested = []
+
+    def fetch(page: KisPage):
+        index = int(page.key or 0)
+        requested.append(index)
+
+        return SimpleNamespace(
+            items=[index],
+            is_last=index == count - 1,
+            next_page=KisPage(100, str(index + 1), str(index + 1)),
+        )
+
+    return fetch, requested
+
+
+def test_iter_pages_streams_and_stops_early():
+    fetch, requested = _fake_pages(5)
+    pages = iter_pages(fetch, KisPage.first(100))
+
+    assert next(pages).items == [0]
+    assert requested == [0]
+
+    second = next(pages)
+    pages.close()
+    assert requested == [0, 1]
+
+    # 반환된 페이지 커서로 이어서 조회합니다.
+    assert [page.items for page in iter_pages(fetch, second.next_page)] == [[2], [3], [4]]
+    assert requested == [0, 1, 2, 3, 4]
+
+
+def test_collect_pages():
+    fetch, requested = _fake_pages(3)
+    assert collect_pages(iter_pages(fetch, KisPage.first(100)), lambda page: page.items).items == [0, 1, 2]
+
+    fetch, requested = _fake_pages(3)
+    assert collect_pages(iter_pages(fetch, KisPage.first(100)), lambda page: page.items, continuous=False).items == [0]
+    assert requested == [0]
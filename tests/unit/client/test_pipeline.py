@@ -0,0 +1,187 @@
+import threading
+
+import pytest
+
+from pykis.client.pipeline import KisWebsocketPipeline, _message_key
+
+
+def _tick(symbol: str, value: int, id: str = "H0STCNT0") -> str:
+    return f"0|{id}|001|{symbol}^{value}^0"
+
+
+def _symbol_values(messages: list[str]) -> list[tuple[str, int]]:
+    return [(body.split("^")[0], int(body.split("^")[1])) for body in (m.split("|", 3)[3] for m in messages)]
+
+
+class _Gate:
+    """디스패처 스레드를 멈춰 대기열을 채우는 메시지 처리 함수"""
+
+    def __init__(self):
+        self.open = threading.Event()
+        self.started = threading.Event()
+        self.messages: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, messages: list[str]):
+        self.started.set()
+        self.open.wait(timeout=5)
+
+        with self.lock:
+            self.messages.extend(messages)
+
+
+def _fill(pipeline: KisWebsocketPipeline, gate: _Gate, messages: list[str]):
+    # 첫 메시지는 디스패처 스레드가 가져가서 처리 중인 상태로 둡니다.
+    pipeline.put(_tick("BUSY", 0))
+    assert gate.started.wait(timeout=5)
+
+    for message in messages:
+        pipeline.put(message)
+
+
+def test_message_key():
+    assert _message_key("0|H0STCNT0|001|005930^1^2") == (("H0STCNT0", "005930"), True)
+    assert _message_key("1|H0STCNI0|001|encrypted") == ("H0STCNI0", False)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        KisWebsocketPipeline(workers=0)
+
+    with pytest.raises(ValueError):
+        KisWebsocketPipeline(max_size=0)
+
+    with pytest.raises(ValueError):
+        KisWebsocketPipeline(overflow="unknown")  # type: ignore
+
+
+def test_per_symbol_ordering_across_workers():
+    received: dict[str, list[int]] = {}
+    lock = threading.Lock()
+
+    def handler(messages: list[str]):
+        with lock:
+            for symbol, value in _symbol_values(messages):
+                received.setdefault(symbol, []).append(value)
+
+    pipeline = KisWebsocketPipeline(workers=4, max_size=16, batch_size=3)
+    pipeline.bind(handler)
+
+    for value in range(200):
+        for symbol in ("A", "B", "C", "D", "E"):
+            pipeline.put(_tick(symbol, value))
+
+    assert pipeline.join(timeout=10)
+    pipeline.close()
+
+    assert received == {symbol: list(range(200)) for symbol in ("A", "B", "C", "D", "E")}
+
+    stats = pipeline.stats
+    assert stats.enqueued == stats.dispatched == 1000
+    assert stats.depth == 0
+    assert 0 < stats.max_depth <= 16
+
+
+def test_drop_oldest_keeps_execution_notices():
+    gate = _Gate()
+    pipeline = KisWebsocketPipeline(workers=1, max_size=3, overflow="drop_oldest")
+    pipeline.bind(gate)
+
+    _fill(
+        pipeline,
+        gate,
+        [
+            "1|H0STCNI0|001|notice",
+            _tick("A", 1),
+            _tick("B", 1),
+            _tick("A", 2),
+            _tick("B", 2),
+        ],
+    )
+
+    stats = pipeline.stats
+    assert stats.dropped == 2
+    assert stats.depth == 3
+
+    gate.open.set()
+    assert pipeline.join(timeout=5)
+    pipeline.close()
+
+    assert gate.messages[1:] == ["1|H0STCNI0|001|notice", _tick("A", 2), _tick("B", 2)]
+
+
+@pytest.mark.parametrize("overflow", ["drop_oldest", "conflate"])
+def test_execution_notice_evicts_tick_instead_of_blocking(overflow):
+    gate = _Gate()
+    pipeline = KisWebsocketPipeline(workers=1, max_size=2, overflow=overflow)
+    pipeline.bind(gate)
+
+    _fill(pipeline, gate, [_tick("A", 1), _tick("B", 1)])
+
+    # 대기열이 가득 차도 체결통보는 가장 오래된 시세를 밀어내고 수신 스레드를 막지 않습니다.
+    producer = threading.Thread(target=pipeline.put, args=("1|H0STCNI0|001|notice",))
+    producer.start()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+
+    stats = pipeline.stats
+    assert stats.dropped == 1
+    assert stats.blocked == 0
+
+    gate.open.set()
+    assert pipeline.join(timeout=5)
+    pipeline.close()
+
+    assert gate.messages[1:] == [_tick("B", 1), "1|H0STCNI0|001|notice"]
+
+
+def test_conflate_replaces_pending_symbol_in_place():
+    gate = _Gate()
+    pipeline = KisWebsocketPipeline(workers=1, max_size=2, overflow="conflate")
+    pipeline.bind(gate)
+
+    _fill(pipeline, gate, [_tick("A", 1), _tick("B", 1), _tick("A", 2), _tick("A", 3), _tick("C", 1)])
+
+    stats = pipeline.stats
+    assert stats.conflated == 2
+    assert stats.dropped == 1
+
+    gate.open.set()
+    assert pipeline.join(timeout=5)
+    pipeline.close()
+
+    # A는 최신 값으로 교체되고, 대기열 초과 시 같은 종목이 없는 C는 가장 오래된 A를 밀어냅니다.
+    assert gate.messages[1:] == [_tick("B", 1), _tick("C", 1)]
+
+
+def test_block_waits_for_space():
+    gate = _Gate()
+    pipeline = KisWebsocketPipeline(workers=1, max_size=1, overflow="block")
+    pipeline.bind(gate)
+
+    _fill(pipeline, gate, [_tick("A", 1)])
+
+    producer = threading.Thread(target=pipeline.put, args=(_tick("A", 2),))
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+
+    gate.open.set()
+    producer.join(timeout=5)
+    assert pipeline.join(timeout=5)
+    pipeline.close()
+
+    assert pipeline.stats.blocked == 1
+    assert gate.messages[1:] == [_tick("A", 1), _tick("A", 2)]
+
+
+def test_close_rejects_new_messages():
+    pipeline = KisWebsocketPipeline(workers=1)
+    pipeline.bind(lambda messages: None)
+    pipeline.close()
+
+    assert pipeline.closed
+    assert pipeline.put(_tick("A", 1)) is False
+
+    with pytest.raises(RuntimeError):
+        pipeline.bind(lambda messages: None)
@@ -0,0 +1,107 @@
+import pytest
+
+from pykis.api.websocket.price import KisDomesticRealtimePrice
+from pykis.client.messaging import KisWebsocketTR
+from pykis.client.recorder import KisWebsocketRecorder, KisWebsocketRecordReader
+
+ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+
+def _row(symbol: str, price: int) -> list[str]:
+    row = ROW.copy()
+    row[0] = symbol
+    row[2] = str(price)
+    return row
+
+
+def _message(*rows: list[str]) -> str:
+    return f"0|H0STCNT0|{len(rows):03d}|" + "^".join("^".join(row) for row in rows)
+
+
+def _record(path, segment_size: int = 64 * 1024) -> None:
+    with KisWebsocketRecorder(path, segment_size=segment_size) as recorder:
+        for i in range(50):
+            assert recorder.put(_message(_row("005930", 70000 + i), _row("000660", 120000 + i)), timestamp=1000 + i)
+
+        # 암호화된 메시지와 기록 대상이 아닌 TR은 기록하지 않습니다.
+        assert not recorder.put("1|H0STCNI0|001|encrypted")
+        assert not recorder.put("0|H0STASP0|001|005930^090000")
+
+        assert recorder.frames == 50
+        assert recorder.rows == 100
+
+
+def test_record_and_read_rows_by_symbol(tmp_path):
+    _record(tmp_path)
+
+    with KisWebsocketRecordReader(tmp_path) as reader:
+        assert len(reader) == 100
+        assert reader.symbols == ["005930", "000660"]
+        assert reader.keys == [KisWebsocketTR("H0STCNT0", "005930"), KisWebsocketTR("H0STCNT0", "000660")]
+
+        rows = list(reader.rows(symbol="000660"))
+        assert [row.time for row in rows] == [1000 + i for i in range(50)]
+        assert rows[3].values == tuple(_row("000660", 120003))
+        assert isinstance(rows[3].data, memoryview)
+
+        assert [row.symbol for row in reader.rows(start=1010, end=1011)] == ["005930", "000660"] * 2
+        assert [row.time for row in reader.rows(symbol="005930", start=1048)] == [1048, 1049]
+        assert list(reader.rows(symbol="unknown")) == []
+
+        frames = list(reader.frames())
+        assert len(frames) == 50
+        assert frames[0].message == _message(_row("005930", 70000), _row("000660", 120000))
+
+        del rows, frames
+
+
+def test_read_parsed_responses(tmp_path):
+    _record(tmp_path)
+
+    with KisWebsocketRecordReader(tmp_path) as reader:
+        prices = list(reader.responses(symbol="005930", start=1040, lazy=True))
+
+    assert len(prices) == 10
+    assert all(isinstance(price, KisDomesticRealtimePrice) for price in prices)
+    assert [int(price.price) for price in prices] == [70040 + i for i in range(10)]
+    assert prices[0].time.isoformat() == "2024-01-02T09:30:00+09:00"
+
+
+def test_segments_rotate_and_append(tmp_path):
+    # 메시지 1건(약 750 바이트)보다 조금 큰 세그먼트를 사용하여 메시지마다 새 세그먼트를 생성합니다.
+    _record(tmp_path, segment_size=1024)
+    _record(tmp_path, segment_size=1024 * 1024)
+
+    assert len(list(tmp_path.glob("*.seg"))) == 51
+
+    with KisWebsocketRecordReader(tmp_path) as reader:
+        assert len(reader) == 200
+        assert len(list(reader.frames())) == 100
+
+
+def test_missing_index_is_rebuilt_from_segment(tmp_path):
+    _record(tmp_path)
+
+    for index in tmp_path.glob("*.idx"):
+        index.write_bytes(index.read_bytes()[:-100])
+
+    with KisWebsocketRecordReader(tmp_path) as reader:
+        assert len(reader) == 100
+        assert [row.time for row in reader.rows(symbol="005930")][-3:] == [1047, 1048, 1049]
+
+
+def test_closed_recorder_rejects_messages(tmp_path):
+    recorder = KisWebsocketRecorder(tmp_path)
+    recorder.close()
+
+    assert recorder.closed
+    assert not recorder.put(_message(_row("005930", 70000)))
+
+    with pytest.raises(ValueError):
+        KisWebsocketRecorder(tmp_path, segment_size=8)
@@ -0,0 +1,122 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pykis.api.websocket.price import on_price
+from pykis.client.messaging import TR_SUBSCRIBE_TYPE, TR_UNSUBSCRIBE_TYPE
+from pykis.client.recorder import KisWebsocketRecorder, KisWebsocketRecordFrame
+from pykis.client.replay import KisWebsocketReplay, KisWebsocketReplaySocket
+from pykis.client.websocket import KisWebsocketClient
+
+ROW = [
+    "005930", "093000", "70000", "2", "500", "0.72", "69950.12", "69500", "70100", "69400",
+    "70100", "70000", "10", "1234567", "86419690000", "3210", "4321", "1111", "101.23", "600000",
+    "634567", "1", "51.4", "80.12", "090000", "5", "500", "091500", "5", "-100",
+    "090500", "2", "600", "20240102", "20", "N", "1000", "2000", "300000", "400000",
+    "0.02", "1100000", "112.2", "0", "N", "69500",
+]
+
+
+def _message(symbol: str, price: int) -> str:
+    row = ROW.copy()
+    row[0] = symbol
+    row[2] = str(price)
+    return "0|H0STCNT0|001|" + "^".join(row)
+
+
+@pytest.fixture
+def client():
+    def approval_key(domain=None, appkey=None):
+        raise AssertionError("재생 중에는 접속키를 발급받지 않아야 합니다.")
+
+    c = KisWebsocketClient(kis=SimpleNamespace(virtual=False, approval_key=approval_key), virtual=False)  # type: ignore
+
+    yield c
+
+    c.conflator.close()
+
+
+@pytest.fixture
+def capture(tmp_path):
+    with KisWebsocketRecorder(tmp_path) as recorder:
+        for i in range(20):
+            recorder.put(_message("005930" if i % 2 else "000660", 70000 + i), timestamp=1000 + i * 0.01)
+
+    return tmp_path
+
+
+def test_replay_delivers_frames_in_recorded_order(client, capture):
+    replay = KisWebsocketReplay(capture, speed=None)
+    replay.attach(client)
+
+    received = []
+    ticket = on_price(client, "KRX", "005930", lambda sender, e: received.append(int(e.response.price)))
+    stats = replay.run(client)
+    ticket.unsubscribe()
+
+    assert stats.frames == 20
+    assert received == [70000 + i for i in range(1, 20, 2)]
+    assert isinstance(client.websocket, KisWebsocketReplaySocket)
+    assert [(type, body.id, body.key) for type, body in client.websocket.requests] == [  # type: ignore
+        (TR_SUBSCRIBE_TYPE, "H0STCNT0", "005930"),
+        (TR_UNSUBSCRIBE_TYPE, "H0STCNT0", "005930"),
+    ]
+
+
+def test_replay_keeps_recorded_pace(client, capture):
+    started = time.perf_counter()
+    KisWebsocketReplay(capture, speed=2).run(client)
+    elapsed = time.perf_counter() - started
+
+    # 기록된 간격 0.19초를 2배속으로 재생
+    assert 0.09 <= elapsed < 1
+
+
+def test_replay_filters_and_stops(client):
+    frames = [
+        KisWebsocketRecordFrame(float(i), "H0STCNT0", 1, memoryview(_message("005930", i).split("|", 3)[3].encode()))
+        for i in range(100)
+    ]
+    replay = KisWebsocketReplay(frames, speed=None, since=10, until=19)
+    replay.attach(client)
+
+    received = []
+    ticket = on_price(client, "KRX", "005930", lambda sender, e: received.append(int(e.response.price)))
+
+    assert replay.run(client).frames == 10
+    assert received == list(range(10, 20))
+
+    replay = KisWebsocketReplay(frames, speed=1)
+    replay.start(client)
+    time.sleep(0.1)
+    replay.stop()
+
+    assert replay.join(5)
+    assert replay.stats.frames < 100
+
+    ticket.unsubscribe()
+
+    with pytest.raises(ValueError):
+        KisWebsocketReplay(frames, speed=0)
+
+
+def test_replay_stop_before_thread_runs(client, monkeypatch):
+    frames = [
+        KisWebsocketRecordFrame(float(i), "H0STCNT0", 1, memoryview(_message("005930", i).split("|", 3)[3].encode()))
+        for i in range(10)
+    ]
+    replay = KisWebsocketReplay(frames, speed=None)
+    start = KisWebsocketReplay._run
+
+    def run(self, client, wait=True):
+        # 스레드 본문이 시작되기 전에 중단 요청이 들어온 상황
+        self.stop()
+        return start(self, client, wait=wait)
+
+    monkeypatch.setattr(KisWebsocketReplay, "_run", run)
+
+    replay.start(client)
+
+    assert replay.join(5)
+    assert replay.stats.frames == 0
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+import requests
+
+from pykis.client.transport import KisAsyncTransport
+
+aiohttp = pytest.importorskip("aiohttp")
+web = pytest.importorskip("aiohttp.web")
+TestServer = pytest.importorskip("aiohttp.test_utils").TestServer
+
+
+async def _handler(request: web.Request) -> web.Response:
+    body = await request.json() if request.can_read_body else None
+
+    return web.json_response(
+        {
+            "rt_cd": "0",
+            "path": request.path,
+            "query": dict(request.query),
+            "tr_id": request.headers.get("tr_id"),
+            "user_agent": request.headers.get("User-Agent"),
+            "body": body,
+        },
+        headers={"tr_cont": "D"},
+    )
+
+
+@pytest_asyncio.fixture
+async def server():
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", _handler)
+    server = TestServer(app)
+    await server.start_server()
+
+    try:
+        yield server
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_send_get_returns_requests_response(server):
+    transport = KisAsyncTransport(limit=4)
+
+    try:
+        request = requests.Request(
+            "GET",
+            str(server.make_url("/uapi/test")),
+            headers={"tr_id": "FHKST01010100"},
+            params={"FID_INPUT_ISCD": "005930"},
+        ).prepare()
+        response = await transport.send(request)
+    finally:
+        await transport.close()
+
+    assert isinstance(response, requests.Response)
+    assert response.ok
+    assert response.request is request
+    assert response.headers["tr_cont"] == "D"
+
+    data = response.json()
+    assert data["path"] == "/uapi/test"
+    assert data["query"] == {"FID_INPUT_ISCD": "005930"}
+    assert data["tr_id"] == "FHKST01010100"
+    assert data["user_agent"].startswith("PyKis/")
+
+
+@pytest.mark.asyncio
+async def test_send_post_json_body(server):
+    transport = KisAsyncTransport()
+
+    try:
+        response = await transport.send(
+            requests.Request("POST", str(server.make_url("/oauth2/Approval")), json={"grant_type": "x"}).prepare()
+        )
+    finally:
+        await transport.close()
+
+    assert response.json()["body"] == {"grant_type": "x"}
+
+
+@pytest.mark.asyncio
+async def test_session_reused_within_loop_and_closed():
+    transport = KisAsyncTransport(limit=2)
+    session = transport.session
+
+    assert transport.session is session
+    assert session.connector.limit == 2
+
+    await transport.close()
+
+    assert session.closed
+    assert transport._session is None
+
+
+def test_session_recreated_for_new_event_loop():
+    transport = KisAsyncTransport()
+
+    async def get_session():
+        return transport.session
+
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+
+    assert first is not second
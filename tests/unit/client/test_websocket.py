@@ -19,6 +19,23 @@ from pykis.client.websocket import (
 class DummyKis:
     def __init__(self, virtual=False):
         self.virtual = virtual
+        self.appkey = SimpleNamespace(appkey="P" + "A" * 35)
+        self.virtual_appkey = None
+        self.websocket_domains = {"real": "ws://localhost:21000", "virtual": "ws://localhost:31000"}
+        self.issued = 0
+        self.discarded = []
+
+    def approval_key(self, domain=None, appkey=None):
+        # provide a fake websocket approval key so KisWebsocketRequest.build() works
+        if appkey is not None:
+            return SimpleNamespace(approval_key=f"APPKEY-{appkey.appkey[:2]}")
+
+        return SimpleNamespace(approval_key="APPKEY-123" if not self.issued else f"APPKEY-{self.issued}")
+
+    def discard_approval_key(self, domain=None, approval_key=None, appkey=None):
+        self.discarded.append((domain, approval_key))
+        self.issued += 1
+        return True
 
 
 class DummyWS:
@@ -38,11 +55,6 @@ def make_client(monkeypatch, virtual=False):
     c = KisWebsocketClient(kis=kis, virtual=False)
     # prevent threads from being started by connect
     c.thread = None
-    # provide a fake websocket approval key function so KisWebsocketRequest.build() works
-    monkeypatch.setattr(
-        "pykis.api.auth.websocket.websocket_approval_key",
-        lambda kis_obj, domain=None: SimpleNamespace(approval_key="APPKEY-123"),
-    )
     return c
 
 
@@ -241,6 +253,73 @@ def test_on_message_routes(monkeypatch):
     assert called["control"]
 
 
+def test_on_message_records_event_messages(monkeypatch, tmp_path):
+    from pykis.client.recorder import KisWebsocketRecorder, KisWebsocketRecordReader
+
+    c = make_client(monkeypatch)
+    handled = []
+    monkeypatch.setattr(c, "_handle_event", handled.append)
+
+    session = c.add_session(SimpleNamespace(appkey="S" + "A" * 35))
+
+    with KisWebsocketRecorder(tmp_path, ids=None) as recorder:
+        c.recorder = recorder
+        assert session.recorder is recorder
+
+        c.websocket = object()
+        c._on_message(c.websocket, "0|X|001|005930^1")
+        c._on_message(c.websocket, "1|Y|001|encrypted")
+
+    # 기록과 관계없이 이벤트는 처리됩니다.
+    assert handled == ["0|X|001|005930^1", "1|Y|001|encrypted"]
+
+    with KisWebsocketRecordReader(tmp_path) as reader:
+        assert [frame.message for frame in reader.frames()] == ["0|X|001|005930^1"]
+
+
+def test_pipeline_handles_session_and_primary_client_messages(monkeypatch):
+    from pykis.client.pipeline import KisWebsocketPipeline
+
+    c = make_client(monkeypatch)
+    c.kis.virtual = True
+    pipeline = KisWebsocketPipeline(workers=1)
+    c.pipeline = pipeline
+
+    # 파이프라인을 설정한 뒤에 만들어진 하위 클라이언트도 같은 대기열을 사용합니다.
+    session = c.add_session(SimpleNamespace(appkey="S" + "A" * 35))
+    primary = c._ensure_primary_client()
+    assert session.pipeline is pipeline and primary.pipeline is pipeline
+
+    handled = []
+    threads = set()
+
+    for client in (c, session, primary):
+
+        def handle_events(messages, client=client):
+            threads.add(threading.current_thread().name)
+            handled.extend((client, message) for message in messages)
+
+        monkeypatch.setattr(client, "_handle_events", handle_events)
+        monkeypatch.setattr(client, "_handle_event", lambda message: pytest.fail("수신 스레드에서 처리됨"))
+        client.websocket = object()
+
+    c._on_message(c.websocket, "0|H0STCNT0|001|005930^1")
+    session._on_message(session.websocket, "0|H0STCNT0|001|000660^1")
+    primary._on_message(primary.websocket, "1|H0STCNI9|001|encrypted")
+
+    assert pipeline.join(timeout=5)
+    # 메시지는 수신한 클라이언트의 암호화 키로 처리되도록 해당 클라이언트에서 처리됩니다.
+    assert handled == [
+        (c, "0|H0STCNT0|001|005930^1"),
+        (session, "0|H0STCNT0|001|000660^1"),
+        (primary, "1|H0STCNI9|001|encrypted"),
+    ]
+    assert threading.current_thread().name not in threads
+
+    c.pipeline = None
+    assert session.pipeline is None and primary.pipeline is None
+
+
 def test_set_encryption_key_non_special_and_handle_event_decryption(monkeypatch):
     c = make_client(monkeypatch)
     # non-special id retains key
@@ -265,7 +344,7 @@ def test_set_encryption_key_non_special_and_handle_event_decryption(monkeypatch)
 
     # monkeypatch KisWebsocketResponse.parse to a dummy that yields nothing
     from pykis.responses.websocket import KisWebsocketResponse
-    monkeypatch.setattr(KisWebsocketResponse, "parse", staticmethod(lambda body, count, response_type: []))
+    monkeypatch.setattr(KisWebsocketResponse, "parse", staticmethod(lambda body, count, response_type, lazy=False: []))
 
     # event with encrypted flag
     msg = "1|NORMAL|1|" + base64.b64encode(ciphertext).decode("ascii")
@@ -725,7 +804,7 @@ def test_handle_event_with_kis_object_initialization(monkeypatch):
     monkeypatch.setattr(
         KisWebsocketResponse, 
         "parse", 
-        staticmethod(lambda body, count, response_type: [test_response])
+        staticmethod(lambda body, count, response_type, lazy=False: [test_response])
     )
     
     invoked = []
@@ -754,7 +833,7 @@ def test_handle_event_catches_event_invoke_exceptions(monkeypatch):
     monkeypatch.setattr(
         KisWebsocketResponse, 
         "parse", 
-        staticmethod(lambda body, count, response_type: [{}])
+        staticmethod(lambda body, count, response_type, lazy=False: [{}])
     )
     
     def failing_handler(sender, args):
@@ -774,7 +853,7 @@ def test_handle_event_catches_parse_exceptions(monkeypatch):
     monkeypatch.setitem(websocket_mod.WEBSOCKET_RESPONSES_MAP, "TESTID", object())
     
     from pykis.responses.websocket import KisWebsocketResponse
-    def failing_parse(body, count, response_type):
+    def failing_parse(body, count, response_type, lazy=False):
         raise Exception("Parse error")
     
     monkeypatch.setattr(KisWebsocketResponse, "parse", staticmethod(failing_parse))
@@ -1009,3 +1088,247 @@ def test_on_message_handles_exceptions(monkeypatch):
     # should not raise
     c._on_message(c.websocket, "invalid")
 
+
+
+def test_handle_control_invalid_approval_key_retries_once(monkeypatch):
+    """Test invalid approval key is discarded and the subscription is requested again once"""
+    c = make_client(monkeypatch)
+    ws = DummyWS()
+    c.websocket = ws
+    c._connected_event.set()
+
+    c.subscribe("TEST", "KEY")
+    tr = KisWebsocketTR("TEST", "KEY")
+    assert c._approval_keys[tr] == "APPKEY-123"
+
+    data = {
+        "header": {"tr_id": "TEST", "tr_key": "KEY"},
+        "body": {"rt_cd": "1", "msg_cd": "OPSP0011", "msg1": "invalid approval : NOT FOUND"},
+    }
+
+    c._handle_control(data)
+    assert c.kis.discarded == [("real", "APPKEY-123")]
+    assert len(ws.sent) == 2
+    assert json.loads(ws.sent[-1])["header"]["approval_key"] == "APPKEY-1"
+
+    # the renewed key is rejected as well: no further retries
+    c._handle_control(data)
+    assert len(ws.sent) == 2
+
+    c._reset_session_state()
+    assert not c._approval_keys
+    assert not c._approval_retries
+
+
+def test_handle_control_other_approval_message_keeps_key(monkeypatch):
+    """Test control messages mentioning approval with another code do not discard the key"""
+    c = make_client(monkeypatch)
+    ws = DummyWS()
+    c.websocket = ws
+    c._connected_event.set()
+
+    c.subscribe("TEST", "KEY")
+    c._handle_control(
+        {
+            "header": {"tr_id": "TEST", "tr_key": "KEY"},
+            "body": {"rt_cd": "1", "msg_cd": "OPSP0008", "msg1": "MAX SUBSCRIBE OVER (approval)"},
+        }
+    )
+
+    assert c.kis.discarded == []
+    assert len(ws.sent) == 1
+
+
+def test_set_encryption_key_reuses_same_key(monkeypatch):
+    c = make_client(monkeypatch)
+    tr = KisWebsocketTR("H0STCNI0", "")
+    body = {"key": "k" * 32, "iv": "i" * 16}
+
+    c._set_encryption_key(tr, body)
+    key = c._keychain[tr]
+    c._set_encryption_key(tr, body)
+    assert c._keychain[tr] is key
+
+    c._set_encryption_key(tr, {"key": "x" * 32, "iv": "i" * 16})
+    assert c._keychain[tr] is not key
+
+
+def test_handle_events_decrypts_in_batch_and_keeps_order(monkeypatch):
+    c = make_client(monkeypatch)
+    c._set_encryption_key(KisWebsocketTR("ENC", ""), {"key": "k" * 32, "iv": "i" * 16})
+    ek = c._keychain[KisWebsocketTR("ENC", "")]
+
+    from cryptography.hazmat.primitives import padding as _padding
+    from cryptography.hazmat.primitives.ciphers import algorithms as _algorithms
+
+    def encrypt(text: str) -> str:
+        padder = _padding.PKCS7(_algorithms.AES.block_size).padder()
+        padded = padder.update(text.encode("utf-8")) + padder.finalize()
+        encryptor = ek.cipher.encryptor()
+        return base64.b64encode(encryptor.update(padded) + encryptor.finalize()).decode("ascii")
+
+    monkeypatch.setitem(websocket_mod.WEBSOCKET_RESPONSES_MAP, "ENC", object())
+    monkeypatch.setitem(websocket_mod.WEBSOCKET_RESPONSES_MAP, "PLAIN", object())
+
+    from pykis.responses.websocket import KisWebsocketResponse
+
+    bodies = []
+    monkeypatch.setattr(
+        KisWebsocketResponse,
+        "parse",
+        staticmethod(lambda body, count, response_type, lazy=False: bodies.append(body) or []),
+    )
+
+    c._handle_events(
+        [
+            "1|ENC|1|" + encrypt("first"),
+            "0|PLAIN|1|plain",
+            "1|ENC|1|" + encrypt("second^fill"),
+            "1|ENC|1|invalid",
+            "1|NOKEY|1|" + encrypt("dropped"),
+        ]
+    )
+
+    # 복호화에 실패한 메시지는 건너뛰고 나머지는 수신 순서대로 처리합니다.
+    assert bodies == ["first", "plain", "second^fill"]
+
+
+def test_pipeline_routes_events_to_dispatcher_threads(monkeypatch):
+    from pykis.client.pipeline import KisWebsocketPipeline
+
+    c = make_client(monkeypatch)
+    c.websocket = DummyWS()
+
+    handled = []
+    threads = set()
+
+    def handle_events(messages):
+        threads.add(threading.current_thread().name)
+        handled.extend(messages)
+
+    monkeypatch.setattr(c, "_handle_events", handle_events)
+
+    pipeline = KisWebsocketPipeline(workers=2)
+    c.pipeline = pipeline
+    c._on_message(c.websocket, "0|H0STCNT0|001|005930^1")
+    c._on_message(c.websocket, "0|H0STCNT0|001|005930^2")
+
+    assert pipeline.join(timeout=5)
+    assert handled == ["0|H0STCNT0|001|005930^1", "0|H0STCNT0|001|005930^2"]
+    assert threading.current_thread().name not in threads
+
+    # 대기열을 해제하면 수신 스레드에서 직접 처리합니다.
+    c.pipeline = None
+    assert pipeline.closed
+
+    called = []
+    monkeypatch.setattr(c, "_handle_event", lambda message: called.append(message))
+    c._on_message(c.websocket, "0|H0STCNT0|001|005930^3")
+    assert called == ["0|H0STCNT0|001|005930^3"]
+
+
+def _auth(prefix: str, virtual: bool = False):
+    from pykis.client.auth import KisAuth
+
+    return KisAuth(
+        id="test_user",
+        appkey=prefix + "A" * (36 - len(prefix)),
+        secretkey="S" * 180,
+        account="50000000-01",
+        virtual=virtual,
+    )
+
+
+def _connect(client: KisWebsocketClient):
+    client.websocket = DummyWS()
+    client.thread = threading.current_thread()
+    client._connected_event.set()
+
+
+def test_add_session_validates_appkey(monkeypatch):
+    c = make_client(monkeypatch)
+
+    with pytest.raises(ValueError):
+        c.add_session(_auth("P", virtual=True))
+
+    with pytest.raises(ValueError):
+        # 기본 앱 키는 추가 세션으로 사용할 수 없습니다.
+        c.add_session(_auth("P"))
+
+    session = c.add_session(_auth("Q"))
+    assert c.sessions == [session]
+    assert session.appkey.appkey.startswith("Q")
+
+    with pytest.raises(ValueError):
+        c.add_session(_auth("Q"))
+
+
+def test_sessions_shard_subscriptions(monkeypatch):
+    monkeypatch.setattr(websocket_mod, "WEBSOCKET_MAX_SUBSCRIPTIONS", 2)
+    c = make_client(monkeypatch)
+    sessions = [c.add_session(_auth("Q")), c.add_session(_auth("R"))]
+
+    for client in (c, *sessions):
+        _connect(client)
+
+    for i in range(6):
+        c.subscribe("H0STCNT0", f"{i:06d}")
+
+    assert [len(client._subscriptions) for client in (c, *sessions)] == [2, 2, 2]
+    assert len(c.subscriptions) == 6
+    assert all(c.is_subscribed("H0STCNT0", f"{i:06d}") for i in range(6))
+
+    # 추가 세션의 요청에는 해당 앱 키로 발급한 접속 키를 사용합니다.
+    sent = json.loads(sessions[0].websocket.sent[-1])
+    assert sent["header"]["approval_key"] == "APPKEY-QA"
+
+    with pytest.raises(ValueError):
+        c.subscribe("H0STCNT0", "999999")
+
+    tr = next(iter(sessions[1]._subscriptions))
+    c.unsubscribe(tr.id, tr.key)
+    assert tr not in sessions[1]._subscriptions
+    assert json.loads(sessions[1].websocket.sent[-1])["header"]["tr_type"] == TR_UNSUBSCRIBE_TYPE
+
+    c.unsubscribe_all()
+    assert not c.subscriptions
+
+
+def test_session_events_are_forwarded(monkeypatch):
+    from pykis.event.subscription import KisSubscriptionEventArgs
+
+    c = make_client(monkeypatch)
+    session = c.add_session(_auth("Q"))
+    received = []
+
+    c.event += lambda sender, e: received.append((sender, e.tr))
+    session.event.invoke(session, KisSubscriptionEventArgs(KisWebsocketTR("H0STCNT0", ""), SimpleNamespace()))
+
+    assert received == [(c, KisWebsocketTR("H0STCNT0", ""))]
+
+
+def test_sessions_rebalance_on_disconnect(monkeypatch):
+    monkeypatch.setattr(websocket_mod, "WEBSOCKET_MAX_SUBSCRIPTIONS", 3)
+    c = make_client(monkeypatch)
+    sessions = [c.add_session(_auth("Q")), c.add_session(_auth("R"))]
+
+    for client in (c, *sessions):
+        _connect(client)
+
+    for i in range(6):
+        c.subscribe("H0STCNT0", f"{i:06d}")
+
+    lost = set(sessions[0]._subscriptions)
+    assert len(lost) == 2
+
+    sessions[0]._on_close(sessions[0].websocket, 1006, "lost")
+
+    assert not sessions[0]._subscriptions
+    assert [len(client._subscriptions) for client in (c, sessions[1])] == [3, 3]
+    assert len(c.subscriptions) == 6
+
+    # disconnect()로 종료한 세션은 구독을 옮기지 않습니다.
+    sessions[1].thread = None
+    before = set(sessions[1]._subscriptions)
+    sessions[1]._on_close(sessions[1].websocket, 1000, "closed")
+    assert sessions[1]._subscriptions == before
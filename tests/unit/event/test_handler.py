@@ -146,3 +146,60 @@ def test_handler_call_and_iter_and_repr_and_eq_hash():
     a += spy
     a("S", KisEventArgs())
     assert invoked and invoked[0][0] == "S"
+
+
+def test_kis_event_handler_dispatch_index():
+    from types import SimpleNamespace
+
+    from pykis.client.messaging import KisWebsocketTR
+    from pykis.event.filters.product import KisProductEventFilter
+    from pykis.event.filters.subscription import KisSubscriptionEventFilter
+    from pykis.event.subscription import KisSubscriptionEventArgs
+
+    handler = KisEventHandler()
+    calls = []
+
+    def on(name, *filters):
+        return handler.on(lambda s, e: calls.append(name), where=KisMultiEventFilter(*filters))
+
+    samsung = on("samsung", KisSubscriptionEventFilter("H0STCNT0"), KisProductEventFilter("005930", "KRX"))
+    hynix = on("hynix", KisSubscriptionEventFilter("H0STCNT0"), KisProductEventFilter("000660", "KRX"))
+    all_prices = on("all", KisSubscriptionEventFilter("H0STCNT0"))
+    unfiltered = handler.on(lambda s, e: calls.append("unfiltered"))
+
+    assert len(handler._index) == 3
+
+    tick = KisSubscriptionEventArgs(
+        KisWebsocketTR("H0STCNT0", ""),
+        SimpleNamespace(symbol="005930", market="KRX"),
+    )
+    assert tick.__event_keys__() == {"id": "H0STCNT0", "symbol": "005930", "market": "KRX"}
+
+    # 색인 키가 다른 핸들러는 필터를 평가하지 않습니다.
+    assert hynix not in handler.match(tick)
+    handler.invoke(None, tick)
+    assert sorted(calls) == ["all", "samsung", "unfiltered"]
+
+    calls.clear()
+    handler.invoke(None, KisSubscriptionEventArgs(KisWebsocketTR("H0STASP0", ""), SimpleNamespace()))
+    assert calls == ["unfiltered"]
+
+    samsung.unsubscribe()
+    hynix.unsubscribe()
+    all_prices.unsubscribe()
+    assert len(handler._index) == 1
+    assert len(handler._index_keys) == 1
+
+    unfiltered.unsubscribe()
+    assert not handler._index
+    assert not handler._index
+
+
+def test_kis_multi_event_filter_event_keys_by_gate():
+    from pykis.event.filters.subscription import KisSubscriptionEventFilter
+
+    f = KisSubscriptionEventFilter("H0STCNT0")
+
+    assert KisMultiEventFilter(f, lambda s, e: False).__event_keys__() == {"id": "H0STCNT0"}
+    # 'and' 게이트는 하위 필터 중 하나만 통과해도 이벤트를 전달하므로 색인할 수 없습니다.
+    assert KisMultiEventFilter(f, gate="and").__event_keys__() == {}
@@ -451,3 +451,30 @@ def test_kis_list_metaclass():
     # Test that it can transform data
     result = list_type.transform([{"x": 1}, {"x": 2}])
     assert len(result) == 2
+
+
+def test_field_plan_is_built_once_per_type():
+    """Test get_field_plan caches the merged field list per type."""
+    from typing import Optional
+
+    class SimpleType(KisType):
+        def transform(self, data):
+            return data
+
+    class Base(KisDynamic):
+        a: Optional[int] = SimpleType()("A")
+
+    class Child(Base):
+        b: int = SimpleType()()
+        _private = SimpleType()("P")
+
+    plan = dyn.get_field_plan(Child)
+
+    assert dyn.get_field_plan(Child) is plan
+    assert [(f.name, f.field, f.nullable) for f in plan] == [("a", "A", True), ("b", "b", False)]
+    # the parent type has its own plan
+    assert [f.name for f in dyn.get_field_plan(Base)] == ["a"]
+
+    obj = KisObject.transform_({"A": None, "b": 2}, Child)
+    assert obj.a is None
+    assert obj.b == 2
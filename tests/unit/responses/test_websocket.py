@@ -109,3 +109,104 @@ def test_parse_transform_exception_is_wrapped():
         list(KisWebsocketResponse.parse("x", response_type=Resp))
 
     assert "데이터 파싱 중 오류" in str(excinfo.value)
+
+
+def test_websocket_parser_is_cached_per_type():
+    class Field:
+        def __init__(self, name):
+            self.field = name
+            self.default = empty
+            self.absolute = False
+
+        def transform(self, value):
+            return value
+
+    class Resp(KisWebsocketResponse):
+        __fields__ = [Field('x')]
+        __annotations__ = {'x': str}
+
+    parser = wsmod.get_websocket_parser(Resp)
+    assert wsmod.get_websocket_parser(Resp) is parser
+
+    # __fields__를 교체하면 파서를 다시 생성합니다.
+    Resp.__fields__ = [Field('y')]
+    assert wsmod.get_websocket_parser(Resp) is not parser
+    assert list(KisWebsocketResponse.parse("a", response_type=Resp))[0].y == "a"
+
+
+def test_websocket_parser_handles_absolute_and_non_identifier_fields():
+    from pykis.responses.types import KisAny, KisString
+
+    class Resp(KisWebsocketResponse):
+        __fields__ = [
+            KisString['symbol'],
+            None,
+            KisString['class'],
+            KisAny(lambda values: "-".join(values))(field='joined', absolute=True),
+        ]
+        __annotations__ = {'symbol': str, 'joined': str}
+
+    r = list(KisWebsocketResponse.parse("005930^skip^A^B", response_type=Resp))[0]
+
+    assert r.symbol == "005930"
+    assert getattr(r, "class") == "A"
+    assert r.joined == "005930-skip-A-B"
+    assert r.__data__ == ("005930", "skip", "A", "B")
+
+
+def test_lazy_parse_decodes_fields_on_first_access():
+    from pykis.responses.types import KisAny, KisInt, KisString
+
+    calls = []
+
+    def joined(values):
+        calls.append("joined")
+        return "-".join(values)
+
+    class Resp(KisWebsocketResponse):
+        __fields__ = [
+            KisString['symbol'],
+            KisInt['price'],
+            KisString['class'],
+            KisAny(joined)(field='joined', absolute=True),
+        ]
+        __annotations__ = {'symbol': str, 'price': int, 'joined': str}
+
+        @wsmod.websocket_property
+        def doubled(self) -> int:
+            calls.append("doubled")
+            return self.price * 2
+
+    eager = list(KisWebsocketResponse.parse("005930^100^A^B", response_type=Resp))[0]
+    assert calls == ["joined", "doubled"]
+    assert vars(eager).keys() >= {"symbol", "price", "class", "joined", "doubled"}
+
+    calls.clear()
+    r = list(KisWebsocketResponse.parse("005930^100^A^B", response_type=Resp, lazy=True))[0]
+
+    assert isinstance(r, Resp)
+    assert type(r).__name__ == "Resp"
+    assert calls == []
+    assert set(vars(r)) == {"__data__"}
+
+    assert r.doubled == 200
+    assert r.doubled == 200
+    assert calls == ["doubled"]
+    assert set(vars(r)) == {"__data__", "price", "doubled"}
+
+    assert r.symbol == eager.symbol
+    assert getattr(r, "class") == "A"
+    assert r.joined == eager.joined
+
+
+def test_lazy_parse_raises_conversion_error_on_access():
+    from pykis.responses.types import KisInt
+
+    class Resp(KisWebsocketResponse):
+        __fields__ = [KisInt['price']]
+        __annotations__ = {'price': int}
+
+    r = list(KisWebsocketResponse.parse("invalid", response_type=Resp, lazy=True))[0]
+
+    with pytest.raises(ValueError, match="Resp.price"):
+        r.price
@@ -3,11 +3,17 @@ import pytest
 from types import SimpleNamespace
 
 import pykis.scope.stock as stock_mod
+from pykis.client.market_index import KisMarketIndex
 
 
 class DummyKis:
     def __init__(self, primary=None):
         self.primary = primary
+        self.market_index = KisMarketIndex()
+        self._rate_limiters = {"real": SimpleNamespace(rate=4), "virtual": SimpleNamespace(rate=1)}
+
+    def _rate_limit(self, domain=None):
+        return self._rate_limiters[domain or "virtual"]
 
 
 def test_stock_uses_info_and_primary_account(monkeypatch):
@@ -101,3 +107,68 @@ def test_kisstockscope_init_registers_filter_direct_instantiation(monkeypatch):
     assert scope.account_number is acc
     assert recorded["owner"] is scope
     assert getattr(scope, "_was_filtered", False) is True
+
+
+def test_stock_uses_market_index_without_info(monkeypatch):
+    calls = []
+
+    def fake_info(self, symbol, market):
+        calls.append((symbol, market))
+        return SimpleNamespace(symbol=symbol, market="KRX")
+
+    monkeypatch.setattr(stock_mod, "_info", fake_info)
+    monkeypatch.setattr(stock_mod, "KisProductEventFilter", type("F", (), {"__init__": lambda self, owner: None}))
+
+    kis = DummyKis(primary=object())
+
+    first = stock_mod.stock(kis, symbol="005930")
+    second = stock_mod.stock(kis, symbol="005930")
+    # 조회한 상품유형이 다르면 다시 조회합니다.
+    stock_mod.stock(kis, symbol="005930", market="KR")
+
+    assert calls == [("005930", None), ("005930", "KR")]
+    assert (first.symbol, first.market) == (second.symbol, second.market) == ("005930", "KRX")
+
+
+def test_stocks_resolves_missing_symbols_and_reports_errors(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_info(self, symbol, market):
+        calls.append(symbol)
+
+        if symbol == "BAD":
+            raise ValueError("not found")
+
+        return SimpleNamespace(symbol=symbol, market="NASDAQ")
+
+    monkeypatch.setattr(stock_mod, "_info", fake_info)
+    monkeypatch.setattr(stock_mod, "KisProductEventFilter", type("F", (), {"__init__": lambda self, owner: None}))
+
+    kis = DummyKis(primary=object())
+    kis.market_index = KisMarketIndex(tmp_path / "market_index.json")
+    kis.market_index.set("AAPL", "US", "AAPL", "NASDAQ")
+
+    workers = []
+    batch_iter = stock_mod.batch_iter
+    monkeypatch.setattr(
+        stock_mod,
+        "batch_iter",
+        lambda fn, items, max_workers: workers.append(max_workers) or batch_iter(fn, items, max_workers=max_workers),
+    )
+
+    results = stock_mod.stocks(kis, ["AAPL", "TSLA", "BAD", "NVDA"], market="US")
+
+    assert list(results) == ["AAPL", "TSLA", "BAD", "NVDA"]
+    # 상품기본조회는 실전도메인으로 요청하므로 모의투자에서도 실전도메인 호출 유량만큼 동시에 요청합니다.
+    assert workers == [4]
+    assert sorted(calls) == ["BAD", "NVDA", "TSLA"]
+    assert results["TSLA"].unwrap().market == "NASDAQ"
+    assert isinstance(results["BAD"].error, ValueError)
+
+    # 다음 실행에서는 API 호출 없이 Scope를 생성합니다.
+    calls.clear()
+    kis.market_index = KisMarketIndex(tmp_path / "market_index.json")
+    results = stock_mod.stocks(kis, ["AAPL", "TSLA", "NVDA"], market="US")
+
+    assert calls == []
+    assert all(result.ok for result in results.values())
@@ -1,6 +1,7 @@
 import json
+import threading
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, call, mock_open, patch
 
 import pytest
 
@@ -10,6 +11,8 @@ from pykis.client.auth import KisAuth
 from pykis.client.exceptions import KisHTTPError
 from pykis.client.form import KisForm
 from pykis.kis import PyKis
+from pykis.__env__ import API_REQUEST_BURST, REAL_API_REQUEST_PER_SECOND
+from pykis.utils.rate_limit import SharedRateLimiter
 
 
 @pytest.fixture
@@ -1040,3 +1043,341 @@ def test_request_with_none_form_element(mock_session):
     assert response.json()["rt_cd"] == "0"
     # None은 무시되고 mock_form만 build 호출됨
     mock_form.build.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_arequest_rate_limit_and_token_expiry():
+    """비동기 API 요청 시 Rate Limit 및 토큰 만료 처리 테스트"""
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+    kis.token = KisObject.transform_(
+        {
+            "access_token": "test_token",
+            "token_type": "Bearer",
+            "access_token_token_expired": "2099-01-01 00:00:00",
+            "expires_in": 86400,
+        },
+        KisAccessToken,
+    )
+
+    mock_send = AsyncMock(
+        side_effect=[
+            MagicMock(ok=False, json=lambda: {"msg_cd": "EGW00201"}),
+            MagicMock(ok=False, json=lambda: {"msg_cd": "EGW00123"}),
+            MagicMock(ok=True, json=lambda: {"rt_cd": "0"}),
+        ]
+    )
+
+    kis._transports["real"] = MagicMock(send=mock_send)
+
+    with (
+        patch("pykis.api.auth.token.token_issue") as mock_token_issue,
+        patch("pykis.kis.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        mock_token_issue.return_value = KisObject.transform_(
+            {
+                "access_token": "new_token",
+                "token_type": "Bearer",
+                "access_token_token_expired": "2099-01-01 00:00:00",
+                "expires_in": 86400,
+            },
+            KisAccessToken,
+        )
+
+        response = await kis.arequest("/test", params={"a": "1"})
+
+        assert response.json()["rt_cd"] == "0"
+        assert mock_send.call_count == 3
+        # 호출 유량도 연속 호출을 분산하기 위해 대기하므로, 유량 초과 재시도 대기만 확인합니다.
+        assert mock_sleep.await_args_list.count(call(0.1)) == 1
+        mock_token_issue.assert_called_once()
+
+    request = mock_send.call_args.args[0]
+    assert request.url == "https://openapi.koreainvestment.com:9443/test?a=1"
+    assert request.headers["Authorization"] == "Bearer new_token"
+    assert request.headers["appkey"] == VALID_APPKEY
+
+
+@pytest.mark.asyncio
+async def test_arequest_acquires_rate_limit_with_tr_id():
+    """비동기 요청은 TR ID를 키로 호출 유량을 비동기 획득합니다."""
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+    limiter = MagicMock(acquire_async=AsyncMock(return_value=True))
+    kis._rate_limiters["real"] = limiter
+    kis._transports["real"] = MagicMock(send=AsyncMock(return_value=MagicMock(ok=True)))
+
+    await kis.arequest("/test", headers={"tr_id": "FHKST01010100"}, auth=False)
+
+    limiter.acquire_async.assert_awaited_once_with(
+        blocking_callback=kis._rate_limit_exceeded,
+        key="FHKST01010100",
+    )
+    limiter.acquire.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_afetch_transforms_response():
+    """afetch는 fetch와 동일하게 응답을 변환합니다."""
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+
+    mock_response = MagicMock(ok=True)
+    mock_response.json.return_value = {"rt_cd": "0", "output": {}}
+    mock_send = AsyncMock(return_value=mock_response)
+
+    kis._transports["real"] = MagicMock(send=mock_send)
+    result = await kis.afetch("/test", api="TR0001", continuous=True, auth=False)
+
+    assert result.rt_cd == "0"
+    request = mock_send.call_args.args[0]
+    assert request.headers["tr_id"] == "TR0001"
+    assert request.headers["tr_cont"] == "N"
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_transports():
+    """aclose는 비동기 전송 계층을 종료합니다."""
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+
+    kis._transports = {
+        "real": MagicMock(close=AsyncMock()),
+        "virtual": MagicMock(close=AsyncMock()),
+    }
+
+    await kis.aclose()
+
+    kis._transports["real"].close.assert_awaited_once()
+    kis._transports["virtual"].close.assert_awaited_once()
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_rate_limiters_spread_requests(tmp_path, shared):
+    """호출 유량은 연속 호출을 `interval` 간격으로 분산합니다."""
+    kis = PyKis(
+        id="t",
+        appkey=VALID_APPKEY,
+        secretkey=VALID_SECRETKEY,
+        virtual_id="v",
+        virtual_appkey=VALID_APPKEY,
+        virtual_secretkey=VALID_SECRETKEY,
+        use_websocket=False,
+        shared_rate_limit=tmp_path if shared else None,
+    )
+
+    for domain in ("real", "virtual"):
+        limiter = kis._rate_limiters[domain]
+        assert isinstance(limiter, SharedRateLimiter) is shared
+        assert limiter.burst == API_REQUEST_BURST == 1
+
+        with patch.object(type(limiter), "_now", return_value=100.0):
+            waits = [limiter._reserve() for _ in range(3)]
+
+        assert waits == pytest.approx([0, limiter.interval, 2 * limiter.interval])
+
+
+def test_shared_rate_limit(tmp_path):
+    """shared_rate_limit 옵션은 AppKey 해시로 공유 호출 유량을 생성합니다."""
+    kis = PyKis(
+        id="t",
+        appkey=VALID_APPKEY,
+        secretkey=VALID_SECRETKEY,
+        use_websocket=False,
+        shared_rate_limit=tmp_path,
+    )
+    other = PyKis(
+        id="other",
+        appkey=VALID_APPKEY,
+        secretkey=VALID_SECRETKEY,
+        use_websocket=False,
+        shared_rate_limit=tmp_path,
+    )
+
+    limiter = kis._rate_limiters["real"]
+
+    assert isinstance(limiter, SharedRateLimiter)
+    assert limiter.path == tmp_path / kis._get_hashed_rate_limit_name("real")
+    assert limiter.rate == REAL_API_REQUEST_PER_SECOND
+    # 같은 AppKey는 ID와 관계없이 같은 호출 유량을 공유합니다.
+    assert other._rate_limiters["real"].path == limiter.path
+    # 모의도메인 AppKey가 없으면 모의도메인 호출 유량은 공유하지 않습니다.
+    assert not isinstance(kis._rate_limiters["virtual"], SharedRateLimiter)
+
+
+def test_rate_limit_follows_request_domain():
+    kis = PyKis(
+        id="test_id",
+        appkey=VALID_APPKEY,
+        secretkey=VALID_SECRETKEY,
+        virtual_id="v_test_id",
+        virtual_appkey=VALID_APPKEY,
+        virtual_secretkey=VALID_SECRETKEY,
+        use_websocket=False,
+    )
+
+    # 도메인을 지정하지 않으면 fetch와 같이 모의투자 여부로 결정합니다.
+    assert kis._rate_limit() is kis._rate_limiters["virtual"]
+    assert kis._rate_limit("real") is kis._rate_limiters["real"]
+
+
+def test_shared_rate_limit_disabled_by_default():
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+
+    assert not isinstance(kis._rate_limiters["real"], SharedRateLimiter)
+
+
+def test_approval_key_is_cached_and_persisted(tmp_path):
+    """웹소켓 접속 키는 도메인별로 캐시되고 keep_token 경로에 저장됩니다."""
+    from pykis.api.auth.websocket import KisWebsocketApprovalKey
+
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, keep_token=tmp_path, use_websocket=False)
+    issued = iter(["KEY1", "KEY2"])
+
+    def fake_issue(self, domain=None):
+        return KisObject.transform_({"approval_key": next(issued)}, KisWebsocketApprovalKey)
+
+    with patch("pykis.api.auth.websocket.websocket_approval_key", fake_issue):
+        assert kis.approval_key("real").approval_key == "KEY1"
+        # 캐시된 접속 키를 재사용합니다.
+        assert kis.approval_key().approval_key == "KEY1"
+        assert (tmp_path / kis._get_hashed_approval_key_name("real")).exists()
+
+        # 다른 프로세스에서도 저장된 접속 키를 불러옵니다.
+        other = PyKis(
+            id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, keep_token=tmp_path, use_websocket=False
+        )
+        assert other.approval_key("real").approval_key == "KEY1"
+
+        # 이미 재발급된 접속 키는 폐기하지 않습니다.
+        assert not kis.discard_approval_key("real", approval_key="OTHER")
+        assert kis.discard_approval_key("real", approval_key="KEY1")
+        assert not (tmp_path / kis._get_hashed_approval_key_name("real")).exists()
+        assert kis.approval_key("real").approval_key == "KEY2"
+
+
+def test_approval_key_reissued_when_expiring():
+    """만료가 임박한 웹소켓 접속 키는 재발급합니다."""
+    from pykis.api.auth.websocket import KisWebsocketApprovalKey
+
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+    kis._approval_keys["real"] = KisObject.transform_(
+        {"approval_key": "OLD", "issued_at": "2000-01-01T00:00:00+09:00"},
+        KisWebsocketApprovalKey,
+    )
+
+    with patch(
+        "pykis.api.auth.websocket.websocket_approval_key",
+        lambda self, domain=None: KisObject.transform_({"approval_key": "NEW"}, KisWebsocketApprovalKey),
+    ):
+        assert kis.approval_key("real").approval_key == "NEW"
+
+
+def test_approval_key_per_session_appkey(tmp_path):
+    """추가 웹소켓 세션의 접속 키는 앱 키별로 캐시되고 파일에 저장하지 않습니다."""
+    from pykis.api.auth.websocket import KisWebsocketApprovalKey
+    from pykis.client.appkey import KisKey
+
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, keep_token=tmp_path, use_websocket=False)
+    appkey = KisKey(id="t", appkey="Q" * 36, secretkey=VALID_SECRETKEY)
+    issued = []
+
+    def fake_issue(self, domain=None, appkey=None):
+        issued.append(appkey.appkey if appkey else None)
+        return KisObject.transform_({"approval_key": f"KEY{len(issued)}"}, KisWebsocketApprovalKey)
+
+    with patch("pykis.api.auth.websocket.websocket_approval_key", fake_issue):
+        assert kis.approval_key("real", appkey=appkey).approval_key == "KEY1"
+        assert kis.approval_key("real", appkey=appkey).approval_key == "KEY1"
+        assert kis.approval_key("real").approval_key == "KEY2"
+        assert issued == ["Q" * 36, None]
+        assert [path.name for path in tmp_path.iterdir()] == [kis._get_hashed_approval_key_name("real")]
+
+        assert not kis.discard_approval_key("real", approval_key="KEY2", appkey=appkey)
+        assert kis.discard_approval_key("real", approval_key="KEY1", appkey=appkey)
+        assert kis.approval_key("real").approval_key == "KEY2"
+        assert kis.approval_key("real", appkey=appkey).approval_key == "KEY3"
+
+
+def test_market_index_option(tmp_path):
+    """market_index 옵션은 종목 상품유형 색인을 파일에 저장합니다."""
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+    assert kis.market_index.path is None
+
+    kis = PyKis(
+        id="t",
+        appkey=VALID_APPKEY,
+        secretkey=VALID_SECRETKEY,
+        use_websocket=False,
+        market_index=tmp_path / "market_index.json",
+    )
+    assert kis.market_index.path == tmp_path / "market_index.json"
+
+
+def test_cache_option(tmp_path):
+    """cache 옵션으로 캐시 저장소를 설정합니다."""
+    from pykis.client.cache import KisCacheStorage
+
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+    assert kis.cache.path is None
+    assert kis.cache.kis is kis
+
+    kis = PyKis(
+        id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False, cache=tmp_path / "cache.db"
+    )
+    assert kis.cache.path == tmp_path / "cache.db"
+
+    storage = KisCacheStorage(max_size=10)
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False, cache=storage)
+    assert kis.cache is storage
+    assert storage.kis is kis
+
+
+def test_domain_override():
+    """domain, websocket_domain 옵션으로 API와 웹소켓 주소를 재정의합니다."""
+    from pykis.__env__ import REAL_DOMAIN, VIRTUAL_DOMAIN, WEBSOCKET_VIRTUAL_DOMAIN
+
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+    assert kis.domains == {"real": REAL_DOMAIN, "virtual": VIRTUAL_DOMAIN}
+
+    kis = PyKis(
+        id="t",
+        appkey=VALID_APPKEY,
+        secretkey=VALID_SECRETKEY,
+        use_websocket=False,
+        domain="http://127.0.0.1:8080",
+        websocket_domain={"real": "ws://127.0.0.1:8080"},
+    )
+    assert kis.domains == {"real": "http://127.0.0.1:8080", "virtual": "http://127.0.0.1:8080"}
+    assert kis.websocket_domains == {"real": "ws://127.0.0.1:8080", "virtual": WEBSOCKET_VIRTUAL_DOMAIN}
+
+    with patch.object(kis._sessions["real"], "request") as request:
+        request.return_value = MagicMock(ok=True)
+        kis.request("/uapi/test", domain="real", auth=False)
+
+    assert request.call_args.kwargs["url"] == "http://127.0.0.1:8080/uapi/test"
+
+
+@pytest.mark.asyncio
+async def test_arequest_issues_token_off_event_loop():
+    """비동기 요청은 토큰 발급을 이벤트 루프 밖의 스레드에서 수행합니다."""
+    kis = PyKis(id="t", appkey=VALID_APPKEY, secretkey=VALID_SECRETKEY, use_websocket=False)
+    kis._transports["real"] = MagicMock(send=AsyncMock(return_value=MagicMock(ok=True)))
+    loop_thread = threading.get_ident()
+    issued_threads = []
+
+    def token_issue(*args, **kwargs):
+        issued_threads.append(threading.get_ident())
+        return KisObject.transform_(
+            {
+                "access_token": "new_token",
+                "token_type": "Bearer",
+                "access_token_token_expired": "2099-01-01 00:00:00",
+                "expires_in": 86400,
+            },
+            KisAccessToken,
+        )
+
+    with patch("pykis.api.auth.token.token_issue", side_effect=token_issue):
+        await kis.arequest("/test")
+        await kis.arequest("/test")
+
+    # 발급된 토큰은 다시 발급하지 않습니다.
+    assert len(issued_threads) == 1
+    assert issued_threads[0] != loop_thread
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from pykis.utils.batch import KisBatchResult, batch_iter, batch_map
+
+
+def test_batch_iter_yields_results_and_errors():
+    def fn(key: int) -> int:
+        if key == 3:
+            raise ValueError("bad key")
+
+        return key * 10
+
+    results = {result.key: result for result in batch_iter(fn, [1, 2, 3, 4, 2], max_workers=2)}
+
+    assert set(results) == {1, 2, 3, 4}
+    assert results[1].ok and results[1].result == 10
+    assert results[4].unwrap() == 40
+
+    assert not results[3].ok
+    assert isinstance(results[3].error, ValueError)
+
+    with pytest.raises(ValueError):
+        results[3].unwrap()
+
+
+def test_batch_iter_yields_in_completion_order():
+    def fn(key: float) -> float:
+        time.sleep(key)
+        return key
+
+    assert [result.key for result in batch_iter(fn, [0.2, 0.0, 0.1], max_workers=3)] == [0.0, 0.1, 0.2]
+
+
+def test_batch_iter_runs_concurrently():
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fn(key: int) -> int:
+        # deadlocks (and times out) unless all four run at the same time
+        barrier.wait()
+        return key
+
+    assert all(result.ok for result in batch_iter(fn, range(4), max_workers=4))
+
+
+def test_batch_iter_cancels_pending_requests_when_closed():
+    started = []
+
+    def fn(key: int) -> int:
+        started.append(key)
+        time.sleep(0.05)
+        return key
+
+    iterator = batch_iter(fn, range(10), max_workers=1)
+    next(iterator)
+    iterator.close()
+    time.sleep(0.2)
+
+    assert len(started) <= 2
+
+
+def test_batch_iter_empty():
+    assert list(batch_iter(lambda key: key, [], max_workers=4)) == []
+
+
+def test_batch_result_repr():
+    assert "KisBatchResult" in repr(KisBatchResult("005930", result=1))
+
+
+def test_batch_map_keeps_key_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fn(key: float) -> float:
+        barrier.wait()
+        time.sleep(key)
+        return key
+
+    assert batch_map(fn, [0.1, 0.0, 0.05]) == [0.1, 0.0, 0.05]
+
+
+def test_batch_map_raises_first_error_in_key_order():
+    def fn(key: int) -> int:
+        if key:
+            time.sleep(0.05)
+            raise KeyError(key)
+
+        raise ValueError(key)
+
+    with pytest.raises(ValueError):
+        batch_map(fn, [0, 1])
+
+
+def test_batch_map_single_key_runs_inline():
+    assert batch_map(lambda key: threading.current_thread(), ["KR"]) == [threading.current_thread()]
+    assert batch_map(lambda key: key, []) == []